@@ -0,0 +1,7 @@
+# coding=utf-8
+"""
+TrendRadar 基准测试
+
+完全离线运行，使用合成数据，不访问任何网络接口。
+运行方式: python -m benchmarks.<模块名>
+"""
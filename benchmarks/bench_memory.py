@@ -0,0 +1,133 @@
+# coding=utf-8
+"""
+条目内存占用基准测试
+
+测量多日数据常驻内存时 NewsItem（__slots__）的内存占用，并对比平台ID、名称和时间
+字段做字符串驻留（与 MCP 解析服务读取数据库时的做法一致）后的效果，
+用于评估 MCP 服务在小容器中能否容纳 30 天的工作集。
+
+运行方式:
+    python -m benchmarks.bench_memory --days 30
+    python -m benchmarks.bench_memory --days 30 --json
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from typing import Callable, Dict, List
+
+from trendradar.storage.base import NewsData
+
+from benchmarks.synthetic import generate_day, merge_day, unshare_strings
+
+
+def _measure(build: Callable[[], List[NewsData]]) -> Dict:
+    """测量构建函数返回的数据所占用的内存"""
+    gc.collect()
+    tracemalloc.start()
+    data = build()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total_items = sum(day.get_total_count() for day in data)
+    del data
+    return {
+        "bytes": current,
+        "peak_bytes": peak,
+        "items": total_items,
+        "bytes_per_item": round(current / total_items, 1) if total_items else 0,
+    }
+
+
+def _intern_strings(data: NewsData) -> NewsData:
+    """驻留条目中在大量条目间重复的短字符串（平台ID、名称、时间）"""
+    for news_list in data.items.values():
+        for item in news_list:
+            item.source_id = sys.intern(item.source_id)
+            item.source_name = sys.intern(item.source_name)
+            item.crawl_time = sys.intern(item.crawl_time)
+            item.first_time = sys.intern(item.first_time)
+            item.last_time = sys.intern(item.last_time)
+    return data
+
+
+def run(days: int, platforms: int, titles_per_crawl: int, crawls_per_day: int) -> Dict:
+    """
+    运行内存基准测试
+
+    Args:
+        days: 天数
+        platforms: 平台数量
+        titles_per_crawl: 每个平台每次抓取的标题数
+        crawls_per_day: 每天抓取次数
+
+    Returns:
+        测试结果字典
+    """
+    merged_days = [
+        merge_day(generate_day(
+            date=f"2025-01-{(i % 28) + 1:02d}",
+            platforms=platforms,
+            titles_per_crawl=titles_per_crawl,
+            crawls_per_day=crawls_per_day,
+            seed=i,
+        ))
+        for i in range(days)
+    ]
+
+    # 模拟从数据库逐行读取：每个字段都是独立字符串对象
+    def build_plain() -> List[NewsData]:
+        return [unshare_strings(day) for day in merged_days]
+
+    def build_interned() -> List[NewsData]:
+        return [_intern_strings(unshare_strings(day)) for day in merged_days]
+
+    plain = _measure(build_plain)
+    interned = _measure(build_interned)
+
+    return {
+        "benchmark": "item_memory",
+        "params": {
+            "days": days,
+            "platforms": platforms,
+            "titles_per_crawl": titles_per_crawl,
+            "crawls_per_day": crawls_per_day,
+        },
+        "results": {
+            "NewsItem": plain,
+            "NewsItem+intern": interned,
+        },
+        "saving_ratio": round(1 - interned["bytes"] / plain["bytes"], 3) if plain["bytes"] else 0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="NewsItem 内存占用基准测试")
+    parser.add_argument("--days", type=int, default=30, help="天数")
+    parser.add_argument("--platforms", type=int, default=11, help="平台数量")
+    parser.add_argument("--titles", type=int, default=50, help="每个平台每次抓取的标题数")
+    parser.add_argument("--crawls", type=int, default=48, help="每天抓取次数")
+    parser.add_argument("--json", action="store_true", help="以 JSON 格式输出")
+    args = parser.parse_args()
+
+    result = run(args.days, args.platforms, args.titles, args.crawls)
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+
+    print(f"合成数据: {args.days} 天 × {args.platforms} 平台 × {args.titles} 条 × {args.crawls} 次抓取")
+    for name, stats in result["results"].items():
+        print(
+            f"  {name:<16} {stats['items']:>8} 条  "
+            f"{stats['bytes'] / 1024 / 1024:>8.2f} MB  "
+            f"{stats['bytes_per_item']:>8.1f} B/条"
+        )
+    print(f"  节省: {result['saving_ratio'] * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+# coding=utf-8
+"""
+推送负载测试（离线）
+
+启动本地 Webhook 替身服务器（benchmarks.webhook_standin），将全部推送渠道
+（飞书、钉钉、企业微信、Telegram、ntfy、Bark、Slack、通用 Webhook）指向替身，
+用合成数据生成大报告，通过 NotificationDispatcher.dispatch_all 完整推送一次，
+按渠道统计：
+- batches: 替身服务器接受的批次数
+- throttled: 收到的限流响应次数
+- bytes: 发送的请求体字节数
+- e2e_ms: 从开始分发到该渠道最后一个批次送达的耗时
+- batches_per_sec: 批次吞吐
+
+speedup 按比例压缩各渠道的频率限制（替身服务器与客户端限流器同步缩放），
+使按真实额度需要数分钟的推送在数秒内完成；--no-rate-limit 关闭客户端令牌桶，
+改用固定批次间隔（同样按 speedup 缩放），用于对比限流响应次数。
+
+运行方式:
+    python -m benchmarks.bench_notify
+    python -m benchmarks.bench_notify --accounts 3 --latency-ms 50 --json
+    python -m benchmarks.bench_notify --no-rate-limit --output fixed.json
+"""
+
+import argparse
+import contextlib
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Dict, List
+
+import pytz
+from requests.adapters import HTTPAdapter
+
+from trendradar.core.analyzer import count_word_frequency
+from trendradar.core.frequency import load_frequency_words, matches_word_groups
+from trendradar.notification.dispatcher import NotificationDispatcher
+from trendradar.notification.ratelimit import DEFAULT_RATE_LIMITS
+from trendradar.notification.sessions import SessionPool
+from trendradar.notification.splitter import split_content_into_batches
+from trendradar.report.generator import prepare_report_data
+from trendradar.storage.base import news_data_to_result_views
+
+from benchmarks.synthetic import generate_day, make_frequency_words, merge_day
+from benchmarks.webhook_standin import WebhookStandIn
+
+
+CHANNELS = ["feishu", "dingtalk", "wework", "telegram", "ntfy", "bark", "slack", "generic_webhook"]
+
+# 固定报告时间，保证多次运行的分批结果一致
+_FIXED_NOW = datetime(2025, 1, 1, 23, 30, tzinfo=pytz.timezone("Asia/Shanghai"))
+
+_TELEGRAM_API = "https://api.telegram.org/"
+
+
+class _RedirectAdapter(HTTPAdapter):
+    """将固定前缀的请求改写到替身服务器（用于 URL 写死在代码中的 Telegram）"""
+
+    def __init__(self, prefix: str, target: str, **kwargs):
+        super().__init__(**kwargs)
+        self.prefix = prefix
+        self.target = target
+
+    def send(self, request, **kwargs):
+        request.url = self.target + request.url[len(self.prefix):]
+        return super().send(request, **kwargs)
+
+
+class _StandInSessionPool(SessionPool):
+    """会话池：Telegram 请求转发到替身服务器，其余渠道不变"""
+
+    def __init__(self, pool_size: int, target: str):
+        super().__init__(pool_size)
+        self.target = target.rstrip("/") + "/"
+
+    def _create_session(self):
+        session = super()._create_session()
+        session.mount(
+            _TELEGRAM_API,
+            _RedirectAdapter(
+                _TELEGRAM_API, self.target,
+                pool_connections=self.pool_size, pool_maxsize=self.pool_size,
+            ),
+        )
+        return session
+
+
+def _build_report(crawls_per_day: int, word_groups: int) -> Dict:
+    """用合成数据生成当日汇总报告数据"""
+    batches = generate_day(crawls_per_day=crawls_per_day)
+    results, id_to_name, title_info = news_data_to_result_views(merge_day(batches))
+
+    with tempfile.TemporaryDirectory(prefix="trendradar-notify-") as tmp_dir:
+        frequency_path = Path(tmp_dir) / "frequency_words.txt"
+        frequency_path.write_text(make_frequency_words(word_groups), encoding="utf-8")
+        word_groups_, filter_words, global_filters = load_frequency_words(str(frequency_path))
+
+    stats, _ = count_word_frequency(
+        results, word_groups_, filter_words, id_to_name, title_info,
+        mode="daily",
+        global_filters=global_filters,
+        is_first_crawl_func=lambda: False,
+        quiet=True,
+    )
+    return prepare_report_data(
+        stats, [], None, id_to_name, "daily",
+        matches_word_groups_func=matches_word_groups,
+        load_frequency_words_func=lambda: (word_groups_, filter_words, global_filters),
+    )
+
+
+def _build_config(standin: WebhookStandIn, accounts: int, workers: int, speedup: float, rate_limit: bool) -> Dict:
+    """生成指向替身服务器的推送配置"""
+    def multi(channel: str) -> str:
+        return ";".join(standin.url(channel, f"hook{i}") for i in range(accounts))
+
+    return {
+        "MAX_ACCOUNTS_PER_CHANNEL": accounts,
+        "MAX_DISPATCH_WORKERS": workers,
+        "BATCH_SEND_INTERVAL": 1.0 / speedup,
+        "FEISHU_WEBHOOK_URL": multi("feishu"),
+        "DINGTALK_WEBHOOK_URL": multi("dingtalk"),
+        "WEWORK_WEBHOOK_URL": multi("wework"),
+        "WEWORK_MSG_TYPE": "markdown",
+        "TELEGRAM_BOT_TOKEN": ";".join(f"standin{i}" for i in range(accounts)),
+        "TELEGRAM_CHAT_ID": ";".join(str(1000 + i) for i in range(accounts)),
+        "NTFY_SERVER_URL": f"{standin.base_url}/ntfy",
+        "NTFY_TOPIC": ";".join(f"topic{i}" for i in range(accounts)),
+        "NTFY_TOKEN": "",
+        "BARK_URL": multi("bark"),
+        "SLACK_WEBHOOK_URL": multi("slack"),
+        "GENERIC_WEBHOOK_URL": multi("generic_webhook"),
+        "GENERIC_WEBHOOK_TEMPLATE": "",
+        "RATE_LIMIT": {
+            "ENABLED": rate_limit,
+            "PER_MINUTE": {
+                channel: per_minute * speedup
+                for channel, (_, per_minute) in DEFAULT_RATE_LIMITS.items()
+            },
+        },
+    }
+
+
+def run(
+    crawls_per_day: int,
+    word_groups: int,
+    accounts: int,
+    workers: int,
+    speedup: float,
+    latency_ms: float,
+    rate_limit: bool,
+) -> Dict:
+    """
+    运行推送负载测试
+
+    Args:
+        crawls_per_day: 合成数据每天抓取次数
+        word_groups: 频率词词组数量
+        accounts: 每个渠道的账号数
+        workers: 调度器并发线程数
+        speedup: 频率限制的时间压缩倍数
+        latency_ms: 替身服务器的模拟网络延迟（毫秒）
+        rate_limit: 是否启用客户端令牌桶限流
+
+    Returns:
+        测试结果字典
+    """
+    report_data = _build_report(crawls_per_day, word_groups)
+    matched = sum(len(stat["titles"]) for stat in report_data["stats"])
+
+    with WebhookStandIn(speedup=speedup, latency_ms=latency_ms) as standin:
+        config = _build_config(standin, accounts, workers, speedup, rate_limit)
+        dispatcher = NotificationDispatcher(
+            config=config,
+            get_time_func=lambda: _FIXED_NOW,
+            split_content_func=partial(split_content_into_batches, get_time_func=lambda: _FIXED_NOW),
+        )
+        dispatcher.sessions = _StandInSessionPool(dispatcher.max_workers, standin.base_url)
+
+        start = time.perf_counter()
+        try:
+            results = dispatcher.dispatch_all(report_data, "当日汇总", mode="daily")
+        finally:
+            dispatcher.close()
+        elapsed = time.perf_counter() - start
+
+        channels: Dict[str, Dict] = {}
+        for channel in CHANNELS:
+            stats = standin.stats.get(channel)
+            if stats is None:
+                channels[channel] = {"ok": results.get(channel, False), "batches": 0}
+                continue
+            span = (stats.last_at - start) if stats.last_at else 0.0
+            channels[channel] = {
+                "ok": results.get(channel, False),
+                "batches": stats.accepted,
+                "throttled": stats.throttled,
+                "bytes": stats.bytes,
+                "e2e_ms": round(span * 1000, 3),
+                "batches_per_sec": round(stats.accepted / span, 2) if span > 0 else None,
+            }
+
+    return {
+        "benchmark": "notify_dispatch",
+        "params": {
+            "crawls_per_day": crawls_per_day,
+            "word_groups": word_groups,
+            "accounts": accounts,
+            "workers": workers,
+            "speedup": speedup,
+            "latency_ms": latency_ms,
+            "rate_limit": rate_limit,
+        },
+        "dataset": {"matched_titles": matched},
+        "elapsed_ms": round(elapsed * 1000, 3),
+        "channels": channels,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="推送离线负载测试")
+    parser.add_argument("--crawls", type=int, default=24, help="合成数据每天抓取次数")
+    parser.add_argument("--groups", type=int, default=40, help="频率词词组数量")
+    parser.add_argument("--accounts", type=int, default=2, help="每个渠道的账号数")
+    parser.add_argument("--workers", type=int, default=8, help="调度器并发线程数")
+    parser.add_argument("--speedup", type=float, default=60.0, help="频率限制的时间压缩倍数")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="模拟网络延迟（毫秒）")
+    parser.add_argument("--no-rate-limit", action="store_true", help="关闭客户端令牌桶，使用固定批次间隔")
+    parser.add_argument("--json", action="store_true", help="以 JSON 格式输出到标准输出")
+    parser.add_argument("--output", help="将 JSON 结果写入文件")
+    args = parser.parse_args()
+
+    # JSON 输出模式下将推送日志转到标准错误，保证标准输出可直接解析
+    log_target = sys.stderr if args.json else sys.stdout
+    with contextlib.redirect_stdout(log_target):
+        result = run(
+            args.crawls, args.groups, args.accounts, args.workers,
+            args.speedup, args.latency_ms, not args.no_rate_limit,
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print(
+            f"\n报告命中 {result['dataset']['matched_titles']} 条，"
+            f"总耗时 {result['elapsed_ms']:.1f} ms"
+        )
+        for channel, stats in result["channels"].items():
+            if not stats["batches"]:
+                print(f"  {channel:<16} 未送达")
+                continue
+            print(
+                f"  {channel:<16} {stats['batches']:>4} 批  限流 {stats['throttled']:>3} 次  "
+                f"{stats['bytes'] / 1024:>8.1f} KB  {stats['e2e_ms']:>9.1f} ms  "
+                f"{stats['batches_per_sec'] or 0:>7.1f} 批/秒"
+            )
+
+    failed: List[str] = [c for c, s in result["channels"].items() if not s["ok"]]
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+# coding=utf-8
+"""
+抓取→存储→分析→渲染→分批 全流程基准测试
+
+使用合成数据模拟一天的定时抓取，对主流程中的各阶段分别计时：
+- save_news_data: 逐批次写入 SQLite（本地存储后端，临时目录）
+- get_today_all_data: 读取当日合并数据
+- detect_new_titles: 检测最新批次的新增标题
+- count_word_frequency: 词频统计（daily 模式）
+- render_html_content: 渲染 HTML 报告
+- split_content_into_batches: 按各推送渠道的 format_type 分批
+
+完全离线运行，输出 JSON 便于在不同提交之间对比。
+
+运行方式:
+    python -m benchmarks.bench_pipeline
+    python -m benchmarks.bench_pipeline --crawls 48 --output before.json
+    python -m benchmarks.bench_pipeline --output after.json --compare before.json
+"""
+
+import argparse
+import contextlib
+import json
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import pytz
+
+from trendradar.core.analyzer import count_word_frequency
+from trendradar.core.frequency import load_frequency_words, matches_word_groups
+from trendradar.notification.batch import get_max_batch_header_size
+from trendradar.notification.splitter import split_content_into_batches
+from trendradar.report.generator import prepare_report_data
+from trendradar.report.html import render_html_content
+from trendradar.storage.base import news_data_to_result_views
+from trendradar.storage.local import LocalStorageBackend
+
+from benchmarks.synthetic import generate_day, make_frequency_words
+
+
+# 各推送渠道的默认批次大小（与 NotificationDispatcher 的默认配置一致）
+FORMAT_BATCH_SIZES: Dict[str, int] = {
+    "feishu": 29000,
+    "dingtalk": 20000,
+    "wework": 4000,
+    "telegram": 4000,
+    "ntfy": 3800,
+    "bark": 3600,
+    "slack": 4000,
+}
+
+# 固定报告时间，保证多次运行的渲染结果一致
+_FIXED_NOW = datetime(2025, 1, 1, 23, 30, tzinfo=pytz.timezone("Asia/Shanghai"))
+
+
+def _timeit(func: Callable[[], object], repeat: int) -> Dict:
+    """
+    重复执行函数并统计耗时
+
+    Args:
+        func: 无参函数
+        repeat: 重复次数
+
+    Returns:
+        耗时统计（毫秒）
+    """
+    samples = []
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "runs": len(samples),
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "mean_ms": round(statistics.mean(samples), 3),
+    }
+
+
+def _to_title_data(new_titles: Dict) -> Dict:
+    """将 detect_new_titles 返回的 NewsItem 转换为 count_word_frequency 使用的字典形态"""
+    return {
+        source_id: {
+            title: {
+                "ranks": [item.rank],
+                "url": item.url or "",
+                "mobileUrl": item.mobile_url or "",
+            }
+            for title, item in titles.items()
+        }
+        for source_id, titles in new_titles.items()
+    }
+
+
+def run(
+    platforms: int,
+    titles_per_crawl: int,
+    crawls_per_day: int,
+    word_groups: int,
+    repeat: int,
+    formats: Optional[List[str]] = None,
+) -> Dict:
+    """
+    运行全流程基准测试
+
+    Args:
+        platforms: 平台数量
+        titles_per_crawl: 每个平台每次抓取的标题数
+        crawls_per_day: 每天抓取次数
+        word_groups: 频率词词组数量
+        repeat: 读取/分析/渲染阶段的重复次数
+        formats: 参与分批测试的 format_type 列表（默认全部）
+
+    Returns:
+        测试结果字典
+    """
+    date = "2025-01-01"
+    batches = generate_day(
+        date=date,
+        platforms=platforms,
+        titles_per_crawl=titles_per_crawl,
+        crawls_per_day=crawls_per_day,
+    )
+    latest = batches[-1]
+    platform_ids = list(latest.id_to_name.keys())
+    stages: Dict[str, Dict] = {}
+
+    with tempfile.TemporaryDirectory(prefix="trendradar-bench-") as tmp_dir:
+        storage = LocalStorageBackend(
+            data_dir=tmp_dir, enable_txt=False, enable_html=False
+        )
+
+        frequency_path = Path(tmp_dir) / "frequency_words.txt"
+        frequency_path.write_text(make_frequency_words(word_groups), encoding="utf-8")
+        groups, filter_words, global_filters = load_frequency_words(str(frequency_path))
+
+        try:
+            # 存储：逐批次写入（每批只执行一次，批次间存在依赖）
+            save_samples = []
+            for batch in batches:
+                start = time.perf_counter()
+                storage.save_news_data(batch)
+                save_samples.append((time.perf_counter() - start) * 1000)
+            stages["save_news_data"] = {
+                "runs": len(save_samples),
+                "total_ms": round(sum(save_samples), 3),
+                "mean_ms": round(statistics.mean(save_samples), 3),
+                "last_ms": round(save_samples[-1], 3),
+            }
+
+            stages["get_today_all_data"] = _timeit(
+                lambda: storage.get_today_all_data(date), repeat
+            )
+            stages["detect_new_titles"] = _timeit(
+                lambda: storage.detect_new_titles(latest), repeat
+            )
+
+            all_data = storage.get_today_all_data(date)
+            new_titles = _to_title_data(storage.detect_new_titles(latest))
+        finally:
+            storage.cleanup()
+
+    results, id_to_name, title_info = news_data_to_result_views(all_data, platform_ids)
+    total_items = sum(len(titles) for titles in results.values())
+
+    def analyze():
+        return count_word_frequency(
+            results=results,
+            word_groups=groups,
+            filter_words=filter_words,
+            id_to_name=id_to_name,
+            title_info=title_info,
+            new_titles=new_titles,
+            mode="daily",
+            global_filters=global_filters,
+            is_first_crawl_func=lambda: False,
+            quiet=True,
+        )
+
+    stages["count_word_frequency"] = _timeit(analyze, repeat)
+    stats, total_titles = analyze()
+
+    report_data = prepare_report_data(
+        stats=stats,
+        failed_ids=[],
+        new_titles=new_titles,
+        id_to_name=id_to_name,
+        mode="daily",
+        matches_word_groups_func=matches_word_groups,
+        load_frequency_words_func=lambda: (groups, filter_words, global_filters),
+    )
+
+    html_holder: Dict[str, str] = {}
+
+    def render():
+        html_holder["html"] = render_html_content(
+            report_data,
+            total_titles,
+            mode="daily",
+            get_time_func=lambda: _FIXED_NOW,
+        )
+
+    stages["render_html_content"] = _timeit(render, repeat)
+    stages["render_html_content"]["output_bytes"] = len(html_holder["html"].encode("utf-8"))
+
+    split_results: Dict[str, Dict] = {}
+    for format_type in formats or list(FORMAT_BATCH_SIZES):
+        max_bytes = FORMAT_BATCH_SIZES[format_type] - get_max_batch_header_size(format_type)
+        output: List[str] = []
+
+        def split(format_type=format_type, max_bytes=max_bytes):
+            output[:] = split_content_into_batches(
+                report_data,
+                format_type,
+                max_bytes=max_bytes,
+                mode="daily",
+                get_time_func=lambda: _FIXED_NOW,
+            )
+
+        split_results[format_type] = _timeit(split, repeat)
+        split_results[format_type]["batches"] = len(output)
+        split_results[format_type]["output_bytes"] = sum(
+            len(batch.encode("utf-8")) for batch in output
+        )
+    stages["split_content_into_batches"] = split_results
+
+    return {
+        "benchmark": "pipeline",
+        "params": {
+            "platforms": platforms,
+            "titles_per_crawl": titles_per_crawl,
+            "crawls_per_day": crawls_per_day,
+            "word_groups": word_groups,
+            "repeat": repeat,
+        },
+        "dataset": {
+            "unique_titles": total_items,
+            "total_titles": total_titles,
+            "matched_titles": sum(stat["count"] for stat in stats),
+            "new_titles": sum(len(titles) for titles in new_titles.values()),
+            "stat_groups": len(stats),
+        },
+        "stages": stages,
+    }
+
+
+def _flatten_timings(result: Dict) -> Dict[str, float]:
+    """提取各阶段的代表耗时（中位数，存储阶段取总耗时），用于对比"""
+    timings = {}
+    for name, stage in result.get("stages", {}).items():
+        if name == "split_content_into_batches":
+            for format_type, split_stage in stage.items():
+                timings[f"{name}[{format_type}]"] = split_stage["median_ms"]
+        elif "median_ms" in stage:
+            timings[name] = stage["median_ms"]
+        elif "total_ms" in stage:
+            timings[name] = stage["total_ms"]
+    return timings
+
+
+def compare(baseline: Dict, current: Dict) -> Dict[str, Dict]:
+    """
+    对比两次运行结果
+
+    Args:
+        baseline: 基准结果（旧提交）
+        current: 当前结果（新提交）
+
+    Returns:
+        {阶段名: {"baseline_ms", "current_ms", "ratio"}}，ratio > 1 表示变慢
+    """
+    old_timings = _flatten_timings(baseline)
+    new_timings = _flatten_timings(current)
+    diff = {}
+    for name, new_ms in new_timings.items():
+        old_ms = old_timings.get(name)
+        if old_ms is None:
+            continue
+        diff[name] = {
+            "baseline_ms": old_ms,
+            "current_ms": new_ms,
+            "ratio": round(new_ms / old_ms, 3) if old_ms else None,
+        }
+    return diff
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TrendRadar 全流程基准测试")
+    parser.add_argument("--platforms", type=int, default=11, help="平台数量")
+    parser.add_argument("--titles", type=int, default=50, help="每个平台每次抓取的标题数")
+    parser.add_argument("--crawls", type=int, default=48, help="每天抓取次数")
+    parser.add_argument("--groups", type=int, default=20, help="频率词词组数量")
+    parser.add_argument("--repeat", type=int, default=5, help="各阶段重复次数")
+    parser.add_argument(
+        "--formats", nargs="*", choices=list(FORMAT_BATCH_SIZES), help="分批测试的 format_type"
+    )
+    parser.add_argument("--json", action="store_true", help="以 JSON 格式输出到标准输出")
+    parser.add_argument("--output", help="将 JSON 结果写入文件")
+    parser.add_argument("--compare", help="与指定 JSON 结果文件对比")
+    args = parser.parse_args()
+
+    # JSON 输出模式下将流程日志转到标准错误，保证标准输出可直接解析
+    log_target = sys.stderr if args.json else sys.stdout
+    with contextlib.redirect_stdout(log_target):
+        result = run(args.platforms, args.titles, args.crawls, args.groups, args.repeat, args.formats)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            result["compare"] = compare(json.load(f), result)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+
+    params = result["params"]
+    dataset = result["dataset"]
+    print(
+        f"合成数据: {params['platforms']} 平台 × {params['titles_per_crawl']} 条 × "
+        f"{params['crawls_per_day']} 次抓取，{dataset['unique_titles']} 条去重标题，"
+        f"{dataset['matched_titles']} 条命中"
+    )
+    for name, ms in _flatten_timings(result).items():
+        line = f"  {name:<40} {ms:>10.2f} ms"
+        if "compare" in result and name in result["compare"]:
+            ratio = result["compare"][name]["ratio"]
+            if ratio is not None:
+                line += f"  (×{ratio:.2f})"
+        print(line)
+    if args.output:
+        print(f"结果已写入: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+# coding=utf-8
+"""
+跨日期搜索基准测试（倒排索引）
+
+在临时项目目录中用合成数据生成多天的 output/news/{date}.db，对 MCP 工具中
+逐日读取并匹配标题的查询分别计时：
+- search_news_by_keyword: DataService 关键词搜索
+- search_news_unified: 统一搜索（keyword / entity 模式）
+- search_related_news_history: 历史相关新闻检索
+- collect_period_data: 带话题的时期数据收集（compare_periods）
+
+每个查询依次运行：不使用索引（逐日读取）、首次使用索引（包含增量建索引）、
+再次使用索引，并校验三者结果完全一致。每次运行前清空全局缓存。
+
+运行方式:
+    python -m benchmarks.bench_search
+    python -m benchmarks.bench_search --days 90 --crawls 4 --json
+"""
+
+import argparse
+import contextlib
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict
+
+from trendradar.storage.local import LocalStorageBackend
+
+from mcp_server.services.cache_service import get_cache
+from mcp_server.tools.analytics import AnalyticsTools
+from mcp_server.tools.search_tools import SearchTools
+
+from benchmarks.synthetic import generate_day
+
+
+def _populate(project_root: Path, days: int, crawls_per_day: int) -> datetime:
+    """生成截至昨天的多天数据，返回开始日期"""
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    start = today - timedelta(days=days)
+    storage = LocalStorageBackend(
+        data_dir=str(project_root / "output"), enable_txt=False, enable_html=False
+    )
+    try:
+        for offset in range(days):
+            date = (start + timedelta(days=offset)).strftime("%Y-%m-%d")
+            for batch in generate_day(date=date, crawls_per_day=crawls_per_day, seed=offset):
+                storage.save_news_data(batch)
+    finally:
+        storage.cleanup()
+    return start
+
+
+def _measure(func: Callable[[], object]) -> Dict:
+    """清空缓存后运行一次查询"""
+    get_cache().clear()
+    start = time.perf_counter()
+    result = func()
+    return {"ms": (time.perf_counter() - start) * 1000, "result": result}
+
+
+def run(days: int, crawls_per_day: int, query: str, reference_title: str) -> Dict:
+    """
+    运行跨日期搜索基准测试
+
+    Args:
+        days: 数据天数（截至昨天）
+        crawls_per_day: 合成数据每天抓取次数
+        query: 关键词 / 实体 / 话题
+        reference_title: 历史相关新闻检索的参考标题
+
+    Returns:
+        测试结果字典
+    """
+    with tempfile.TemporaryDirectory(prefix="trendradar-search-") as tmp_dir:
+        project_root = Path(tmp_dir)
+        start_date = _populate(project_root, days, crawls_per_day)
+        end_date = start_date + timedelta(days=days - 1)
+        date_range = {"start": start_date.strftime("%Y-%m-%d"), "end": end_date.strftime("%Y-%m-%d")}
+
+        search = SearchTools(str(project_root))
+        analytics = AnalyticsTools(str(project_root))
+        search_index = search.data_service.search_index
+
+        queries = {
+            "search_news_by_keyword": lambda: search.data_service.search_news_by_keyword(
+                query, (start_date, end_date)
+            ),
+            "search_news_unified_keyword": lambda: search.search_news_unified(
+                query, "keyword", date_range=date_range, limit=100
+            ),
+            "search_news_unified_entity": lambda: search.search_news_unified(
+                query, "entity", date_range=date_range, platforms=["weibo", "zhihu"], limit=100
+            ),
+            "search_related_news_history": lambda: search.search_related_news_history(
+                reference_title, time_preset="custom", start_date=start_date, end_date=end_date, limit=100
+            ),
+            "collect_period_data": lambda: analytics._collect_period_data(
+                (start_date, end_date), None, query
+            )["news"],
+        }
+
+        results: Dict[str, Dict] = {}
+        try:
+            for name, func in queries.items():
+                search.data_service.search_index = None
+                analytics.data_service.search_index = None
+                scan = _measure(func)
+
+                search.data_service.search_index = search_index
+                analytics.data_service.search_index = search_index
+                # 首次查询：未索引的日期交给后台建索引，本次退回逐日读取
+                cold = _measure(func)
+                search_index.wait_idle()
+                warm = _measure(func)
+
+                results[name] = {
+                    "scan_ms": round(scan["ms"], 3),
+                    "index_cold_ms": round(cold["ms"], 3),
+                    "index_warm_ms": round(warm["ms"], 3),
+                    "identical": scan["result"] == cold["result"] == warm["result"],
+                }
+            index_stats = search_index.get_stats()
+        finally:
+            search_index.close()
+
+    return {
+        "benchmark": "cross_day_search",
+        "params": {
+            "days": days,
+            "crawls_per_day": crawls_per_day,
+            "query": query,
+            "reference_title": reference_title,
+        },
+        "index": index_stats,
+        "queries": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="跨日期搜索基准测试")
+    parser.add_argument("--days", type=int, default=30, help="数据天数")
+    parser.add_argument("--crawls", type=int, default=4, help="合成数据每天抓取次数")
+    parser.add_argument("--query", default="特斯拉", help="关键词 / 实体 / 话题")
+    parser.add_argument("--reference", default="特斯拉发布自动驾驶", help="历史相关新闻检索的参考标题")
+    parser.add_argument("--json", action="store_true", help="以 JSON 格式输出到标准输出")
+    parser.add_argument("--output", help="将 JSON 结果写入文件")
+    args = parser.parse_args()
+
+    log_target = sys.stderr if args.json else sys.stdout
+    with contextlib.redirect_stdout(log_target):
+        result = run(args.days, args.crawls, args.query, args.reference)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        index = result["index"]
+        print(f"索引 {index['days']} 天 / {index['titles']} 条标题，{index['size_bytes'] / 1024 / 1024:.1f} MB")
+        for name, stats in result["queries"].items():
+            print(
+                f"  {name:<30} 逐日 {stats['scan_ms']:>9.1f} ms  "
+                f"首次 {stats['index_cold_ms']:>9.1f} ms  "
+                f"索引 {stats['index_warm_ms']:>8.1f} ms  "
+                f"{'一致' if stats['identical'] else '不一致'}"
+            )
+
+    if not all(stats["identical"] for stats in result["queries"].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
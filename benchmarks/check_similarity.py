@@ -0,0 +1,249 @@
+# coding=utf-8
+"""
+近似重复索引召回率校验
+
+用合成数据对比 MCP 分析工具中两处相似度计算的逐一比较结果与工具实际采用的方式
+（阈值不低于 MIN_INDEX_THRESHOLD 时使用索引候选，否则逐一比较）：
+- find_similar_news：抽样参考标题，统计 SequenceMatcher 相似度达到阈值的标题中
+  被工具找到的比例（召回率），并给出索引候选本身的召回率和候选数量占比
+- aggregate_news：分别以逐一比较和工具方式执行 _aggregate_similar_news，
+  统计聚合组数、与逐一比较完全一致的聚合组比例以及耗时
+
+默认覆盖两个工具接受的最低阈值（find_similar_news 0.0、aggregate_news 0.3）、默认阈值
+和索引下限。工具方式的召回率或一致组比例低于 --min-recall 时以非零状态退出。
+
+运行方式:
+    python -m benchmarks.check_similarity
+    python -m benchmarks.check_similarity --similar-thresholds 0.0,0.5,0.7 --aggregate-thresholds 0.3,0.7
+    python -m benchmarks.check_similarity --crawls 24 --samples 300 --json
+"""
+
+import argparse
+import contextlib
+import json
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+from typing import Dict, List, Tuple
+
+from trendradar.storage.base import news_data_to_result_views
+
+from mcp_server.services.similarity_index import SimilarityIndex, use_similarity_index
+from mcp_server.tools.analytics import AnalyticsTools, calculate_news_weight
+
+from benchmarks.synthetic import generate_day, merge_day
+
+
+_DATE = "2025-01-01"
+
+
+def _build_day(crawls_per_day: int, seed: int) -> Tuple[Dict, Dict]:
+    """生成与 read_all_titles_for_date 形态一致的当日标题数据"""
+    batches = generate_day(date=_DATE, crawls_per_day=crawls_per_day, seed=seed)
+    all_titles, id_to_name, _ = news_data_to_result_views(merge_day(batches))
+    return all_titles, id_to_name
+
+
+def _build_news_list(all_titles: Dict, id_to_name: Dict) -> List[Dict]:
+    """按 aggregate_news 的方式生成新闻列表"""
+    news_list = []
+    for platform_id, titles in all_titles.items():
+        for title, info in titles.items():
+            ranks = info.get("ranks", [])
+            news_item = {
+                "title": title,
+                "platform": platform_id,
+                "platform_name": id_to_name.get(platform_id, platform_id),
+                "date": _DATE,
+                "ranks": ranks,
+                "count": len(ranks),
+                "rank": ranks[0] if ranks else 999,
+            }
+            news_item["weight"] = calculate_news_weight(news_item)
+            news_list.append(news_item)
+    return news_list
+
+
+def check_find_similar(index: SimilarityIndex, titles: List[str], samples: int, threshold: float, seed: int) -> Dict:
+    """对比参考标题的逐一比较结果与工具方式（索引候选或逐一比较）的结果"""
+    rng = random.Random(seed)
+    references = rng.sample(titles, min(samples, len(titles)))
+    uses_index = use_similarity_index(threshold)
+
+    expected = found = index_found = candidates_total = 0
+    exact_time = indexed_time = 0.0
+    for reference in references:
+        start = time.perf_counter()
+        matches = {
+            title for title in titles
+            if title != reference and SequenceMatcher(None, reference, title).ratio() >= threshold
+        }
+        exact_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        candidates = index.query(reference)
+        indexed = {
+            title for title in candidates
+            if SequenceMatcher(None, reference, title).ratio() >= threshold
+        }
+        indexed_time += time.perf_counter() - start
+
+        expected += len(matches)
+        index_found += len(matches & indexed)
+        found += len(matches & indexed) if uses_index else len(matches)
+        candidates_total += len(candidates)
+
+    return {
+        "threshold": threshold,
+        "uses_index": uses_index,
+        "references": len(references),
+        "expected_matches": expected,
+        "recall": round(found / expected, 4) if expected else 1.0,
+        "index_recall": round(index_found / expected, 4) if expected else 1.0,
+        "candidate_ratio": round(candidates_total / (len(references) * len(titles)), 4),
+        "exact_ms": round(exact_time * 1000, 3),
+        "indexed_ms": round(indexed_time * 1000, 3),
+    }
+
+
+def check_aggregate(tools: AnalyticsTools, news_list: List[Dict], index: SimilarityIndex, threshold: float) -> Dict:
+    """对比 _aggregate_similar_news 逐一比较与工具方式（传入索引，由阈值决定是否使用）的聚合结果"""
+    start = time.perf_counter()
+    exact = tools._aggregate_similar_news(news_list, threshold, False)
+    exact_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = tools._aggregate_similar_news(news_list, threshold, False, {_DATE: index})
+    indexed_time = time.perf_counter() - start
+
+    def group_key(group: Dict) -> str:
+        return json.dumps([group["representative_title"], group["sources"]], ensure_ascii=False)
+
+    exact_keys = {group_key(group) for group in exact}
+    identical = sum(1 for group in indexed if group_key(group) in exact_keys)
+
+    # 逐一比较时被合并的新闻数中，索引候选同样合并的比例
+    exact_merged = sum(len(group["sources"]) - 1 for group in exact)
+    indexed_merged = sum(len(group["sources"]) - 1 for group in indexed)
+
+    return {
+        "threshold": threshold,
+        "uses_index": use_similarity_index(threshold),
+        "news": len(news_list),
+        "exact_groups": len(exact),
+        "indexed_groups": len(indexed),
+        "identical_groups": round(identical / len(exact), 4) if exact else 1.0,
+        "merge_recall": round(indexed_merged / exact_merged, 4) if exact_merged else 1.0,
+        "exact_ms": round(exact_time * 1000, 3),
+        "indexed_ms": round(indexed_time * 1000, 3),
+    }
+
+
+def run(
+    crawls_per_day: int,
+    samples: int,
+    similar_thresholds: List[float],
+    aggregate_thresholds: List[float],
+    seed: int,
+) -> Dict:
+    """
+    运行召回率校验
+
+    Args:
+        crawls_per_day: 合成数据每天抓取次数
+        samples: find_similar_news 抽样的参考标题数
+        similar_thresholds: find_similar_news 相似度阈值列表
+        aggregate_thresholds: aggregate_news 相似度阈值列表
+        seed: 随机种子
+
+    Returns:
+        校验结果字典
+    """
+    all_titles, id_to_name = _build_day(crawls_per_day, seed)
+    titles = sorted({title for platform_titles in all_titles.values() for title in platform_titles})
+
+    start = time.perf_counter()
+    index = SimilarityIndex(titles)
+    build_time = time.perf_counter() - start
+
+    news_list = _build_news_list(all_titles, id_to_name)
+    tools = AnalyticsTools()
+
+    return {
+        "benchmark": "similarity_index",
+        "params": {
+            "crawls_per_day": crawls_per_day,
+            "samples": samples,
+            "seed": seed,
+        },
+        "dataset": {"titles": len(titles), "news": len(news_list)},
+        "index_build_ms": round(build_time * 1000, 3),
+        "find_similar": [
+            check_find_similar(index, titles, samples, threshold, seed) for threshold in similar_thresholds
+        ],
+        "aggregate": [
+            check_aggregate(tools, news_list, index, threshold) for threshold in aggregate_thresholds
+        ],
+    }
+
+
+def _parse_thresholds(value: str) -> List[float]:
+    """解析逗号分隔的阈值列表"""
+    return [float(item) for item in value.split(",") if item.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="近似重复索引召回率校验")
+    parser.add_argument("--crawls", type=int, default=6, help="合成数据每天抓取次数")
+    parser.add_argument("--samples", type=int, default=200, help="find_similar_news 抽样参考标题数")
+    parser.add_argument(
+        "--similar-thresholds", type=_parse_thresholds, default=[0.0, 0.6, 0.7],
+        help="find_similar_news 相似度阈值（逗号分隔，默认覆盖最低值 0.0、默认值 0.6 和索引下限）"
+    )
+    parser.add_argument(
+        "--aggregate-thresholds", type=_parse_thresholds, default=[0.3, 0.7],
+        help="aggregate_news 相似度阈值（逗号分隔，默认覆盖最低值 0.3 和默认值 0.7）"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    parser.add_argument("--min-recall", type=float, default=0.95, help="召回率下限，低于该值时返回非零状态")
+    parser.add_argument("--json", action="store_true", help="以 JSON 格式输出到标准输出")
+    args = parser.parse_args()
+
+    log_target = sys.stderr if args.json else sys.stdout
+    with contextlib.redirect_stdout(log_target):
+        result = run(args.crawls, args.samples, args.similar_thresholds, args.aggregate_thresholds, args.seed)
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print(
+            f"标题 {result['dataset']['titles']} 条，新闻 {result['dataset']['news']} 条，"
+            f"建索引 {result['index_build_ms']:.1f} ms"
+        )
+        for similar in result["find_similar"]:
+            print(
+                f"find_similar  阈值 {similar['threshold']}（{'索引' if similar['uses_index'] else '逐一'}）: "
+                f"召回率 {similar['recall']:.2%}  索引候选召回率 {similar['index_recall']:.2%}  "
+                f"候选占比 {similar['candidate_ratio']:.2%}  "
+                f"逐一 {similar['exact_ms']:.1f} ms / 索引 {similar['indexed_ms']:.1f} ms"
+            )
+        for aggregate in result["aggregate"]:
+            print(
+                f"aggregate     阈值 {aggregate['threshold']}（{'索引' if aggregate['uses_index'] else '逐一'}）: "
+                f"合并召回率 {aggregate['merge_recall']:.2%}  "
+                f"一致组 {aggregate['identical_groups']:.2%}  "
+                f"组数 {aggregate['exact_groups']} / {aggregate['indexed_groups']}  "
+                f"逐一 {aggregate['exact_ms']:.1f} ms / 工具 {aggregate['indexed_ms']:.1f} ms"
+            )
+
+    worst = min(
+        [similar["recall"] for similar in result["find_similar"]]
+        + [min(aggregate["merge_recall"], aggregate["identical_groups"]) for aggregate in result["aggregate"]]
+    )
+    if worst < args.min_recall:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
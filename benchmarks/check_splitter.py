@@ -0,0 +1,247 @@
+# coding=utf-8
+"""
+消息分批结果一致性校验（golden 文件）
+
+用合成数据生成覆盖各 format_type、报告模式、批次大小以及
+RSS/独立展示区/AI 分析/反转顺序等组合的用例集，记录 split_content_into_batches
+每个用例输出的 SHA-256 摘要，与仓库中的 golden 文件比对，确保输出逐字节一致。
+
+benchmarks/golden/splitter.golden.json 由基线版本（87c85d2）的 splitter.py 生成：
+改动分批逻辑后直接运行 --check 即可；有意修改输出格式时再用 --record 重新生成并一并提交。
+
+运行方式:
+    python -m benchmarks.check_splitter
+    python -m benchmarks.check_splitter --check /tmp/other.golden.json
+    python -m benchmarks.check_splitter --record benchmarks/golden/splitter.golden.json
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from trendradar.core.analyzer import count_word_frequency
+from trendradar.core.frequency import load_frequency_words, matches_word_groups
+from trendradar.notification.splitter import split_content_into_batches
+from trendradar.report.generator import prepare_report_data
+from trendradar.storage.base import news_data_to_result_views
+
+from benchmarks.synthetic import generate_day, make_frequency_words, merge_day
+
+
+FORMAT_TYPES = ["feishu", "dingtalk", "wework", "telegram", "ntfy", "bark", "slack", "other"]
+MAX_BYTES_VARIANTS = [None, 600, 1500, 4000]
+
+# 仓库内的 golden 文件（基线 splitter 的输出摘要）
+GOLDEN_PATH = Path(__file__).resolve().parent / "golden" / "splitter.golden.json"
+
+_FIXED_NOW = datetime(2025, 1, 1, 12, 0, 0)
+
+_AI_CONTENT = "## AI 分析\n\n" + "\n".join(
+    f"- 要点 {i}：人工智能对{i}行业的影响持续扩大" for i in range(40)
+)
+
+
+def _build_reports() -> Dict[str, Tuple[Dict, str]]:
+    """生成不同规模、不同模式的报告数据"""
+    reports = {}
+    for crawls, groups, seed in [(6, 20, 0), (24, 40, 1), (2, 5, 2)]:
+        batches = generate_day(crawls_per_day=crawls, seed=seed)
+        results, id_to_name, title_info = news_data_to_result_views(merge_day(batches))
+
+        with tempfile.TemporaryDirectory(prefix="trendradar-golden-") as tmp_dir:
+            frequency_path = Path(tmp_dir) / "frequency_words.txt"
+            frequency_path.write_text(make_frequency_words(groups, seed=seed), encoding="utf-8")
+            word_groups, filter_words, global_filters = load_frequency_words(str(frequency_path))
+
+        new_titles: Dict[str, Dict] = {}
+        for source_id, items in batches[-1].items.items():
+            for item in items[:7]:
+                new_titles.setdefault(source_id, {})[item.title] = {
+                    "ranks": [item.rank],
+                    "url": item.url,
+                    "mobileUrl": "",
+                }
+
+        for mode in ("daily", "current", "incremental"):
+            stats, _ = count_word_frequency(
+                results, word_groups, filter_words, id_to_name, title_info,
+                new_titles=new_titles,
+                mode=mode,
+                global_filters=global_filters,
+                is_first_crawl_func=lambda: False,
+                quiet=True,
+            )
+            report_data = prepare_report_data(
+                stats,
+                ["failed-platform", "other-platform"] if seed == 1 else [],
+                new_titles,
+                id_to_name,
+                mode,
+                matches_word_groups_func=matches_word_groups,
+                load_frequency_words_func=lambda: (word_groups, filter_words, global_filters),
+            )
+            reports[f"c{crawls}_s{seed}_{mode}"] = (report_data, mode)
+
+    reports["empty"] = (
+        {"stats": [], "new_titles": [], "failed_ids": [], "total_new_count": 0},
+        "daily",
+    )
+    return reports
+
+
+def _rss_stats() -> List[Dict]:
+    """生成 RSS 统计条目（格式与热榜 stats 一致）"""
+    stats = []
+    for w in range(3):
+        titles = [
+            {
+                "title": f"RSS 标题 {w}-{i} 人工智能",
+                "source_name": f"Feed{i % 2}",
+                "time_display": "10:00",
+                "count": 1 + i % 2,
+                "ranks": [],
+                "rank_threshold": 5,
+                "url": f"https://rss.example.com/{w}/{i}",
+                "mobile_url": "",
+                "is_new": i % 3 == 0,
+            }
+            for i in range(6)
+        ]
+        stats.append({"word": f"RSS词{w}", "count": len(titles), "titles": titles})
+    return stats
+
+
+def _standalone_data() -> Dict:
+    """生成独立展示区数据"""
+    return {
+        "platforms": [
+            {
+                "id": "zhihu",
+                "name": "知乎",
+                "items": [
+                    {
+                        "title": f"知乎热榜 {i}",
+                        "url": f"https://zhihu.example.com/{i}" if i % 3 else "",
+                        "rank": i + 1,
+                        "ranks": [i + 1, i + 2],
+                        "first_time": "08-00",
+                        "last_time": "10-30" if i % 2 else "08-00",
+                        "count": 1 + i % 3,
+                    }
+                    for i in range(12)
+                ],
+            },
+            {"id": "empty", "name": "空平台", "items": []},
+        ],
+        "rss_feeds": [
+            {
+                "id": "hacker-news",
+                "name": "Hacker News",
+                "items": [
+                    {
+                        "title": f"HN story {i}",
+                        "url": f"https://hn.example.com/{i}",
+                        "published_at": "2025-01-01T08:00:00+00:00",
+                        "author": "pg" if i % 2 else "",
+                    }
+                    for i in range(9)
+                ],
+            }
+        ],
+    }
+
+
+def iter_cases() -> Iterator[Tuple[str, Dict]]:
+    """
+    生成全部校验用例
+
+    Yields:
+        (用例名, split_content_into_batches 关键字参数)
+    """
+    reports = _build_reports()
+    for (name, (report_data, mode)), format_type in itertools.product(reports.items(), FORMAT_TYPES):
+        for max_bytes in MAX_BYTES_VARIANTS:
+            for variant in range(4):
+                kwargs = dict(
+                    report_data=report_data,
+                    format_type=format_type,
+                    max_bytes=max_bytes,
+                    mode=mode,
+                    get_time_func=lambda: _FIXED_NOW,
+                )
+                if variant >= 1:
+                    kwargs.update(
+                        rss_items=_rss_stats(),
+                        rss_new_items=_rss_stats()[:2],
+                        update_info={"remote_version": "9.9.9", "current_version": "1.0.0"},
+                    )
+                if variant >= 2:
+                    kwargs.update(
+                        standalone_data=_standalone_data(),
+                        ai_content=_AI_CONTENT,
+                        ai_stats={"analyzed_news": 12},
+                        display_mode="platform",
+                    )
+                if variant == 3:
+                    kwargs.update(reverse_content_order=True, feishu_separator="━━━")
+                yield f"{name}|{format_type}|{max_bytes}|{variant}", kwargs
+
+
+def digest_all() -> Dict[str, str]:
+    """计算全部用例输出的摘要"""
+    digests = {}
+    for name, kwargs in iter_cases():
+        batches = split_content_into_batches(**kwargs)
+        hasher = hashlib.sha256()
+        for batch in batches:
+            hasher.update(batch.encode("utf-8"))
+            hasher.update(b"\x00")
+        digests[name] = f"{len(batches)}:{hasher.hexdigest()}"
+    return digests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="消息分批结果一致性校验")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--record", help="记录 golden 文件")
+    group.add_argument(
+        "--check", nargs="?", const=str(GOLDEN_PATH), default=str(GOLDEN_PATH),
+        help="与 golden 文件比对（默认 benchmarks/golden/splitter.golden.json）",
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    digests = digest_all()
+    elapsed = time.perf_counter() - start
+
+    if args.record:
+        with open(args.record, "w", encoding="utf-8") as f:
+            json.dump(digests, f, ensure_ascii=False, indent=1, sort_keys=True)
+        print(f"已记录 {len(digests)} 个用例（{elapsed:.2f}s）: {args.record}")
+        return
+
+    with open(args.check, "r", encoding="utf-8") as f:
+        golden = json.load(f)
+
+    mismatched = [name for name, value in golden.items() if digests.get(name) != value]
+    missing = [name for name in digests if name not in golden]
+    if mismatched:
+        print(f"❌ {len(mismatched)}/{len(golden)} 个用例输出不一致:")
+        for name in mismatched[:20]:
+            print(f"  {name}")
+        sys.exit(1)
+
+    print(f"✅ {len(golden)} 个用例输出一致（{elapsed:.2f}s）")
+    if missing:
+        print(f"  另有 {len(missing)} 个新用例不在 golden 文件中")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+# coding=utf-8
+"""
+本地 SMTP 替身服务器与邮件发送校验
+
+SMTPStandIn 是一个最小化的明文 SMTP 服务器（EHLO / AUTH PLAIN / AUTH LOGIN /
+MAIL / RCPT / DATA / RSET / NOOP / QUIT），记录连接数、登录次数和收到的邮件，
+用于在离线环境下验证 send_to_email 与 SMTPTransport 的行为。
+
+校验内容：模拟一次运行中热榜报告、RSS 报告和重复报告共 3 封邮件，
+对比每封邮件单独建立连接与复用 SMTPTransport 时的连接/登录次数与耗时，
+并检查收到的邮件可被正确解析、HTML 内容完整。
+
+运行方式:
+    python -m benchmarks.smtp_standin
+    python -m benchmarks.smtp_standin --html-kb 2048 --json
+"""
+
+import argparse
+import base64
+import contextlib
+import email
+import json
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from email import policy
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from trendradar.notification.mailer import SMTPTransport
+from trendradar.notification.senders import send_to_email
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """单个 SMTP 连接的处理器"""
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode("ascii"))
+        self.wfile.flush()
+
+    def handle(self) -> None:
+        server: "SMTPStandIn" = self.server.standin
+        server._record("connections")
+        self._reply("220 trendradar-standin ESMTP")
+
+        mail_from = ""
+        recipients: List[str] = []
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+            line = raw.decode("utf-8", "replace").rstrip("\r\n")
+            command = line[:4].upper()
+
+            if command in ("EHLO", "HELO"):
+                self.wfile.write(
+                    b"250-trendradar-standin\r\n250-AUTH PLAIN LOGIN\r\n250 8BITMIME\r\n"
+                )
+                self.wfile.flush()
+            elif command == "AUTH":
+                parts = line.split()
+                if parts[1].upper() == "LOGIN":
+                    self._reply("334 " + base64.b64encode(b"Username:").decode())
+                    self.rfile.readline()
+                    self._reply("334 " + base64.b64encode(b"Password:").decode())
+                    self.rfile.readline()
+                elif len(parts) < 3:
+                    self._reply("334 ")
+                    self.rfile.readline()
+                server._record("logins")
+                self._reply("235 2.7.0 Authentication successful")
+            elif command == "MAIL":
+                mail_from = line.split(":", 1)[1].strip()
+                recipients = []
+                self._reply("250 OK")
+            elif command == "RCPT":
+                recipients.append(line.split(":", 1)[1].strip())
+                self._reply("250 OK")
+            elif command == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                chunks = []
+                while True:
+                    data_line = self.rfile.readline()
+                    if not data_line or data_line == b".\r\n":
+                        break
+                    if data_line.startswith(b".."):
+                        data_line = data_line[1:]
+                    chunks.append(data_line)
+                server._store(mail_from, recipients, b"".join(chunks))
+                self._reply("250 OK queued")
+            elif command in ("RSET", "NOOP"):
+                self._reply("250 OK")
+            elif command == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+
+class _ThreadingTCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class SMTPStandIn:
+    """
+    本地 SMTP 替身服务器
+
+    使用示例:
+        with SMTPStandIn() as smtp:
+            transport = SMTPTransport("a@b.c", "pw", smtp.host, smtp.port, use_tls=None)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._server = _ThreadingTCPServer((host, port), _SMTPHandler)
+        self._server.standin = self
+        self.host, self.port = self._server.server_address[:2]
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {"connections": 0, "logins": 0}
+        self.messages: List[Tuple[str, List[str], bytes]] = []
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def _record(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def _store(self, mail_from: str, recipients: List[str], data: bytes) -> None:
+        with self._lock:
+            self.messages.append((mail_from, list(recipients), data))
+
+    def start(self) -> "SMTPStandIn":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "SMTPStandIn":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def _make_report(path: Path, html_kb: int) -> None:
+    """生成指定大小的 HTML 报告"""
+    row = "<tr><td>人工智能大模型最新进展</td><td>https://example.com/news/0</td></tr>\n"
+    rows = row * max(html_kb * 1024 // len(row.encode("utf-8")), 1)
+    path.write_text(f"<html><body><table>\n{rows}</table></body></html>", encoding="utf-8")
+
+
+def run(html_kb: int) -> Dict:
+    """
+    运行邮件发送校验
+
+    Args:
+        html_kb: HTML 报告大小（KB）
+
+    Returns:
+        测试结果字典
+    """
+    now = datetime(2025, 1, 1, 12, 0)
+    recipients = "a@example.com, b@example.com"
+    results: Dict[str, Dict] = {}
+
+    with tempfile.TemporaryDirectory(prefix="trendradar-smtp-") as tmp_dir:
+        hot_report = Path(tmp_dir) / "hot.html"
+        rss_report = Path(tmp_dir) / "rss.html"
+        _make_report(hot_report, html_kb)
+        _make_report(rss_report, html_kb // 4 or 1)
+        # 热榜报告、RSS 报告、热榜报告重复发送（如同一次运行内的重试）
+        sends = [("当日汇总", hot_report), ("RSS 订阅更新", rss_report), ("当日汇总", hot_report)]
+
+        for mode in ("per_email", "shared_transport"):
+            with SMTPStandIn() as smtp:
+                shared = None
+                if mode == "shared_transport":
+                    shared = SMTPTransport("bot@example.com", "pw", smtp.host, smtp.port, use_tls=None)
+
+                start = time.perf_counter()
+                ok = []
+                for report_type, report in sends:
+                    transport = shared or SMTPTransport(
+                        "bot@example.com", "pw", smtp.host, smtp.port, use_tls=None
+                    )
+                    ok.append(send_to_email(
+                        "bot@example.com", "pw", recipients, report_type, str(report),
+                        get_time_func=lambda: now,
+                        transport=transport,
+                    ))
+                    if shared is None:
+                        transport.close()
+                if shared is not None:
+                    shared.close()
+                elapsed = (time.perf_counter() - start) * 1000
+
+                # 校验收到的邮件：HTML 完整、收件人正确
+                intact = True
+                for (_, rcpts, data), (_, report) in zip(smtp.messages, sends):
+                    parsed = email.message_from_bytes(data, policy=policy.default)
+                    html = parsed.get_body(preferencelist=("html",)).get_content()
+                    intact &= html == report.read_text(encoding="utf-8")
+                    intact &= rcpts == ["<a@example.com>", "<b@example.com>"]
+
+                results[mode] = {
+                    "sent": sum(ok),
+                    "received": len(smtp.messages),
+                    "connections": smtp.stats["connections"],
+                    "logins": smtp.stats["logins"],
+                    "intact": intact,
+                    "elapsed_ms": round(elapsed, 3),
+                }
+
+    return {"benchmark": "smtp_transport", "params": {"html_kb": html_kb}, "results": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SMTP 邮件发送离线校验")
+    parser.add_argument("--html-kb", type=int, default=512, help="HTML 报告大小（KB）")
+    parser.add_argument("--json", action="store_true", help="以 JSON 格式输出")
+    args = parser.parse_args()
+
+    log_target = sys.stderr if args.json else sys.stdout
+    with contextlib.redirect_stdout(log_target):
+        result = run(args.html_kb)
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        for mode, stats in result["results"].items():
+            print(
+                f"  {mode:<18} 发送 {stats['sent']} 封，连接 {stats['connections']} 次，"
+                f"登录 {stats['logins']} 次，内容完整 {stats['intact']}，"
+                f"{stats['elapsed_ms']:.1f} ms"
+            )
+
+    if not all(stats["intact"] and stats["sent"] == stats["received"] for stats in result["results"].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
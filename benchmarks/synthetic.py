@@ -0,0 +1,306 @@
+# coding=utf-8
+"""
+合成数据生成器
+
+生成与真实热榜数据形态一致的合成数据，供基准测试使用：
+- N 个平台，每次抓取 M 条标题，每天 K 次抓取
+- 中文标题（由常见新闻词汇随机拼接）
+- 逼真的 URL 变动：榜单条目逐批替换、排名上下浮动、
+  部分平台 URL 带动态参数（如微博 band_rank）
+"""
+
+import random
+from typing import Dict, List, Optional, Tuple
+
+from trendradar.storage.base import NewsData, NewsItem
+
+
+_SUBJECTS = [
+    "国务院", "央行", "外交部", "教育部", "北京", "上海", "深圳", "杭州", "成都",
+    "华为", "小米", "比亚迪", "腾讯", "阿里巴巴", "字节跳动", "苹果", "特斯拉",
+    "英伟达", "中国队", "国足", "女排", "博物馆", "高铁", "航天员", "科学家",
+    "网友", "专家", "多地", "消费者", "气象台", "证监会", "A股", "港股", "美联储",
+]
+
+_EVENTS = [
+    "发布", "回应", "宣布", "推出", "召开", "启动", "暂停", "上调", "下调", "突破",
+    "曝光", "澄清", "夺冠", "亮相", "签约", "升级", "开放", "整改", "调查", "预警",
+]
+
+_OBJECTS = [
+    "新政策", "人工智能大模型", "新能源汽车", "芯片", "房地产市场", "养老金",
+    "春运安排", "寒潮预警", "暴雨预警", "世界杯预选赛", "新品发布会", "财报",
+    "降息", "国产大飞机", "量子计算", "低空经济", "自动驾驶", "出口数据",
+    "消费券", "考研成绩", "演唱会门票", "航母", "空间站", "文旅项目",
+]
+
+_SUFFIXES = [
+    "", "", "", "引发热议", "最新进展", "官方通报", "背后原因", "现场画面",
+    "网友热评", "专家解读", "持续发酵", "冲上热搜",
+]
+
+# 使用动态 URL 参数的平台（模拟微博 band_rank）
+_DYNAMIC_URL_PLATFORMS = {"weibo"}
+
+DEFAULT_PLATFORMS: List[Tuple[str, str]] = [
+    ("toutiao", "今日头条"),
+    ("baidu", "百度热搜"),
+    ("wallstreetcn-hot", "华尔街见闻"),
+    ("thepaper", "澎湃新闻"),
+    ("bilibili-hot-search", "bilibili 热搜"),
+    ("cls-hot", "财联社热门"),
+    ("ifeng", "凤凰网"),
+    ("tieba", "贴吧"),
+    ("weibo", "微博"),
+    ("douyin", "抖音"),
+    ("zhihu", "知乎"),
+]
+
+
+def make_platforms(count: int) -> List[Tuple[str, str]]:
+    """
+    生成平台列表（前 11 个使用真实平台ID，超出部分自动编号）
+
+    Args:
+        count: 平台数量
+
+    Returns:
+        [(platform_id, platform_name), ...]
+    """
+    platforms = list(DEFAULT_PLATFORMS[:count])
+    for i in range(len(platforms), count):
+        platforms.append((f"platform-{i}", f"平台{i}"))
+    return platforms
+
+
+def make_title(rng: random.Random, serial: int) -> str:
+    """
+    生成一条中文新闻标题
+
+    Args:
+        rng: 随机数生成器
+        serial: 序号（保证标题唯一）
+
+    Returns:
+        标题字符串
+    """
+    title = (
+        rng.choice(_SUBJECTS)
+        + rng.choice(_EVENTS)
+        + rng.choice(_OBJECTS)
+        + rng.choice(_SUFFIXES)
+    )
+    return f"{title}（{serial}）"
+
+
+def _make_url(platform_id: str, serial: int, rank: int) -> str:
+    """生成新闻 URL（部分平台带动态排名参数）"""
+    if platform_id in _DYNAMIC_URL_PLATFORMS:
+        return f"https://s.weibo.com/weibo?q=%23{serial}%23&t=31&band_rank={rank}&Refer=top"
+    return f"https://{platform_id}.example.com/article/{serial}"
+
+
+def generate_day(
+    date: str = "2025-01-01",
+    platforms: int = 11,
+    titles_per_crawl: int = 50,
+    crawls_per_day: int = 24,
+    churn: float = 0.2,
+    seed: Optional[int] = 0,
+) -> List[NewsData]:
+    """
+    生成一天内所有批次的抓取数据
+
+    每个批次在上一批次基础上替换 churn 比例的标题（新上榜），
+    其余标题排名随机浮动，模拟真实榜单的滚动。
+
+    Args:
+        date: 日期（YYYY-MM-DD）
+        platforms: 平台数量
+        titles_per_crawl: 每个平台每次抓取的标题数
+        crawls_per_day: 每天抓取次数
+        churn: 每批次新上榜标题比例（0-1）
+        seed: 随机种子（None 表示不固定）
+
+    Returns:
+        按抓取时间排序的 NewsData 列表
+    """
+    rng = random.Random(seed)
+    platform_list = make_platforms(platforms)
+    id_to_name = dict(platform_list)
+
+    serial = 0
+    boards: Dict[str, List[Tuple[str, int]]] = {}
+    for platform_id, _ in platform_list:
+        board = []
+        for _ in range(titles_per_crawl):
+            serial += 1
+            board.append((make_title(rng, serial), serial))
+        boards[platform_id] = board
+
+    batches = []
+    for crawl_index in range(crawls_per_day):
+        minutes = crawl_index * (24 * 60 // max(crawls_per_day, 1))
+        crawl_time = f"{minutes // 60:02d}-{minutes % 60:02d}"
+
+        items: Dict[str, List[NewsItem]] = {}
+        for platform_id, platform_name in platform_list:
+            board = boards[platform_id]
+
+            if crawl_index > 0:
+                # 替换部分标题（新上榜），其余打乱顺序（排名浮动）
+                replace_count = int(len(board) * churn)
+                for _ in range(replace_count):
+                    serial += 1
+                    board[rng.randrange(len(board))] = (make_title(rng, serial), serial)
+                rng.shuffle(board)
+
+            news_list = []
+            for rank, (title, title_serial) in enumerate(board, 1):
+                news_list.append(NewsItem(
+                    title=title,
+                    source_id=platform_id,
+                    source_name=platform_name,
+                    rank=rank,
+                    url=_make_url(platform_id, title_serial, rank),
+                    mobile_url="",
+                    crawl_time=crawl_time,
+                    ranks=[rank],
+                    first_time=crawl_time,
+                    last_time=crawl_time,
+                    count=1,
+                ))
+            items[platform_id] = news_list
+
+        batches.append(NewsData(
+            date=date,
+            crawl_time=crawl_time,
+            items=items,
+            id_to_name=dict(id_to_name),
+            failed_ids=[],
+        ))
+
+    return batches
+
+
+def merge_day(batches: List[NewsData]) -> NewsData:
+    """
+    将一天的批次合并为当日汇总数据（与 get_today_all_data 返回形态一致）
+
+    Args:
+        batches: generate_day 生成的批次列表
+
+    Returns:
+        合并后的 NewsData
+    """
+    merged: Dict[str, Dict[str, NewsItem]] = {}
+    for batch in batches:
+        for source_id, news_list in batch.items.items():
+            source_items = merged.setdefault(source_id, {})
+            for item in news_list:
+                existing = source_items.get(item.title)
+                if existing is None:
+                    source_items[item.title] = NewsItem(
+                        title=item.title,
+                        source_id=item.source_id,
+                        source_name=item.source_name,
+                        rank=item.rank,
+                        url=item.url,
+                        mobile_url=item.mobile_url,
+                        crawl_time=item.crawl_time,
+                        ranks=list(item.ranks),
+                        first_time=item.first_time,
+                        last_time=item.last_time,
+                        count=1,
+                    )
+                else:
+                    existing.rank = item.rank
+                    if item.rank not in existing.ranks:
+                        existing.ranks.append(item.rank)
+                    existing.crawl_time = item.crawl_time
+                    existing.last_time = item.last_time
+                    existing.count += 1
+
+    last = batches[-1]
+    return NewsData(
+        date=last.date,
+        crawl_time=last.crawl_time,
+        items={source_id: list(items.values()) for source_id, items in merged.items()},
+        id_to_name=dict(last.id_to_name),
+        failed_ids=[],
+    )
+
+
+def unshare_strings(data: NewsData) -> NewsData:
+    """
+    复制条目中的所有字符串，使其不再共享对象
+
+    从 SQLite 逐行读取时每个字段都是独立的字符串对象；合成数据默认共享同一对象，
+    直接测量内存会低估真实开销，因此测量前先调用本函数还原真实形态。
+
+    Args:
+        data: NewsData 对象
+
+    Returns:
+        字符串不共享的新 NewsData 对象
+    """
+    def copy(value: str) -> str:
+        return (value + ".")[:-1] if value else value
+
+    items = {}
+    for source_id, news_list in data.items.items():
+        items[source_id] = [
+            NewsItem(
+                title=copy(item.title),
+                source_id=copy(item.source_id),
+                source_name=copy(item.source_name),
+                rank=item.rank,
+                url=copy(item.url),
+                mobile_url=copy(item.mobile_url),
+                crawl_time=copy(item.crawl_time),
+                ranks=list(item.ranks),
+                first_time=copy(item.first_time),
+                last_time=copy(item.last_time),
+                count=item.count,
+            )
+            for item in news_list
+        ]
+
+    return NewsData(
+        date=data.date,
+        crawl_time=data.crawl_time,
+        items=items,
+        id_to_name=dict(data.id_to_name),
+        failed_ids=list(data.failed_ids),
+    )
+
+
+def make_frequency_words(groups: int = 20, seed: Optional[int] = 0) -> str:
+    """
+    生成与合成标题词汇匹配的频率词配置文本（frequency_words.txt 格式）
+
+    词组由主体词/对象词组合而成，部分词组带必须词（+）、过滤词（!）和数量限制（@），
+    覆盖 load_frequency_words 与 count_word_frequency 的主要匹配分支。
+
+    Args:
+        groups: 词组数量
+        seed: 随机种子（None 表示不固定）
+
+    Returns:
+        频率词配置文本
+    """
+    rng = random.Random(seed)
+    vocabulary = _SUBJECTS + _OBJECTS
+
+    sections = ["[GLOBAL_FILTER]\n" + rng.choice(_SUFFIXES[3:]), "[WORD_GROUPS]"]
+    for i in range(groups):
+        lines = rng.sample(vocabulary, 2)
+        if i % 4 == 1:
+            lines.append("+" + rng.choice(_EVENTS))
+        if i % 5 == 2:
+            lines.append("!" + rng.choice(_SUFFIXES[3:]))
+        if i % 3 == 0:
+            lines.append(f"@{rng.randint(5, 20)}")
+        sections.append("\n".join(lines))
+
+    return "\n\n".join(sections) + "\n"
@@ -0,0 +1,250 @@
+# coding=utf-8
+"""
+本地 Webhook 替身服务器
+
+模拟各推送渠道的接口响应，供离线测试 NotificationDispatcher 使用：
+- 飞书   POST /feishu/<id>          成功 {"code": 0}，限流 {"code": 11232}
+- 钉钉   POST /dingtalk/<id>        成功 {"errcode": 0}，限流 {"errcode": 130101}
+- 企业微信 POST /wework/<id>        成功 {"errcode": 0}，限流 {"errcode": 45009}
+- Telegram POST /bot<token>/sendMessage  成功 {"ok": true}，限流 429 + parameters.retry_after
+- Slack  POST /slack/<id>           成功文本 "ok"，限流 429 + Retry-After
+- ntfy   POST /ntfy/<topic>         成功 200，限流 429
+- Bark   POST /push                 成功 {"code": 200}，限流 429
+- 通用   POST /generic/<id>         成功 200，限流 429 + Retry-After
+
+每个 webhook（请求路径，Telegram 为 chat_id，Bark 为 device_key）按渠道官方频率限制
+维护令牌桶，超出额度时返回该渠道的限流响应。speedup 用于压缩时间：
+speedup=60 表示把"每分钟 N 条"的限制按"每秒 N 条"执行，便于快速测试。
+
+使用示例:
+    with WebhookStandIn(speedup=60, latency_ms=20) as standin:
+        url = standin.url("dingtalk", "robot1")
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+from trendradar.notification.ratelimit import DEFAULT_RATE_LIMITS, TokenBucket
+
+
+# 各渠道的限流响应：(HTTP 状态码, 响应体)
+_THROTTLE_BODIES = {
+    "feishu": (200, {"code": 11232, "msg": "frequency limited psm[lark.oapi.app_platform_runtime]"}),
+    "dingtalk": (200, {"errcode": 130101, "errmsg": "send too fast, exceed 20 times per minute"}),
+    "wework": (200, {"errcode": 45009, "errmsg": "api freq out of limit"}),
+    "bark": (429, {"code": 429, "message": "too many requests"}),
+    "ntfy": (429, {"code": 42901, "http": 429, "error": "limit reached: too many requests"}),
+}
+
+_SUCCESS_BODIES = {
+    "feishu": {"code": 0, "msg": "success", "data": {}},
+    "dingtalk": {"errcode": 0, "errmsg": "ok"},
+    "wework": {"errcode": 0, "errmsg": "ok"},
+    "telegram": {"ok": True, "result": {"message_id": 1}},
+    "ntfy": {"id": "standin", "event": "message"},
+    "bark": {"code": 200, "message": "success"},
+    "generic_webhook": {"status": "ok"},
+}
+
+
+class ChannelStats:
+    """单个渠道的请求统计"""
+
+    def __init__(self):
+        self.requests = 0
+        self.accepted = 0
+        self.throttled = 0
+        self.bytes = 0
+        self.first_at: Optional[float] = None
+        self.last_at: Optional[float] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "accepted": self.accepted,
+            "throttled": self.throttled,
+            "bytes": self.bytes,
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """替身服务器请求处理器（HTTP/1.1 keep-alive）"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def _send(self, status: int, body, headers: Optional[Dict[str, str]] = None) -> None:
+        data = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain" if isinstance(body, bytes) else "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self) -> None:
+        standin: "WebhookStandIn" = self.server.standin
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        channel, key = standin.route(self.path, body)
+        if channel is None:
+            self._send(404, {"error": "unknown endpoint"})
+            return
+
+        if standin.latency:
+            time.sleep(standin.latency)
+
+        retry_after = standin.admit(channel, key, len(body))
+        if retry_after is None:
+            if channel == "slack":
+                self._send(200, b"ok")
+            else:
+                self._send(200, _SUCCESS_BODIES[channel])
+            return
+
+        seconds = str(max(int(retry_after + 0.999), 1))
+        if channel == "telegram":
+            self._send(429, {
+                "ok": False,
+                "error_code": 429,
+                "description": f"Too Many Requests: retry after {seconds}",
+                "parameters": {"retry_after": int(seconds)},
+            })
+        elif channel == "slack":
+            self._send(429, b"rate_limited", {"Retry-After": seconds})
+        elif channel == "generic_webhook":
+            self._send(429, {"error": "rate limited"}, {"Retry-After": seconds})
+        else:
+            status, payload = _THROTTLE_BODIES[channel]
+            self._send(status, payload)
+
+
+class WebhookStandIn:
+    """
+    本地 Webhook 替身服务器
+
+    Args:
+        speedup: 时间压缩倍数（1 表示按真实频率限制执行）
+        latency_ms: 每个请求的模拟网络延迟（毫秒）
+        throttle: 是否启用限流模拟
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        speedup: float = 1.0,
+        latency_ms: float = 0.0,
+        throttle: bool = True,
+    ):
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.standin = self
+        self.host, self.port = self._server.server_address[:2]
+        self.speedup = speedup
+        self.latency = latency_ms / 1000.0
+        self.throttle = throttle
+        self.stats: Dict[str, ChannelStats] = {}
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def url(self, channel: str, key: str = "default") -> str:
+        """
+        生成渠道的 webhook 地址
+
+        Args:
+            channel: 渠道名称（feishu/dingtalk/wework/slack/generic_webhook/bark）
+            key: webhook 标识
+
+        Returns:
+            webhook URL（ntfy 使用 base_url + topic，Telegram 需重定向 api.telegram.org）
+        """
+        if channel == "bark":
+            return f"{self.base_url}/{key}"
+        if channel == "generic_webhook":
+            return f"{self.base_url}/generic/{key}"
+        return f"{self.base_url}/{channel}/{key}"
+
+    def route(self, path: str, body: bytes) -> Tuple[Optional[str], str]:
+        """根据请求路径识别渠道和 webhook 标识"""
+        parts = path.split("?", 1)[0].strip("/").split("/")
+        head = parts[0]
+        if head.startswith("bot") and parts[-1] == "sendMessage":
+            try:
+                chat_id = str(json.loads(body).get("chat_id", ""))
+            except ValueError:
+                chat_id = ""
+            return "telegram", f"{head}:{chat_id}"
+        if head == "push":
+            try:
+                device_key = str(json.loads(body).get("device_key", ""))
+            except ValueError:
+                device_key = ""
+            return "bark", device_key
+        if head == "generic":
+            return "generic_webhook", "/".join(parts[1:])
+        if head in ("feishu", "dingtalk", "wework", "slack", "ntfy"):
+            return head, "/".join(parts[1:])
+        return None, ""
+
+    def admit(self, channel: str, key: str, size: int) -> Optional[float]:
+        """
+        记录请求并判断是否放行
+
+        Returns:
+            None 表示放行；否则为建议的重试等待秒数
+        """
+        now = time.perf_counter()
+        with self._lock:
+            stats = self.stats.setdefault(channel, ChannelStats())
+            stats.requests += 1
+
+            if self.throttle:
+                bucket = self._buckets.get((channel, key))
+                if bucket is None:
+                    burst, per_minute = DEFAULT_RATE_LIMITS.get(channel, (10, 60))
+                    bucket = TokenBucket(burst, per_minute / 60.0 * self.speedup)
+                    self._buckets[(channel, key)] = bucket
+                wait = bucket.reserve()
+                if wait > 0:
+                    # 被拒绝的请求不消耗令牌
+                    bucket.tokens += 1
+                    stats.throttled += 1
+                    return wait
+
+            stats.accepted += 1
+            stats.bytes += size
+            if stats.first_at is None:
+                stats.first_at = now
+            stats.last_at = now
+        return None
+
+    def reset(self) -> None:
+        """清空统计和令牌桶"""
+        with self._lock:
+            self.stats.clear()
+            self._buckets.clear()
+
+    def start(self) -> "WebhookStandIn":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "WebhookStandIn":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
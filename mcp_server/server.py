@@ -5,7 +5,6 @@ TrendRadar MCP Server - FastMCP 2.0 实现
 支持 stdio 和 HTTP 两种传输模式。
 """
 
-import asyncio
 import json
 from typing import List, Optional, Dict, Union
 
@@ -18,6 +17,7 @@ from .tools.search_tools import SearchTools
 from .tools.config_mgmt import ConfigManagementTools
 from .tools.system import SystemManagementTools
 from .tools.storage_sync import StorageSyncTools
+from .services.execution import ToolExecutor
 from .utils.date_parser import DateParser
 from .utils.errors import MCPError
 
@@ -28,8 +28,17 @@ mcp = FastMCP('trendradar-news')
 # 全局工具实例（在第一次请求时初始化）
 _tools_instances = {}
 
-# Session-level 工具实例存储（用于 Context 管理）
-_session_tools: Dict[str, Dict] = {}
+# 工具执行层：按 query / analytics / system 通道限制并发，带截止时间和并发请求去重
+_executor = ToolExecutor()
+
+# 工具结果的 JSON 序列化参数：默认紧凑输出（无缩进和多余空格），
+# 大结果集的响应体积明显缩小；run_server(pretty_json=True) 时恢复缩进格式
+_json_options = {"ensure_ascii": False, "separators": (",", ":")}
+
+
+def _to_json(result: Dict) -> str:
+    """序列化工具或资源的返回结果"""
+    return json.dumps(result, **_json_options)
 
 
 def _get_tools(project_root: Optional[str] = None):
@@ -46,10 +55,10 @@ def _get_tools(project_root: Optional[str] = None):
 
 def _get_tools_with_context(ctx: Optional[Context] = None) -> Dict:
     """
-    获取工具实例（支持 Session 隔离）
+    获取工具实例
 
-    如果提供了 Context，则为每个 session 创建独立的工具实例。
-    这样可以避免不同会话之间的状态污染。
+    工具类本身不保存会话状态，数据缓存（按日期的 DayDataset、倒排索引等）在进程内共享，
+    所有 session 复用同一组工具实例，避免按 session 重复创建服务对象。
 
     Args:
         ctx: FastMCP Context 对象
@@ -57,24 +66,7 @@ def _get_tools_with_context(ctx: Optional[Context] = None) -> Dict:
     Returns:
         工具实例字典
     """
-    if ctx is None:
-        return _get_tools()
-
-    # 获取 session ID（如果有的话）
-    session_id = getattr(ctx, 'session_id', None) or 'default'
-
-    if session_id not in _session_tools:
-        # 为新 session 创建工具实例
-        _session_tools[session_id] = {
-            'data': DataQueryTools(),
-            'analytics': AnalyticsTools(),
-            'search': SearchTools(),
-            'config': ConfigManagementTools(),
-            'system': SystemManagementTools(),
-            'storage': StorageSyncTools(),
-        }
-
-    return _session_tools[session_id]
+    return _get_tools()
 
 
 # ==================== MCP Resources ====================
@@ -87,13 +79,13 @@ async def get_platforms_resource() -> str:
     返回 config.yaml 中配置的所有平台信息，包括 ID 和名称。
     """
     tools = _get_tools()
-    config = await asyncio.to_thread(
-        tools['config'].get_current_config, section="crawler"
+    config = await _executor.run(
+        'query', tools['config'].get_current_config, section="crawler"
     )
-    return json.dumps({
+    return _to_json({
         "platforms": config.get("platforms", []),
         "description": "TrendRadar 支持的热榜平台列表"
-    }, ensure_ascii=False, indent=2)
+    })
 
 
 @mcp.resource("config://rss-feeds")
@@ -104,11 +96,11 @@ async def get_rss_feeds_resource() -> str:
     返回当前配置的所有 RSS 源信息。
     """
     tools = _get_tools()
-    status = await asyncio.to_thread(tools['data'].get_rss_feeds_status)
-    return json.dumps({
+    status = await _executor.run('query', tools['data'].get_rss_feeds_status)
+    return _to_json({
         "feeds": status.get("today_feeds", {}),
         "description": "TrendRadar 支持的 RSS 订阅源列表"
-    }, ensure_ascii=False, indent=2)
+    })
 
 
 @mcp.resource("data://available-dates")
@@ -119,13 +111,13 @@ async def get_available_dates_resource() -> str:
     返回本地存储中可查询的日期列表。
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['storage'].list_available_dates, source="local"
+    result = await _executor.run(
+        'query', tools['storage'].list_available_dates, source="local"
     )
-    return json.dumps({
+    return _to_json({
         "dates": result.get("data", {}).get("local", {}).get("dates", []),
         "description": "本地存储中可查询的日期列表"
-    }, ensure_ascii=False, indent=2)
+    })
 
 
 @mcp.resource("config://keywords")
@@ -136,14 +128,14 @@ async def get_keywords_resource() -> str:
     返回 frequency_words.txt 中配置的关注词分组。
     """
     tools = _get_tools()
-    config = await asyncio.to_thread(
-        tools['config'].get_current_config, section="keywords"
+    config = await _executor.run(
+        'query', tools['config'].get_current_config, section="keywords"
     )
-    return json.dumps({
+    return _to_json({
         "word_groups": config.get("word_groups", []),
         "total_groups": config.get("total_groups", 0),
         "description": "TrendRadar 关注词配置"
-    }, ensure_ascii=False, indent=2)
+    })
 
 
 # ==================== 日期解析工具（优先调用）====================
@@ -200,21 +192,21 @@ async def resolve_date_range(
         2. search_news(query="特斯拉", date_range={"start": "2025-11-20", "end": "2025-11-26"})
     """
     try:
-        result = await asyncio.to_thread(DateParser.resolve_date_range_expression, expression)
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        result = await _executor.run('query', DateParser.resolve_date_range_expression, expression)
+        return _to_json(result)
     except MCPError as e:
-        return json.dumps({
+        return _to_json({
             "success": False,
             "error": e.to_dict()
-        }, ensure_ascii=False, indent=2)
+        })
     except Exception as e:
-        return json.dumps({
+        return _to_json({
             "success": False,
             "error": {
                 "code": "INTERNAL_ERROR",
                 "message": str(e)
             }
-        }, ensure_ascii=False, indent=2)
+        })
 
 
 # ==================== 数据查询工具 ====================
@@ -253,11 +245,11 @@ async def get_latest_news(
     **注意**：如果用户询问"为什么只显示了部分"，说明他们需要完整数据
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['data'].get_latest_news,
+    result = await _executor.run(
+        'query', tools['data'].get_latest_news,
         platforms=platforms, limit=limit, include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool
@@ -286,11 +278,11 @@ async def get_trending_topics(
         - 自动提取热点: get_trending_topics(extract_mode="auto_extract", top_n=20)
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['data'].get_trending_topics,
+    result = await _executor.run(
+        'query', tools['data'].get_trending_topics,
         top_n=top_n, mode=mode, extract_mode=extract_mode
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _to_json(result)
 
 
 # ==================== RSS 数据查询工具 ====================
@@ -339,11 +331,11 @@ async def get_latest_rss(
         - 包含摘要: get_latest_rss(include_summary=True, days=7, limit=20)
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['data'].get_latest_rss,
+    result = await _executor.run(
+        'query', tools['data'].get_latest_rss,
         feeds=feeds, days=days, limit=limit, include_summary=include_summary
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool
@@ -375,15 +367,15 @@ async def search_rss(
         - search_rss(keyword="machine learning", feeds=['hacker-news'], days=14)
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['data'].search_rss,
+    result = await _executor.run(
+        'query', tools['data'].search_rss,
         keyword=keyword,
         feeds=feeds,
         days=days,
         limit=limit,
         include_summary=include_summary
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool
@@ -405,8 +397,8 @@ async def get_rss_feeds_status() -> str:
         - get_rss_feeds_status()  # 查看所有 RSS 源状态
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(tools['data'].get_rss_feeds_status)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    result = await _executor.run('query', tools['data'].get_rss_feeds_status)
+    return _to_json(result)
 
 
 @mcp.tool
@@ -414,7 +406,8 @@ async def get_news_by_date(
     date_range: Optional[Union[Dict[str, str], str]] = None,
     platforms: Optional[List[str]] = None,
     limit: int = 50,
-    include_url: bool = False
+    include_url: bool = False,
+    cursor: Optional[str] = None
 ) -> str:
     """
     获取指定日期的新闻数据，用于历史数据分析和对比
@@ -432,9 +425,11 @@ async def get_news_by_date(
         limit: 返回条数限制，默认50，最大1000
                注意：实际返回数量可能少于请求值，取决于指定日期的新闻总数
         include_url: 是否包含URL链接，默认False（节省token）
+        cursor: 分页游标，传入上一次返回的 next_cursor 获取下一页（其余参数保持不变）
 
     Returns:
-        JSON格式的新闻列表，包含标题、平台、排名等信息
+        JSON格式的新闻列表，包含标题、平台、排名等信息；
+        next_cursor 不为 null 时表示还有下一页
 
     **重要：数据展示建议**
     本工具会返回完整的新闻列表（通常50条）给你。但请注意：
@@ -449,14 +444,15 @@ async def get_news_by_date(
     **注意**：如果用户询问"为什么只显示了部分"，说明他们需要完整数据
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['data'].get_news_by_date,
+    result = await _executor.run(
+        'query', tools['data'].get_news_by_date,
         date_range=date_range,
         platforms=platforms,
         limit=limit,
-        include_url=include_url
+        include_url=include_url,
+        cursor=cursor
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _to_json(result)
 
 
 
@@ -513,8 +509,8 @@ async def analyze_topic_trend(
         2. analyze_topic_trend(topic="特斯拉", analysis_type="lifecycle", date_range=...)
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['analytics'].analyze_topic_trend_unified,
+    result = await _executor.run(
+        'analytics', tools['analytics'].analyze_topic_trend_unified,
         topic=topic,
         analysis_type=analysis_type,
         date_range=date_range,
@@ -524,7 +520,7 @@ async def analyze_topic_trend(
         lookahead_hours=lookahead_hours,
         confidence_threshold=confidence_threshold
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool
@@ -548,6 +544,7 @@ async def analyze_data_insights(
                     - **格式**: {"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"}
                     - **示例**: {"start": "2025-01-01", "end": "2025-01-07"}
                     - **重要**: 必须是对象格式，不能传递整数
+                    - keyword_cooccur模式: 统计整个日期范围内的共现，不指定时为今天
         min_frequency: 最小共现频次（keyword_cooccur模式），默认3
         top_n: 返回TOP N结果（keyword_cooccur模式），默认20
 
@@ -558,17 +555,18 @@ async def analyze_data_insights(
         - analyze_data_insights(insight_type="platform_compare", topic="人工智能")
         - analyze_data_insights(insight_type="platform_activity", date_range={"start": "2025-01-01", "end": "2025-01-07"})
         - analyze_data_insights(insight_type="keyword_cooccur", min_frequency=5, top_n=15)
+        - analyze_data_insights(insight_type="keyword_cooccur", date_range={"start": "2025-01-01", "end": "2025-01-07"})
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['analytics'].analyze_data_insights_unified,
+    result = await _executor.run(
+        'analytics', tools['analytics'].analyze_data_insights_unified,
         insight_type=insight_type,
         topic=topic,
         date_range=date_range,
         min_frequency=min_frequency,
         top_n=top_n
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool
@@ -624,8 +622,8 @@ async def analyze_sentiment(
     - 仅在用户明确要求"总结"或"挑重点"时才进行筛选
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['analytics'].analyze_sentiment,
+    result = await _executor.run(
+        'analytics', tools['analytics'].analyze_sentiment,
         topic=topic,
         platforms=platforms,
         date_range=date_range,
@@ -633,7 +631,7 @@ async def analyze_sentiment(
         sort_by_weight=sort_by_weight,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool
@@ -642,7 +640,8 @@ async def find_related_news(
     date_range: Optional[Union[Dict[str, str], str]] = None,
     threshold: float = 0.5,
     limit: int = 50,
-    include_url: bool = False
+    include_url: bool = False,
+    cursor: Optional[str] = None
 ) -> str:
     """
     查找与指定新闻标题相关的其他新闻（支持当天和历史数据）
@@ -660,9 +659,10 @@ async def find_related_news(
                    注意：阈值越高匹配越严格，返回结果越少
         limit: 返回条数限制，默认50
         include_url: 是否包含URL链接，默认False（节省token）
+        cursor: 分页游标，传入上一次返回的 next_cursor 获取下一页（其余参数保持不变）
 
     Returns:
-        JSON格式的相关新闻列表，按相似度排序
+        JSON格式的相关新闻列表，按相似度排序；next_cursor 不为 null 时表示还有下一页
 
     Examples:
         - 查找今天的相似新闻: find_related_news(reference_title="特斯拉降价")
@@ -674,15 +674,16 @@ async def find_related_news(
     - 仅在用户明确要求"总结"时才进行筛选
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['search'].find_related_news_unified,
+    result = await _executor.run(
+        'analytics', tools['search'].find_related_news_unified,
         reference_title=reference_title,
         date_range=date_range,
         threshold=threshold,
         limit=limit,
-        include_url=include_url
+        include_url=include_url,
+        cursor=cursor
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool
@@ -704,12 +705,12 @@ async def generate_summary_report(
         JSON格式的摘要报告，包含Markdown格式内容
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['analytics'].generate_summary_report,
+    result = await _executor.run(
+        'analytics', tools['analytics'].generate_summary_report,
         report_type=report_type,
         date_range=date_range
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool
@@ -718,7 +719,8 @@ async def aggregate_news(
     platforms: Optional[List[str]] = None,
     similarity_threshold: float = 0.7,
     limit: int = 50,
-    include_url: bool = False
+    include_url: bool = False,
+    cursor: Optional[str] = None
 ) -> str:
     """
     跨平台新闻聚合 - 对相似新闻进行去重合并
@@ -740,6 +742,7 @@ async def aggregate_news(
                               越高越严格（仅合并非常相似的标题）
         limit: 返回聚合新闻数量，默认50
         include_url: 是否包含URL链接，默认False
+        cursor: 分页游标，传入上一次返回的 next_cursor 获取下一页（其余参数保持不变）
 
     Returns:
         JSON格式的聚合结果，包含：
@@ -752,6 +755,7 @@ async def aggregate_news(
             - best_rank: 最佳排名
             - aggregate_weight: 综合权重
             - sources: 各平台来源详情
+        - next_cursor: 下一页游标（没有更多结果时为 null）
         - statistics: 平台覆盖统计
 
     Examples:
@@ -765,15 +769,16 @@ async def aggregate_news(
     - 可优先展示 platform_count > 1 的新闻
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['analytics'].aggregate_news,
+    result = await _executor.run(
+        'analytics', tools['analytics'].aggregate_news,
         date_range=date_range,
         platforms=platforms,
         similarity_threshold=similarity_threshold,
         limit=limit,
-        include_url=include_url
+        include_url=include_url,
+        cursor=cursor
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool
@@ -824,8 +829,8 @@ async def compare_periods(
           )
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['analytics'].compare_periods,
+    result = await _executor.run(
+        'analytics', tools['analytics'].compare_periods,
         period1=period1,
         period2=period2,
         topic=topic,
@@ -833,7 +838,7 @@ async def compare_periods(
         platforms=platforms,
         top_n=top_n
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _to_json(result)
 
 
 # ==================== 智能检索工具 ====================
@@ -849,7 +854,8 @@ async def search_news(
     threshold: float = 0.6,
     include_url: bool = False,
     include_rss: bool = False,
-    rss_limit: int = 20
+    rss_limit: int = 20,
+    cursor: Optional[str] = None
 ) -> str:
     """
     统一搜索接口，支持多种搜索模式，可同时搜索热榜和RSS
@@ -886,12 +892,15 @@ async def search_news(
                      - 设为True时，会在热榜结果后附加RSS搜索结果
                      - RSS结果独立展示，不影响热榜排名
         rss_limit: RSS返回条数限制，默认20（仅当include_rss=True时有效）
+        cursor: 分页游标，传入上一次返回的 next_cursor 获取下一页（其余参数保持不变，
+                limit 可以调整为下一页的条数；RSS 结果只在第一页返回）
 
     Returns:
         JSON格式的搜索结果，包含：
         - results: 热榜新闻列表（按排名/相关度排序）
         - rss: RSS订阅结果列表（仅当include_rss=True时返回）
         - summary: 搜索统计信息
+        - next_cursor: 下一页游标（没有更多结果时为 null）
 
     Examples:
         用户："搜索本周的AI新闻"
@@ -917,8 +926,8 @@ async def search_news(
     - 当include_rss=True时，热榜和RSS结果分开展示，RSS在热榜之后
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['search'].search_news_unified,
+    result = await _executor.run(
+        'analytics', tools['search'].search_news_unified,
         query=query,
         search_mode=search_mode,
         date_range=date_range,
@@ -928,9 +937,10 @@ async def search_news(
         threshold=threshold,
         include_url=include_url,
         include_rss=include_rss,
-        rss_limit=rss_limit
+        rss_limit=rss_limit,
+        cursor=cursor
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _to_json(result)
 
 
 # ==================== 配置与系统管理工具 ====================
@@ -954,8 +964,8 @@ async def get_current_config(
         JSON格式的配置信息
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(tools['config'].get_current_config, section=section)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    result = await _executor.run('query', tools['config'].get_current_config, section=section)
+    return _to_json(result)
 
 
 @mcp.tool
@@ -969,8 +979,8 @@ async def get_system_status() -> str:
         JSON格式的系统状态信息
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(tools['system'].get_system_status)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    result = await _executor.run('query', tools['system'].get_system_status)
+    return _to_json(result)
 
 
 @mcp.tool
@@ -1014,8 +1024,8 @@ async def check_version(
         - check_version(proxy_url="http://127.0.0.1:7890")  # 使用代理访问 GitHub
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(tools['system'].check_version, proxy_url=proxy_url)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    result = await _executor.run('system', tools['system'].check_version, proxy_url=proxy_url)
+    return _to_json(result)
 
 
 @mcp.tool
@@ -1049,11 +1059,11 @@ async def trigger_crawl(
         - 使用默认平台: trigger_crawl()  # 爬取config.yaml中配置的所有平台
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(
-        tools['system'].trigger_crawl,
+    result = await _executor.run(
+        'system', tools['system'].trigger_crawl,
         platforms=platforms, save_to_local=save_to_local, include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _to_json(result)
 
 
 # ==================== 存储同步工具 ====================
@@ -1095,8 +1105,8 @@ async def sync_from_remote(
         - S3_SECRET_ACCESS_KEY: 访问密钥
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(tools['storage'].sync_from_remote, days=days)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    result = await _executor.run('system', tools['storage'].sync_from_remote, days=days)
+    return _to_json(result)
 
 
 @mcp.tool
@@ -1129,8 +1139,8 @@ async def get_storage_status() -> str:
         - get_storage_status()  # 查看所有存储状态
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(tools['storage'].get_storage_status)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    result = await _executor.run('query', tools['storage'].get_storage_status)
+    return _to_json(result)
 
 
 @mcp.tool
@@ -1173,8 +1183,8 @@ async def list_available_dates(
         - list_available_dates(source="remote")  # 仅查看远程
     """
     tools = _get_tools()
-    result = await asyncio.to_thread(tools['storage'].list_available_dates, source=source)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    result = await _executor.run('query', tools['storage'].list_available_dates, source=source)
+    return _to_json(result)
 
 
 # ==================== 启动入口 ====================
@@ -1183,7 +1193,8 @@ def run_server(
     project_root: Optional[str] = None,
     transport: str = 'stdio',
     host: str = '0.0.0.0',
-    port: int = 3333
+    port: int = 3333,
+    pretty_json: bool = False
 ):
     """
     启动 MCP 服务器
@@ -1193,7 +1204,12 @@ def run_server(
         transport: 传输模式，'stdio' 或 'http'
         host: HTTP模式的监听地址，默认 0.0.0.0
         port: HTTP模式的监听端口，默认 3333
+        pretty_json: 是否以缩进格式输出 JSON 结果，默认 False（紧凑格式）
     """
+    if pretty_json:
+        _json_options.pop("separators", None)
+        _json_options["indent"] = 2
+
     # 初始化工具实例
     _get_tools(project_root)
 
@@ -1302,6 +1318,11 @@ if __name__ == '__main__':
         '--project-root',
         help='项目根目录路径'
     )
+    parser.add_argument(
+        '--pretty-json',
+        action='store_true',
+        help='以缩进格式输出 JSON 结果（默认紧凑格式）'
+    )
 
     args = parser.parse_args()
 
@@ -1309,5 +1330,6 @@ if __name__ == '__main__':
         project_root=args.project_root,
         transport=args.transport,
         host=args.host,
-        port=args.port
+        port=args.port,
+        pretty_json=args.pretty_json
     )
@@ -2,13 +2,44 @@
 缓存服务
 
 实现TTL缓存机制，提升数据访问性能。
+
+缓存有容量上限：按 key 的命名空间（第一个 ":" 之前的部分，如 read_all、latest_news）
+分别设置字节预算（近似估算对象大小），超出预算或总条目数时按 LRU 淘汰；
+后台线程定期清理过期条目。命中、未命中和淘汰次数通过 get_stats 输出。
+
+条目可以带数据版本（如数据库文件的 mtime/大小）：读取时传入当前版本，版本不一致立即失效；
+只依赖数据库文件的条目以 ttl=None 读写，不再按时间过期。
 """
 
 import hashlib
 import json
+import sys
 import time
-from typing import Any, Optional
-from threading import Lock
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from threading import Event, Lock, Thread
+
+
+MB = 1024 * 1024
+
+# 缓存总字节预算与条目上限
+DEFAULT_MAX_BYTES = 512 * MB
+DEFAULT_MAX_ENTRIES = 2048
+
+# 各命名空间的字节预算（未列出的命名空间使用 DEFAULT_NAMESPACE_BUDGET）
+NAMESPACE_BUDGETS = {
+    "read_all": 256 * MB,           # 按日期、平台组合缓存的全部标题
+    "similarity_index": 64 * MB,    # 近似重复索引（单日 5000 条标题约 6 MB）
+    "keyword_stats": 64 * MB,       # 每日关键词统计表
+    "pages": 64 * MB,               # 分页结果快照
+}
+DEFAULT_NAMESPACE_BUDGET = 32 * MB
+
+# 未通过 get 指定 TTL 的条目的默认存活时间（秒），用于后台清理
+DEFAULT_TTL = 3600
+
+# 后台清理过期条目的间隔（秒）
+CLEANUP_INTERVAL = 60
 
 
 def make_cache_key(namespace: str, **params) -> str:
@@ -57,48 +88,211 @@ def make_cache_key(namespace: str, **params) -> str:
     return f"{namespace}:{hash_value}"
 
 
+def estimate_size(value: Any) -> int:
+    """
+    近似估算对象占用的字节数
+
+    递归累加容器及其元素的 sys.getsizeof，同一对象只计算一次
+    （驻留字符串、共享的子对象不会重复计入）。
+
+    Args:
+        value: 待估算的对象
+
+    Returns:
+        近似字节数
+    """
+    seen = set()
+    total = 0
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        obj_id = id(obj)
+        if obj_id in seen:
+            continue
+        seen.add(obj_id)
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(obj.__dict__)
+    return total
+
+
+class _CacheEntry:
+    """缓存条目"""
+
+    __slots__ = ("value", "timestamp", "ttl", "size", "namespace", "version")
+
+    def __init__(self, value: Any, ttl: Optional[float], size: int, namespace: str, version: Any):
+        self.value = value
+        self.timestamp = time.time()
+        self.ttl = ttl
+        self.size = size
+        self.namespace = namespace
+        self.version = version
+
+
 class CacheService:
     """缓存服务类"""
 
-    def __init__(self):
-        """初始化缓存服务"""
-        self._cache = {}
-        self._timestamps = {}
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        namespace_budgets: Optional[Dict[str, int]] = None,
+        cleanup_interval: Optional[float] = CLEANUP_INTERVAL
+    ):
+        """
+        初始化缓存服务
+
+        Args:
+            max_bytes: 缓存总字节预算
+            max_entries: 缓存条目上限
+            namespace_budgets: 各命名空间的字节预算，默认为 NAMESPACE_BUDGETS
+            cleanup_interval: 后台清理过期条目的间隔（秒），None 表示不启动后台清理
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.namespace_budgets = dict(NAMESPACE_BUDGETS if namespace_budgets is None else namespace_budgets)
+        self.cleanup_interval = cleanup_interval
+
+        # 按访问顺序排列（最近访问的在末尾）
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._namespace_bytes: Dict[str, int] = {}
+        self._total_bytes = 0
         self._lock = Lock()
 
-    def get(self, key: str, ttl: int = 900) -> Optional[Any]:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        self._rejections = 0
+
+        self._stop_event = Event()
+        self._cleanup_thread: Optional[Thread] = None
+
+    @staticmethod
+    def _namespace_of(key: str) -> str:
+        """key 的命名空间（第一个 ":" 之前的部分）"""
+        return key.split(":", 1)[0]
+
+    def _budget_of(self, namespace: str) -> int:
+        return self.namespace_budgets.get(namespace, DEFAULT_NAMESPACE_BUDGET)
+
+    def _remove(self, key: str) -> _CacheEntry:
+        """删除条目并更新字节统计（需持有锁）"""
+        entry = self._cache.pop(key)
+        self._total_bytes -= entry.size
+        self._namespace_bytes[entry.namespace] -= entry.size
+        if not self._namespace_bytes[entry.namespace]:
+            del self._namespace_bytes[entry.namespace]
+        return entry
+
+    def _evict_for(self, namespace: str) -> None:
+        """按 LRU 淘汰条目，直到命名空间预算、总预算和条目上限都满足（需持有锁）"""
+        budget = self._budget_of(namespace)
+        if self._namespace_bytes.get(namespace, 0) > budget:
+            for key in [k for k, e in self._cache.items() if e.namespace == namespace]:
+                if self._namespace_bytes.get(namespace, 0) <= budget:
+                    break
+                self._remove(key)
+                self._evictions += 1
+
+        while self._cache and (
+            self._total_bytes > self.max_bytes or len(self._cache) > self.max_entries
+        ):
+            self._remove(next(iter(self._cache)))
+            self._evictions += 1
+
+    def _ensure_cleanup_thread(self) -> None:
+        """首次写入时启动后台清理线程（需持有锁）"""
+        if self.cleanup_interval is None or self._cleanup_thread is not None:
+            return
+        self._cleanup_thread = Thread(
+            target=self._cleanup_loop, name="mcp-cache-cleanup", daemon=True
+        )
+        self._cleanup_thread.start()
+
+    def _cleanup_loop(self) -> None:
+        while not self._stop_event.wait(self.cleanup_interval):
+            self.cleanup_expired()
+
+    def stop(self) -> None:
+        """停止后台清理线程"""
+        self._stop_event.set()
+
+    def get(self, key: str, ttl: Optional[float] = 900, version: Any = None) -> Optional[Any]:
         """
         获取缓存数据
 
         Args:
             key: 缓存键
-            ttl: 存活时间（秒），默认15分钟
+            ttl: 存活时间（秒），默认15分钟；None 表示不按时间过期
+            version: 当前数据版本，与写入时的版本不一致时缓存失效
 
         Returns:
-            缓存的值，如果不存在或已过期则返回None
+            缓存的值，如果不存在、已过期或版本已变化则返回None
         """
         with self._lock:
-            if key in self._cache:
+            entry = self._cache.get(key)
+            if entry is not None and entry.version != version:
+                # 数据已变化（如爬虫写入了新批次），立即失效
+                self._remove(key)
+                self._invalidations += 1
+                entry = None
+            if entry is not None:
                 # 检查是否过期
-                if time.time() - self._timestamps[key] < ttl:
-                    return self._cache[key]
+                if ttl is None or time.time() - entry.timestamp < ttl:
+                    # 记录调用方使用的 TTL，供后台清理使用
+                    entry.ttl = ttl
+                    self._cache.move_to_end(key)
+                    self._hits += 1
+                    return entry.value
                 else:
                     # 已过期，删除缓存
-                    del self._cache[key]
-                    del self._timestamps[key]
+                    self._remove(key)
+                    self._expirations += 1
+            self._misses += 1
         return None
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, version: Any = None) -> None:
         """
         设置缓存数据
 
         Args:
             key: 缓存键
             value: 缓存值
+            ttl: 后台清理使用的存活时间（秒），默认为 DEFAULT_TTL（带版本的条目默认不按时间过期），
+                之后以 get 时传入的 ttl 为准
+            version: 数据版本
         """
+        if ttl is None and version is None:
+            ttl = DEFAULT_TTL
+
+        namespace = self._namespace_of(key)
+        size = estimate_size(value)
+
         with self._lock:
-            self._cache[key] = value
-            self._timestamps[key] = time.time()
+            if key in self._cache:
+                self._remove(key)
+
+            # 单个值超出命名空间预算时不缓存
+            if size > self._budget_of(namespace) or size > self.max_bytes:
+                self._rejections += 1
+                return
+
+            self._cache[key] = _CacheEntry(value, ttl, size, namespace, version)
+            self._total_bytes += size
+            self._namespace_bytes[namespace] = self._namespace_bytes.get(namespace, 0) + size
+            self._evict_for(namespace)
+            self._ensure_cleanup_thread()
 
     def delete(self, key: str) -> bool:
         """
@@ -112,8 +306,7 @@ class CacheService:
         """
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
-                del self._timestamps[key]
+                self._remove(key)
                 return True
         return False
 
@@ -121,29 +314,31 @@ class CacheService:
         """清空所有缓存"""
         with self._lock:
             self._cache.clear()
-            self._timestamps.clear()
+            self._namespace_bytes.clear()
+            self._total_bytes = 0
 
-    def cleanup_expired(self, ttl: int = 900) -> int:
+    def cleanup_expired(self, ttl: Optional[int] = None) -> int:
         """
         清理过期缓存
 
         Args:
-            ttl: 存活时间（秒）
+            ttl: 存活时间（秒），None 表示使用各条目自身的存活时间（不按时间过期的条目保留）
 
         Returns:
             清理的条目数量
         """
         with self._lock:
             current_time = time.time()
-            expired_keys = [
-                key for key, timestamp in self._timestamps.items()
-                if current_time - timestamp >= ttl
-            ]
+            expired_keys = []
+            for key, entry in self._cache.items():
+                entry_ttl = entry.ttl if ttl is None else ttl
+                if entry_ttl is not None and current_time - entry.timestamp >= entry_ttl:
+                    expired_keys.append(key)
 
             for key in expired_keys:
-                del self._cache[key]
-                del self._timestamps[key]
+                self._remove(key)
 
+            self._expirations += len(expired_keys)
             return len(expired_keys)
 
     def get_stats(self) -> dict:
@@ -154,16 +349,37 @@ class CacheService:
             统计信息字典
         """
         with self._lock:
+            timestamps = [entry.timestamp for entry in self._cache.values()]
+            lookups = self._hits + self._misses
+            namespaces = {}
+            for entry in self._cache.values():
+                stats = namespaces.setdefault(entry.namespace, {"entries": 0, "bytes": 0})
+                stats["entries"] += 1
+                stats["bytes"] += entry.size
+            for namespace, stats in namespaces.items():
+                stats["budget_bytes"] = self._budget_of(namespace)
+
             return {
                 "total_entries": len(self._cache),
                 "oldest_entry_age": (
-                    time.time() - min(self._timestamps.values())
-                    if self._timestamps else 0
+                    time.time() - min(timestamps)
+                    if timestamps else 0
                 ),
                 "newest_entry_age": (
-                    time.time() - max(self._timestamps.values())
-                    if self._timestamps else 0
-                )
+                    time.time() - max(timestamps)
+                    if timestamps else 0
+                ),
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+                "rejections": self._rejections,
+                "namespaces": namespaces,
             }
 
 
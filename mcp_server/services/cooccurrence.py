@@ -0,0 +1,106 @@
+"""
+关键词共现矩阵
+
+以词表（关键词 → 词项 ID）和标题 × 词项关联矩阵 C 表示一段日期内的标题，
+共现矩阵为 CᵀC：非对角元素 (a, b) 为两个关键词在同一标题中两两组合出现的次数。
+
+C 按日期分块：C = [C_1; C_2; ...]，因此 CᵀC = Σ C_dᵀC_d。每天的块乘积就是
+每日关键词统计表（DayKeywordStats.pairs）中已物化的关键词对计数，跨日期只需按
+词项 ID 累加各天的块；关联矩阵的列（词项 → 标题序号）即统计表中的倒排列表，
+共现标题样本由两个倒排列表求交得到，不再对标题重新分词。
+
+共现矩阵只保存上三角非零元素（COO 格式，array 紧凑存储）。
+"""
+
+from array import array
+from typing import Dict, List, Sequence, Tuple
+
+from trendradar.utils.topk import select_top_k
+
+from .keyword_stats import DayKeywordStats
+
+
+class CooccurrenceMatrix:
+    """
+    多日关键词共现矩阵（只读）
+
+    使用示例:
+        matrix = CooccurrenceMatrix([stats_day1, stats_day2])
+        for keyword1, keyword2, count in matrix.top_pairs(min_count=3, top_n=20):
+            samples = matrix.sample_titles(keyword1, keyword2)
+    """
+
+    def __init__(self, days: Sequence[DayKeywordStats]):
+        """
+        累加各天的共现块
+
+        Args:
+            days: 各天的关键词统计表（按日期顺序）
+        """
+        self.days: Tuple[DayKeywordStats, ...] = tuple(days)
+        self.terms: List[str] = []
+        self.term_ids: Dict[str, int] = {}
+
+        term_ids = self.term_ids
+        terms = self.terms
+
+        # 键为 (词项 ID1 << 32) | 词项 ID2，按首次出现的顺序保存
+        totals: Dict[int, int] = {}
+        for stats in self.days:
+            for (term1, term2), count in stats.pairs.items():
+                id1 = term_ids.get(term1)
+                if id1 is None:
+                    id1 = term_ids[term1] = len(terms)
+                    terms.append(term1)
+                id2 = term_ids.get(term2)
+                if id2 is None:
+                    id2 = term_ids[term2] = len(terms)
+                    terms.append(term2)
+                key = (id1 << 32) | id2
+                totals[key] = totals.get(key, 0) + count
+
+        self.rows = array("I", (key >> 32 for key in totals))
+        self.cols = array("I", (key & 0xFFFFFFFF for key in totals))
+        self.values = array("I", totals.values())
+
+    @property
+    def nnz(self) -> int:
+        """非零关键词对数量"""
+        return len(self.values)
+
+    def top_pairs(self, min_count: int = 1, top_n: int = 20) -> List[Tuple[str, str, int]]:
+        """
+        获取共现次数最高的关键词对
+
+        Args:
+            min_count: 最小共现次数
+            top_n: 返回数量
+
+        Returns:
+            [(关键词1, 关键词2, 共现次数), ...]，关键词对按字符串排序，
+            次数相同时按首次出现的顺序
+        """
+        values = self.values
+        candidates = [i for i in range(len(values)) if values[i] >= min_count]
+        top = select_top_k(candidates, top_n, key=values.__getitem__, reverse=True)
+        terms = self.terms
+        return [(terms[self.rows[i]], terms[self.cols[i]], values[i]) for i in top]
+
+    def sample_titles(self, term1: str, term2: str, limit: int = 3) -> List[str]:
+        """
+        同时包含两个关键词的标题样本（按日期顺序求倒排列表交集）
+
+        Args:
+            term1: 关键词1
+            term2: 关键词2
+            limit: 样本数量
+
+        Returns:
+            标题样本列表
+        """
+        samples: List[str] = []
+        for stats in self.days:
+            if len(samples) >= limit:
+                break
+            samples.extend(stats.pair_sample_titles(term1, term2, limit - len(samples)))
+        return samples
@@ -9,8 +9,13 @@ from collections import Counter
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
+from trendradar.utils.topk import select_top_k
+
 from .cache_service import get_cache
+from .keyword_stats import TITLE_STOPWORDS, extract_title_words, get_keyword_stats_store
+from .pagination import ResultPager
 from .parser_service import ParserService
+from .search_index import get_search_index
 from ..utils.errors import DataNotFoundError
 
 
@@ -18,20 +23,7 @@ class DataService:
     """数据访问服务类"""
 
     # 中文停用词列表（用于 auto_extract 模式）
-    STOPWORDS = {
-        '的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一',
-        '一个', '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有',
-        '看', '好', '自己', '这', '那', '来', '被', '与', '为', '对', '将', '从',
-        '以', '及', '等', '但', '或', '而', '于', '中', '由', '可', '可以', '已',
-        '已经', '还', '更', '最', '再', '因为', '所以', '如果', '虽然', '然而',
-        '什么', '怎么', '如何', '哪', '哪些', '多少', '几', '这个', '那个',
-        '他', '她', '它', '他们', '她们', '我们', '你们', '大家', '自己',
-        '这样', '那样', '怎样', '这么', '那么', '多么', '非常', '特别',
-        '应该', '可能', '能够', '需要', '必须', '一定', '肯定', '确实',
-        '正在', '已经', '曾经', '将要', '即将', '刚刚', '马上', '立刻',
-        '回应', '发布', '表示', '称', '曝', '官方', '最新', '重磅', '突发',
-        '热搜', '刷屏', '引发', '关注', '网友', '评论', '转发', '点赞'
-    }
+    STOPWORDS = TITLE_STOPWORDS
 
     def __init__(self, project_root: str = None):
         """
@@ -42,6 +34,9 @@ class DataService:
         """
         self.parser = ParserService(project_root)
         self.cache = get_cache()
+        self.search_index = get_search_index(self.parser)
+        self.keyword_stats = get_keyword_stats_store(self.parser)
+        self.pager = ResultPager(self.cache)
 
     def get_latest_news(
         self,
@@ -63,9 +58,10 @@ class DataService:
         Raises:
             DataNotFoundError: 数据不存在
         """
-        # 尝试从缓存获取
+        # 尝试从缓存获取（今天的数据库有新提交时失效）
         cache_key = f"latest_news:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=900)  # 15分钟缓存
+        version = (self.parser.get_date_folder_name(), self.parser.get_db_version())
+        cached = self.cache.get(cache_key, ttl=None, version=version)
         if cached:
             return cached
 
@@ -106,14 +102,11 @@ class DataService:
 
                 news_list.append(news_item)
 
-        # 按排名排序
-        news_list.sort(key=lambda x: x["rank"])
-
-        # 限制返回数量
-        result = news_list[:limit]
+        # 按排名排序并限制返回数量
+        result = select_top_k(news_list, limit, key=lambda x: x["rank"])
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, version=version)
 
         return result
 
@@ -121,7 +114,7 @@ class DataService:
         self,
         target_date: datetime,
         platforms: Optional[List[str]] = None,
-        limit: int = 50,
+        limit: Optional[int] = 50,
         include_url: bool = False
     ) -> List[Dict]:
         """
@@ -130,7 +123,7 @@ class DataService:
         Args:
             target_date: 目标日期
             platforms: 平台ID列表,None表示所有平台
-            limit: 返回条数限制
+            limit: 返回条数限制,None表示返回全部（按排名排序）
             include_url: 是否包含URL链接,默认False(节省token)
 
         Returns:
@@ -149,10 +142,12 @@ class DataService:
         """
         # 尝试从缓存获取
         date_str = target_date.strftime("%Y-%m-%d")
-        cache_key = f"news_by_date:{date_str}:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30分钟缓存
-        if cached:
-            return cached
+        # 缓存按排名排序的完整列表，不同 limit 共用同一条目
+        cache_key = f"news_by_date:{date_str}:{','.join(platforms or [])}:{include_url}"
+        version = self.parser.get_db_version(target_date)
+        cached = self.cache.get(cache_key, ttl=None, version=version)  # 数据库文件变化时失效
+        if cached is not None:
+            return cached[:limit]
 
         # 读取指定日期的数据
         all_titles, id_to_name, timestamps = self.parser.read_all_titles_for_date(
@@ -186,16 +181,13 @@ class DataService:
 
                 news_list.append(news_item)
 
-        # 按排名排序
-        news_list.sort(key=lambda x: x["rank"])
+        # 按排名排序（稳定排序，排名相同时保持平台、标题的读取顺序）
+        result = sorted(news_list, key=lambda x: x["rank"])
 
-        # 限制返回数量
-        result = news_list[:limit]
+        # 缓存结果（已结束的日期数据库不再变化，缓存一直有效）
+        self.cache.set(cache_key, result, version=version)
 
-        # 缓存结果(历史数据缓存更久)
-        self.cache.set(cache_key, result)
-
-        return result
+        return result[:limit]
 
     def search_news_by_keyword(
         self,
@@ -230,14 +222,22 @@ class DataService:
         results = []
         platform_distribution = Counter()
 
+        # 已结束日期通过倒排索引只读取候选标题
+        indexed = (
+            self.search_index.lookup_substring(keyword, start_date, end_date, platforms)
+            if self.search_index else {}
+        )
+
         # 遍历日期范围
-        current_date = start_date
-        while current_date <= end_date:
+        for current_date, day in self.parser.iter_titles_for_range(
+            start_date, end_date, platform_ids=platforms, skip_dates=indexed
+        ):
             try:
-                all_titles, id_to_name, _ = self.parser.read_all_titles_for_date(
-                    date=current_date,
-                    platform_ids=platforms
-                )
+                date_str = current_date.strftime("%Y-%m-%d")
+                if date_str in indexed:
+                    all_titles, id_to_name = indexed[date_str]
+                else:
+                    all_titles, id_to_name, _ = day.result()
 
                 # 搜索包含关键词的标题
                 for platform_id, titles in all_titles.items():
@@ -266,9 +266,6 @@ class DataService:
                 # 该日期没有数据,继续下一天
                 pass
 
-            # 下一天
-            current_date += timedelta(days=1)
-
         if not results:
             raise DataNotFoundError(
                 f"未找到包含关键词 '{keyword}' 的新闻",
@@ -309,23 +306,7 @@ class DataService:
         Returns:
             关键词列表
         """
-        # 移除URL和特殊字符
-        title = re.sub(r'http[s]?://\S+', '', title)
-        title = re.sub(r'\[.*?\]', '', title)  # 移除方括号内容
-        title = re.sub(r'[【】《》「」『』""''・·•]', '', title)  # 移除中文标点
-
-        # 使用正则表达式分词（中文和英文）
-        # 匹配连续的中文字符或英文单词
-        words = re.findall(r'[\u4e00-\u9fff]{2,}|[a-zA-Z]{2,}[a-zA-Z0-9]*', title)
-
-        # 过滤停用词和短词
-        keywords = [
-            word for word in words
-            if word and len(word) >= min_length and word.lower() not in self.STOPWORDS
-            and word not in self.STOPWORDS
-        ]
-
-        return keywords
+        return extract_title_words(title, min_length)
 
     def get_trending_topics(
         self,
@@ -353,7 +334,9 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"trending_topics:{top_n}:{mode}:{extract_mode}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30分钟缓存
+        version = (self.parser.get_date_folder_name(), self.parser.get_db_version())
+        # 30分钟缓存（关注词配置可能变化），今天的数据库有新提交时立即失效
+        cached = self.cache.get(cache_key, ttl=1800, version=version)
         if cached:
             return cached
 
@@ -378,14 +361,15 @@ class DataService:
         word_frequency = Counter()
         keyword_to_news = {}
 
-        # 遍历要处理的标题
-        for platform_id, titles in titles_to_process.items():
-            for title in titles.keys():
-                if extract_mode == "keywords":
-                    # 基于预设关键词统计（支持正则匹配）
-                    from trendradar.core.frequency import _word_matches
+        if extract_mode == "keywords":
+            # 基于预设关键词统计（支持正则匹配）
+            from trendradar.core.frequency import _word_matches
 
-                    word_groups = self.parser.parse_frequency_words()
+            word_groups = self.parser.parse_frequency_words()
+
+            # 遍历要处理的标题
+            for platform_id, titles in titles_to_process.items():
+                for title in titles.keys():
                     title_lower = title.lower()
 
                     for group in word_groups:
@@ -403,14 +387,10 @@ class DataService:
                             keyword_to_news[display_key].append(title)
                             break  # 每个标题只计入第一个匹配的词组
 
-                elif extract_mode == "auto_extract":
-                    # 自动提取关键词
-                    extracted_words = self._extract_words_from_title(title)
-                    for word in extracted_words:
-                        word_frequency[word] += 1
-                        if word not in keyword_to_news:
-                            keyword_to_news[word] = []
-                        keyword_to_news[word].append(title)
+        elif extract_mode == "auto_extract":
+            # 自动提取关键词：查当天的关键词统计表，不再逐条分词
+            keyword_stats = self.keyword_stats.get(None, "words")
+            word_frequency.update(keyword_stats.counts)
 
         # 获取TOP N关键词
         top_keywords = word_frequency.most_common(top_n)
@@ -418,12 +398,15 @@ class DataService:
         # 构建话题列表
         topics = []
         for keyword, frequency in top_keywords:
-            matched_news = keyword_to_news.get(keyword, [])
+            if extract_mode == "auto_extract":
+                matched_count = keyword_stats.news_count(keyword)
+            else:
+                matched_count = len(set(keyword_to_news.get(keyword, [])))
 
             topics.append({
                 "keyword": keyword,
                 "frequency": frequency,
-                "matched_news": len(set(matched_news)),  # 去重后的新闻数量
+                "matched_news": matched_count,  # 去重后的新闻数量
                 "trend": "stable",
                 "weight_score": 0.0
             })
@@ -439,7 +422,7 @@ class DataService:
         }
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=1800, version=version)
 
         return result
 
@@ -681,6 +664,22 @@ class DataService:
     # RSS 数据查询方法
     # ========================================
 
+    def _get_days_version(self, days: int, db_type: str = "news") -> Tuple:
+        """
+        获取最近 N 天数据库文件的组合版本（用作跨日期查询结果的缓存版本）
+
+        Args:
+            days: 天数（含今天）
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            ((日期, 版本), ...) 元组，任一天的数据库变化或跨日时版本随之变化
+        """
+        today = datetime.now()
+        return self.parser.get_dates_version(
+            (today - timedelta(days=i) for i in range(days)), db_type
+        )
+
     def get_latest_rss(
         self,
         feeds: Optional[List[str]] = None,
@@ -705,7 +704,8 @@ class DataService:
         """
         days = min(max(days, 1), 30)  # 限制 1-30 天
         cache_key = f"latest_rss:{','.join(feeds or [])}:{days}:{limit}:{include_summary}"
-        cached = self.cache.get(cache_key, ttl=900)
+        version = self._get_days_version(days, db_type="rss")
+        cached = self.cache.get(cache_key, ttl=None, version=version)
         if cached:
             return cached
 
@@ -761,14 +761,13 @@ class DataService:
             except DataNotFoundError:
                 continue
 
-        # 按发布时间排序（最新的在前）
-        rss_list.sort(key=lambda x: x.get("published_at", ""), reverse=True)
-
-        # 限制返回数量
-        result = rss_list[:limit]
+        # 按发布时间排序（最新的在前）并限制返回数量
+        result = select_top_k(
+            rss_list, limit, key=lambda x: x.get("published_at", ""), reverse=True
+        )
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, version=version)
 
         return result
 
@@ -794,7 +793,8 @@ class DataService:
             匹配的 RSS 条目列表（按 URL 去重）
         """
         cache_key = f"search_rss:{keyword}:{','.join(feeds or [])}:{days}:{limit}:{include_summary}"
-        cached = self.cache.get(cache_key, ttl=900)
+        version = self._get_days_version(days, db_type="rss")
+        cached = self.cache.get(cache_key, ttl=None, version=version)
         if cached:
             return cached
 
@@ -844,14 +844,13 @@ class DataService:
             except DataNotFoundError:
                 continue
 
-        # 按发布时间排序
-        results.sort(key=lambda x: x.get("published_at", ""), reverse=True)
-
-        # 限制返回数量
-        result = results[:limit]
+        # 按发布时间排序并限制返回数量
+        result = select_top_k(
+            results, limit, key=lambda x: x.get("published_at", ""), reverse=True
+        )
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, version=version)
 
         return result
 
@@ -863,7 +862,9 @@ class DataService:
             RSS 源状态信息
         """
         cache_key = "rss_feeds_status"
-        cached = self.cache.get(cache_key, ttl=300)
+        # 可用日期列表依赖目录扫描，保留 5 分钟过期；今天的 RSS 数据库有新提交时立即失效
+        version = self._get_days_version(1, db_type="rss")
+        cached = self.cache.get(cache_key, ttl=300, version=version)
         if cached:
             return cached
 
@@ -895,6 +896,6 @@ class DataService:
             "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
 
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=300, version=version)
 
         return result
@@ -0,0 +1,211 @@
+"""
+工具执行层
+
+MCP 工具方法均为同步实现，由服务器放到线程中执行。执行层按工具类别划分执行通道，
+每个通道使用独立的有界线程池，突发的重量分析请求只会在各自通道中排队，
+不会无限制地创建线程争用 GIL 和 SQLite：
+- query: 轻量查询（单日读取、配置与状态查询，以缓存命中为主）
+- analytics: 重量分析（多日遍历、聚合、相似度计算、跨日期搜索）
+- system: 系统操作（爬取、同步、版本检查；有副作用，不做去重）
+
+每次调用带截止时间：超时后立即向调用方返回 DEADLINE_EXCEEDED 错误；工作线程中的
+多日循环在每一步之间调用 check_deadline()，截止时间已过或调用方已全部离开时抛出
+DeadlineExceededError，提前结束计算并释放线程。
+
+参数完全相同的并发调用共享同一次计算（in-flight 去重）：后到的请求直接等待
+正在进行的计算结果，计算完成后即从去重表移除，不缓存结果。
+"""
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+
+from ..utils.errors import DeadlineExceededError
+
+
+# 执行通道配置：max_workers 为并发上限，timeout 为截止时间（秒），dedupe 为是否去重
+TOOL_LANES = {
+    "query": {"max_workers": 8, "timeout": 60, "dedupe": True},
+    "analytics": {"max_workers": 3, "timeout": 120, "dedupe": True},
+    "system": {"max_workers": 2, "timeout": 600, "dedupe": False},
+}
+
+
+class Deadline:
+    """调用的截止时间（可被取消）"""
+
+    __slots__ = ("timeout", "expires_at", "cancelled")
+
+    def __init__(self, timeout: Optional[float]):
+        """
+        Args:
+            timeout: 超时时间（秒），None 表示不限时
+        """
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout if timeout is not None else None
+        self.cancelled = False
+
+    def remaining(self) -> Optional[float]:
+        """剩余时间（秒），不限时返回 None"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def cancel(self) -> None:
+        """取消调用（工作线程在下一个检查点放弃计算）"""
+        self.cancelled = True
+
+    def check(self) -> None:
+        """
+        检查是否已超时或被取消
+
+        Raises:
+            DeadlineExceededError: 已超时或被取消
+        """
+        if self.cancelled:
+            raise DeadlineExceededError("请求已取消")
+        if self.expires_at is not None and time.monotonic() >= self.expires_at:
+            raise DeadlineExceededError(f"请求超过 {self.timeout} 秒未完成")
+
+
+# 当前线程正在执行的调用的截止时间
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("tool_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """
+    获取当前调用的截止时间，供需要阻塞等待的代码限定等待时长
+
+    Returns:
+        Deadline，不是通过执行层调用时返回 None
+    """
+    return _current_deadline.get()
+
+
+def check_deadline() -> None:
+    """
+    检查当前调用的截止时间，供多日循环等长时间计算在每一步之间调用
+
+    不是通过执行层调用时（如脚本、基准测试直接调用工具方法）不做任何检查。
+
+    Raises:
+        DeadlineExceededError: 已超时或被取消
+    """
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.check()
+
+
+def _invoke(deadline: Deadline, func: Callable[..., Any], args: tuple, kwargs: Dict) -> Any:
+    """在工作线程中执行工具方法"""
+    token = _current_deadline.set(deadline)
+    try:
+        # 排队期间已超时或被取消时不再开始计算
+        deadline.check()
+        return func(*args, **kwargs)
+    except DeadlineExceededError as e:
+        return {"success": False, "error": e.to_dict()}
+    finally:
+        _current_deadline.reset(token)
+
+
+class _InflightCall:
+    """正在进行的计算"""
+
+    __slots__ = ("future", "deadline", "waiters")
+
+    def __init__(self, future: "asyncio.Future", deadline: Deadline):
+        self.future = future
+        self.deadline = deadline
+        self.waiters = 0
+
+
+class ToolExecutor:
+    """
+    工具执行器（在事件循环中使用）
+
+    使用示例:
+        executor = ToolExecutor()
+        result = await executor.run("analytics", tools.aggregate_news, date_range=date_range)
+    """
+
+    def __init__(self, lanes: Optional[Dict[str, Dict]] = None):
+        """
+        Args:
+            lanes: 执行通道配置，默认为 TOOL_LANES
+        """
+        self.lanes = {name: dict(config) for name, config in (lanes or TOOL_LANES).items()}
+        self._pools: Dict[str, ThreadPoolExecutor] = {}
+        self._inflight: Dict[str, _InflightCall] = {}
+
+    def _get_pool(self, lane: str) -> ThreadPoolExecutor:
+        """获取通道的线程池（首次使用时创建）"""
+        pool = self._pools.get(lane)
+        if pool is None:
+            pool = self._pools[lane] = ThreadPoolExecutor(
+                max_workers=self.lanes[lane]["max_workers"], thread_name_prefix=f"tool-{lane}"
+            )
+        return pool
+
+    @staticmethod
+    def _make_key(func: Callable[..., Any], args: tuple, kwargs: Dict) -> str:
+        """生成去重 key（方法名 + 参数）"""
+        name = getattr(func, "__qualname__", repr(func))
+        params = json.dumps([args, kwargs], sort_keys=True, ensure_ascii=False, default=str)
+        return f"{name}:{params}"
+
+    def _forget(self, key: Optional[str], call: _InflightCall) -> None:
+        """从去重表移除计算（已被新的计算替换时保留）"""
+        if key is not None and self._inflight.get(key) is call:
+            del self._inflight[key]
+
+    def _on_done(self, key: Optional[str], call: _InflightCall) -> None:
+        """计算结束：移出去重表，并取走异常（调用方均已离开时避免未取走异常的警告）"""
+        self._forget(key, call)
+        if not call.future.cancelled():
+            call.future.exception()
+
+    async def run(self, lane: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        在指定通道中执行工具方法
+
+        Args:
+            lane: 执行通道名称（见 TOOL_LANES）
+            func: 同步工具方法
+            *args, **kwargs: 方法参数
+
+        Returns:
+            方法返回值；超时或被取消时返回 {"success": False, "error": {"code": "DEADLINE_EXCEEDED", ...}}
+        """
+        config = self.lanes[lane]
+        key = self._make_key(func, args, kwargs) if config.get("dedupe", True) else None
+
+        call = self._inflight.get(key) if key is not None else None
+        if call is None:
+            deadline = Deadline(config.get("timeout"))
+            future = asyncio.get_running_loop().run_in_executor(
+                self._get_pool(lane), _invoke, deadline, func, args, kwargs
+            )
+            call = _InflightCall(future, deadline)
+            if key is not None:
+                self._inflight[key] = call
+            future.add_done_callback(lambda _: self._on_done(key, call))
+
+        call.waiters += 1
+        try:
+            # shield：单个调用方超时或取消不影响共享同一计算的其他调用方
+            return await asyncio.wait_for(asyncio.shield(call.future), call.deadline.remaining())
+        except asyncio.TimeoutError:
+            return {
+                "success": False,
+                "error": DeadlineExceededError(f"请求超过 {call.deadline.timeout} 秒未完成").to_dict()
+            }
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.future.done():
+                # 已没有调用方等待结果：通知工作线程在下一个检查点放弃计算，新请求重新计算
+                call.deadline.cancel()
+                self._forget(key, call)
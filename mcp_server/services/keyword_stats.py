@@ -0,0 +1,531 @@
+"""
+每日关键词统计表
+
+热点话题（auto_extract）、异常热度检测、话题预测和关键词共现原本在每次调用时
+对当天（以及作为基准的前几天）的全部标题重新分词统计。
+
+关键词统计表按日期和分词方式物化一次：
+- 关键词 → 出现该词的标题（按出现次数重复，出现次数即频次）、平台、最佳排名
+- 关键词对 → 共现次数（同一标题内两两组合，只有关键词共现分析使用的 keywords 分词方式统计）
+
+统计表在日期数据库文件变化（爬虫写入新批次）后重新计算。已结束的日期持久化到
+output/index/keyword_stats.db，进程重启后无需重新分词；今天的数据库仍在不断写入，
+其统计表只缓存在内存中，不在每个新批次后重写存储；
+日期数据库文件被清理后，对应的统计数据在打开存储和写入新统计表时一并删除；
+内存中的统计表以数据库文件版本缓存，各工具只做查表。
+统计口径（顺序、重复计数）与原逐条分词的实现一致。
+"""
+
+import json
+import re
+import sqlite3
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..utils.errors import DataNotFoundError
+from .cache_service import get_cache
+from .parser_service import ParserService
+
+
+# 标题词语停用词（auto_extract 模式）
+TITLE_STOPWORDS = {
+    '的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一',
+    '一个', '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有',
+    '看', '好', '自己', '这', '那', '来', '被', '与', '为', '对', '将', '从',
+    '以', '及', '等', '但', '或', '而', '于', '中', '由', '可', '可以', '已',
+    '已经', '还', '更', '最', '再', '因为', '所以', '如果', '虽然', '然而',
+    '什么', '怎么', '如何', '哪', '哪些', '多少', '几', '这个', '那个',
+    '他', '她', '它', '他们', '她们', '我们', '你们', '大家', '自己',
+    '这样', '那样', '怎样', '这么', '那么', '多么', '非常', '特别',
+    '应该', '可能', '能够', '需要', '必须', '一定', '肯定', '确实',
+    '正在', '已经', '曾经', '将要', '即将', '刚刚', '马上', '立刻',
+    '回应', '发布', '表示', '称', '曝', '官方', '最新', '重磅', '突发',
+    '热搜', '刷屏', '引发', '关注', '网友', '评论', '转发', '点赞'
+}
+
+# 关键词停用词（analytics 工具的简单分词）
+KEYWORD_STOPWORDS = {
+    '的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个', '上', '也', '很',
+    '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好', '自己', '这'
+}
+
+
+def split_keywords(title: str, min_length: int = 2) -> List[str]:
+    """
+    从标题中提取关键词（按空格和标点切分）
+
+    Args:
+        title: 标题文本
+        min_length: 最小关键词长度
+
+    Returns:
+        关键词列表（按出现顺序，可能重复）
+    """
+    # 移除URL和特殊字符
+    title = re.sub(r'http[s]?://\S+', '', title)
+    title = re.sub(r'[^\w\s]', ' ', title)
+
+    # 简单分词（按空格和常见分隔符）
+    words = re.split(r'[\s，。！？、]+', title)
+
+    keywords = []
+    for word in words:
+        word = word.strip()
+        if word and len(word) >= min_length and word not in KEYWORD_STOPWORDS:
+            keywords.append(word)
+    return keywords
+
+
+def extract_title_words(title: str, min_length: int = 2) -> List[str]:
+    """
+    从标题中提取有意义的词语（连续中文或英文单词，过滤停用词）
+
+    Args:
+        title: 新闻标题
+        min_length: 最小词长
+
+    Returns:
+        词语列表（按出现顺序，可能重复）
+    """
+    # 移除URL和特殊字符
+    title = re.sub(r'http[s]?://\S+', '', title)
+    title = re.sub(r'\[.*?\]', '', title)  # 移除方括号内容
+    title = re.sub(r'[【】《》「」『』""''・·•]', '', title)  # 移除中文标点
+
+    # 匹配连续的中文字符或英文单词
+    words = re.findall(r'[\u4e00-\u9fff]{2,}|[a-zA-Z]{2,}[a-zA-Z0-9]*', title)
+
+    # 过滤停用词和短词
+    return [
+        word for word in words
+        if word and len(word) >= min_length and word.lower() not in TITLE_STOPWORDS
+        and word not in TITLE_STOPWORDS
+    ]
+
+
+# 分词方式：统计表按分词方式分别物化
+EXTRACTORS: Dict[str, Callable[[str], List[str]]] = {
+    "keywords": split_keywords,
+    "words": extract_title_words,
+}
+
+# 需要统计关键词对的分词方式（关键词共现分析只使用 keywords 分词）
+PAIR_EXTRACTORS = {"keywords"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stats_days (
+    date TEXT NOT NULL,
+    extractor TEXT NOT NULL,
+    db_version TEXT NOT NULL,
+    title_count INTEGER NOT NULL,
+    term_count INTEGER NOT NULL,
+    computed_at TEXT NOT NULL,
+    PRIMARY KEY (date, extractor)
+);
+
+CREATE TABLE IF NOT EXISTS stats_titles (
+    date TEXT NOT NULL,
+    extractor TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    PRIMARY KEY (date, extractor, seq)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS stats_terms (
+    date TEXT NOT NULL,
+    extractor TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    term TEXT NOT NULL,
+    title_ids TEXT NOT NULL,
+    platforms TEXT NOT NULL,
+    best_rank INTEGER,
+    PRIMARY KEY (date, extractor, seq)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS stats_pairs (
+    date TEXT NOT NULL,
+    extractor TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    term1 TEXT NOT NULL,
+    term2 TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (date, extractor, seq)
+) WITHOUT ROWID;
+"""
+
+
+class DayKeywordStats:
+    """
+    单日关键词统计（只读，进程内所有会话共享）
+
+    关键词和关键词对按首次出现的顺序保存（与逐条统计时 Counter 的插入顺序一致）。
+    """
+
+    def __init__(
+        self,
+        titles: List[str],
+        postings: Dict[str, List[int]],
+        platforms: Dict[str, List[str]],
+        best_ranks: Dict[str, Optional[int]],
+        pairs: Dict[Tuple[str, str], int],
+    ):
+        """
+        Args:
+            titles: 至少包含一个关键词的标题（按遍历顺序，不同平台的相同标题分别保存）
+            postings: 关键词 → 标题序号列表（标题中每出现一次记录一次）
+            platforms: 关键词 → 平台ID列表
+            best_ranks: 关键词 → 最佳（最小）排名
+            pairs: (关键词1, 关键词2) → 共现次数，关键词对按字符串排序（未统计时为空）
+        """
+        self.titles = titles
+        self.postings = postings
+        self.platforms = platforms
+        self.best_ranks = best_ranks
+        self.pairs = pairs
+        self.counts: Dict[str, int] = {term: len(ids) for term, ids in postings.items()}
+
+    @classmethod
+    def build(
+        cls,
+        all_titles: Dict,
+        extractor: Callable[[str], List[str]],
+        with_pairs: bool = True,
+    ) -> "DayKeywordStats":
+        """
+        从单日标题数据计算统计表
+
+        Args:
+            all_titles: read_all_titles_for_date 返回的标题数据
+            extractor: 分词函数
+            with_pairs: 是否统计关键词对（两两组合的开销随标题词数平方增长）
+
+        Returns:
+            统计表
+        """
+        titles: List[str] = []
+        postings: Dict[str, List[int]] = {}
+        platforms: Dict[str, List[str]] = {}
+        best_ranks: Dict[str, Optional[int]] = {}
+        pairs: Counter = Counter()
+
+        for platform_id, platform_titles in all_titles.items():
+            for title, info in platform_titles.items():
+                words = extractor(title)
+                if not words:
+                    continue
+
+                title_id = len(titles)
+                titles.append(title)
+                ranks = info.get("ranks") or []
+                best_rank = min(ranks) if ranks else None
+
+                for word in words:
+                    postings.setdefault(word, []).append(title_id)
+                    word_platforms = platforms.setdefault(word, [])
+                    if platform_id not in word_platforms:
+                        word_platforms.append(platform_id)
+                    if best_rank is not None:
+                        current = best_ranks.get(word)
+                        if current is None or best_rank < current:
+                            best_ranks[word] = best_rank
+                    else:
+                        best_ranks.setdefault(word, None)
+
+                if not with_pairs:
+                    continue
+
+                # 两两共现（按出现位置组合，与逐条统计一致）
+                for i, first in enumerate(words):
+                    for second in words[i + 1:]:
+                        pairs[(first, second) if first <= second else (second, first)] += 1
+
+        return cls(titles, postings, platforms, best_ranks, dict(pairs))
+
+    def news_count(self, term: str) -> int:
+        """包含关键词的不同标题数"""
+        return len({self.titles[i] for i in self.postings.get(term, ())})
+
+    def sample_titles(self, term: str, limit: int = 3) -> List[str]:
+        """
+        包含关键词的标题样本
+
+        Args:
+            term: 关键词
+            limit: 样本数量
+
+        Returns:
+            按遍历顺序的前 limit 个标题（关键词在标题中出现多次时重复）
+        """
+        return [self.titles[i] for i in self.postings.get(term, ())[:limit]]
+
+    def pair_sample_titles(self, term1: str, term2: str, limit: int = 3) -> List[str]:
+        """
+        同时包含两个关键词的标题样本
+
+        Args:
+            term1: 关键词1（按其出现位置遍历）
+            term2: 关键词2
+            limit: 样本数量
+
+        Returns:
+            标题样本列表
+        """
+        with_second = set(self.postings.get(term2, ()))
+        samples = []
+        for title_id in self.postings.get(term1, ()):
+            if title_id in with_second:
+                samples.append(self.titles[title_id])
+                if len(samples) >= limit:
+                    break
+        return samples
+
+
+class KeywordStatsStore:
+    """
+    每日关键词统计表的存储（内存缓存 + SQLite 持久化）
+
+    使用示例:
+        stats = store.get(date, "keywords")
+        for keyword, count in stats.counts.items():
+            ...
+    """
+
+    def __init__(self, parser: ParserService, store_path: Optional[Path] = None):
+        """
+        初始化统计表存储（首次写入时才创建文件）
+
+        Args:
+            parser: 数据解析服务（用于读取日期数据库）
+            store_path: 存储文件路径，默认为 output/index/keyword_stats.db
+        """
+        self.parser = parser
+        self.cache = get_cache()
+        self.store_path = store_path or (parser.project_root / "output" / "index" / "keyword_stats.db")
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = Lock()
+        self._load_locks: Dict[str, Lock] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        """获取存储连接（懒加载）"""
+        if self._conn is None:
+            self.store_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.store_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._prune_missing_days(conn)
+        return self._conn
+
+    def _prune_missing_days(self, conn: sqlite3.Connection) -> None:
+        """删除日期数据库文件已不存在的统计数据（调用方需持有 _lock）"""
+        try:
+            dates = [date_str for (date_str,) in conn.execute("SELECT DISTINCT date FROM stats_days")]
+            missing = [
+                date_str for date_str in dates
+                if not (self.parser.project_root / "output" / "news" / f"{date_str}.db").exists()
+            ]
+            if missing:
+                with conn:
+                    for date_str in missing:
+                        self._delete_rows(conn, date_str)
+        except sqlite3.Error as e:
+            print(f"Warning: 关键词统计表清理失败: {e}")
+
+    def close(self) -> None:
+        """关闭存储连接"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get(self, date: datetime = None, extractor: str = "keywords") -> DayKeywordStats:
+        """
+        获取单日关键词统计表
+
+        Args:
+            date: 日期对象，默认为今天
+            extractor: 分词方式（"keywords" 或 "words"）
+
+        Returns:
+            统计表
+
+        Raises:
+            DataNotFoundError: 该日期没有数据
+        """
+        date_str = self.parser.get_date_folder_name(date)
+        version = self.parser.get_db_version(date)
+        if version is None:
+            self._delete_day(date_str)
+            raise DataNotFoundError(
+                f"未找到 {date_str} 的 news 数据",
+                suggestion="请先运行爬虫或检查日期是否正确"
+            )
+
+        cache_key = f"keyword_stats:{extractor}:{date_str}"
+        # 只有已结束的日期读写持久化存储
+        closed = date_str < self.parser.get_date_folder_name()
+        stats = self.cache.get(cache_key, ttl=None, version=version)
+        if stats is not None:
+            return stats
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(cache_key, Lock())
+        try:
+            with load_lock:
+                # 等待期间其他会话可能已完成计算
+                stats = self.cache.get(cache_key, ttl=None, version=version)
+                if stats is None:
+                    stats = self._load(date_str, extractor, version) if closed else None
+                    if stats is None:
+                        all_titles, _, _ = self.parser.read_all_titles_for_date(date)
+                        stats = DayKeywordStats.build(
+                            all_titles, EXTRACTORS[extractor], with_pairs=extractor in PAIR_EXTRACTORS
+                        )
+                        if closed:
+                            self._save(date_str, extractor, version, stats)
+                    self.cache.set(cache_key, stats, version=version)
+        finally:
+            # 加载结束即移除加载锁（已被新的锁替换时保留），避免按日期累积
+            with self._lock:
+                if self._load_locks.get(cache_key) is load_lock:
+                    del self._load_locks[cache_key]
+        return stats
+
+    def _load(self, date_str: str, extractor: str, version: Tuple) -> Optional[DayKeywordStats]:
+        """读取与数据库文件版本一致的持久化统计表，不存在或已过期时返回 None"""
+        if not self.store_path.exists():
+            return None
+
+        with self._lock:
+            try:
+                conn = self._connect()
+                params = {"date": date_str, "extractor": extractor}
+                row = conn.execute(
+                    "SELECT db_version FROM stats_days WHERE date = :date AND extractor = :extractor",
+                    params,
+                ).fetchone()
+                if row is None or tuple(json.loads(row[0])) != tuple(version):
+                    return None
+
+                titles = [
+                    title for (title,) in conn.execute(
+                        "SELECT title FROM stats_titles WHERE date = :date AND extractor = :extractor ORDER BY seq",
+                        params,
+                    )
+                ]
+                postings, platforms, best_ranks = {}, {}, {}
+                for term, title_ids, term_platforms, best_rank in conn.execute(
+                    """
+                    SELECT term, title_ids, platforms, best_rank FROM stats_terms
+                    WHERE date = :date AND extractor = :extractor ORDER BY seq
+                    """,
+                    params,
+                ):
+                    postings[term] = json.loads(title_ids)
+                    platforms[term] = json.loads(term_platforms)
+                    best_ranks[term] = best_rank
+                pairs = {
+                    (term1, term2): count
+                    for term1, term2, count in conn.execute(
+                        """
+                        SELECT term1, term2, count FROM stats_pairs
+                        WHERE date = :date AND extractor = :extractor ORDER BY seq
+                        """,
+                        params,
+                    )
+                }
+            except sqlite3.Error as e:
+                print(f"Warning: 关键词统计表读取失败，改为重新计算: {e}")
+                return None
+
+        return DayKeywordStats(titles, postings, platforms, best_ranks, pairs)
+
+    def _save(self, date_str: str, extractor: str, version: Tuple, stats: DayKeywordStats) -> None:
+        """持久化统计表（替换该日期、分词方式的旧数据）"""
+        with self._lock:
+            try:
+                conn = self._connect()
+                with conn:
+                    self._delete_rows(conn, date_str, extractor)
+                    conn.executemany(
+                        "INSERT INTO stats_titles VALUES (?, ?, ?, ?)",
+                        ((date_str, extractor, seq, title) for seq, title in enumerate(stats.titles)),
+                    )
+                    conn.executemany(
+                        "INSERT INTO stats_terms VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            (
+                                date_str, extractor, seq, term,
+                                json.dumps(title_ids),
+                                json.dumps(stats.platforms[term], ensure_ascii=False),
+                                stats.best_ranks.get(term),
+                            )
+                            for seq, (term, title_ids) in enumerate(stats.postings.items())
+                        ),
+                    )
+                    conn.executemany(
+                        "INSERT INTO stats_pairs VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            (date_str, extractor, seq, term1, term2, count)
+                            for seq, ((term1, term2), count) in enumerate(stats.pairs.items())
+                        ),
+                    )
+                    conn.execute(
+                        "INSERT INTO stats_days VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            date_str, extractor, json.dumps(list(version)),
+                            len(stats.titles), len(stats.postings),
+                            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                        ),
+                    )
+                self._prune_missing_days(conn)
+            except sqlite3.Error as e:
+                print(f"Warning: 关键词统计表保存失败: {e}")
+
+    @staticmethod
+    def _delete_rows(conn: sqlite3.Connection, date_str: str, extractor: Optional[str] = None) -> None:
+        """删除日期（及分词方式）的统计数据"""
+        condition = "date = ?" + (" AND extractor = ?" if extractor else "")
+        params = (date_str, extractor) if extractor else (date_str,)
+        for table in ("stats_titles", "stats_terms", "stats_pairs", "stats_days"):
+            conn.execute(f"DELETE FROM {table} WHERE {condition}", params)
+
+    def _delete_day(self, date_str: str) -> None:
+        """日期数据库文件已被清理：删除该日统计数据"""
+        if not self.store_path.exists():
+            return
+        with self._lock:
+            try:
+                conn = self._connect()
+                with conn:
+                    self._delete_rows(conn, date_str)
+            except sqlite3.Error:
+                pass
+
+
+# 按项目根目录共享的存储实例
+_stores: Dict[str, KeywordStatsStore] = {}
+_stores_lock = Lock()
+
+
+def get_keyword_stats_store(parser: ParserService) -> KeywordStatsStore:
+    """
+    获取项目的共享关键词统计表存储
+
+    Args:
+        parser: 数据解析服务
+
+    Returns:
+        统计表存储实例
+    """
+    key = str(Path(parser.project_root).resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = KeywordStatsStore(parser)
+            _stores[key] = store
+        return store
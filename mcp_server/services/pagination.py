@@ -0,0 +1,151 @@
+"""
+游标分页
+
+搜索、按日期查询、聚合和相关新闻等工具需要先得到完整的结果集并排序，再按 limit 截断。
+分页时把完整的排序结果（快照）缓存在服务端，以查询参数的哈希和数据版本作为 key：
+第一页计算并缓存快照，后续页凭游标直接从快照切片，只需 O(页大小)。
+
+游标是不透明字符串（URL 安全的 base64 JSON），记录查询标识、快照版本、偏移量和
+上一页最后一条结果的标识键：
+- 游标与当前查询参数不一致时报参数错误
+- 快照仍在缓存中时，后续页始终来自同一快照，翻页期间写入的新数据不会造成重复或遗漏
+- 快照已过期或被淘汰时重新计算：数据未变化则按偏移量继续；数据已变化则定位上一页
+  最后一条结果并从其后继续（找不到时退回偏移量）
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .cache_service import CacheService, make_cache_key
+from ..utils.errors import InvalidParameterError
+
+
+# 结果快照的存活时间（秒）
+PAGES_TTL = 600
+
+
+class ResultPage:
+    """一页结果"""
+
+    __slots__ = ("items", "offset", "total", "next_cursor", "snapshot")
+
+    def __init__(self, items: List, offset: int, total: int, next_cursor: Optional[str], snapshot: Dict):
+        self.items = items
+        self.offset = offset
+        self.total = total
+        self.next_cursor = next_cursor
+        self.snapshot = snapshot
+
+
+class ResultPager:
+    """
+    基于缓存快照的游标分页
+
+    使用示例:
+        page = pager.get_page(
+            "search_news", {"query": "AI"}, limit=50,
+            load=lambda: {"items": sorted_results},
+            item_key=lambda x: (x["date"], x["platform"], x["title"]),
+            version=version, cursor=cursor
+        )
+        page.items, page.next_cursor
+    """
+
+    def __init__(self, cache: CacheService):
+        """
+        Args:
+            cache: 缓存服务（快照保存在 pages 命名空间）
+        """
+        self.cache = cache
+
+    def get_page(
+        self,
+        tool: str,
+        params: Dict[str, Any],
+        limit: int,
+        load: Callable[[], Dict],
+        item_key: Callable[[Any], Tuple],
+        version: Any = None,
+        cursor: Optional[str] = None
+    ) -> ResultPage:
+        """
+        获取一页结果
+
+        Args:
+            tool: 工具名称
+            params: 决定结果集的查询参数（不含 limit 和 cursor）
+            limit: 本页条数
+            load: 计算完整结果快照的函数，返回 {"items": 排序后的完整列表, ...}，
+                其余字段随快照一起缓存，供各页生成摘要
+            item_key: 结果条目的标识键（由字符串/整数组成的元组），用于数据变化后续页定位
+            version: 结果依赖的数据版本（如相关日期数据库文件的版本）
+            cursor: 上一页返回的 next_cursor，None 表示第一页
+
+        Returns:
+            ResultPage
+
+        Raises:
+            InvalidParameterError: 游标无效或与查询参数不匹配
+        """
+        query_id = make_cache_key(tool, **params)
+        version_id = hashlib.md5(repr(version).encode("utf-8")).hexdigest()[:8]
+
+        offset = 0
+        after = None
+        if cursor:
+            cursor_query, snapshot_id, offset, after = self._decode_cursor(cursor)
+            if cursor_query != query_id:
+                raise InvalidParameterError(
+                    "cursor 与当前查询参数不匹配",
+                    suggestion="翻页时请保持除 limit 以外的参数不变，或去掉 cursor 重新查询"
+                )
+        else:
+            snapshot_id = version_id
+
+        snapshot = self.cache.get(f"pages:{query_id}:{snapshot_id}", ttl=PAGES_TTL)
+        if snapshot is None:
+            snapshot = load()
+            if cursor and snapshot_id != version_id and after is not None:
+                # 快照已失效且数据已变化：从上一页最后一条结果之后继续
+                for position, item in enumerate(snapshot["items"]):
+                    if list(item_key(item)) == after:
+                        offset = position + 1
+                        break
+            snapshot_id = version_id
+            self.cache.set(f"pages:{query_id}:{snapshot_id}", snapshot, ttl=PAGES_TTL)
+
+        items = snapshot["items"]
+        page = items[offset:offset + limit]
+        end = offset + len(page)
+
+        next_cursor = None
+        if end < len(items):
+            next_cursor = self._encode_cursor(query_id, snapshot_id, end, list(item_key(items[end - 1])))
+
+        return ResultPage(page, offset, len(items), next_cursor, snapshot)
+
+    @staticmethod
+    def _encode_cursor(query_id: str, snapshot_id: str, offset: int, after: List) -> str:
+        """编码游标"""
+        payload = json.dumps([query_id, snapshot_id, offset, after], ensure_ascii=False, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[str, str, int, Optional[List]]:
+        """解码游标"""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            query_id, snapshot_id, offset, after = json.loads(
+                base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+            )
+            if not isinstance(offset, int) or offset < 0:
+                raise ValueError(offset)
+            return str(query_id), str(snapshot_id), offset, after
+        except (ValueError, TypeError, UnicodeError, binascii.Error):
+            raise InvalidParameterError(
+                "无效的 cursor",
+                suggestion="请使用上一页返回的 next_cursor 原样传入"
+            )
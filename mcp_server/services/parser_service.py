@@ -7,14 +7,109 @@ v2.0.0: 仅支持 SQLite 数据库，移除 TXT 文件支持
 
 import re
 import sqlite3
+import sys
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+from threading import Lock
+from typing import Collection, Dict, Iterable, Iterator, List, Tuple, Optional
+from datetime import datetime, timedelta
 
 import yaml
 
 from ..utils.errors import FileParseError, DataNotFoundError
 from .cache_service import get_cache
+from .execution import check_deadline, current_deadline
+
+
+class DayDataset:
+    """
+    单日全部平台的数据（进程内所有会话共享，只读）
+
+    按平台过滤时返回共享同一批标题字典的视图，不再按平台组合重复读取 SQLite；
+    视图按平台组合缓存，相同组合返回同一对象。调用方不得修改返回的字典。
+
+    数据集放入缓存时按当时的大小计入预算，之后创建的视图不再计入，
+    因此视图缓存只保留最近使用的 MAX_VIEWS 个平台组合。
+    """
+
+    # 视图缓存的平台组合数上限
+    MAX_VIEWS = 16
+
+    def __init__(self, all_titles: Dict, id_to_name: Dict, all_timestamps: Dict):
+        self.all_titles = all_titles
+        self.id_to_name = id_to_name
+        self.all_timestamps = all_timestamps
+        self._views: "OrderedDict[Tuple[str, ...], Optional[Tuple[Dict, Dict, Dict]]]" = OrderedDict()
+        self._views_lock = Lock()
+
+    def view(self, platform_ids: Optional[List[str]] = None) -> Optional[Tuple[Dict, Dict, Dict]]:
+        """
+        获取平台过滤视图
+
+        Args:
+            platform_ids: 平台/Feed ID列表，None表示所有
+
+        Returns:
+            (all_titles, id_to_name, all_timestamps) 元组，过滤后没有数据时返回 None
+        """
+        if not platform_ids:
+            return (self.all_titles, self.id_to_name, self.all_timestamps)
+
+        key = tuple(sorted(set(platform_ids)))
+        with self._views_lock:
+            if key in self._views:
+                self._views.move_to_end(key)
+                return self._views[key]
+
+        wanted = set(key)
+        titles = {pid: items for pid, items in self.all_titles.items() if pid in wanted}
+        names = {pid: self.id_to_name[pid] for pid in titles}
+        view = (titles, names, self.all_timestamps) if titles else None
+
+        with self._views_lock:
+            self._views[key] = view
+            while len(self._views) > self.MAX_VIEWS:
+                self._views.popitem(last=False)
+        return view
+
+
+# 按缓存键的加载锁：多个会话同时请求同一天时只读取一次 SQLite
+_load_locks: Dict[str, Lock] = {}
+_load_locks_guard = Lock()
+
+
+@contextmanager
+def _load_lock(key: str) -> Iterator[None]:
+    """持有缓存键的加载锁，加载结束即移除（已被新的锁替换时保留），避免按日期累积"""
+    with _load_locks_guard:
+        lock = _load_locks.get(key)
+        if lock is None:
+            lock = _load_locks[key] = Lock()
+    try:
+        with lock:
+            yield
+    finally:
+        with _load_locks_guard:
+            if _load_locks.get(key) is lock:
+                del _load_locks[key]
+
+
+# 多日范围读取的共享线程池（各日数据库只读、互不依赖，SQLite 查询期间释放 GIL）
+RANGE_LOAD_WORKERS = 4
+_range_executor: Optional[ThreadPoolExecutor] = None
+_range_executor_guard = Lock()
+
+
+def _get_range_executor() -> ThreadPoolExecutor:
+    global _range_executor
+    with _range_executor_guard:
+        if _range_executor is None:
+            _range_executor = ThreadPoolExecutor(
+                max_workers=RANGE_LOAD_WORKERS, thread_name_prefix="range-loader"
+            )
+        return _range_executor
 
 
 class ParserService:
@@ -75,6 +170,51 @@ class ParserService:
             return db_path
         return None
 
+    def get_db_version(self, date: datetime = None, db_type: str = "news") -> Optional[Tuple[int, ...]]:
+        """
+        获取数据库文件版本
+
+        爬虫每次提交都会改变数据库文件（及 WAL 文件）的修改时间或大小，
+        用作缓存版本可以在新数据写入后立即让缓存失效。
+
+        Args:
+            date: 日期对象，默认为今天
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            (mtime_ns, size, wal_mtime_ns, wal_size) 元组，数据库不存在时返回 None
+        """
+        date_str = self.get_date_folder_name(date)
+        db_path = self.project_root / "output" / db_type / f"{date_str}.db"
+        try:
+            stat = db_path.stat()
+        except OSError:
+            return None
+
+        try:
+            wal_stat = db_path.with_name(db_path.name + "-wal").stat()
+            wal_version = (wal_stat.st_mtime_ns, wal_stat.st_size)
+        except OSError:
+            wal_version = (0, 0)
+
+        return (stat.st_mtime_ns, stat.st_size) + wal_version
+
+    def get_dates_version(self, dates: Iterable[datetime], db_type: str = "news") -> Tuple:
+        """
+        获取多个日期数据库文件的组合版本（用作跨日期查询结果的缓存版本）
+
+        Args:
+            dates: 日期列表
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            ((日期, 版本), ...) 元组，任一天的数据库变化时版本随之变化
+        """
+        return tuple(
+            (self.get_date_folder_name(date), self.get_db_version(date, db_type))
+            for date in dates
+        )
+
     def _read_from_sqlite(
         self,
         date: datetime = None,
@@ -101,7 +241,8 @@ class ParserService:
         all_timestamps = {}
 
         try:
-            conn = sqlite3.connect(str(db_path))
+            # 只读连接：与爬虫写入互不阻塞
+            conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
@@ -178,7 +319,8 @@ class ParserService:
 
         for row in rows:
             news_id = row['id']
-            platform_id = row['platform_id']
+            # 平台ID、抓取时间在大量条目间重复，驻留后共享同一字符串对象（多日缓存时节省内存）
+            platform_id = sys.intern(row['platform_id'])
             platform_name = row['platform_name'] or platform_id
             title = row['title']
 
@@ -194,8 +336,8 @@ class ParserService:
                 "ranks": ranks,
                 "url": row['url'] or "",
                 "mobileUrl": row['mobile_url'] or "",
-                "first_time": row['first_crawl_time'] or "",
-                "last_time": row['last_crawl_time'] or "",
+                "first_time": sys.intern(row['first_crawl_time'] or ""),
+                "last_time": sys.intern(row['last_crawl_time'] or ""),
                 "count": row['crawl_count'] or 1,
             }
 
@@ -261,7 +403,7 @@ class ParserService:
         rows = cursor.fetchall()
 
         for row in rows:
-            feed_id = row['feed_id']
+            feed_id = sys.intern(row['feed_id'])
             feed_name = row['feed_name'] or feed_id
             title = row['title']
 
@@ -276,8 +418,8 @@ class ParserService:
                 "published_at": row['published_at'] or "",
                 "summary": row['summary'] or "",
                 "author": row['author'] or "",
-                "first_time": row['first_crawl_time'] or "",
-                "last_time": row['last_crawl_time'] or "",
+                "first_time": sys.intern(row['first_crawl_time'] or ""),
+                "last_time": sys.intern(row['last_crawl_time'] or ""),
                 "count": row['crawl_count'] or 1,
             }
 
@@ -309,6 +451,10 @@ class ParserService:
         """
         读取指定日期的所有数据（带缓存）
 
+        每个日期只读取并缓存一份全部平台的数据（DayDataset），按平台过滤时返回其视图。
+        缓存以数据库文件版本为准：文件未变化时一直有效（已结束的日期只读取一次），
+        爬虫写入新数据后下一次读取立即重新加载。
+
         Args:
             date: 日期对象，默认为今天
             platform_ids: 平台/Feed ID列表，None表示所有
@@ -321,26 +467,145 @@ class ParserService:
             DataNotFoundError: 数据不存在
         """
         date_str = self.get_date_folder_name(date)
-        platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
-        cache_key = f"read_all:{db_type}:{date_str}:{platform_key}"
-
-        is_today = (date is None) or (date.date() == datetime.now().date())
-        ttl = 900 if is_today else 3600
-
-        cached = self.cache.get(cache_key, ttl=ttl)
-        if cached:
-            return cached
-
-        result = self._read_from_sqlite(date, platform_ids, db_type)
-        if result:
-            self.cache.set(cache_key, result)
-            return result
+        cache_key = f"read_all:{db_type}:{date_str}"
+
+        dataset = None
+        version = self.get_db_version(date, db_type)
+        if version is not None:
+            dataset = self.cache.get(cache_key, ttl=None, version=version)
+            if dataset is None:
+                with _load_lock(cache_key):
+                    # 等待期间其他会话可能已完成加载
+                    dataset = self.cache.get(cache_key, ttl=None, version=version)
+                    if dataset is None:
+                        result = self._read_from_sqlite(date, None, db_type)
+                        if result:
+                            dataset = DayDataset(*result)
+                            # 版本在读取前获取：读取期间若有新提交，下次读取会因版本不一致重新加载
+                            self.cache.set(cache_key, dataset, version=version)
+
+        if dataset is not None:
+            view = dataset.view(platform_ids)
+            if view:
+                return view
 
         raise DataNotFoundError(
             f"未找到 {date_str} 的 {db_type} 数据",
             suggestion="请先运行爬虫或检查日期是否正确"
         )
 
+    def read_day_from_db(
+        self,
+        date: datetime = None,
+        db_type: str = "news"
+    ) -> Optional[Tuple[Dict, Dict, Dict]]:
+        """
+        直接从数据库读取指定日期的全部数据（不经过缓存）
+
+        用于只遍历一次的场景（如建立倒排索引），避免把整天的数据放入共享缓存。
+
+        Args:
+            date: 日期对象，默认为今天
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            (all_titles, id_to_name, all_timestamps) 元组，数据库不存在或无法读取时返回 None
+        """
+        return self._read_from_sqlite(date, None, db_type)
+
+    def iter_titles_for_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        platform_ids: Optional[List[str]] = None,
+        db_type: str = "news",
+        skip_dates: Optional[Collection[str]] = None
+    ) -> Iterator[Tuple[datetime, Optional[Future]]]:
+        """
+        并行读取日期范围内每天的数据，按日期顺序逐天返回
+
+        各天由共享线程池并行调用 read_all_titles_for_date 读取（最多预读
+        2 * RANGE_LOAD_WORKERS 天），调用方可以在后续日期仍在读取时处理已返回的日期。
+        提前结束迭代时取消尚未开始的读取。
+
+        使用示例:
+            for current_date, day in parser.iter_titles_for_range(start_date, end_date):
+                try:
+                    all_titles, id_to_name, timestamps = day.result()
+                except DataNotFoundError:
+                    continue
+
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期（包含）
+            platform_ids: 平台/Feed ID列表，None表示所有
+            db_type: 数据库类型 ("news" 或 "rss")
+            skip_dates: 不需要读取的日期字符串（YYYY-MM-DD），如已由倒排索引提供的日期
+
+        Yields:
+            (日期, Future) 元组：Future.result() 返回 read_all_titles_for_date 的结果，
+            或抛出其异常（如 DataNotFoundError）；skip_dates 中的日期对应 None
+
+        Raises:
+            DeadlineExceededError: 当前工具调用已超时或被取消（每天返回前检查，等待读取时最多等到截止时间）
+        """
+        dates = []
+        current_date = start_date
+        while current_date <= end_date:
+            dates.append(current_date)
+            current_date += timedelta(days=1)
+
+        skip_dates = skip_dates or ()
+        to_load = [date for date in dates if self.get_date_folder_name(date) not in skip_dates]
+        load_set = set(to_load)
+
+        if len(to_load) <= 1:
+            # 单日无需线程池，直接在调用线程读取
+            for date in dates:
+                check_deadline()
+                if date not in load_set:
+                    yield date, None
+                    continue
+                future = Future()
+                try:
+                    future.set_result(self.read_all_titles_for_date(date, platform_ids, db_type))
+                except Exception as e:
+                    future.set_exception(e)
+                yield date, future
+            return
+
+        deadline = current_deadline()
+        executor = _get_range_executor()
+        prefetch = RANGE_LOAD_WORKERS * 2
+        pending = deque()
+        loads = iter(to_load)
+        try:
+            for date in dates:
+                check_deadline()
+                if date not in load_set:
+                    yield date, None
+                    continue
+                while len(pending) < prefetch:
+                    next_date = next(loads, None)
+                    if next_date is None:
+                        break
+                    pending.append(executor.submit(
+                        self.read_all_titles_for_date, next_date, platform_ids, db_type
+                    ))
+                future = pending.popleft()
+                # 等待该日读取完成后再返回，调用方处理期间后续日期继续读取；
+                # 等待不超过当前调用的截止时间，超时后由 check_deadline 抛出
+                while not future.done():
+                    try:
+                        future.exception(timeout=deadline.remaining() if deadline else None)
+                    except FutureTimeoutError:
+                        pass
+                    check_deadline()
+                yield date, future
+        finally:
+            for future in pending:
+                future.cancel()
+
     def parse_yaml_config(self, config_path: str = None) -> dict:
         """
         解析YAML配置文件
@@ -0,0 +1,490 @@
+"""
+跨日期标题倒排索引
+
+关键词/实体搜索、历史相关新闻检索和带话题的时期对比原本逐日读取 output/news/{date}.db
+的全部标题再逐条匹配，30 天、90 天范围的查询需要解码整个时间段的数据。
+
+倒排索引保存在 output/index/news_search.db（SQLite，连接启用 mmap 读取）：
+- titles: 每条标题一行（日期、平台、标题、排名、链接），seq 保留逐日读取时的遍历顺序
+- bigram_postings: 小写标题的字符二元组 → 标题
+- word_postings: 标题关键词（extract_keywords 切分）→ 标题
+- indexed_days: 已索引日期及对应数据库文件的 mtime / 大小
+
+只索引已结束的日期（早于今天）。查询只使用已建立且与数据库文件一致的日期索引，
+范围内尚未索引或已变化的日期交给后台线程建立（日期数据库文件变化后重建，
+文件被清理后删除该日索引），本次查询对这些日期退回逐日读取，不等待建索引。
+查询线程各自使用独立的只读查询连接，后台建索引使用单独的写连接（WAL 模式下读写互不阻塞），
+并发查询之间不再串行。
+索引只用于筛选候选标题，最终匹配仍由各工具原有逻辑完成，结果与逐日扫描一致。
+"""
+
+import json
+import re
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .parser_service import ParserService
+
+
+# 连接的 mmap 上限（字节）
+MMAP_SIZE = 256 * 1024 * 1024
+
+# 子串查询最多使用的二元组数量（取交集，数量越多候选越少）
+MAX_QUERY_BIGRAMS = 16
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS indexed_days (
+    date TEXT PRIMARY KEY,
+    db_mtime REAL NOT NULL,
+    db_size INTEGER NOT NULL,
+    title_count INTEGER NOT NULL,
+    indexed_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS titles (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    platform_id TEXT NOT NULL,
+    platform_name TEXT NOT NULL,
+    title TEXT NOT NULL,
+    ranks TEXT NOT NULL,
+    url TEXT NOT NULL DEFAULT '',
+    mobile_url TEXT NOT NULL DEFAULT ''
+);
+
+CREATE INDEX IF NOT EXISTS idx_titles_date ON titles(date, seq);
+
+CREATE TABLE IF NOT EXISTS bigram_postings (
+    date TEXT NOT NULL,
+    token TEXT NOT NULL,
+    title_id INTEGER NOT NULL,
+    PRIMARY KEY (date, token, title_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS word_postings (
+    date TEXT NOT NULL,
+    token TEXT NOT NULL,
+    title_id INTEGER NOT NULL,
+    PRIMARY KEY (date, token, title_id)
+) WITHOUT ROWID;
+"""
+
+
+def extract_keywords(text: str, min_length: int = 2) -> List[str]:
+    """
+    从文本中提取关键词
+
+    Args:
+        text: 输入文本
+        min_length: 最小词长
+
+    Returns:
+        关键词列表
+    """
+    # 移除URL和特殊字符
+    text = re.sub(r'http[s]?://\S+', '', text)
+    text = re.sub(r'\[.*?\]', '', text)  # 移除方括号内容
+
+    # 使用正则表达式分词（中文和英文）
+    words = re.findall(r'[\w]+', text)
+
+    # 过滤短词
+    return [word for word in words if word and len(word) >= min_length]
+
+
+def _bigrams(text: str) -> Set[str]:
+    """小写文本的字符二元组集合"""
+    text = text.lower()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class SearchIndex:
+    """
+    标题倒排索引
+
+    查询方法返回 {日期: (all_titles, id_to_name)}，结构与 read_all_titles_for_date
+    一致但只包含候选标题（info 中包含 ranks、url、mobileUrl）；
+    未被索引覆盖的日期（今天、无数据、后台尚未建好索引、索引不可用）不出现在结果中，
+    由调用方按原方式读取。
+    """
+
+    def __init__(self, parser: ParserService, index_path: Optional[Path] = None):
+        """
+        初始化倒排索引（首次查询时才创建索引文件）
+
+        Args:
+            parser: 数据解析服务（用于读取日期数据库）
+            index_path: 索引文件路径，默认为 output/index/news_search.db
+        """
+        self.parser = parser
+        self.index_path = index_path or (parser.project_root / "output" / "index" / "news_search.db")
+        # 查询连接（每个线程一个，_lock 只保护连接的创建和登记）
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._lock = Lock()
+        # 后台建索引的连接和线程（单线程，按提交顺序逐日建立）
+        self._writer_conn: Optional[sqlite3.Connection] = None
+        self._writer_lock = Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # 已提交、尚未完成的日期
+        self._pending: Set[str] = set()
+        self._pending_lock = Lock()
+
+    def _open(self) -> sqlite3.Connection:
+        """打开索引连接"""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        """获取当前线程的查询连接（懒加载）"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            with self._lock:
+                conn = self._open()
+                self._readers.append(conn)
+                self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """关闭索引连接（等待进行中的建索引结束）"""
+        with self._pending_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        with self._pending_lock:
+            self._pending.clear()
+        with self._writer_lock:
+            if self._writer_conn is not None:
+                self._writer_conn.close()
+                self._writer_conn = None
+        with self._lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+            # 丢弃各线程持有的已关闭连接
+            self._local = threading.local()
+
+    # ========================================
+    # 索引维护
+    # ========================================
+
+    def _closed_dates(self, start_date: datetime, end_date: datetime) -> List[datetime]:
+        """查询范围内已结束（早于今天）的日期"""
+        today = datetime.now().date()
+        dates = []
+        current = start_date
+        while current <= end_date and current.date() < today:
+            dates.append(current)
+            current += timedelta(days=1)
+        return dates
+
+    def _day_db_stat(self, date_str: str):
+        """日期数据库文件的 stat，文件不存在时返回 None"""
+        db_path = self.parser.project_root / "output" / "news" / f"{date_str}.db"
+        try:
+            return db_path.stat()
+        except OSError:
+            return None
+
+    def _covered_dates(self, conn: sqlite3.Connection, dates: List[datetime]) -> Tuple[List[str], List[datetime]]:
+        """
+        区分已建立最新索引的日期和需要后台处理的日期
+
+        Returns:
+            (被索引覆盖的日期字符串列表（按日期升序）, 需要建立/重建/删除索引的日期列表)
+        """
+        indexed = {
+            row[0]: (row[1], row[2])
+            for row in conn.execute("SELECT date, db_mtime, db_size FROM indexed_days")
+        }
+
+        covered = []
+        stale = []
+        for date in dates:
+            date_str = self.parser.get_date_folder_name(date)
+            stat = self._day_db_stat(date_str)
+            if stat is None:
+                # 数据库文件已被清理：后台删除该日索引
+                if date_str in indexed:
+                    stale.append(date)
+                continue
+
+            if indexed.get(date_str) == (stat.st_mtime, stat.st_size):
+                covered.append(date_str)
+            else:
+                stale.append(date)
+        return covered, stale
+
+    def _schedule(self, dates: List[datetime]) -> None:
+        """把日期交给后台线程建立索引（已在队列中的日期不重复提交）"""
+        with self._pending_lock:
+            for date in dates:
+                date_str = self.parser.get_date_folder_name(date)
+                if date_str in self._pending:
+                    continue
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="search-index")
+                self._pending.add(date_str)
+                self._executor.submit(self._sync_day, date, date_str)
+
+    def _sync_day(self, date: datetime, date_str: str) -> None:
+        """后台建立（或重建、删除）单日索引"""
+        try:
+            with self._writer_lock:
+                if self._writer_conn is None:
+                    self._writer_conn = self._open()
+                conn = self._writer_conn
+                stat = self._day_db_stat(date_str)
+                if stat is None:
+                    with conn:
+                        self._delete_day(conn, date_str)
+                    return
+
+                row = conn.execute(
+                    "SELECT db_mtime, db_size FROM indexed_days WHERE date = ?", (date_str,)
+                ).fetchone()
+                if row is None or tuple(row) != (stat.st_mtime, stat.st_size):
+                    self._index_day(conn, date, date_str, stat)
+        except sqlite3.Error as e:
+            print(f"Warning: 建立 {date_str} 的标题倒排索引失败: {e}")
+        finally:
+            with self._pending_lock:
+                self._pending.discard(date_str)
+
+    def wait_idle(self) -> None:
+        """等待已提交的后台建索引全部完成（用于脚本和基准测试）"""
+        with self._pending_lock:
+            executor = self._executor
+        if executor is not None:
+            executor.submit(lambda: None).result()
+
+    def _delete_day(self, conn: sqlite3.Connection, date_str: str) -> None:
+        """删除日期的全部索引数据"""
+        conn.execute("DELETE FROM bigram_postings WHERE date = ?", (date_str,))
+        conn.execute("DELETE FROM word_postings WHERE date = ?", (date_str,))
+        conn.execute("DELETE FROM titles WHERE date = ?", (date_str,))
+        conn.execute("DELETE FROM indexed_days WHERE date = ?", (date_str,))
+
+    def _index_day(self, conn: sqlite3.Connection, date: datetime, date_str: str, stat) -> bool:
+        """
+        建立（或重建）单日索引
+
+        Returns:
+            是否成功（日期数据库无法读取时返回 False）
+        """
+        result = self.parser.read_day_from_db(date, "news")
+        if result is None:
+            return False
+        all_titles, id_to_name, _ = result
+
+        with conn:
+            self._delete_day(conn, date_str)
+
+            seq = 0
+            bigram_rows = []
+            word_rows = []
+            for platform_id, titles in all_titles.items():
+                platform_name = id_to_name.get(platform_id, platform_id)
+                for title, info in titles.items():
+                    cursor = conn.execute(
+                        """
+                        INSERT INTO titles (date, seq, platform_id, platform_name, title, ranks, url, mobile_url)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            date_str, seq, platform_id, platform_name, title,
+                            json.dumps(info.get("ranks", [])),
+                            info.get("url", ""), info.get("mobileUrl", ""),
+                        ),
+                    )
+                    title_id = cursor.lastrowid
+                    seq += 1
+                    bigram_rows.extend((date_str, token, title_id) for token in _bigrams(title))
+                    word_rows.extend((date_str, token, title_id) for token in set(extract_keywords(title)))
+
+            conn.executemany("INSERT OR IGNORE INTO bigram_postings VALUES (?, ?, ?)", bigram_rows)
+            conn.executemany("INSERT OR IGNORE INTO word_postings VALUES (?, ?, ?)", word_rows)
+            conn.execute(
+                """
+                INSERT INTO indexed_days (date, db_mtime, db_size, title_count, indexed_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (date_str, stat.st_mtime, stat.st_size, seq, datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+            )
+        return True
+
+    # ========================================
+    # 查询
+    # ========================================
+
+    def _lookup(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        platform_ids: Optional[List[str]],
+        id_query: str,
+        params: Dict[str, str],
+    ) -> Dict[str, Tuple[Dict, Dict]]:
+        """按候选标题 ID 子查询（命名参数，:date 为当前日期）读取各日期的候选标题"""
+        dates = self._closed_dates(start_date, end_date)
+        if not dates:
+            return {}
+
+        query = f"""
+            SELECT platform_id, platform_name, title, ranks, url, mobile_url
+            FROM titles
+            WHERE date = :date AND id IN ({id_query})
+        """
+        params = dict(params)
+        if platform_ids:
+            for i, platform_id in enumerate(platform_ids):
+                params[f"p{i}"] = platform_id
+            query += f" AND platform_id IN ({','.join(f':p{i}' for i in range(len(platform_ids)))})"
+        query += " ORDER BY seq"
+
+        results: Dict[str, Tuple[Dict, Dict]] = {}
+        try:
+            conn = self._connect()
+            covered, stale = self._covered_dates(conn, dates)
+            if stale:
+                self._schedule(stale)
+            for date_str in covered:
+                all_titles: Dict[str, Dict] = {}
+                id_to_name: Dict[str, str] = {}
+                params["date"] = date_str
+                for platform_id, platform_name, title, ranks, url, mobile_url in conn.execute(query, params):
+                    id_to_name.setdefault(platform_id, platform_name)
+                    all_titles.setdefault(platform_id, {})[title] = {
+                        "ranks": json.loads(ranks),
+                        "url": url,
+                        "mobileUrl": mobile_url,
+                    }
+                results[date_str] = (all_titles, id_to_name)
+        except sqlite3.Error as e:
+            print(f"Warning: 标题倒排索引不可用，改为逐日读取: {e}")
+            return {}
+        return results
+
+    def lookup_substring(
+        self,
+        query: str,
+        start_date: datetime,
+        end_date: datetime,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Tuple[Dict, Dict]]:
+        """
+        查找可能包含子串的标题（不区分大小写）
+
+        Args:
+            query: 查询子串（少于 2 个字符时不使用索引）
+            start_date: 开始日期
+            end_date: 结束日期
+            platform_ids: 平台ID列表，None表示所有
+
+        Returns:
+            {日期: (候选 all_titles, id_to_name)}，只包含被索引覆盖的日期
+        """
+        tokens = sorted(_bigrams(query))[:MAX_QUERY_BIGRAMS]
+        if not tokens:
+            return {}
+
+        id_query = " INTERSECT ".join(
+            f"SELECT title_id FROM bigram_postings WHERE date = :date AND token = :t{i}"
+            for i in range(len(tokens))
+        )
+        params = {f"t{i}": token for i, token in enumerate(tokens)}
+        return self._lookup(start_date, end_date, platform_ids, id_query, params)
+
+    def lookup_words(
+        self,
+        words: Iterable[str],
+        start_date: datetime,
+        end_date: datetime,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Tuple[Dict, Dict]]:
+        """
+        查找至少包含一个关键词的标题
+
+        Args:
+            words: 关键词（与 extract_keywords 切分方式一致）
+            start_date: 开始日期
+            end_date: 结束日期
+            platform_ids: 平台ID列表，None表示所有
+
+        Returns:
+            {日期: (候选 all_titles, id_to_name)}，只包含被索引覆盖的日期
+        """
+        tokens = sorted(set(words))
+        if not tokens:
+            return {}
+
+        id_query = (
+            "SELECT title_id FROM word_postings WHERE date = :date AND token IN "
+            f"({','.join(f':t{i}' for i in range(len(tokens)))})"
+        )
+        params = {f"t{i}": token for i, token in enumerate(tokens)}
+        return self._lookup(start_date, end_date, platform_ids, id_query, params)
+
+    def get_stats(self) -> Dict:
+        """
+        获取索引统计信息
+
+        Returns:
+            统计信息字典（索引文件不存在时 days 为 0）
+        """
+        with self._pending_lock:
+            pending = len(self._pending)
+        if not self.index_path.exists():
+            return {"days": 0, "titles": 0, "size_bytes": 0, "pending_days": pending}
+
+        try:
+            conn = self._connect()
+            days, titles = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(title_count), 0) FROM indexed_days"
+            ).fetchone()
+        except sqlite3.Error:
+            days, titles = 0, 0
+        # WAL 模式下未合并的数据位于 -wal 文件
+        wal_path = self.index_path.with_name(self.index_path.name + "-wal")
+        size = self.index_path.stat().st_size + (wal_path.stat().st_size if wal_path.exists() else 0)
+        return {
+            "days": days,
+            "titles": titles,
+            "size_bytes": size,
+            "pending_days": pending,
+        }
+
+
+# 按项目根目录共享的索引实例
+_indexes: Dict[str, SearchIndex] = {}
+_indexes_lock = Lock()
+
+
+def get_search_index(parser: ParserService) -> SearchIndex:
+    """
+    获取项目的共享倒排索引实例
+
+    Args:
+        parser: 数据解析服务
+
+    Returns:
+        倒排索引实例
+    """
+    key = str(Path(parser.project_root).resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = SearchIndex(parser)
+            _indexes[key] = index
+        return index
@@ -0,0 +1,217 @@
+"""
+标题近似重复索引
+
+基于字符 shingle 的 MinHash 签名 + LSH 分桶，为相似新闻查找和跨平台聚合提供候选标题，
+只对候选标题计算精确的 SequenceMatcher 相似度，避免与当日全部标题逐一比较。
+
+参数取值面向较高的 SequenceMatcher 阈值：双字 shingle、48 个分桶 × 每桶 2 行，
+shingle Jaccard 相似度 0.2 的标题对进入候选的概率约 86%，0.3 以上约 99%。
+阈值较低时相似标题之间共享的 shingle 很少，候选会漏掉部分结果，因此只在阈值不低于
+MIN_INDEX_THRESHOLD（经 benchmarks/check_similarity.py 验证结果与逐一比较一致）时使用索引，
+更低的阈值由调用方逐一比较。
+
+索引以紧凑数组保存：每个分桶是按分桶键排序的 (键, 标题序号) 两个 array，
+每个标题的分桶键连续保存在一个 array 中，单日 5000 条标题约占几 MB。
+"""
+
+import hashlib
+import random
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+# 2^61 - 1（梅森素数），用于构造哈希置换 (a * x + b) mod p
+_MERSENNE_PRIME = (1 << 61) - 1
+
+DEFAULT_SHINGLE_SIZE = 2
+DEFAULT_BANDS = 48
+DEFAULT_ROWS = 2
+
+# 使用索引的最低相似度阈值（低于该值时索引召回不足，调用方应逐一比较）
+MIN_INDEX_THRESHOLD = 0.7
+
+
+def use_similarity_index(threshold: float) -> bool:
+    """
+    相似度阈值是否可以使用近似重复索引筛选候选
+
+    Args:
+        threshold: SequenceMatcher 相似度阈值
+
+    Returns:
+        阈值不低于 MIN_INDEX_THRESHOLD 时返回 True
+    """
+    return threshold >= MIN_INDEX_THRESHOLD
+
+
+def shingle(text: str, size: int = DEFAULT_SHINGLE_SIZE) -> Set[str]:
+    """
+    生成文本的字符 shingle 集合（忽略空白）
+
+    Args:
+        text: 文本
+        size: shingle 长度
+
+    Returns:
+        shingle 集合；文本短于 size 时返回文本本身
+    """
+    text = "".join(text.split())
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def _base_hash(value: str) -> int:
+    """稳定的 64 位字符串哈希（不受 PYTHONHASHSEED 影响）"""
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class SimilarityIndex:
+    """
+    MinHash/LSH 近似重复索引
+
+    索引建立后只读，可在多个线程间共享。
+
+    使用示例:
+        index = SimilarityIndex(titles)
+        for other in index.query("特斯拉宣布降价"):
+            ...  # 对候选标题计算精确相似度
+    """
+
+    def __init__(
+        self,
+        titles: Iterable[str],
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        bands: int = DEFAULT_BANDS,
+        rows: int = DEFAULT_ROWS,
+        seed: int = 1,
+    ):
+        """
+        建立索引
+
+        Args:
+            titles: 标题列表（重复标题只索引一次）
+            shingle_size: shingle 长度
+            bands: LSH 分桶数
+            rows: 每个分桶包含的签名行数
+            seed: 哈希置换的随机种子
+        """
+        self.shingle_size = shingle_size
+        self.bands = bands
+        self.rows = rows
+
+        rng = random.Random(seed)
+        self._perms: List[Tuple[int, int]] = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(bands * rows)
+        ]
+
+        # 标题 → 序号；第 i 个标题的分桶键位于 _keys[i * bands:(i + 1) * bands]
+        self._titles: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._keys = array("q")
+
+        # 建索引期间缓存每个 shingle 的置换哈希值（同一天的标题大量共享 shingle）
+        shingle_hashes: Dict[str, Tuple[int, ...]] = {}
+        for title in titles:
+            if title in self._ids:
+                continue
+            self._ids[title] = len(self._titles)
+            self._titles.append(title)
+            self._keys.extend(self._band_keys_for(title, shingle_hashes))
+
+        # 每个分桶按键排序的 (键, 标题序号)，相同键的标题相邻
+        self._bucket_keys: List[array] = []
+        self._bucket_ids: List[array] = []
+        count = len(self._titles)
+        for band in range(bands):
+            column = self._keys[band::bands]
+            order = sorted(range(count), key=column.__getitem__)
+            self._bucket_keys.append(array("q", (column[i] for i in order)))
+            self._bucket_ids.append(array("i", order))
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def __contains__(self, title: str) -> bool:
+        return title in self._ids
+
+    def _band_keys_for(
+        self,
+        title: str,
+        shingle_hashes: Optional[Dict[str, Tuple[int, ...]]] = None,
+    ) -> Tuple[int, ...]:
+        """计算标题的 MinHash 签名并按分桶切分"""
+        vectors = []
+        for gram in shingle(title, self.shingle_size):
+            vector = shingle_hashes.get(gram) if shingle_hashes is not None else None
+            if vector is None:
+                h = _base_hash(gram)
+                vector = tuple((a * h + b) % _MERSENNE_PRIME for a, b in self._perms)
+                if shingle_hashes is not None:
+                    shingle_hashes[gram] = vector
+            vectors.append(vector)
+
+        if not vectors:
+            # 空标题：所有分桶使用同一个占位值
+            return tuple(-1 for _ in range(self.bands))
+
+        signature = tuple(map(min, zip(*vectors)))
+        rows = self.rows
+        return tuple(
+            hash(signature[band * rows:(band + 1) * rows])
+            for band in range(self.bands)
+        )
+
+    def query(self, title: str) -> Set[str]:
+        """
+        查找候选相似标题
+
+        Args:
+            title: 标题（可以不在索引中）
+
+        Returns:
+            与其至少落入一个相同分桶的已索引标题（不含标题本身）
+        """
+        title_id = self._ids.get(title)
+        if title_id is not None:
+            keys = self._keys[title_id * self.bands:(title_id + 1) * self.bands]
+        else:
+            keys = self._band_keys_for(title)
+
+        found: Set[int] = set()
+        for band, key in enumerate(keys):
+            bucket_keys = self._bucket_keys[band]
+            bucket_ids = self._bucket_ids[band]
+            position = bisect_left(bucket_keys, key)
+            while position < len(bucket_keys) and bucket_keys[position] == key:
+                found.add(bucket_ids[position])
+                position += 1
+
+        candidates = {self._titles[i] for i in found}
+        candidates.discard(title)
+        return candidates
+
+    def candidate_pairs(self) -> Iterator[Tuple[str, str]]:
+        """
+        枚举索引内的全部候选标题对（每对只返回一次）
+
+        Yields:
+            (标题 A, 标题 B)
+        """
+        seen: Set[Tuple[int, int]] = set()
+        for bucket_keys, bucket_ids in zip(self._bucket_keys, self._bucket_ids):
+            start = 0
+            count = len(bucket_keys)
+            while start < count:
+                end = start + 1
+                while end < count and bucket_keys[end] == bucket_keys[start]:
+                    end += 1
+                members = sorted(bucket_ids[start:end])
+                for i, first in enumerate(members):
+                    for second in members[i + 1:]:
+                        if (first, second) not in seen:
+                            seen.add((first, second))
+                            yield self._titles[first], self._titles[second]
+                start = end
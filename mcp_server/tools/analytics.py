@@ -7,10 +7,16 @@
 import re
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Union
 from difflib import SequenceMatcher
 
+from trendradar.utils.topk import select_top_k
+
+from ..services.cooccurrence import CooccurrenceMatrix
 from ..services.data_service import DataService
+from ..services.execution import check_deadline
+from ..services.keyword_stats import split_keywords
+from ..services.similarity_index import SimilarityIndex, use_similarity_index
 from ..utils.validators import (
     validate_platforms,
     validate_limit,
@@ -22,6 +28,10 @@ from ..utils.validators import (
 from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
 
 
+# 标题数不超过该值时直接逐一计算相似度，不使用近似重复索引
+EXACT_SIMILARITY_SCAN_LIMIT = 200
+
+
 def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
     """
     计算新闻权重（用于排序）
@@ -104,6 +114,7 @@ class AnalyticsTools:
                 - "keyword_cooccur": 关键词共现分析（分析关键词同时出现的模式）
             topic: 话题关键词（可选，platform_compare模式适用）
             date_range: 日期范围，格式: {"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"}
+                        （keyword_cooccur模式不指定时为今天）
             min_frequency: 最小共现频次（keyword_cooccur模式），默认3
             top_n: 返回TOP N结果（keyword_cooccur模式），默认20
 
@@ -136,7 +147,8 @@ class AnalyticsTools:
             else:  # keyword_cooccur
                 return self.analyze_keyword_cooccurrence(
                     min_frequency=min_frequency,
-                    top_n=top_n
+                    top_n=top_n,
+                    date_range=date_range
                 )
 
         except MCPError as e:
@@ -308,13 +320,10 @@ class AnalyticsTools:
 
             # 收集趋势数据
             trend_data = []
-            current_date = start_date
 
-            while current_date <= end_date:
+            for current_date, day in self.data_service.parser.iter_titles_for_range(start_date, end_date):
                 try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
+                    all_titles, _, _ = day.result()
 
                     # 统计该时间点的话题出现次数
                     count = 0
@@ -339,9 +348,6 @@ class AnalyticsTools:
                         "sample_titles": []
                     })
 
-                # 按天增加时间
-                current_date += timedelta(days=1)
-
             # 计算趋势指标
             counts = [item["count"] for item in trend_data]
             total_days = (end_date - start_date).days + 1
@@ -450,12 +456,9 @@ class AnalyticsTools:
             })
 
             # 遍历日期范围
-            current_date = start_date
-            while current_date <= end_date:
+            for current_date, day in self.data_service.parser.iter_titles_for_range(start_date, end_date):
                 try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
+                    all_titles, id_to_name, _ = day.result()
 
                     for platform_id, titles in all_titles.items():
                         platform_name = id_to_name.get(platform_id, platform_id)
@@ -475,8 +478,6 @@ class AnalyticsTools:
                 except DataNotFoundError:
                     pass
 
-                current_date += timedelta(days=1)
-
             # 转换为可序列化的格式
             result_stats = {}
             for platform, stats in platform_stats.items():
@@ -527,7 +528,8 @@ class AnalyticsTools:
     def analyze_keyword_cooccurrence(
         self,
         min_frequency: int = 3,
-        top_n: int = 20
+        top_n: int = 20,
+        date_range: Optional[Union[Dict[str, str], str]] = None
     ) -> Dict:
         """
         关键词共现分析 - 分析哪些关键词经常同时出现
@@ -535,6 +537,7 @@ class AnalyticsTools:
         Args:
             min_frequency: 最小共现频次
             top_n: 返回TOP N关键词对
+            date_range: 日期范围（可选，默认今天），格式: {"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"}
 
         Returns:
             关键词共现分析结果
@@ -544,6 +547,7 @@ class AnalyticsTools:
             - "分析一下哪些关键词经常一起出现"
             - "看看'人工智能'经常和哪些词一起出现"
             - "找出今天新闻中的关键词关联"
+            - "本周哪些关键词经常一起出现"
 
             代码调用示例：
             >>> tools = AnalyticsTools()
@@ -558,63 +562,40 @@ class AnalyticsTools:
             min_frequency = validate_limit(min_frequency, default=3, max_limit=100)
             top_n = validate_top_n(top_n, default=20)
 
-            # 读取今天的数据
-            all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
+            if date_range:
+                start_date, end_date = validate_date_range(date_range)
+            else:
+                start_date = end_date = datetime.now()
 
-            # 关键词共现统计
-            cooccurrence = Counter()
-            keyword_titles = defaultdict(list)
+            # 日期范围内的共现矩阵（由每日关键词统计表累加）
+            matrix = self._get_cooccurrence_matrix(start_date, end_date)
 
-            for platform_id, titles in all_titles.items():
-                for title in titles.keys():
-                    # 提取关键词
-                    keywords = self._extract_keywords(title)
-
-                    # 记录每个关键词出现的标题
-                    for kw in keywords:
-                        keyword_titles[kw].append(title)
-
-                    # 计算两两共现
-                    if len(keywords) >= 2:
-                        for i, kw1 in enumerate(keywords):
-                            for kw2 in keywords[i+1:]:
-                                # 统一排序，避免重复
-                                pair = tuple(sorted([kw1, kw2]))
-                                cooccurrence[pair] += 1
-
-            # 过滤低频共现
-            filtered_pairs = [
-                (pair, count) for pair, count in cooccurrence.items()
-                if count >= min_frequency
-            ]
-
-            # 排序并取TOP N
-            top_pairs = sorted(filtered_pairs, key=lambda x: x[1], reverse=True)[:top_n]
-
-            # 构建结果
+            # 过滤低频共现，排序并取TOP N
             result_pairs = []
-            for (kw1, kw2), count in top_pairs:
-                # 找出同时包含两个关键词的标题样本
-                titles_with_both = [
-                    title for title in keyword_titles[kw1]
-                    if kw2 in self._extract_keywords(title)
-                ]
-
+            for kw1, kw2, count in matrix.top_pairs(min_frequency, top_n):
                 result_pairs.append({
                     "keyword1": kw1,
                     "keyword2": kw2,
                     "cooccurrence_count": count,
-                    "sample_titles": titles_with_both[:3]
+                    # 同时包含两个关键词的标题样本
+                    "sample_titles": matrix.sample_titles(kw1, kw2, 3)
                 })
 
+            summary = {
+                "description": "关键词共现分析结果",
+                "total": len(result_pairs),
+                "min_frequency": min_frequency,
+                "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+            if date_range:
+                summary["date_range"] = {
+                    "start": start_date.strftime("%Y-%m-%d"),
+                    "end": end_date.strftime("%Y-%m-%d")
+                }
+
             return {
                 "success": True,
-                "summary": {
-                    "description": "关键词共现分析结果",
-                    "total": len(result_pairs),
-                    "min_frequency": min_frequency,
-                    "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                },
+                "summary": summary,
                 "data": result_pairs
             }
 
@@ -697,14 +678,12 @@ class AnalyticsTools:
 
             # 收集新闻数据（支持多天）
             all_news_items = []
-            current_date = start_date
 
-            while current_date <= end_date:
+            for current_date, day in self.data_service.parser.iter_titles_for_range(
+                start_date, end_date, platform_ids=platforms
+            ):
                 try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
+                    all_titles, id_to_name, _ = day.result()
 
                     # 收集该日期的新闻
                     for platform_id, titles in all_titles.items():
@@ -733,9 +712,6 @@ class AnalyticsTools:
                     # 该日期没有数据，继续下一天
                     pass
 
-                # 下一天
-                current_date += timedelta(days=1)
-
             if not all_news_items:
                 time_desc = "今天" if start_date == end_date else f"{start_date.strftime('%Y-%m-%d')} 至 {end_date.strftime('%Y-%m-%d')}"
                 raise DataNotFoundError(
@@ -757,15 +733,16 @@ class AnalyticsTools:
 
             deduplicated_news = list(unique_news.values())
 
-            # 按权重排序（如果启用）
+            # 按权重排序（如果启用）并限制返回数量
             if sort_by_weight:
-                deduplicated_news.sort(
+                selected_news = select_top_k(
+                    deduplicated_news,
+                    limit,
                     key=lambda x: calculate_news_weight(x),
                     reverse=True
                 )
-
-            # 限制返回数量
-            selected_news = deduplicated_news[:limit]
+            else:
+                selected_news = deduplicated_news[:limit]
 
             # 生成 AI 提示词
             ai_prompt = self._create_sentiment_analysis_prompt(
@@ -955,6 +932,14 @@ class AnalyticsTools:
             # 读取数据
             all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date()
 
+            # 通过近似重复索引筛选候选标题，只对候选计算精确相似度（阈值过低时逐一比较）
+            candidates = None
+            if (
+                use_similarity_index(threshold)
+                and sum(len(titles) for titles in all_titles.values()) > EXACT_SIMILARITY_SCAN_LIMIT
+            ):
+                candidates = self._get_similarity_index(all_titles).query(reference_title)
+
             # 计算相似度
             similar_items = []
 
@@ -964,6 +949,8 @@ class AnalyticsTools:
                 for title, info in titles.items():
                     if title == reference_title:
                         continue
+                    if candidates is not None and title not in candidates:
+                        continue
 
                     # 计算相似度
                     similarity = self._calculate_similarity(reference_title, title)
@@ -983,11 +970,10 @@ class AnalyticsTools:
 
                         similar_items.append(news_item)
 
-            # 按相似度排序
-            similar_items.sort(key=lambda x: x["similarity"], reverse=True)
-
-            # 限制数量
-            result_items = similar_items[:limit]
+            # 按相似度排序并限制数量
+            result_items = select_top_k(
+                similar_items, limit, key=lambda x: x["similarity"], reverse=True
+            )
 
             if not result_items:
                 raise DataNotFoundError(
@@ -1114,18 +1100,17 @@ class AnalyticsTools:
             if entity in entity_context:
                 del entity_context[entity]
 
-            # 按权重排序（如果启用）
+            # 按权重排序（如果启用）并限制返回数量
             if sort_by_weight:
-                related_news.sort(
+                result_news = select_top_k(
+                    related_news,
+                    limit,
                     key=lambda x: calculate_news_weight(x),
                     reverse=True
                 )
             else:
                 # 按排名排序
-                related_news.sort(key=lambda x: x["rank"])
-
-            # 限制返回数量
-            result_news = related_news[:limit]
+                result_news = select_top_k(related_news, limit, key=lambda x: x["rank"])
 
             return {
                 "success": True,
@@ -1210,12 +1195,9 @@ class AnalyticsTools:
             all_platforms_news = defaultdict(int)
             all_titles_list = []
 
-            current_date = start_date
-            while current_date <= end_date:
+            for current_date, day in self.data_service.parser.iter_titles_for_range(start_date, end_date):
                 try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
+                    all_titles, id_to_name, _ = day.result()
 
                     for platform_id, titles in all_titles.items():
                         platform_name = id_to_name.get(platform_id, platform_id)
@@ -1235,8 +1217,6 @@ class AnalyticsTools:
                 except DataNotFoundError:
                     pass
 
-                current_date += timedelta(days=1)
-
             # 生成报告
             report_title = f"{'每日' if report_type == 'daily' else '每周'}新闻热点摘要"
             date_str = f"{start_date.strftime('%Y-%m-%d')}" if report_type == "daily" else f"{start_date.strftime('%Y-%m-%d')} 至 {end_date.strftime('%Y-%m-%d')}"
@@ -1383,12 +1363,9 @@ class AnalyticsTools:
             })
 
             # 遍历日期范围
-            current_date = start_date
-            while current_date <= end_date:
+            for current_date, day in self.data_service.parser.iter_titles_for_range(start_date, end_date):
                 try:
-                    all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
+                    all_titles, id_to_name, timestamps = day.result()
 
                     for platform_id, titles in all_titles.items():
                         platform_name = id_to_name.get(platform_id, platform_id)
@@ -1410,8 +1387,6 @@ class AnalyticsTools:
                 except DataNotFoundError:
                     pass
 
-                current_date += timedelta(days=1)
-
             # 转换为可序列化的格式
             result_activity = {}
             for platform, stats in platform_activity.items():
@@ -1512,12 +1487,9 @@ class AnalyticsTools:
 
             # 收集话题历史数据
             lifecycle_data = []
-            current_date = start_date
-            while current_date <= end_date:
+            for current_date, day in self.data_service.parser.iter_titles_for_range(start_date, end_date):
                 try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
+                    all_titles, _, _ = day.result()
 
                     # 统计该日的话题出现次数
                     count = 0
@@ -1537,8 +1509,6 @@ class AnalyticsTools:
                         "count": 0
                     })
 
-                current_date += timedelta(days=1)
-
             # 计算分析天数
             total_days = (end_date - start_date).days + 1
 
@@ -1657,37 +1627,16 @@ class AnalyticsTools:
             threshold = validate_threshold(threshold, default=3.0, min_value=1.0, max_value=100.0)
             time_window = validate_limit(time_window, default=24, max_limit=72)
 
-            # 读取当前和之前的数据
-            current_all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
+            # 当前的关键词统计表
+            current_stats = self.data_service.keyword_stats.get()
+            current_keywords = current_stats.counts
 
-            # 读取昨天的数据作为基准
+            # 昨天的关键词频率作为基准
             yesterday = datetime.now() - timedelta(days=1)
             try:
-                previous_all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                    date=yesterday
-                )
+                previous_keywords = self.data_service.keyword_stats.get(yesterday).counts
             except DataNotFoundError:
-                previous_all_titles = {}
-
-            # 统计当前的关键词频率
-            current_keywords = Counter()
-            current_keyword_titles = defaultdict(list)
-
-            for _, titles in current_all_titles.items():
-                for title in titles.keys():
-                    keywords = self._extract_keywords(title)
-                    current_keywords.update(keywords)
-
-                    for kw in keywords:
-                        current_keyword_titles[kw].append(title)
-
-            # 统计之前的关键词频率
-            previous_keywords = Counter()
-
-            for _, titles in previous_all_titles.items():
-                for title in titles.keys():
-                    keywords = self._extract_keywords(title)
-                    previous_keywords.update(keywords)
+                previous_keywords = {}
 
             # 检测异常热度
             viral_topics = []
@@ -1713,7 +1662,7 @@ class AnalyticsTools:
                         "current_count": current_count,
                         "previous_count": previous_count,
                         "growth_rate": round(growth_rate, 2) if growth_rate != float('inf') else "新话题",
-                        "sample_titles": current_keyword_titles[keyword][:3],
+                        "sample_titles": current_stats.sample_titles(keyword, 3),
                         "alert_level": "高" if growth_rate > threshold * 2 else "中"
                     })
 
@@ -1809,16 +1758,7 @@ class AnalyticsTools:
                 date = datetime.now() - timedelta(days=days_ago)
 
                 try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=date
-                    )
-
-                    # 统计关键词
-                    keywords_count = Counter()
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            keywords = self._extract_keywords(title)
-                            keywords_count.update(keywords)
+                    keywords_count = self.data_service.keyword_stats.get(date).counts
 
                     # 记录每个关键词的历史数据
                     for keyword, count in keywords_count.items():
@@ -1829,20 +1769,9 @@ class AnalyticsTools:
 
             # 添加今天的数据
             try:
-                all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
-
-                keywords_count = Counter()
-                keyword_titles = defaultdict(list)
-
-                for _, titles in all_titles.items():
-                    for title in titles.keys():
-                        keywords = self._extract_keywords(title)
-                        keywords_count.update(keywords)
-
-                        for kw in keywords:
-                            keyword_titles[kw].append(title)
+                today_stats = self.data_service.keyword_stats.get()
 
-                for keyword, count in keywords_count.items():
+                for keyword, count in today_stats.counts.items():
                     keyword_trends[keyword].append(count)
 
             except DataNotFoundError:
@@ -1892,7 +1821,7 @@ class AnalyticsTools:
                             "confidence": round(confidence, 2),
                             "trend_data": trend_data,
                             "prediction": "上升趋势，可能成为热点",
-                            "sample_titles": keyword_titles.get(keyword, [])[:3]
+                            "sample_titles": today_stats.sample_titles(keyword, 3)
                         })
 
             # 按置信度和增长率排序
@@ -1942,22 +1871,7 @@ class AnalyticsTools:
         Returns:
             关键词列表
         """
-        # 移除URL和特殊字符
-        title = re.sub(r'http[s]?://\S+', '', title)
-        title = re.sub(r'[^\w\s]', ' ', title)
-
-        # 简单分词（按空格和常见分隔符）
-        words = re.split(r'[\s，。！？、]+', title)
-
-        # 过滤停用词和短词
-        stopwords = {'的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个', '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好', '自己', '这'}
-
-        keywords = [
-            word.strip() for word in words
-            if word.strip() and len(word.strip()) >= min_length and word.strip() not in stopwords
-        ]
-
-        return keywords
+        return split_keywords(title, min_length)
 
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """
@@ -1973,6 +1887,72 @@ class AnalyticsTools:
         # 使用 SequenceMatcher 计算相似度
         return SequenceMatcher(None, text1, text2).ratio()
 
+    def _get_similarity_index(
+        self,
+        all_titles: Dict,
+        date: datetime = None,
+        platform_ids: Optional[List[str]] = None
+    ) -> SimilarityIndex:
+        """
+        获取指定日期标题的近似重复索引（带缓存）
+
+        Args:
+            all_titles: read_all_titles_for_date 返回的标题数据
+            date: 日期对象，默认为今天
+            platform_ids: 平台ID列表，None表示所有
+
+        Returns:
+            近似重复索引
+        """
+        date_str = self.data_service.parser.get_date_folder_name(date)
+        platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
+        cache_key = f"similarity_index:{date_str}:{platform_key}"
+
+        # 索引与标题数据快照绑定：数据库有新提交、标题重新读取后，索引随之重建
+        version = self.data_service.parser.get_db_version(date)
+        cached = self.data_service.cache.get(cache_key, ttl=None, version=version)
+        if cached and cached[0] is all_titles:
+            return cached[1]
+
+        index = SimilarityIndex(
+            title for titles in all_titles.values() for title in titles
+        )
+        self.data_service.cache.set(cache_key, (all_titles, index), version=version)
+        return index
+
+    def _get_cooccurrence_matrix(self, start_date: datetime, end_date: datetime) -> CooccurrenceMatrix:
+        """
+        获取日期范围内的关键词共现矩阵
+
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期
+
+        Returns:
+            共现矩阵
+
+        Raises:
+            DataNotFoundError: 日期范围内没有数据
+        """
+        days = []
+        current_date = start_date
+        while current_date <= end_date:
+            check_deadline()
+            try:
+                days.append(self.data_service.keyword_stats.get(current_date))
+            except DataNotFoundError:
+                if start_date == end_date:
+                    raise
+            current_date += timedelta(days=1)
+
+        if not days:
+            raise DataNotFoundError(
+                f"未找到 {start_date.strftime('%Y-%m-%d')} 至 {end_date.strftime('%Y-%m-%d')} 的新闻数据",
+                suggestion="请检查日期范围或先运行爬虫"
+            )
+
+        return CooccurrenceMatrix(days)
+
     def _find_unique_topics(self, platform_stats: Dict) -> Dict[str, List[str]]:
         """
         找出各平台独有的热点话题
@@ -2014,7 +1994,8 @@ class AnalyticsTools:
         platforms: Optional[List[str]] = None,
         similarity_threshold: float = 0.7,
         limit: int = 50,
-        include_url: bool = False
+        include_url: bool = False,
+        cursor: Optional[str] = None
     ) -> Dict:
         """
         跨平台新闻聚合 - 对相似新闻进行去重合并
@@ -2030,10 +2011,11 @@ class AnalyticsTools:
             similarity_threshold: 相似度阈值，0-1之间，默认0.7
             limit: 返回聚合新闻数量，默认50
             include_url: 是否包含URL链接，默认False
+            cursor: 分页游标（上一页返回的 next_cursor），None 表示第一页
 
         Returns:
             聚合结果字典，包含：
-            - aggregated_news: 聚合后的新闻列表
+            - aggregated_news: 聚合后的新闻列表（还有下一页时 next_cursor 不为 None）
             - statistics: 聚合统计信息
         """
         try:
@@ -2051,45 +2033,90 @@ class AnalyticsTools:
             else:
                 start_date = end_date = datetime.now()
 
-            # 收集所有新闻
-            all_news = []
-            current_date = start_date
-
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
-
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-
-                        for title, info in titles.items():
-                            news_item = {
-                                "title": title,
-                                "platform": platform_id,
-                                "platform_name": platform_name,
-                                "date": current_date.strftime("%Y-%m-%d"),
-                                "ranks": info.get("ranks", []),
-                                "count": len(info.get("ranks", [])),
-                                "rank": info["ranks"][0] if info["ranks"] else 999
-                            }
+            def collect() -> Dict:
+                """收集并聚合新闻，按综合权重完整排序（作为分页快照）"""
+                all_news = []
+                similarity_indexes = {}
+
+                for current_date, day in self.data_service.parser.iter_titles_for_range(
+                    start_date, end_date, platform_ids=platforms
+                ):
+                    try:
+                        all_titles, id_to_name, _ = day.result()
+
+                        if use_similarity_index(similarity_threshold):
+                            similarity_indexes[current_date.strftime("%Y-%m-%d")] = (
+                                self._get_similarity_index(all_titles, current_date, platforms)
+                            )
+
+                        for platform_id, titles in all_titles.items():
+                            platform_name = id_to_name.get(platform_id, platform_id)
+
+                            for title, info in titles.items():
+                                news_item = {
+                                    "title": title,
+                                    "platform": platform_id,
+                                    "platform_name": platform_name,
+                                    "date": current_date.strftime("%Y-%m-%d"),
+                                    "ranks": info.get("ranks", []),
+                                    "count": len(info.get("ranks", [])),
+                                    "rank": info["ranks"][0] if info["ranks"] else 999
+                                }
+
+                                if include_url:
+                                    news_item["url"] = info.get("url", "")
+                                    news_item["mobileUrl"] = info.get("mobileUrl", "")
+
+                                # 计算权重
+                                news_item["weight"] = calculate_news_weight(news_item)
+                                all_news.append(news_item)
+
+                    except DataNotFoundError:
+                        pass
+
+                # 执行聚合
+                aggregated = self._aggregate_similar_news(
+                    all_news, similarity_threshold, include_url, similarity_indexes
+                )
 
-                            if include_url:
-                                news_item["url"] = info.get("url", "")
-                                news_item["mobileUrl"] = info.get("mobileUrl", "")
+                # 按综合权重排序（稳定排序）
+                aggregated.sort(key=lambda x: x["aggregate_weight"], reverse=True)
 
-                            # 计算权重
-                            news_item["weight"] = calculate_news_weight(news_item)
-                            all_news.append(news_item)
+                # 统计信息
+                platform_coverage = Counter()
+                for item in aggregated:
+                    for p in item["platforms"]:
+                        platform_coverage[p] += 1
 
-                except DataNotFoundError:
-                    pass
+                return {
+                    "items": aggregated,
+                    "original_count": len(all_news),
+                    "platform_coverage": dict(platform_coverage),
+                    "multi_platform_news": len([a for a in aggregated if len(a["platforms"]) > 1]),
+                    "single_platform_news": len([a for a in aggregated if len(a["platforms"]) == 1])
+                }
 
-                current_date += timedelta(days=1)
+            page = self.data_service.pager.get_page(
+                "aggregate_news",
+                {
+                    "start": start_date.strftime("%Y-%m-%d"),
+                    "end": end_date.strftime("%Y-%m-%d"),
+                    "platforms": platforms,
+                    "similarity_threshold": similarity_threshold,
+                    "include_url": include_url
+                },
+                limit=limit,
+                load=collect,
+                item_key=lambda x: (x["dates"][0], x["platform_ids"][0], x["representative_title"]),
+                version=self.data_service.parser.get_dates_version(
+                    start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)
+                ),
+                cursor=cursor
+            )
+            results = page.items
+            snapshot = page.snapshot
 
-            if not all_news:
+            if not snapshot["original_count"]:
                 return {
                     "success": True,
                     "summary": {
@@ -2101,27 +2128,11 @@ class AnalyticsTools:
                     "message": "未找到新闻数据"
                 }
 
-            # 执行聚合
-            aggregated = self._aggregate_similar_news(
-                all_news, similarity_threshold, include_url
-            )
-
-            # 按综合权重排序
-            aggregated.sort(key=lambda x: x["aggregate_weight"], reverse=True)
-
-            # 限制返回数量
-            results = aggregated[:limit]
-
             # 统计信息
-            total_original = len(all_news)
-            total_aggregated = len(aggregated)
+            total_original = snapshot["original_count"]
+            total_aggregated = page.total
             dedup_rate = 1 - (total_aggregated / total_original) if total_original > 0 else 0
 
-            platform_coverage = Counter()
-            for item in aggregated:
-                for p in item["platforms"]:
-                    platform_coverage[p] += 1
-
             return {
                 "success": True,
                 "summary": {
@@ -2129,6 +2140,7 @@ class AnalyticsTools:
                     "original_count": total_original,
                     "aggregated_count": total_aggregated,
                     "returned": len(results),
+                    "offset": page.offset,
                     "deduplication_rate": f"{dedup_rate * 100:.1f}%",
                     "similarity_threshold": similarity_threshold,
                     "date_range": {
@@ -2137,10 +2149,11 @@ class AnalyticsTools:
                     }
                 },
                 "data": results,
+                "next_cursor": page.next_cursor,
                 "statistics": {
-                    "platform_coverage": dict(platform_coverage),
-                    "multi_platform_news": len([a for a in aggregated if len(a["platforms"]) > 1]),
-                    "single_platform_news": len([a for a in aggregated if len(a["platforms"]) == 1])
+                    "platform_coverage": snapshot["platform_coverage"],
+                    "multi_platform_news": snapshot["multi_platform_news"],
+                    "single_platform_news": snapshot["single_platform_news"]
                 }
             }
 
@@ -2153,7 +2166,8 @@ class AnalyticsTools:
         self,
         news_list: List[Dict],
         threshold: float,
-        include_url: bool
+        include_url: bool,
+        similarity_indexes: Optional[Dict[str, SimilarityIndex]] = None
     ) -> List[Dict]:
         """
         对新闻列表进行相似度聚合
@@ -2162,6 +2176,8 @@ class AnalyticsTools:
             news_list: 新闻列表
             threshold: 相似度阈值
             include_url: 是否包含URL
+            similarity_indexes: 各日期的近似重复索引 {日期: 索引}，
+                提供且阈值不低于索引适用下限时只与候选新闻比较，否则逐一比较
 
         Returns:
             聚合后的新闻列表
@@ -2172,12 +2188,34 @@ class AnalyticsTools:
         # 按权重排序，优先保留高权重新闻作为代表
         sorted_news = sorted(news_list, key=lambda x: x.get("weight", 0), reverse=True)
 
+        # (日期, 标题) -> 排序后位置，用于将索引返回的候选标题映射回新闻
+        positions = None
+        if (
+            similarity_indexes
+            and use_similarity_index(threshold)
+            and len(sorted_news) > EXACT_SIMILARITY_SCAN_LIMIT
+        ):
+            positions = defaultdict(list)
+            for idx, item in enumerate(sorted_news):
+                positions[(item["date"], item["title"])].append(idx)
+
+        def candidates_of(news: Dict) -> Iterable[int]:
+            """候选新闻位置（升序，与逐一比较时的遍历顺序一致）"""
+            if positions is None:
+                return range(len(sorted_news))
+            found = set()
+            for date_str, index in similarity_indexes.items():
+                for title in index.query(news["title"]) | {news["title"]}:
+                    found.update(positions.get((date_str, title), ()))
+            return sorted(found)
+
         aggregated = []
         used_indices = set()
 
         for i, news in enumerate(sorted_news):
             if i in used_indices:
                 continue
+            check_deadline()
 
             # 创建聚合组
             group = {
@@ -2205,9 +2243,10 @@ class AnalyticsTools:
             used_indices.add(i)
 
             # 查找相似新闻
-            for j, other_news in enumerate(sorted_news):
+            for j in candidates_of(news):
                 if j in used_indices:
                     continue
+                other_news = sorted_news[j]
 
                 similarity = self._calculate_similarity(news["title"], other_news["title"])
 
@@ -2388,13 +2427,22 @@ class AnalyticsTools:
         all_keywords = Counter()
         platform_stats = Counter()
 
-        current_date = start_date
-        while current_date <= end_date:
+        # 指定话题时为子串过滤：已结束日期通过倒排索引只读取候选标题
+        indexed = {}
+        if topic and self.data_service.search_index:
+            indexed = self.data_service.search_index.lookup_substring(
+                topic, start_date, end_date, platforms
+            )
+
+        for current_date, day in self.data_service.parser.iter_titles_for_range(
+            start_date, end_date, platform_ids=platforms, skip_dates=indexed
+        ):
             try:
-                all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                    date=current_date,
-                    platform_ids=platforms
-                )
+                date_str = current_date.strftime("%Y-%m-%d")
+                if date_str in indexed:
+                    all_titles, id_to_name = indexed[date_str]
+                else:
+                    all_titles, id_to_name, _ = day.result()
 
                 for platform_id, titles in all_titles.items():
                     platform_name = id_to_name.get(platform_id, platform_id)
@@ -2425,8 +2473,6 @@ class AnalyticsTools:
             except DataNotFoundError:
                 pass
 
-            current_date += timedelta(days=1)
-
         return {
             "news": all_news,
             "news_count": len(all_news),
@@ -2457,8 +2503,8 @@ class AnalyticsTools:
         persistent_keywords = [kw for kw in top_kw1 if kw in top_kw2]
 
         # TOP 新闻对比
-        top_news1 = sorted(data1["news"], key=lambda x: x.get("weight", 0), reverse=True)[:top_n]
-        top_news2 = sorted(data2["news"], key=lambda x: x.get("weight", 0), reverse=True)[:top_n]
+        top_news1 = select_top_k(data1["news"], top_n, key=lambda x: x.get("weight", 0), reverse=True)
+        top_news2 = select_top_k(data2["news"], top_n, key=lambda x: x.get("weight", 0), reverse=True)
 
         return {
             "overview": {
@@ -2515,10 +2561,10 @@ class AnalyticsTools:
             })
 
         # 按变化幅度排序
-        rising = sorted([k for k in keyword_changes if k["change"] > 0],
-                       key=lambda x: x["change"], reverse=True)[:top_n]
-        falling = sorted([k for k in keyword_changes if k["change"] < 0],
-                        key=lambda x: x["change"])[:top_n]
+        rising = select_top_k([k for k in keyword_changes if k["change"] > 0],
+                              top_n, key=lambda x: x["change"], reverse=True)
+        falling = select_top_k([k for k in keyword_changes if k["change"] < 0],
+                               top_n, key=lambda x: x["change"])
         new_topics = [k for k in keyword_changes if k["period1_count"] == 0 and k["period2_count"] > 0][:top_n]
 
         return {
@@ -234,7 +234,8 @@ class DataQueryTools:
         date_range: Optional[Union[Dict[str, str], str]] = None,
         platforms: Optional[List[str]] = None,
         limit: Optional[int] = None,
-        include_url: bool = False
+        include_url: bool = False,
+        cursor: Optional[str] = None
     ) -> Dict:
         """
         按日期查询新闻，支持自然语言日期
@@ -247,9 +248,10 @@ class DataQueryTools:
             platforms: 平台ID列表，如 ['zhihu', 'weibo']
             limit: 返回条数限制，默认50
             include_url: 是否包含URL链接，默认False（节省token）
+            cursor: 分页游标（上一页返回的 next_cursor），None 表示第一页
 
         Returns:
-            新闻列表字典
+            新闻列表字典，还有下一页时 next_cursor 不为 None
 
         Example:
             >>> tools = DataQueryTools()
@@ -282,25 +284,37 @@ class DataQueryTools:
             platforms = validate_platforms(platforms)
             limit = validate_limit(limit, default=50)
 
-            # 获取数据
-            news_list = self.data_service.get_news_by_date(
-                target_date=target_date,
-                platforms=platforms,
+            # 获取数据（按排名排序的完整列表缓存为分页快照）
+            page = self.data_service.pager.get_page(
+                "get_news_by_date",
+                {"date": target_date.strftime("%Y-%m-%d"), "platforms": platforms, "include_url": include_url},
                 limit=limit,
-                include_url=include_url
+                load=lambda: {
+                    "items": self.data_service.get_news_by_date(
+                        target_date=target_date,
+                        platforms=platforms,
+                        limit=None,
+                        include_url=include_url
+                    )
+                },
+                item_key=lambda x: (x["platform"], x["title"]),
+                version=self.data_service.parser.get_db_version(target_date),
+                cursor=cursor
             )
 
             return {
                 "success": True,
                 "summary": {
                     "description": f"按日期查询的新闻（{target_date.strftime('%Y-%m-%d')}）",
-                    "total": len(news_list),
-                    "returned": len(news_list),
+                    "total": page.total,
+                    "returned": len(page.items),
+                    "offset": page.offset,
                     "date": target_date.strftime("%Y-%m-%d"),
                     "date_range": date_range,
                     "platforms": platforms or "全部平台"
                 },
-                "data": news_list
+                "data": page.items,
+                "next_cursor": page.next_cursor
             }
 
         except MCPError as e:
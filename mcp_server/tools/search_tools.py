@@ -4,13 +4,16 @@
 提供模糊搜索、链接查询、历史相关新闻检索等高级搜索功能。
 """
 
-import re
 from collections import Counter
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Tuple, Union
 
+from trendradar.utils.topk import select_top_k
+
 from ..services.data_service import DataService
+from ..services.execution import check_deadline
+from ..services.search_index import extract_keywords
 from ..utils.validators import validate_keyword, validate_limit, validate_threshold, normalize_date_range
 from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
 
@@ -38,7 +41,8 @@ class SearchTools:
         threshold: float = 0.6,
         include_url: bool = False,
         include_rss: bool = False,
-        rss_limit: int = 20
+        rss_limit: int = 20,
+        cursor: Optional[str] = None
     ) -> Dict:
         """
         统一新闻搜索工具 - 整合多种搜索模式，支持同时搜索热榜和RSS
@@ -64,9 +68,12 @@ class SearchTools:
             include_url: 是否包含URL链接，默认False（节省token）
             include_rss: 是否同时搜索RSS数据，默认False
             rss_limit: RSS返回条数限制，默认20
+            cursor: 分页游标（上一页返回的 next_cursor），None 表示第一页；
+                翻页时 RSS 结果不再重复返回
 
         Returns:
-            搜索结果字典，包含匹配的新闻列表（热榜和RSS分开展示）
+            搜索结果字典，包含匹配的新闻列表（热榜和RSS分开展示），
+            还有下一页时 next_cursor 不为 None
 
         Examples:
             - search_news_unified(query="人工智能", search_mode="keyword")
@@ -117,40 +124,81 @@ class SearchTools:
                 # 使用最新可用日期
                 start_date = end_date = latest
 
-            # 收集所有匹配的新闻
-            all_matches = []
-            current_date = start_date
+            def collect() -> Dict:
+                """收集所有匹配的新闻并完整排序（作为分页快照）"""
+                all_matches = []
 
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
+                # keyword/entity 模式为子串匹配：已结束日期通过倒排索引只读取候选标题
+                indexed = {}
+                if search_mode in ("keyword", "entity") and self.data_service.search_index:
+                    indexed = self.data_service.search_index.lookup_substring(
+                        query, start_date, end_date, platforms
                     )
 
-                    # 根据搜索模式执行不同的搜索逻辑
-                    if search_mode == "keyword":
-                        matches = self._search_by_keyword_mode(
-                            query, all_titles, id_to_name, current_date, include_url
-                        )
-                    elif search_mode == "fuzzy":
-                        matches = self._search_by_fuzzy_mode(
-                            query, all_titles, id_to_name, current_date, threshold, include_url
-                        )
-                    else:  # entity
-                        matches = self._search_by_entity_mode(
-                            query, all_titles, id_to_name, current_date, include_url
-                        )
-
-                    all_matches.extend(matches)
+                for current_date, day in self.data_service.parser.iter_titles_for_range(
+                    start_date, end_date, platform_ids=platforms, skip_dates=indexed
+                ):
+                    try:
+                        date_str = current_date.strftime("%Y-%m-%d")
+                        if date_str in indexed:
+                            all_titles, id_to_name = indexed[date_str]
+                        else:
+                            all_titles, id_to_name, _ = day.result()
+
+                        # 根据搜索模式执行不同的搜索逻辑
+                        if search_mode == "keyword":
+                            matches = self._search_by_keyword_mode(
+                                query, all_titles, id_to_name, current_date, include_url
+                            )
+                        elif search_mode == "fuzzy":
+                            matches = self._search_by_fuzzy_mode(
+                                query, all_titles, id_to_name, current_date, threshold, include_url
+                            )
+                        else:  # entity
+                            matches = self._search_by_entity_mode(
+                                query, all_titles, id_to_name, current_date, include_url
+                            )
 
-                except DataNotFoundError:
-                    # 该日期没有数据，继续下一天
-                    pass
+                        all_matches.extend(matches)
+
+                    except DataNotFoundError:
+                        # 该日期没有数据，继续下一天
+                        pass
+
+                # 统一排序逻辑（稳定排序，分数相同时保持日期、平台的读取顺序）
+                if sort_by == "relevance":
+                    all_matches.sort(key=lambda x: x.get("similarity_score", 1.0), reverse=True)
+                elif sort_by == "weight":
+                    from .analytics import calculate_news_weight
+                    all_matches.sort(key=lambda x: calculate_news_weight(x), reverse=True)
+                elif sort_by == "date":
+                    all_matches.sort(key=lambda x: x.get("date", ""), reverse=True)
 
-                current_date += timedelta(days=1)
+                return {"items": all_matches}
 
-            if not all_matches:
+            page = self.data_service.pager.get_page(
+                "search_news",
+                {
+                    "query": query,
+                    "search_mode": search_mode,
+                    "start": start_date.strftime("%Y-%m-%d"),
+                    "end": end_date.strftime("%Y-%m-%d"),
+                    "platforms": platforms,
+                    "sort_by": sort_by,
+                    "threshold": threshold if search_mode == "fuzzy" else None,
+                    "include_url": include_url
+                },
+                limit=limit,
+                load=collect,
+                item_key=lambda x: (x.get("date", ""), x["platform"], x["title"]),
+                version=self.data_service.parser.get_dates_version(
+                    start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)
+                ),
+                cursor=cursor
+            )
+            results = page.items
+
+            if not page.total:
                 # 获取可用日期范围用于错误提示
                 earliest, latest = self.data_service.get_available_date_range()
 
@@ -180,18 +228,6 @@ class SearchTools:
                 }
                 return result
 
-            # 统一排序逻辑
-            if sort_by == "relevance":
-                all_matches.sort(key=lambda x: x.get("similarity_score", 1.0), reverse=True)
-            elif sort_by == "weight":
-                from .analytics import calculate_news_weight
-                all_matches.sort(key=lambda x: calculate_news_weight(x), reverse=True)
-            elif sort_by == "date":
-                all_matches.sort(key=lambda x: x.get("date", ""), reverse=True)
-
-            # 限制返回数量
-            results = all_matches[:limit]
-
             # 构建时间范围描述（正确判断是否为今天）
             if start_date.date() == datetime.now().date() and start_date == end_date:
                 time_range_desc = "今天"
@@ -204,8 +240,9 @@ class SearchTools:
                 "success": True,
                 "summary": {
                     "description": f"新闻搜索结果（{search_mode}模式）",
-                    "total_found": len(all_matches),
+                    "total_found": page.total,
                     "returned": len(results),
+                    "offset": page.offset,
                     "requested_limit": limit,
                     "search_mode": search_mode,
                     "query": query,
@@ -213,16 +250,17 @@ class SearchTools:
                     "time_range": time_range_desc,
                     "sort_by": sort_by
                 },
-                "data": results
+                "data": results,
+                "next_cursor": page.next_cursor
             }
 
             if search_mode == "fuzzy":
                 result["summary"]["threshold"] = threshold
-                if len(all_matches) < limit:
-                    result["note"] = f"模糊搜索模式下，相似度阈值 {threshold} 仅匹配到 {len(all_matches)} 条结果"
+                if page.total < limit:
+                    result["note"] = f"模糊搜索模式下，相似度阈值 {threshold} 仅匹配到 {page.total} 条结果"
 
-            # 如果启用 RSS 搜索，同时搜索 RSS 数据
-            if include_rss:
+            # 如果启用 RSS 搜索，同时搜索 RSS 数据（只在第一页返回）
+            if include_rss and not cursor:
                 rss_results = self._search_rss_by_keyword(
                     query=query,
                     start_date=start_date,
@@ -463,17 +501,8 @@ class SearchTools:
         Returns:
             关键词列表
         """
-        # 移除URL和特殊字符
-        text = re.sub(r'http[s]?://\S+', '', text)
-        text = re.sub(r'\[.*?\]', '', text)  # 移除方括号内容
-
-        # 使用正则表达式分词（中文和英文）
-        words = re.findall(r'[\w]+', text)
-
-        # 过滤短词
-        keywords = [word for word in words if word and len(word) >= min_length]
-
-        return keywords
+        # 与倒排索引的关键词切分保持一致
+        return extract_keywords(text, min_length)
 
     def _calculate_keyword_overlap(self, keywords1: List[str], keywords2: List[str]) -> float:
         """
@@ -609,12 +638,25 @@ class SearchTools:
 
             # 收集所有相关新闻
             all_related_news = []
-            current_date = search_start
 
-            while current_date <= search_end:
+            # 没有共同关键词时综合相似度不超过 0.3（仅文本相似度部分），
+            # 阈值高于 0.3 时已结束日期只需读取与参考文本有共同关键词的候选标题
+            indexed = {}
+            if threshold > 0.3 and self.data_service.search_index:
+                indexed = self.data_service.search_index.lookup_words(
+                    reference_keywords, search_start, search_end
+                )
+
+            for current_date, day in self.data_service.parser.iter_titles_for_range(
+                search_start, search_end, skip_dates=indexed
+            ):
                 try:
                     # 读取该日期的数据
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(current_date)
+                    date_str = current_date.strftime("%Y-%m-%d")
+                    if date_str in indexed:
+                        all_titles, id_to_name = indexed[date_str]
+                    else:
+                        all_titles, id_to_name, _ = day.result()
 
                     # 搜索相关新闻
                     for platform_id, titles in all_titles.items():
@@ -663,9 +705,6 @@ class SearchTools:
                     # 记录错误但继续处理其他日期
                     print(f"Warning: 处理日期 {current_date.strftime('%Y-%m-%d')} 时出错: {e}")
 
-                # 移动到下一天
-                current_date += timedelta(days=1)
-
             if not all_related_news:
                 return {
                     "success": True,
@@ -680,11 +719,10 @@ class SearchTools:
                     "message": "未找到相关新闻"
                 }
 
-            # 按相似度排序
-            all_related_news.sort(key=lambda x: x["similarity_score"], reverse=True)
-
-            # 限制返回数量
-            results = all_related_news[:limit]
+            # 按相似度排序并限制返回数量
+            results = select_top_k(
+                all_related_news, limit, key=lambda x: x["similarity_score"], reverse=True
+            )
 
             # 统计信息
             platform_distribution = Counter([news["platform"] for news in all_related_news])
@@ -742,7 +780,8 @@ class SearchTools:
         date_range: Optional[Union[Dict[str, str], str]] = None,
         threshold: float = 0.5,
         limit: int = 50,
-        include_url: bool = False
+        include_url: bool = False,
+        cursor: Optional[str] = None
     ) -> Dict:
         """
         统一的相关新闻查找工具 - 整合相似新闻和历史相关搜索
@@ -759,9 +798,10 @@ class SearchTools:
             threshold: 相似度阈值，0-1之间，默认0.5
             limit: 返回条数限制，默认50
             include_url: 是否包含URL链接，默认False
+            cursor: 分页游标（上一页返回的 next_cursor），None 表示第一页
 
         Returns:
-            相关新闻列表，按相似度排序
+            相关新闻列表，按相似度排序，还有下一页时 next_cursor 不为 None
         """
         try:
             # 参数验证
@@ -813,68 +853,86 @@ class SearchTools:
             # 提取参考标题的关键词
             reference_keywords = self._extract_keywords(reference_title)
 
-            # 收集所有相关新闻
-            all_related_news = []
+            def collect() -> Dict:
+                """收集所有相关新闻，按相似度完整排序（作为分页快照）"""
+                all_related_news = []
             
-            for search_date in search_dates:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(search_date)
+                for search_date in search_dates:
+                    check_deadline()
+                    try:
+                        all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(search_date)
                     
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
+                        for platform_id, titles in all_titles.items():
+                            platform_name = id_to_name.get(platform_id, platform_id)
                         
-                        for title, info in titles.items():
-                            if title == reference_title:
-                                continue
+                            for title, info in titles.items():
+                                if title == reference_title:
+                                    continue
                             
-                            # 计算相似度（使用混合算法）
-                            text_similarity = self._calculate_similarity(reference_title, title)
+                                # 计算相似度（使用混合算法）
+                                text_similarity = self._calculate_similarity(reference_title, title)
                             
-                            # 如果有关键词，也计算关键词重合度
-                            if reference_keywords:
-                                title_keywords = self._extract_keywords(title)
-                                keyword_similarity = self._jaccard_similarity(reference_keywords, title_keywords)
-                                # 混合相似度：70% 文本 + 30% 关键词
-                                similarity = 0.7 * text_similarity + 0.3 * keyword_similarity
-                            else:
-                                similarity = text_similarity
+                                # 如果有关键词，也计算关键词重合度
+                                if reference_keywords:
+                                    title_keywords = self._extract_keywords(title)
+                                    keyword_similarity = self._jaccard_similarity(reference_keywords, title_keywords)
+                                    # 混合相似度：70% 文本 + 30% 关键词
+                                    similarity = 0.7 * text_similarity + 0.3 * keyword_similarity
+                                else:
+                                    similarity = text_similarity
                             
-                            if similarity >= threshold:
-                                news_item = {
-                                    "title": title,
-                                    "platform": platform_id,
-                                    "platform_name": platform_name,
-                                    "date": search_date.strftime("%Y-%m-%d"),
-                                    "similarity": round(similarity, 3),
-                                    "rank": info["ranks"][0] if info["ranks"] else 0
-                                }
+                                if similarity >= threshold:
+                                    news_item = {
+                                        "title": title,
+                                        "platform": platform_id,
+                                        "platform_name": platform_name,
+                                        "date": search_date.strftime("%Y-%m-%d"),
+                                        "similarity": round(similarity, 3),
+                                        "rank": info["ranks"][0] if info["ranks"] else 0
+                                    }
                                 
-                                if include_url:
-                                    news_item["url"] = info.get("url", "")
+                                    if include_url:
+                                        news_item["url"] = info.get("url", "")
                                 
-                                all_related_news.append(news_item)
+                                    all_related_news.append(news_item)
                                 
-                except Exception:
-                    # 某天数据读取失败，跳过
-                    continue
+                    except Exception:
+                        # 某天数据读取失败，跳过
+                        continue
 
-            # 按相似度排序
-            all_related_news.sort(key=lambda x: x["similarity"], reverse=True)
-            
-            # 限制数量
-            results = all_related_news[:limit]
+                # 按相似度排序（稳定排序，相似度相同时保持日期、平台的读取顺序）
+                all_related_news.sort(key=lambda x: x["similarity"], reverse=True)
 
-            # 统计信息
-            from collections import Counter
-            platform_dist = Counter([n["platform_name"] for n in all_related_news])
-            date_dist = Counter([n["date"] for n in all_related_news])
+                # 统计信息
+                return {
+                    "items": all_related_news,
+                    "platform_distribution": dict(Counter(n["platform_name"] for n in all_related_news)),
+                    "date_distribution": dict(Counter(n["date"] for n in all_related_news))
+                }
+
+            page = self.data_service.pager.get_page(
+                "find_related_news",
+                {
+                    "reference_title": reference_title,
+                    "dates": [date.strftime("%Y-%m-%d") for date in search_dates],
+                    "threshold": threshold,
+                    "include_url": include_url
+                },
+                limit=limit,
+                load=collect,
+                item_key=lambda x: (x["date"], x["platform"], x["title"]),
+                version=self.data_service.parser.get_dates_version(search_dates),
+                cursor=cursor
+            )
+            results = page.items
 
             return {
                 "success": True,
                 "summary": {
                     "description": "相关新闻搜索结果",
-                    "total_found": len(all_related_news),
+                    "total_found": page.total,
                     "returned": len(results),
+                    "offset": page.offset,
                     "reference_title": reference_title,
                     "threshold": threshold,
                     "date_range": {
@@ -883,9 +941,10 @@ class SearchTools:
                     } if search_dates else None
                 },
                 "data": results,
+                "next_cursor": page.next_cursor,
                 "statistics": {
-                    "platform_distribution": dict(platform_dist),
-                    "date_distribution": dict(date_dist)
+                    "platform_distribution": page.snapshot["platform_distribution"],
+                    "date_distribution": page.snapshot["date_distribution"]
                 }
             }
 
@@ -917,16 +976,13 @@ class SearchTools:
         """
         all_rss_matches = []
         query_lower = query.lower()
-        current_date = start_date
 
-        while current_date <= end_date:
+        for current_date, day in self.data_service.parser.iter_titles_for_range(
+            start_date, end_date, db_type="rss"
+        ):
             try:
                 # 读取该日期的 RSS 数据
-                all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                    date=current_date,
-                    platform_ids=None,
-                    db_type="rss"
-                )
+                all_titles, id_to_name, _ = day.result()
 
                 for feed_id, items in all_titles.items():
                     feed_name = id_to_name.get(feed_id, feed_id)
@@ -960,12 +1016,10 @@ class SearchTools:
                 # 其他错误，跳过
                 pass
 
-            current_date += timedelta(days=1)
-
-        # 按发布时间排序（最新的在前）
-        all_rss_matches.sort(key=lambda x: x.get("published_at", ""), reverse=True)
-
+        # 按发布时间排序（最新的在前）并限制数量
         return {
-            "items": all_rss_matches[:limit],
+            "items": select_top_k(
+                all_rss_matches, limit, key=lambda x: x.get("published_at", ""), reverse=True
+            ),
             "total": len(all_rss_matches)
         }
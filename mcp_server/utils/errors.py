@@ -82,6 +82,17 @@ class CrawlTaskError(MCPError):
         )
 
 
+class DeadlineExceededError(MCPError):
+    """请求超时或已被取消错误"""
+
+    def __init__(self, message: str, suggestion: Optional[str] = None):
+        super().__init__(
+            message=message,
+            code="DEADLINE_EXCEEDED",
+            suggestion=suggestion or "请缩小日期范围或减少平台数量后重试"
+        )
+
+
 class FileParseError(MCPError):
     """文件解析错误"""
 
@@ -148,6 +148,10 @@ def _parse_string_to_bool(value: str) -> bool:
         return bool(value)
 
 
+# config.yaml 文件版本 (mtime_ns, size) -> 平台ID列表，配置文件变化时重新解析
+_platforms_cache = {}
+
+
 def get_supported_platforms() -> List[str]:
     """
     从 config.yaml 动态获取支持的平台列表
@@ -158,6 +162,7 @@ def get_supported_platforms() -> List[str]:
     Note:
         - 读取失败时返回空列表，允许所有平台通过（降级策略）
         - 平台列表来自 config/config.yaml 中的 platforms 配置
+        - 解析结果按配置文件的修改时间和大小缓存，每次工具调用不再重复解析 YAML
     """
     try:
         # 获取 config.yaml 路径（相对于当前文件）
@@ -165,10 +170,18 @@ def get_supported_platforms() -> List[str]:
         config_path = os.path.join(current_dir, "..", "..", "config", "config.yaml")
         config_path = os.path.normpath(config_path)
 
+        stat = os.stat(config_path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = _platforms_cache.get(config_path)
+        if cached and cached[0] == version:
+            return list(cached[1])
+
         with open(config_path, 'r', encoding='utf-8') as f:
             config = yaml.safe_load(f)
             platforms = config.get('platforms', [])
-            return [p['id'] for p in platforms if 'id' in p]
+            platform_ids = [p['id'] for p in platforms if 'id' in p]
+        _platforms_cache[config_path] = (version, platform_ids)
+        return list(platform_ids)
     except Exception as e:
         # 降级方案：返回空列表，允许所有平台
         print(f"警告：无法加载平台配置 ({config_path}): {e}")
@@ -18,7 +18,7 @@ from trendradar import __version__
 from trendradar.core import load_config
 from trendradar.core.analyzer import convert_keyword_stats_to_platform_stats
 from trendradar.crawler import DataFetcher
-from trendradar.storage import convert_crawl_results_to_news_data
+from trendradar.storage import convert_crawl_results_to_news_data, CurrentTitleInfoView
 from trendradar.utils.time import is_within_days
 from trendradar.ai import AIAnalyzer, AIAnalysisResult
 
@@ -331,24 +331,8 @@ class NewsAnalyzer:
             return None
 
     def _prepare_current_title_info(self, results: Dict, time_info: str) -> Dict:
-        """从当前抓取结果构建标题信息"""
-        title_info = {}
-        for source_id, titles_data in results.items():
-            title_info[source_id] = {}
-            for title, title_data in titles_data.items():
-                ranks = title_data.get("ranks", [])
-                url = title_data.get("url", "")
-                mobile_url = title_data.get("mobileUrl", "")
-
-                title_info[source_id][title] = {
-                    "first_time": time_info,
-                    "last_time": time_info,
-                    "count": 1,
-                    "ranks": ranks,
-                    "url": url,
-                    "mobileUrl": mobile_url,
-                }
-        return title_info
+        """从当前抓取结果构建标题信息（只读视图，不复制数据）"""
+        return CurrentTitleInfoView(results, time_info)
 
     def _prepare_standalone_data(
         self,
@@ -423,7 +407,7 @@ class NewsAnalyzer:
                 # 用于显示的排名范围：合并历史排名和当前排名
                 historical_ranks = meta.get("ranks", []) if meta else []
                 # 合并去重，保持顺序
-                all_ranks = historical_ranks.copy()
+                all_ranks = list(historical_ranks)
                 for rank in current_ranks:
                     if rank not in all_ranks:
                         all_ranks.append(rank)
@@ -627,7 +611,7 @@ class NewsAnalyzer:
             update_info_to_send = self.update_info if cfg["SHOW_VERSION_UPDATE"] else None
 
             # 使用 NotificationDispatcher 发送到所有渠道（合并热榜+RSS+AI分析+独立展示区）
-            dispatcher = self.ctx.create_notification_dispatcher()
+            dispatcher = self.ctx.get_notification_dispatcher()
             results = dispatcher.dispatch_all(
                 report_data=report_data,
                 report_type=report_type,
@@ -22,6 +22,7 @@ from trendradar.core import (
     save_titles_to_file,
     read_all_today_titles,
     detect_latest_new_titles,
+    read_latest_batch_titles,
     is_first_crawl_today,
     count_word_frequency,
 )
@@ -30,12 +31,17 @@ from trendradar.report import (
     prepare_report_data,
     generate_html_report,
     render_html_content,
+    TitleFragmentCache,
+    get_fragment_cache,
+    set_fragment_cache,
 )
 from trendradar.notification import (
     render_feishu_content,
     render_dingtalk_content,
     split_content_into_batches,
     NotificationDispatcher,
+    NotificationOutbox,
+    DeltaPushTracker,
     PushRecordManager,
 )
 from trendradar.storage import get_storage_manager
@@ -72,6 +78,11 @@ class AppContext:
         """
         self.config = config
         self._storage_manager = None
+        self._notification_dispatcher: Optional[NotificationDispatcher] = None
+
+        # 运行级标题片段缓存：HTML 报告与各推送格式中相同的标题行只渲染一次，由 cleanup() 移除
+        self.fragment_cache = TitleFragmentCache()
+        set_fragment_cache(self.fragment_cache)
 
     # === 配置访问 ===
 
@@ -202,6 +213,10 @@ class AppContext:
         """检测是否是当天第一次爬取"""
         return self.get_storage_manager().is_first_crawl_today()
 
+    def get_latest_batch_titles(self) -> Optional[Tuple[str, Dict]]:
+        """获取最新一批抓取中出现的标题（按当前监控平台过滤）"""
+        return read_latest_batch_titles(self.get_storage_manager(), self.platform_ids)
+
     # === 频率词处理 ===
 
     def load_frequency_words(
@@ -251,6 +266,7 @@ class AppContext:
             is_first_crawl_func=self.is_first_crawl,
             convert_time_func=self.convert_time_display,
             quiet=quiet,
+            latest_batch_func=self.get_latest_batch_titles,
         )
 
     # === 报告生成 ===
@@ -430,8 +446,46 @@ class AppContext:
             config=self.config,
             get_time_func=self.get_time,
             split_content_func=self.split_content,
+            outbox=self.create_notification_outbox(),
+            delta_tracker=self.create_delta_push_tracker(),
         )
 
+    def get_notification_dispatcher(self) -> NotificationDispatcher:
+        """获取通知调度器（单次运行内共享，复用 HTTP 连接与限流状态）"""
+        if self._notification_dispatcher is None:
+            self._notification_dispatcher = self.create_notification_dispatcher()
+        return self._notification_dispatcher
+
+    def create_notification_outbox(self) -> Optional[NotificationOutbox]:
+        """创建推送发件箱（未启用或存储后端不支持时返回 None）"""
+        outbox_config = self.config.get("OUTBOX", {})
+        if not outbox_config.get("ENABLED", False):
+            return None
+
+        storage_manager = self.get_storage_manager()
+        if not storage_manager.supports_outbox:
+            return None
+
+        return NotificationOutbox(
+            storage_backend=storage_manager,
+            max_pending_age=outbox_config.get("MAX_PENDING_AGE", 60),
+            max_attempts=outbox_config.get("MAX_ATTEMPTS", 5),
+            retries=outbox_config.get("RETRIES", 2),
+            retry_backoff=outbox_config.get("RETRY_BACKOFF", 2),
+        )
+
+    def create_delta_push_tracker(self) -> Optional[DeltaPushTracker]:
+        """创建增量推送记录（未启用或存储后端不支持时返回 None）"""
+        if not self.config.get("DELTA_PUSH", {}).get("ENABLED", False):
+            return None
+
+        storage_manager = self.get_storage_manager()
+        if not storage_manager.supports_delivery_state:
+            print("[增量推送] 当前存储后端不支持记录已推送标题，使用完整推送")
+            return None
+
+        return DeltaPushTracker(storage_manager)
+
     def create_push_manager(self) -> PushRecordManager:
         """创建推送记录管理器"""
         return PushRecordManager(
@@ -443,6 +497,18 @@ class AppContext:
 
     def cleanup(self):
         """清理资源"""
+        if self.config.get("DEBUG", False):
+            stats = self.fragment_cache.stats()
+            print(
+                f"[调试] 标题片段缓存：渲染 {stats['misses']} 次，复用 {stats['hits']} 次"
+            )
+        if get_fragment_cache() is self.fragment_cache:
+            set_fragment_cache(None)
+        self.fragment_cache.clear()
+
+        if self._notification_dispatcher:
+            self._notification_dispatcher.close()
+            self._notification_dispatcher = None
         if self._storage_manager:
             self._storage_manager.cleanup_old_data()
             self._storage_manager.cleanup()
@@ -17,6 +17,7 @@ from trendradar.core.data import (
     read_all_today_titles,
     detect_latest_new_titles_from_storage,
     detect_latest_new_titles,
+    read_latest_batch_titles,
     is_first_crawl_today,
 )
 from trendradar.core.analyzer import (
@@ -40,6 +41,7 @@ __all__ = [
     "read_all_today_titles",
     "detect_latest_new_titles_from_storage",
     "detect_latest_new_titles",
+    "read_latest_batch_titles",
     "is_first_crawl_today",
     # 统计分析
     "calculate_news_weight",
@@ -8,9 +8,10 @@
 - count_word_frequency: 统计词频
 """
 
-from typing import Dict, List, Tuple, Optional, Callable
+from typing import Dict, List, Set, Tuple, Optional, Callable
 
 from trendradar.core.frequency import matches_word_groups, _word_matches
+from trendradar.utils.topk import select_top_k
 
 
 def calculate_news_weight(
@@ -103,6 +104,7 @@ def count_word_frequency(
     is_first_crawl_func: Optional[Callable[[], bool]] = None,
     convert_time_func: Optional[Callable[[str], str]] = None,
     quiet: bool = False,
+    latest_batch_func: Optional[Callable[[], Optional[Tuple[str, Dict[str, Set[str]]]]]] = None,
 ) -> Tuple[List[Dict], int]:
     """
     统计词频，支持必须词、频率词、过滤词、全局过滤词，并标记新增标题
@@ -123,6 +125,8 @@ def count_word_frequency(
         is_first_crawl_func: 检测是否是当天第一次爬取的函数
         convert_time_func: 时间格式转换函数
         quiet: 是否静默模式（不打印日志）
+        latest_batch_func: 获取最新批次标题的函数（current 模式使用，
+            返回 (最新时间, {source_id: {title}})，不提供或返回 None 时遍历 title_info 计算）
 
     Returns:
         Tuple[List[Dict], int]: (统计结果列表, 总标题数)
@@ -163,7 +167,29 @@ def count_word_frequency(
             all_news_are_new = True
     elif mode == "current":
         # current 模式：只处理当前时间批次的新闻，但统计信息来自全部历史
-        if title_info:
+        latest_batch = latest_batch_func() if (title_info and latest_batch_func) else None
+        if latest_batch:
+            # 由存储层直接给出最新批次的标题集合，无需遍历全天 title_info
+            latest_time, batch_titles = latest_batch
+            results_to_process = {}
+            for source_id in results:
+                batch_set = batch_titles.get(source_id)
+                if not batch_set or source_id not in title_info:
+                    continue
+                source_titles = results[source_id]
+                filtered_titles = {
+                    title: source_titles[title]
+                    for title in source_titles
+                    if title in batch_set
+                }
+                if filtered_titles:
+                    results_to_process[source_id] = filtered_titles
+
+            if not quiet:
+                print(
+                    f"当前榜单模式：最新时间 {latest_time}，筛选出 {sum(len(titles) for titles in results_to_process.values())} 条当前榜单新闻"
+                )
+        elif title_info:
             latest_time = None
             for source_titles in title_info.values():
                 for title_data in source_titles.values():
@@ -431,9 +457,16 @@ def count_word_frequency(
         for source_id, title_list in data["titles"].items():
             all_titles.extend(title_list)
 
-        # 按权重排序
-        sorted_titles = sorted(
+        # 应用最大显示数量限制（优先级：单独配置 > 全局配置）
+        group_max_count = group_key_to_max_count.get(group_key, 0)
+        if group_max_count == 0:
+            # 使用全局配置
+            group_max_count = max_news_per_keyword
+
+        # 按权重排序（设置了最大数量时只选出前 N 条，无需完整排序）
+        sorted_titles = select_top_k(
             all_titles,
+            group_max_count if group_max_count > 0 else None,
             key=lambda x: (
                 -calculate_news_weight(x, rank_threshold, weight_config),
                 min(x["ranks"]) if x["ranks"] else 999,
@@ -441,15 +474,6 @@ def count_word_frequency(
             ),
         )
 
-        # 应用最大显示数量限制（优先级：单独配置 > 全局配置）
-        group_max_count = group_key_to_max_count.get(group_key, 0)
-        if group_max_count == 0:
-            # 使用全局配置
-            group_max_count = max_news_per_keyword
-
-        if group_max_count > 0:
-            sorted_titles = sorted_titles[:group_max_count]
-
         # 优先使用 display_name，否则使用 group_key
         display_word = group_key_to_display_name.get(group_key) or group_key
 
@@ -665,18 +689,17 @@ def count_rss_frequency(
         if data["count"] == 0:
             continue
 
-        # 按发布时间排序（最新在前）
-        sorted_titles = sorted(
-            data["titles"],
-            key=lambda x: x["ranks"][0] if x["ranks"] else 999
-        )
-
         # 应用最大显示数量限制
         group_max_count = group_key_to_max_count.get(group_key, 0)
         if group_max_count == 0:
             group_max_count = max_news_per_keyword
-        if group_max_count > 0:
-            sorted_titles = sorted_titles[:group_max_count]
+
+        # 按发布时间排序（最新在前），设置了最大数量时只选出前 N 条
+        sorted_titles = select_top_k(
+            data["titles"],
+            group_max_count if group_max_count > 0 else None,
+            key=lambda x: x["ranks"][0] if x["ranks"] else 999
+        )
 
         # 优先使用 display_name，否则使用 group_key
         display_word = group_key_to_display_name.get(group_key) or group_key
@@ -6,12 +6,15 @@
 - save_titles_to_file: 保存标题到 TXT 文件
 - read_all_today_titles: 从存储后端读取当天所有标题
 - detect_latest_new_titles: 检测最新批次的新增标题
+- read_latest_batch_titles: 读取最新批次出现的标题
 
 Author: TrendRadar Team
 """
 
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Callable
+from typing import Dict, List, Set, Tuple, Optional, Callable
+
+from trendradar.storage.base import news_data_to_result_views
 
 
 def save_titles_to_file(
@@ -96,6 +99,7 @@ def read_all_today_titles_from_storage(
 
     Returns:
         Tuple[Dict, Dict, Dict]: (all_results, id_to_name, title_info)
+        all_results 和 title_info 为 NewsData 上的只读映射视图
     """
     try:
         news_data = storage_manager.get_today_all_data()
@@ -103,46 +107,8 @@ def read_all_today_titles_from_storage(
         if not news_data or not news_data.items:
             return {}, {}, {}
 
-        all_results = {}
-        final_id_to_name = {}
-        title_info = {}
-
-        for source_id, news_list in news_data.items.items():
-            # 按平台过滤
-            if current_platform_ids is not None and source_id not in current_platform_ids:
-                continue
-
-            # 获取来源名称
-            source_name = news_data.id_to_name.get(source_id, source_id)
-            final_id_to_name[source_id] = source_name
-
-            if source_id not in all_results:
-                all_results[source_id] = {}
-                title_info[source_id] = {}
-
-            for item in news_list:
-                title = item.title
-                ranks = getattr(item, 'ranks', [item.rank])
-                first_time = getattr(item, 'first_time', item.crawl_time)
-                last_time = getattr(item, 'last_time', item.crawl_time)
-                count = getattr(item, 'count', 1)
-
-                all_results[source_id][title] = {
-                    "ranks": ranks,
-                    "url": item.url or "",
-                    "mobileUrl": item.mobile_url or "",
-                }
-
-                title_info[source_id][title] = {
-                    "first_time": first_time,
-                    "last_time": last_time,
-                    "count": count,
-                    "ranks": ranks,
-                    "url": item.url or "",
-                    "mobileUrl": item.mobile_url or "",
-                }
-
-        return all_results, final_id_to_name, title_info
+        # 直接返回 NewsData 上的只读视图（按平台过滤），不复制条目
+        return news_data_to_result_views(news_data, current_platform_ids)
 
     except Exception as e:
         print(f"[存储] 从存储后端读取数据失败: {e}")
@@ -285,6 +251,27 @@ def detect_latest_new_titles(
     return new_titles
 
 
+def read_latest_batch_titles(
+    storage_manager,
+    current_platform_ids: Optional[List[str]] = None,
+) -> Optional[Tuple[str, Dict[str, Set[str]]]]:
+    """
+    从存储后端读取最新一批抓取中出现的标题
+
+    Args:
+        storage_manager: 存储管理器实例
+        current_platform_ids: 当前监控的平台 ID 列表（用于过滤）
+
+    Returns:
+        (最新批次时间, {source_id: {title, ...}})，读取失败返回 None
+    """
+    try:
+        return storage_manager.get_latest_batch_titles(platform_ids=current_platform_ids)
+    except Exception as e:
+        print(f"[存储] 从存储后端读取最新批次失败: {e}")
+        return None
+
+
 def is_first_crawl_today(output_dir: str, date_folder: str) -> bool:
     """
     检测是否是当天第一次爬取
@@ -99,8 +99,12 @@ def _load_notification_config(config_data: Dict) -> Dict:
     notification = config_data.get("notification", {})
     advanced = config_data.get("advanced", {})
     batch_size = advanced.get("batch_size", {})
+    outbox = advanced.get("outbox", {})
+    rate_limit = advanced.get("rate_limit", {})
 
     enable_notification_env = _get_env_bool("ENABLE_NOTIFICATION")
+    outbox_enabled_env = _get_env_bool("OUTBOX_ENABLED")
+    rate_limit_enabled_env = _get_env_bool("RATE_LIMIT_ENABLED")
 
     return {
         "ENABLE_NOTIFICATION": enable_notification_env if enable_notification_env is not None else notification.get("enabled", True),
@@ -112,6 +116,18 @@ def _load_notification_config(config_data: Dict) -> Dict:
         "BATCH_SEND_INTERVAL": advanced.get("batch_send_interval", 1.0),
         "FEISHU_MESSAGE_SEPARATOR": advanced.get("feishu_message_separator", "---"),
         "MAX_ACCOUNTS_PER_CHANNEL": _get_env_int("MAX_ACCOUNTS_PER_CHANNEL") or advanced.get("max_accounts_per_channel", 3),
+        "MAX_DISPATCH_WORKERS": _get_env_int("MAX_DISPATCH_WORKERS") or advanced.get("max_dispatch_workers", 4),
+        "OUTBOX": {
+            "ENABLED": outbox_enabled_env if outbox_enabled_env is not None else outbox.get("enabled", False),
+            "MAX_PENDING_AGE": outbox.get("max_pending_age", 60),
+            "MAX_ATTEMPTS": outbox.get("max_attempts", 5),
+            "RETRIES": outbox.get("retries", 2),
+            "RETRY_BACKOFF": outbox.get("retry_backoff", 2),
+        },
+        "RATE_LIMIT": {
+            "ENABLED": rate_limit_enabled_env if rate_limit_enabled_env is not None else rate_limit.get("enabled", True),
+            "PER_MINUTE": rate_limit.get("per_minute") or {},
+        },
     }
 
 
@@ -133,6 +149,18 @@ def _load_push_window_config(config_data: Dict) -> Dict:
     }
 
 
+def _load_delta_push_config(config_data: Dict) -> Dict:
+    """加载增量推送配置"""
+    notification = config_data.get("notification", {})
+    delta_push = notification.get("delta_push", {})
+
+    enabled_env = _get_env_bool("DELTA_PUSH_ENABLED")
+
+    return {
+        "ENABLED": enabled_env if enabled_env is not None else delta_push.get("enabled", False),
+    }
+
+
 def _load_weight_config(config_data: Dict) -> Dict:
     """加载权重配置"""
     advanced = config_data.get("advanced", {})
@@ -428,6 +456,7 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
 
     # 推送窗口配置
     config["PUSH_WINDOW"] = _load_push_window_config(config_data)
+    config["DELTA_PUSH"] = _load_delta_push_config(config_data)
 
     # 权重配置
     config["WEIGHT_CONFIG"] = _load_weight_config(config_data)
@@ -11,6 +11,11 @@
 - push_manager: 推送记录管理
 - formatters: 内容格式转换
 - batch: 批次处理工具
+- outbox: 推送发件箱（批次持久化与断点续发）
+- delta: 增量推送（按渠道只推送新增标题）
+- ratelimit: 按 webhook 的令牌桶限流
+- sessions: 按渠道复用的 HTTP 会话池
+- mailer: 可复用的 SMTP 邮件传输
 - renderer: 通知内容渲染
 - splitter: 消息分批拆分
 - senders: 消息发送器（各渠道发送函数）
@@ -18,6 +23,11 @@
 """
 
 from trendradar.notification.push_manager import PushRecordManager
+from trendradar.notification.outbox import NotificationOutbox
+from trendradar.notification.delta import DeltaPushTracker, DELTA_PUSH_MODES
+from trendradar.notification.ratelimit import RateLimiter, DEFAULT_RATE_LIMITS
+from trendradar.notification.sessions import SessionPool
+from trendradar.notification.mailer import SMTPTransport
 from trendradar.notification.formatters import (
     strip_markdown,
     convert_markdown_to_mrkdwn,
@@ -27,6 +37,7 @@ from trendradar.notification.batch import (
     get_max_batch_header_size,
     truncate_to_bytes,
     add_batch_headers,
+    BatchCache,
 )
 from trendradar.notification.renderer import (
     render_feishu_content,
@@ -42,6 +53,7 @@ from trendradar.notification.senders import (
     send_to_wework,
     send_to_telegram,
     send_to_email,
+    create_smtp_transport,
     send_to_ntfy,
     send_to_bark,
     send_to_slack,
@@ -52,6 +64,18 @@ from trendradar.notification.dispatcher import NotificationDispatcher
 __all__ = [
     # 推送记录管理
     "PushRecordManager",
+    # 推送发件箱
+    "NotificationOutbox",
+    # 增量推送
+    "DeltaPushTracker",
+    "DELTA_PUSH_MODES",
+    # 推送限流
+    "RateLimiter",
+    "DEFAULT_RATE_LIMITS",
+    # HTTP 会话池
+    "SessionPool",
+    # SMTP 邮件传输
+    "SMTPTransport",
     # 格式转换
     "strip_markdown",
     "convert_markdown_to_mrkdwn",
@@ -60,6 +84,7 @@ __all__ = [
     "get_max_batch_header_size",
     "truncate_to_bytes",
     "add_batch_headers",
+    "BatchCache",
     # 内容渲染
     "render_feishu_content",
     "render_dingtalk_content",
@@ -72,6 +97,7 @@ __all__ = [
     "send_to_wework",
     "send_to_telegram",
     "send_to_email",
+    "create_smtp_transport",
     "send_to_ntfy",
     "send_to_bark",
     "send_to_slack",
@@ -5,7 +5,9 @@
 提供消息分批发送的辅助函数
 """
 
-from typing import List
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Tuple
 
 
 def get_batch_header(format_type: str, batch_num: int, total_batches: int) -> str:
@@ -113,3 +115,77 @@ def add_batch_headers(
         result.append(header + content)
 
     return result
+
+
+class BatchCache:
+    """单次分发内的分批结果缓存
+
+    同一渠道的多个账号（以及共用同一格式的渠道）使用完全相同的报告数据，
+    AI 分析渲染、split_content_into_batches 与 add_batch_headers 的结果也完全相同。
+    调度器在每次 dispatch 时创建一个实例传给各发送函数，使相同输入只分批一次。
+
+    缓存键由格式标识、批次大小和各输入对象的身份（id）组成；
+    缓存条目同时持有这些输入对象的引用，保证分发期间 id 不会被复用。
+
+    每个缓存键对应一个 Future：首个请求者在锁外生成批次，同一键的并发请求者等待该 Future，
+    不同键的生成互不阻塞。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple, Tuple[Tuple, Future]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _make_key(format_key: str, batch_size: int, inputs: Tuple) -> Tuple:
+        """将输入对象转换为可哈希的身份键（不可变标量按值，其余按 id）"""
+        parts = []
+        for value in inputs:
+            if value is None or isinstance(value, (str, int, float, bool)):
+                parts.append(value)
+            else:
+                parts.append(("id", id(value)))
+        return (format_key, batch_size, tuple(parts))
+
+    def get_or_build(
+        self,
+        format_key: str,
+        batch_size: int,
+        inputs: Tuple[Any, ...],
+        build: Callable[[], List[str]],
+    ) -> List[str]:
+        """获取缓存的批次列表，未命中时调用 build 生成
+
+        Args:
+            format_key: 格式标识（如 "dingtalk"、"wework_text"、"generic_webhook"）
+            batch_size: 批次大小（字节）
+            inputs: 影响分批结果的全部输入（报告数据、RSS 条目、AI 分析结果等）
+            build: 生成批次列表的函数
+
+        Returns:
+            批次列表（副本，调用方可自由修改）
+        """
+        key = self._make_key(format_key, batch_size, inputs)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                future: Future = Future()
+                self._entries[key] = (inputs, future)
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if entry is not None:
+            return list(entry[1].result())
+
+        # 锁外生成：同一键的并发账号等待本次生成结果，其他键不受影响
+        try:
+            batches = build()
+        except BaseException as e:
+            with self._lock:
+                self._entries.pop(key, None)
+            future.set_exception(e)
+            raise
+        future.set_result(batches)
+        return list(batches)
@@ -0,0 +1,140 @@
+# coding=utf-8
+"""
+增量推送模块
+
+daily / current 模式每次推送都会带上完整的热点词汇统计，即使距上次推送只多了几条标题。
+启用增量推送后，按渠道账号记录当日已推送过的词组与标题（push_delivered_titles 表），
+每次只推送有新标题的词组（词组内只保留新标题），其余词组合并为一行"无新增"摘要；
+分批仍由 split_content_into_batches 完成，遵守各渠道的字节限制。
+"""
+
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# 增量推送生效的报告模式（incremental 模式本身只推送新增内容）
+DELTA_PUSH_MODES = ("daily", "current")
+
+
+class DeltaPushTracker:
+    """
+    按渠道账号的已推送标题记录
+
+    同一渠道的多个账号分别记录：某个账号推送失败不影响其他账号，
+    该账号下次推送时仍会收到这些标题。
+
+    使用示例:
+        tracker = DeltaPushTracker(storage_manager)
+        delta_report, pending = tracker.build_delta("feishu", report_data, account)
+        ...  # 推送 delta_report
+        tracker.commit("feishu", pending, account)
+    """
+
+    def __init__(self, storage_backend: Any):
+        """
+        初始化增量推送记录
+
+        Args:
+            storage_backend: 存储后端（需支持 supports_delivery_state）
+        """
+        self.storage_backend = storage_backend
+
+    @staticmethod
+    def title_key(title_data: Dict) -> str:
+        """
+        生成标题摘要（来源 + 标题）
+
+        Args:
+            title_data: 报告数据中的标题条目
+
+        Returns:
+            16 位十六进制摘要
+        """
+        raw = f"{title_data.get('source_name', '')}\x00{title_data.get('title', '')}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def state_key(channel: str, account: str = "") -> str:
+        """
+        生成已推送记录的渠道键（渠道名称 + 账号摘要）
+
+        Args:
+            channel: 渠道名称
+            account: 账号摘要（见 NotificationOutbox.account_key）
+
+        Returns:
+            push_delivered_titles 表中的 channel 值
+        """
+        return f"{channel}:{account}" if account else channel
+
+    def build_delta(
+        self,
+        channel: str,
+        report_data: Dict,
+        account: str = "",
+    ) -> Tuple[Dict, Dict[str, List[str]]]:
+        """
+        生成渠道账号的增量报告数据
+
+        Args:
+            channel: 渠道名称
+            report_data: 完整报告数据（由 prepare_report_data 生成）
+            account: 账号摘要
+
+        Returns:
+            (增量报告数据, 待记录的 {词组: [标题摘要, ...]})；
+            增量报告的 stats 只包含有新标题的词组，未变化的词组汇总到 unchanged_summary
+        """
+        delivered = self.storage_backend.get_delivered_titles(self.state_key(channel, account))
+
+        changed_stats = []
+        pending: Dict[str, List[str]] = {}
+        unchanged_groups = 0
+        unchanged_titles = 0
+
+        for stat in report_data["stats"]:
+            word = stat["word"]
+            seen = delivered.get(word, set())
+            new_titles = []
+            new_keys = []
+            for title_data in stat["titles"]:
+                key = self.title_key(title_data)
+                if key not in seen:
+                    new_titles.append(title_data)
+                    new_keys.append(key)
+
+            if new_titles:
+                changed_stats.append({**stat, "count": len(new_titles), "titles": new_titles})
+                pending[word] = new_keys
+            else:
+                unchanged_groups += 1
+                unchanged_titles += len(stat["titles"])
+
+        delta_report = {**report_data, "stats": changed_stats}
+        if unchanged_groups:
+            delta_report["unchanged_summary"] = {
+                "groups": unchanged_groups,
+                "titles": unchanged_titles,
+            }
+        return delta_report, pending
+
+    def commit(
+        self,
+        channel: str,
+        pending: Optional[Dict[str, List[str]]],
+        account: str = "",
+    ) -> bool:
+        """
+        记录渠道账号本次已推送的标题（仅在推送成功或批次已持久化到发件箱后调用）
+
+        Args:
+            channel: 渠道名称
+            pending: build_delta 返回的待记录标题
+            account: 账号摘要
+
+        Returns:
+            是否记录成功
+        """
+        if not pending:
+            return True
+        return self.storage_backend.record_delivered_titles(self.state_key(channel, account), pending)
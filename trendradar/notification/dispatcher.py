@@ -4,6 +4,8 @@
 
 提供统一的通知分发接口。
 支持所有通知渠道的多账号配置，使用 `;` 分隔多个账号。
+各渠道之间、同一渠道的多个账号之间通过有界线程池并发发送，
+单个渠道内部仍按顺序发送批次并遵守批次间隔。
 
 使用示例:
     dispatcher = NotificationDispatcher(config, get_time_func, split_content_func)
@@ -12,7 +14,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from trendradar.core.config import (
     get_account_at_index,
@@ -21,9 +26,16 @@ from trendradar.core.config import (
     validate_paired_configs,
 )
 
+from .batch import BatchCache
+from .delta import DELTA_PUSH_MODES, DeltaPushTracker
+from .outbox import NotificationOutbox
+from .ratelimit import RateLimiter
+from .mailer import SMTPTransport
+from .sessions import SessionPool
 from .senders import (
     send_to_bark,
     send_to_dingtalk,
+    create_smtp_transport,
     send_to_email,
     send_to_feishu,
     send_to_ntfy,
@@ -56,6 +68,8 @@ class NotificationDispatcher:
         config: Dict[str, Any],
         get_time_func: Callable,
         split_content_func: Callable,
+        outbox: Optional[NotificationOutbox] = None,
+        delta_tracker: Optional[DeltaPushTracker] = None,
     ):
         """
         初始化通知调度器
@@ -64,11 +78,64 @@ class NotificationDispatcher:
             config: 完整的配置字典，包含所有通知渠道的配置
             get_time_func: 获取当前时间的函数
             split_content_func: 内容分批函数
+            outbox: 推送发件箱（可选，启用后批次先持久化再投递，失败批次下次推送时续发）
+            delta_tracker: 增量推送记录（可选，启用后 daily/current 模式只推送各渠道账号未推送过的标题）
         """
         self.config = config
         self.get_time_func = get_time_func
         self.split_content_func = split_content_func
+        self.outbox = outbox
+        self.delta_tracker = delta_tracker
         self.max_accounts = config.get("MAX_ACCOUNTS_PER_CHANNEL", 3)
+        self.max_workers = max(int(config.get("MAX_DISPATCH_WORKERS", 4) or 1), 1)
+
+        # 按渠道账号复用的 HTTP 会话（同一账号的多个批次共享连接，RSS 推送按渠道共用），由 close() 关闭
+        self.sessions = SessionPool(pool_size=self.max_workers)
+
+        # 邮件 SMTP 会话（首次发送邮件时创建，单次运行内复用同一已认证会话），由 close() 关闭
+        self.email_transport: Optional[SMTPTransport] = None
+        self._email_lock = threading.Lock()
+
+        # 按 webhook 的令牌桶限流器，替代批次间固定间隔（在调度器生命周期内共享）
+        rate_limit_config = config.get("RATE_LIMIT", {})
+        self.rate_limiter: Optional[RateLimiter] = None
+        if rate_limit_config.get("ENABLED", True):
+            self.rate_limiter = RateLimiter(per_minute=rate_limit_config.get("PER_MINUTE") or {})
+
+    def _run_concurrently(self, tasks: List[Tuple[str, Callable[[], bool]]]) -> List[bool]:
+        """
+        使用有界线程池并发执行发送任务
+
+        每个任务内部仍按顺序发送自己的批次（批次间隔不受影响），
+        只是慢速渠道/账号不再阻塞其他任务。单个任务异常视为发送失败，不影响其他任务。
+
+        Args:
+            tasks: [(任务名称, 无参发送函数), ...]
+
+        Returns:
+            List[bool]: 与 tasks 顺序一致的发送结果
+        """
+        def run(name: str, func: Callable[[], bool]) -> bool:
+            try:
+                return bool(func())
+            except Exception as e:
+                print(f"❌ {name} 发送异常: {e}")
+                return False
+
+        workers = min(self.max_workers, len(tasks))
+        if workers <= 1:
+            return [run(name, func) for name, func in tasks]
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notify") as executor:
+            futures = [executor.submit(run, name, func) for name, func in tasks]
+            return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """关闭调度器持有的 HTTP 会话和 SMTP 会话"""
+        self.sessions.close()
+        if self.email_transport is not None:
+            self.email_transport.close()
+            self.email_transport = None
 
     def dispatch_all(
         self,
@@ -101,67 +168,89 @@ class NotificationDispatcher:
         Returns:
             Dict[str, bool]: 每个渠道的发送结果，key 为渠道名，value 为是否成功
         """
-        results = {}
+        # [(渠道, [(账号任务名称, 账号摘要, 无参发送函数), ...]), ...]
+        channels: List[Tuple[str, List[Tuple[str, str, Callable[[], bool]]]]] = []
+        # 本次分发内共享的分批结果缓存（同渠道多账号只分批一次）
+        batch_cache = BatchCache()
 
         # 获取 AI 推送模式
         ai_config = self.config.get("AI_ANALYSIS", {})
         ai_push_mode = ai_config.get("PUSH_MODE", "both")
+        only_analysis = ai_push_mode == "only_analysis" and ai_analysis
+
+        # 增量推送：各渠道的每个账号只推送该账号未推送过的标题，送达（或已持久化到发件箱）后再记录
+        delta_pending: Dict[Tuple[str, str], Dict[str, List[str]]] = {}
+        delta_skipped = set()
+        use_delta = self.delta_tracker is not None and mode in DELTA_PUSH_MODES and not only_analysis
+
+        def report_for(channel: str, account: str) -> Dict:
+            """获取渠道账号的报告数据（仅推送 AI 分析时为空报告，增量推送时为该账号的增量报告）"""
+            if only_analysis:
+                return {"stats": [], "failed_ids": [], "new_titles": {}, "id_to_name": {}}
+            if not use_delta:
+                return report_data
+            delta_report, pending = self.delta_tracker.build_delta(channel, report_data, account)
+            # 只有账号确实无内容可发（无新增标题、RSS、AI 分析和独立展示区）时才跳过
+            if not (pending or rss_items or rss_new_items or ai_analysis or standalone_data):
+                delta_skipped.add((channel, account))
+            delta_pending[(channel, account)] = pending
+            return delta_report
 
         # 飞书
         if self.config.get("FEISHU_WEBHOOK_URL"):
-            results["feishu"] = self._send_feishu(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
-                ai_analysis, ai_push_mode, standalone_data
-            )
+            channels.append(("feishu", self._feishu_tasks(
+                partial(report_for, "feishu"), report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
+                ai_analysis, ai_push_mode, standalone_data, batch_cache,
+            )))
 
         # 钉钉
         if self.config.get("DINGTALK_WEBHOOK_URL"):
-            results["dingtalk"] = self._send_dingtalk(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
-                ai_analysis, ai_push_mode, standalone_data
-            )
+            channels.append(("dingtalk", self._dingtalk_tasks(
+                partial(report_for, "dingtalk"), report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
+                ai_analysis, ai_push_mode, standalone_data, batch_cache,
+            )))
 
         # 企业微信
         if self.config.get("WEWORK_WEBHOOK_URL"):
-            results["wework"] = self._send_wework(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
-                ai_analysis, ai_push_mode, standalone_data
-            )
+            channels.append(("wework", self._wework_tasks(
+                partial(report_for, "wework"), report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
+                ai_analysis, ai_push_mode, standalone_data, batch_cache,
+            )))
 
         # Telegram（需要配对验证）
         if self.config.get("TELEGRAM_BOT_TOKEN") and self.config.get("TELEGRAM_CHAT_ID"):
-            results["telegram"] = self._send_telegram(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
-                ai_analysis, ai_push_mode, standalone_data
-            )
+            channels.append(("telegram", self._telegram_tasks(
+                partial(report_for, "telegram"), report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
+                ai_analysis, ai_push_mode, standalone_data, batch_cache,
+            )))
 
         # ntfy（需要配对验证）
         if self.config.get("NTFY_SERVER_URL") and self.config.get("NTFY_TOPIC"):
-            results["ntfy"] = self._send_ntfy(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
-                ai_analysis, ai_push_mode, standalone_data
-            )
+            channels.append(("ntfy", self._ntfy_tasks(
+                partial(report_for, "ntfy"), report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
+                ai_analysis, ai_push_mode, standalone_data, batch_cache,
+            )))
 
         # Bark
         if self.config.get("BARK_URL"):
-            results["bark"] = self._send_bark(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
-                ai_analysis, ai_push_mode, standalone_data
-            )
+            channels.append(("bark", self._bark_tasks(
+                partial(report_for, "bark"), report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
+                ai_analysis, ai_push_mode, standalone_data, batch_cache,
+            )))
 
         # Slack
         if self.config.get("SLACK_WEBHOOK_URL"):
-            results["slack"] = self._send_slack(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
-                ai_analysis, ai_push_mode, standalone_data
-            )
+            channels.append(("slack", self._slack_tasks(
+                partial(report_for, "slack"), report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
+                ai_analysis, ai_push_mode, standalone_data, batch_cache,
+            )))
 
         # 通用 Webhook
         if self.config.get("GENERIC_WEBHOOK_URL"):
-            results["generic_webhook"] = self._send_generic_webhook(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
-                ai_analysis, ai_push_mode, standalone_data
-            )
+            channels.append(("generic_webhook", self._generic_webhook_tasks(
+                partial(report_for, "generic_webhook"), report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
+                ai_analysis, ai_push_mode, standalone_data, batch_cache,
+            )))
 
         # 邮件（保持原有逻辑，已支持多收件人）
         if (
@@ -169,47 +258,104 @@ class NotificationDispatcher:
             and self.config.get("EMAIL_PASSWORD")
             and self.config.get("EMAIL_TO")
         ):
-            results["email"] = self._send_email(report_type, html_file_path, ai_analysis, ai_push_mode)
+            channels.append(("email", [("邮件", "", partial(
+                self._send_email, report_type, html_file_path, ai_analysis, ai_push_mode,
+            ))]))
+
+        # 增量推送下自上次推送以来没有新标题的账号不再发送
+        if delta_skipped:
+            skipped_names = sorted(
+                name
+                for channel, account_tasks in channels
+                for name, account, _ in account_tasks
+                if (channel, account) in delta_skipped
+            )
+            print(f"[增量推送] 以下账号自上次推送以来无新增标题，跳过：{', '.join(skipped_names)}")
+
+        # 所有渠道的所有账号展开为一个任务列表，在同一个有界线程池中并发发送
+        tasks = [
+            (channel, account, name, func)
+            for channel, account_tasks in channels
+            for name, account, func in account_tasks
+            if (channel, account) not in delta_skipped
+        ]
+        account_results: Dict[str, List[bool]] = {channel: [] for channel, _ in channels}
+        delivered = set()
+        for (channel, account, _, _), result in zip(
+            tasks, self._run_concurrently([(name, func) for _, _, name, func in tasks])
+        ):
+            account_results[channel].append(result)
+            # 启用发件箱时批次入队即视为已送达：未发出的批次由发件箱续发，
+            # 不应再计入下次的增量报告（否则同样的标题会既续发又重新推送）
+            enqueued = self.outbox is not None and self.outbox.take_enqueued(channel, account)
+            if result or enqueued:
+                delivered.add((channel, account))
+
+        # 结果字典保持渠道顺序：任一账号发送成功即视为渠道成功，账号全部跳过的渠道视为成功
+        results = {
+            channel: any(account_results[channel]) or (bool(account_tasks) and not account_results[channel])
+            for channel, account_tasks in channels
+        }
+
+        # 按账号记录已推送标题：失败的账号不记录，下次推送时重新获得这些标题，
+        # 也不影响同渠道其他已送达账号的记录
+        for (channel, account), pending in delta_pending.items():
+            if (channel, account) in delivered:
+                self.delta_tracker.commit(channel, pending, account)
+
+        if batch_cache.misses:
+            print(
+                f"[推送] 分批缓存：生成 {batch_cache.misses} 次，复用 {batch_cache.hits} 次"
+            )
 
         return results
 
-    def _send_to_multi_accounts(
+    def _account_tasks(
         self,
         channel_name: str,
         config_value: str,
         send_func: Callable[..., bool],
+        report_for: Callable[[str], Dict],
         **kwargs,
-    ) -> bool:
+    ) -> List[Tuple[str, str, Callable[[], bool]]]:
         """
-        通用多账号发送逻辑
+        通用多账号发送任务
 
         Args:
             channel_name: 渠道名称（用于日志和账号数量限制提示）
             config_value: 配置值（可能包含多个账号，用 ; 分隔）
-            send_func: 发送函数，签名为 (account, account_label=..., **kwargs) -> bool
+            send_func: 发送函数，签名为 (account, account_label=..., report_data=..., account_key=..., **kwargs) -> bool
+            report_for: 按账号摘要获取报告数据的函数（增量推送时各账号的增量报告不同）
             **kwargs: 传递给发送函数的其他参数
 
         Returns:
-            bool: 任一账号发送成功则返回 True
+            List[Tuple[str, str, Callable[[], bool]]]: 各账号的 (任务名称, 账号摘要, 无参发送函数)
         """
         accounts = parse_multi_account_config(config_value)
         if not accounts:
-            return False
+            return []
 
         accounts = limit_accounts(accounts, self.max_accounts, channel_name)
-        results = []
+        tasks = []
 
         for i, account in enumerate(accounts):
             if account:
                 account_label = f"账号{i+1}" if len(accounts) > 1 else ""
-                result = send_func(account, account_label=account_label, **kwargs)
-                results.append(result)
-
-        return any(results) if results else False
-
-    def _send_feishu(
+                account_key = NotificationOutbox.account_key(account)
+                tasks.append((
+                    f"{channel_name}{account_label}",
+                    account_key,
+                    partial(
+                        send_func, account, account_label=account_label,
+                        report_data=report_for(account_key), account_key=account_key, **kwargs,
+                    ),
+                ))
+
+        return tasks
+
+    def _feishu_tasks(
         self,
-        report_data: Dict,
+        report_for: Callable[[str], Dict],
         report_type: str,
         update_info: Optional[Dict],
         proxy_url: Optional[str],
@@ -219,16 +365,14 @@ class NotificationDispatcher:
         ai_analysis: Optional[AIAnalysisResult] = None,
         ai_push_mode: str = "both",
         standalone_data: Optional[Dict] = None,
-    ) -> bool:
-        """发送到飞书（多账号，支持热榜+RSS合并+AI分析+独立展示区）"""
-        # 根据 AI 推送模式决定是否发送原始内容
-        if ai_push_mode == "only_analysis" and ai_analysis:
-            report_data = {"stats": [], "failed_ids": [], "new_titles": {}, "id_to_name": {}}
-
-        return self._send_to_multi_accounts(
+        batch_cache: Optional[BatchCache] = None,
+    ) -> List[Tuple[str, str, Callable[[], bool]]]:
+        """飞书各账号的发送任务（多账号，支持热榜+RSS合并+AI分析+独立展示区）"""
+        return self._account_tasks(
             channel_name="飞书",
             config_value=self.config["FEISHU_WEBHOOK_URL"],
-            send_func=lambda url, account_label: send_to_feishu(
+            report_for=report_for,
+            send_func=lambda url, account_label, report_data, account_key: send_to_feishu(
                 webhook_url=url,
                 report_data=report_data,
                 report_type=report_type,
@@ -245,12 +389,16 @@ class NotificationDispatcher:
                 ai_analysis=ai_analysis,
                 ai_push_mode=ai_push_mode,
                 standalone_data=standalone_data,
+                batch_cache=batch_cache,
+                rate_limiter=self.rate_limiter,
+                session=self.sessions.get("feishu", account_key),
+                outbox=self.outbox,
             ),
         )
 
-    def _send_dingtalk(
+    def _dingtalk_tasks(
         self,
-        report_data: Dict,
+        report_for: Callable[[str], Dict],
         report_type: str,
         update_info: Optional[Dict],
         proxy_url: Optional[str],
@@ -260,15 +408,14 @@ class NotificationDispatcher:
         ai_analysis: Optional[AIAnalysisResult] = None,
         ai_push_mode: str = "both",
         standalone_data: Optional[Dict] = None,
-    ) -> bool:
-        """发送到钉钉（多账号，支持热榜+RSS合并+AI分析+独立展示区）"""
-        if ai_push_mode == "only_analysis" and ai_analysis:
-            report_data = {"stats": [], "failed_ids": [], "new_titles": {}, "id_to_name": {}}
-
-        return self._send_to_multi_accounts(
+        batch_cache: Optional[BatchCache] = None,
+    ) -> List[Tuple[str, str, Callable[[], bool]]]:
+        """钉钉各账号的发送任务（多账号，支持热榜+RSS合并+AI分析+独立展示区）"""
+        return self._account_tasks(
             channel_name="钉钉",
             config_value=self.config["DINGTALK_WEBHOOK_URL"],
-            send_func=lambda url, account_label: send_to_dingtalk(
+            report_for=report_for,
+            send_func=lambda url, account_label, report_data, account_key: send_to_dingtalk(
                 webhook_url=url,
                 report_data=report_data,
                 report_type=report_type,
@@ -284,12 +431,16 @@ class NotificationDispatcher:
                 ai_analysis=ai_analysis,
                 ai_push_mode=ai_push_mode,
                 standalone_data=standalone_data,
+                batch_cache=batch_cache,
+                rate_limiter=self.rate_limiter,
+                session=self.sessions.get("dingtalk", account_key),
+                outbox=self.outbox,
             ),
         )
 
-    def _send_wework(
+    def _wework_tasks(
         self,
-        report_data: Dict,
+        report_for: Callable[[str], Dict],
         report_type: str,
         update_info: Optional[Dict],
         proxy_url: Optional[str],
@@ -299,15 +450,14 @@ class NotificationDispatcher:
         ai_analysis: Optional[AIAnalysisResult] = None,
         ai_push_mode: str = "both",
         standalone_data: Optional[Dict] = None,
-    ) -> bool:
-        """发送到企业微信（多账号，支持热榜+RSS合并+AI分析+独立展示区）"""
-        if ai_push_mode == "only_analysis" and ai_analysis:
-            report_data = {"stats": [], "failed_ids": [], "new_titles": {}, "id_to_name": {}}
-
-        return self._send_to_multi_accounts(
+        batch_cache: Optional[BatchCache] = None,
+    ) -> List[Tuple[str, str, Callable[[], bool]]]:
+        """企业微信各账号的发送任务（多账号，支持热榜+RSS合并+AI分析+独立展示区）"""
+        return self._account_tasks(
             channel_name="企业微信",
             config_value=self.config["WEWORK_WEBHOOK_URL"],
-            send_func=lambda url, account_label: send_to_wework(
+            report_for=report_for,
+            send_func=lambda url, account_label, report_data, account_key: send_to_wework(
                 webhook_url=url,
                 report_data=report_data,
                 report_type=report_type,
@@ -324,12 +474,16 @@ class NotificationDispatcher:
                 ai_analysis=ai_analysis,
                 ai_push_mode=ai_push_mode,
                 standalone_data=standalone_data,
+                batch_cache=batch_cache,
+                rate_limiter=self.rate_limiter,
+                session=self.sessions.get("wework", account_key),
+                outbox=self.outbox,
             ),
         )
 
-    def _send_telegram(
+    def _telegram_tasks(
         self,
-        report_data: Dict,
+        report_for: Callable[[str], Dict],
         report_type: str,
         update_info: Optional[Dict],
         proxy_url: Optional[str],
@@ -339,16 +493,14 @@ class NotificationDispatcher:
         ai_analysis: Optional[AIAnalysisResult] = None,
         ai_push_mode: str = "both",
         standalone_data: Optional[Dict] = None,
-    ) -> bool:
-        """发送到 Telegram（多账号，需验证 token 和 chat_id 配对，支持热榜+RSS合并+AI分析+独立展示区）"""
-        if ai_push_mode == "only_analysis" and ai_analysis:
-            report_data = {"stats": [], "failed_ids": [], "new_titles": {}, "id_to_name": {}}
-
+        batch_cache: Optional[BatchCache] = None,
+    ) -> List[Tuple[str, str, Callable[[], bool]]]:
+        """Telegram 各账号的发送任务（多账号，需验证 token 和 chat_id 配对，支持热榜+RSS合并+AI分析+独立展示区）"""
         telegram_tokens = parse_multi_account_config(self.config["TELEGRAM_BOT_TOKEN"])
         telegram_chat_ids = parse_multi_account_config(self.config["TELEGRAM_CHAT_ID"])
 
         if not telegram_tokens or not telegram_chat_ids:
-            return False
+            return []
 
         # 验证配对
         valid, count = validate_paired_configs(
@@ -357,22 +509,24 @@ class NotificationDispatcher:
             required_keys=["bot_token", "chat_id"],
         )
         if not valid or count == 0:
-            return False
+            return []
 
         # 限制账号数量
         telegram_tokens = limit_accounts(telegram_tokens, self.max_accounts, "Telegram")
         telegram_chat_ids = telegram_chat_ids[: len(telegram_tokens)]
 
-        results = []
+        tasks = []
         for i in range(len(telegram_tokens)):
             token = telegram_tokens[i]
             chat_id = telegram_chat_ids[i]
             if token and chat_id:
                 account_label = f"账号{i+1}" if len(telegram_tokens) > 1 else ""
-                result = send_to_telegram(
+                account_key = NotificationOutbox.account_key(token, chat_id)
+                tasks.append((f"Telegram{account_label}", account_key, partial(
+                    send_to_telegram,
                     bot_token=token,
                     chat_id=chat_id,
-                    report_data=report_data,
+                    report_data=report_for(account_key),
                     report_type=report_type,
                     update_info=update_info,
                     proxy_url=proxy_url,
@@ -386,14 +540,17 @@ class NotificationDispatcher:
                     ai_analysis=ai_analysis,
                     ai_push_mode=ai_push_mode,
                     standalone_data=standalone_data,
-                )
-                results.append(result)
+                    batch_cache=batch_cache,
+                    rate_limiter=self.rate_limiter,
+                    session=self.sessions.get("telegram", account_key),
+                    outbox=self.outbox,
+                )))
 
-        return any(results) if results else False
+        return tasks
 
-    def _send_ntfy(
+    def _ntfy_tasks(
         self,
-        report_data: Dict,
+        report_for: Callable[[str], Dict],
         report_type: str,
         update_info: Optional[Dict],
         proxy_url: Optional[str],
@@ -403,40 +560,40 @@ class NotificationDispatcher:
         ai_analysis: Optional[AIAnalysisResult] = None,
         ai_push_mode: str = "both",
         standalone_data: Optional[Dict] = None,
-    ) -> bool:
-        """发送到 ntfy（多账号，需验证 topic 和 token 配对，支持热榜+RSS合并+AI分析+独立展示区）"""
-        if ai_push_mode == "only_analysis" and ai_analysis:
-            report_data = {"stats": [], "failed_ids": [], "new_titles": {}, "id_to_name": {}}
-
+        batch_cache: Optional[BatchCache] = None,
+    ) -> List[Tuple[str, str, Callable[[], bool]]]:
+        """ntfy 各账号的发送任务（多账号，需验证 topic 和 token 配对，支持热榜+RSS合并+AI分析+独立展示区）"""
         ntfy_server_url = self.config["NTFY_SERVER_URL"]
         ntfy_topics = parse_multi_account_config(self.config["NTFY_TOPIC"])
         ntfy_tokens = parse_multi_account_config(self.config.get("NTFY_TOKEN", ""))
 
         if not ntfy_server_url or not ntfy_topics:
-            return False
+            return []
 
         # 验证 token 和 topic 数量一致（如果配置了 token）
         if ntfy_tokens and len(ntfy_tokens) != len(ntfy_topics):
             print(
                 f"❌ ntfy 配置错误：topic 数量({len(ntfy_topics)})与 token 数量({len(ntfy_tokens)})不一致，跳过 ntfy 推送"
             )
-            return False
+            return []
 
         # 限制账号数量
         ntfy_topics = limit_accounts(ntfy_topics, self.max_accounts, "ntfy")
         if ntfy_tokens:
             ntfy_tokens = ntfy_tokens[: len(ntfy_topics)]
 
-        results = []
+        tasks = []
         for i, topic in enumerate(ntfy_topics):
             if topic:
                 token = get_account_at_index(ntfy_tokens, i, "") if ntfy_tokens else ""
                 account_label = f"账号{i+1}" if len(ntfy_topics) > 1 else ""
-                result = send_to_ntfy(
+                account_key = NotificationOutbox.account_key(ntfy_server_url, topic)
+                tasks.append((f"ntfy{account_label}", account_key, partial(
+                    send_to_ntfy,
                     server_url=ntfy_server_url,
                     topic=topic,
                     token=token,
-                    report_data=report_data,
+                    report_data=report_for(account_key),
                     report_type=report_type,
                     update_info=update_info,
                     proxy_url=proxy_url,
@@ -449,14 +606,16 @@ class NotificationDispatcher:
                     ai_analysis=ai_analysis,
                     ai_push_mode=ai_push_mode,
                     standalone_data=standalone_data,
-                )
-                results.append(result)
+                    batch_cache=batch_cache,
+                    rate_limiter=self.rate_limiter,
+                    session=self.sessions.get("ntfy", account_key),
+                )))
 
-        return any(results) if results else False
+        return tasks
 
-    def _send_bark(
+    def _bark_tasks(
         self,
-        report_data: Dict,
+        report_for: Callable[[str], Dict],
         report_type: str,
         update_info: Optional[Dict],
         proxy_url: Optional[str],
@@ -466,15 +625,14 @@ class NotificationDispatcher:
         ai_analysis: Optional[AIAnalysisResult] = None,
         ai_push_mode: str = "both",
         standalone_data: Optional[Dict] = None,
-    ) -> bool:
-        """发送到 Bark（多账号，支持热榜+RSS合并+AI分析+独立展示区）"""
-        if ai_push_mode == "only_analysis" and ai_analysis:
-            report_data = {"stats": [], "failed_ids": [], "new_titles": {}, "id_to_name": {}}
-
-        return self._send_to_multi_accounts(
+        batch_cache: Optional[BatchCache] = None,
+    ) -> List[Tuple[str, str, Callable[[], bool]]]:
+        """Bark 各账号的发送任务（多账号，支持热榜+RSS合并+AI分析+独立展示区）"""
+        return self._account_tasks(
             channel_name="Bark",
             config_value=self.config["BARK_URL"],
-            send_func=lambda url, account_label: send_to_bark(
+            report_for=report_for,
+            send_func=lambda url, account_label, report_data, account_key: send_to_bark(
                 bark_url=url,
                 report_data=report_data,
                 report_type=report_type,
@@ -490,12 +648,15 @@ class NotificationDispatcher:
                 ai_analysis=ai_analysis,
                 ai_push_mode=ai_push_mode,
                 standalone_data=standalone_data,
+                batch_cache=batch_cache,
+                rate_limiter=self.rate_limiter,
+                session=self.sessions.get("bark", account_key),
             ),
         )
 
-    def _send_slack(
+    def _slack_tasks(
         self,
-        report_data: Dict,
+        report_for: Callable[[str], Dict],
         report_type: str,
         update_info: Optional[Dict],
         proxy_url: Optional[str],
@@ -505,15 +666,14 @@ class NotificationDispatcher:
         ai_analysis: Optional[AIAnalysisResult] = None,
         ai_push_mode: str = "both",
         standalone_data: Optional[Dict] = None,
-    ) -> bool:
-        """发送到 Slack（多账号，支持热榜+RSS合并+AI分析+独立展示区）"""
-        if ai_push_mode == "only_analysis" and ai_analysis:
-            report_data = {"stats": [], "failed_ids": [], "new_titles": {}, "id_to_name": {}}
-
-        return self._send_to_multi_accounts(
+        batch_cache: Optional[BatchCache] = None,
+    ) -> List[Tuple[str, str, Callable[[], bool]]]:
+        """Slack 各账号的发送任务（多账号，支持热榜+RSS合并+AI分析+独立展示区）"""
+        return self._account_tasks(
             channel_name="Slack",
             config_value=self.config["SLACK_WEBHOOK_URL"],
-            send_func=lambda url, account_label: send_to_slack(
+            report_for=report_for,
+            send_func=lambda url, account_label, report_data, account_key: send_to_slack(
                 webhook_url=url,
                 report_data=report_data,
                 report_type=report_type,
@@ -529,12 +689,16 @@ class NotificationDispatcher:
                 ai_analysis=ai_analysis,
                 ai_push_mode=ai_push_mode,
                 standalone_data=standalone_data,
+                batch_cache=batch_cache,
+                rate_limiter=self.rate_limiter,
+                session=self.sessions.get("slack", account_key),
+                outbox=self.outbox,
             ),
         )
 
-    def _send_generic_webhook(
+    def _generic_webhook_tasks(
         self,
-        report_data: Dict,
+        report_for: Callable[[str], Dict],
         report_type: str,
         update_info: Optional[Dict],
         proxy_url: Optional[str],
@@ -544,19 +708,17 @@ class NotificationDispatcher:
         ai_analysis: Optional[AIAnalysisResult] = None,
         ai_push_mode: str = "both",
         standalone_data: Optional[Dict] = None,
-    ) -> bool:
-        """发送到通用 Webhook（多账号，支持热榜+RSS合并+AI分析+独立展示区）"""
-        if ai_push_mode == "only_analysis" and ai_analysis:
-            report_data = {"stats": [], "failed_ids": [], "new_titles": {}, "id_to_name": {}}
-
+        batch_cache: Optional[BatchCache] = None,
+    ) -> List[Tuple[str, str, Callable[[], bool]]]:
+        """通用 Webhook 各账号的发送任务（多账号，支持热榜+RSS合并+AI分析+独立展示区）"""
         urls = parse_multi_account_config(self.config.get("GENERIC_WEBHOOK_URL", ""))
         templates = parse_multi_account_config(self.config.get("GENERIC_WEBHOOK_TEMPLATE", ""))
 
         if not urls:
-            return False
+            return []
 
         urls = limit_accounts(urls, self.max_accounts, "通用Webhook")
-        results = []
+        tasks = []
 
         for i, url in enumerate(urls):
             if not url:
@@ -570,11 +732,13 @@ class NotificationDispatcher:
                     template = templates[0] # 共用一个模板
 
             account_label = f"账号{i+1}" if len(urls) > 1 else ""
+            account_key = NotificationOutbox.account_key(url)
 
-            result = send_to_generic_webhook(
+            tasks.append((f"通用Webhook{account_label}", account_key, partial(
+                send_to_generic_webhook,
                 webhook_url=url,
                 payload_template=template,
-                report_data=report_data,
+                report_data=report_for(account_key),
                 report_type=report_type,
                 update_info=update_info,
                 proxy_url=proxy_url,
@@ -588,10 +752,13 @@ class NotificationDispatcher:
                 ai_analysis=ai_analysis,
                 ai_push_mode=ai_push_mode,
                 standalone_data=standalone_data,
-            )
-            results.append(result)
+                batch_cache=batch_cache,
+                rate_limiter=self.rate_limiter,
+                session=self.sessions.get("generic_webhook", account_key),
+                outbox=self.outbox,
+            )))
 
-        return any(results) if results else False
+        return tasks
 
     def _send_email(
         self,
@@ -601,6 +768,15 @@ class NotificationDispatcher:
         ai_push_mode: str = "both",
     ) -> bool:
         """发送邮件（保持原有逻辑，已支持多收件人，支持AI分析）"""
+        with self._email_lock:
+            if self.email_transport is None:
+                self.email_transport = create_smtp_transport(
+                    self.config["EMAIL_FROM"],
+                    self.config["EMAIL_PASSWORD"],
+                    self.config.get("EMAIL_SMTP_SERVER", ""),
+                    self.config.get("EMAIL_SMTP_PORT", ""),
+                )
+
         return send_to_email(
             from_email=self.config["EMAIL_FROM"],
             password=self.config["EMAIL_PASSWORD"],
@@ -612,6 +788,7 @@ class NotificationDispatcher:
             get_time_func=self.get_time_func,
             ai_analysis=ai_analysis,
             ai_push_mode=ai_push_mode,
+            transport=self.email_transport,
         )
 
     # === RSS 通知方法 ===
@@ -708,7 +885,6 @@ class NotificationDispatcher:
         proxy_url: Optional[str],
     ) -> bool:
         """发送 RSS 到飞书"""
-        import requests
 
         content = render_rss_feishu_content(
             rss_items=rss_items,
@@ -749,7 +925,7 @@ class NotificationDispatcher:
                     }
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(webhook_url, json=payload, proxies=proxies, timeout=30)
+                    resp = self.sessions.get("feishu").post(webhook_url, json=payload, proxies=proxies, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ 飞书{account_label} RSS 通知发送成功")
@@ -767,7 +943,6 @@ class NotificationDispatcher:
         proxy_url: Optional[str],
     ) -> bool:
         """发送 RSS 到钉钉"""
-        import requests
 
         content = render_rss_dingtalk_content(
             rss_items=rss_items,
@@ -800,7 +975,7 @@ class NotificationDispatcher:
                     }
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(webhook_url, json=payload, proxies=proxies, timeout=30)
+                    resp = self.sessions.get("dingtalk").post(webhook_url, json=payload, proxies=proxies, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ 钉钉{account_label} RSS 通知发送成功")
@@ -819,8 +994,6 @@ class NotificationDispatcher:
         channel: str,
     ) -> bool:
         """发送 RSS 到 Markdown 兼容渠道（企业微信、Telegram、ntfy、Bark、Slack）"""
-        import requests
-
         content = render_rss_markdown_content(
             rss_items=rss_items,
             feeds_info=feeds_info,
@@ -846,7 +1019,6 @@ class NotificationDispatcher:
 
     def _send_rss_wework(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到企业微信"""
-        import requests
 
         webhooks = parse_multi_account_config(self.config["WEWORK_WEBHOOK_URL"])
         webhooks = limit_accounts(webhooks, self.max_accounts, "企业微信")
@@ -869,7 +1041,7 @@ class NotificationDispatcher:
                     }
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(webhook_url, json=payload, proxies=proxies, timeout=30)
+                    resp = self.sessions.get("wework").post(webhook_url, json=payload, proxies=proxies, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ 企业微信{account_label} RSS 通知发送成功")
@@ -882,7 +1054,6 @@ class NotificationDispatcher:
 
     def _send_rss_telegram(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 Telegram"""
-        import requests
 
         tokens = parse_multi_account_config(self.config["TELEGRAM_BOT_TOKEN"])
         chat_ids = parse_multi_account_config(self.config["TELEGRAM_CHAT_ID"])
@@ -913,7 +1084,7 @@ class NotificationDispatcher:
                     }
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(url, json=payload, proxies=proxies, timeout=30)
+                    resp = self.sessions.get("telegram").post(url, json=payload, proxies=proxies, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ Telegram{account_label} RSS 通知发送成功")
@@ -926,7 +1097,6 @@ class NotificationDispatcher:
 
     def _send_rss_ntfy(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 ntfy"""
-        import requests
 
         server_url = self.config["NTFY_SERVER_URL"]
         topics = parse_multi_account_config(self.config["NTFY_TOPIC"])
@@ -955,7 +1125,7 @@ class NotificationDispatcher:
                         headers["Authorization"] = f"Bearer {token}"
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(
+                    resp = self.sessions.get("ntfy").post(
                         url, data=batch_content.encode("utf-8"),
                         headers=headers, proxies=proxies, timeout=30
                     )
@@ -971,7 +1141,6 @@ class NotificationDispatcher:
 
     def _send_rss_bark(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 Bark"""
-        import requests
         import urllib.parse
 
         urls = parse_multi_account_config(self.config["BARK_URL"])
@@ -994,7 +1163,7 @@ class NotificationDispatcher:
                     url = f"{bark_url.rstrip('/')}/{title}/{body}"
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.get(url, proxies=proxies, timeout=30)
+                    resp = self.sessions.get("bark").get(url, proxies=proxies, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ Bark{account_label} RSS 通知发送成功")
@@ -1007,7 +1176,6 @@ class NotificationDispatcher:
 
     def _send_rss_slack(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 Slack"""
-        import requests
 
         webhooks = parse_multi_account_config(self.config["SLACK_WEBHOOK_URL"])
         webhooks = limit_accounts(webhooks, self.max_accounts, "Slack")
@@ -1037,7 +1205,7 @@ class NotificationDispatcher:
                     }
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(webhook_url, json=payload, proxies=proxies, timeout=30)
+                    resp = self.sessions.get("slack").post(webhook_url, json=payload, proxies=proxies, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ Slack{account_label} RSS 通知发送成功")
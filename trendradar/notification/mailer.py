@@ -0,0 +1,139 @@
+# coding=utf-8
+"""
+SMTP 邮件传输模块
+
+在单次运行内复用同一个已认证的 SMTP 会话：
+- 首次发送时建立连接（SSL / STARTTLS）并登录，之后的邮件直接复用
+- 复用的会话被服务器空闲断开时自动重连一次（本次新建的会话断开不重试）
+- 已编码的 HTML 正文按键缓存，同一报告重复发送时不再重新读取、编码 HTML；
+  收件人、Message-ID 等邮件头每次发送单独生成
+"""
+
+import smtplib
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+
+class SMTPTransport:
+    """
+    可复用的 SMTP 传输（线程安全）
+
+    use_tls 含义与 send_to_email 一致：True 为 STARTTLS，False 为 SSL；
+    None 表示明文连接，仅用于本地离线替身服务器。
+    """
+
+    def __init__(
+        self,
+        from_email: str,
+        password: str,
+        server: str,
+        port: int,
+        use_tls: Optional[bool] = True,
+        timeout: float = 30,
+    ):
+        """
+        初始化 SMTP 传输
+
+        Args:
+            from_email: 发件人邮箱（同时作为登录用户名）
+            password: 邮箱密码/授权码
+            server: SMTP 服务器
+            port: SMTP 端口
+            use_tls: True=STARTTLS，False=SSL，None=明文
+            timeout: 连接超时（秒）
+        """
+        self.from_email = from_email
+        self.password = password
+        self.server = server
+        self.port = int(port)
+        self.use_tls = use_tls
+        self.timeout = timeout
+
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._lock = threading.Lock()
+        self._bodies: Dict[Hashable, Any] = {}
+        self.connections = 0
+        self.sent = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        """建立连接并登录"""
+        if self.use_tls is False:
+            # SSL 模式
+            smtp = smtplib.SMTP_SSL(self.server, self.port, timeout=self.timeout)
+        else:
+            smtp = smtplib.SMTP(self.server, self.port, timeout=self.timeout)
+        smtp.set_debuglevel(0)  # 设为1可以查看详细调试信息
+        smtp.ehlo()
+        if self.use_tls:
+            # TLS 模式
+            smtp.starttls()
+            smtp.ehlo()
+
+        try:
+            smtp.login(self.from_email, self.password)
+        except Exception:
+            smtp.close()
+            raise
+
+        self.connections += 1
+        return smtp
+
+    def get_body(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        获取已构建的邮件正文（不存在时构建并缓存）
+
+        Args:
+            key: 缓存键（需覆盖影响正文内容的全部输入）
+            build: 构建函数，返回邮件正文（如已编码的 MIMEText）
+
+        Returns:
+            邮件正文
+        """
+        with self._lock:
+            body = self._bodies.get(key)
+        if body is None:
+            body = build()
+            with self._lock:
+                self._bodies[key] = body
+        return body
+
+    def send(self, recipients: List[str], message: bytes) -> None:
+        """
+        发送已序列化的邮件
+
+        Args:
+            recipients: 收件人列表
+            message: 邮件字节
+
+        Raises:
+            smtplib.SMTPException: 发送失败
+        """
+        with self._lock:
+            reused = self._smtp is not None
+            if not reused:
+                self._smtp = self._connect()
+            try:
+                self._smtp.sendmail(self.from_email, recipients, message)
+            except smtplib.SMTPServerDisconnected:
+                self._smtp = None
+                if not reused:
+                    # 刚建立的会话就断开，说明不是空闲超时，重连也无济于事
+                    raise
+                # 复用的会话被服务器空闲断开，重连后重发一次
+                self._smtp = self._connect()
+                self._smtp.sendmail(self.from_email, recipients, message)
+            self.sent += 1
+
+    def close(self) -> None:
+        """结束会话并清空正文缓存"""
+        with self._lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except Exception:
+                    try:
+                        self._smtp.close()
+                    except Exception:
+                        pass
+                self._smtp = None
+            self._bodies.clear()
@@ -0,0 +1,285 @@
+# coding=utf-8
+"""
+推送发件箱模块
+
+将已渲染的消息批次持久化到存储后端（push_outbox 表），由投递过程按顺序逐批发送：
+- 每个批次独立记录状态（pending / sent / failed / expired）和累计尝试次数
+- 单次运行内失败的批次按指数退避重试
+- 仍未送达的批次保持 pending，下次推送同一渠道账号时先续发，
+  已送达的批次不会重复发送，也无需重新渲染
+- 热榜报告是累积的，积压超过 max_pending_age 的批次标记为 expired 不再续发，
+  避免故障恢复后把过时的报告排在本次报告之前重发
+"""
+
+import hashlib
+import threading
+import time
+import uuid
+from typing import Any, Callable, List, Optional, Tuple
+
+from .ratelimit import RateLimiter
+
+
+# 单批次发送函数：(批次序号, 批次总数, 批次内容, 报告类型) -> 是否成功
+# 报告类型随批次一起传入：续发的批次使用入队时的报告类型，而不是本次运行的
+PostBatchFunc = Callable[[int, int, str, str], bool]
+
+
+def deliver_batches(
+    batches: List[str],
+    post_batch: PostBatchFunc,
+    batch_interval: float,
+    outbox: Optional["NotificationOutbox"] = None,
+    channel: str = "",
+    account: str = "",
+    report_type: str = "",
+    log_prefix: str = "",
+    rate_limiter: Optional[RateLimiter] = None,
+) -> bool:
+    """
+    按顺序投递批次（有发件箱时经发件箱投递，否则直接逐批发送，遇到失败即停止）
+
+    有限流器时每个批次发送前按该 webhook 的令牌桶等待，不再使用固定的批次间隔。
+
+    Args:
+        batches: 批次内容列表
+        post_batch: 单批次发送函数
+        batch_interval: 批次发送间隔（秒）
+        outbox: 推送发件箱（可选）
+        channel: 渠道名称
+        account: 账号摘要（见 NotificationOutbox.account_key）
+        report_type: 报告类型
+        log_prefix: 日志前缀
+        rate_limiter: 推送限流器（可选）
+
+    Returns:
+        bool: 本次批次是否全部发送成功
+    """
+    if outbox is not None:
+        return outbox.deliver(
+            channel, account, batches, post_batch, batch_interval, report_type, log_prefix,
+            rate_limiter=rate_limiter,
+        )
+
+    post_batch = paced(post_batch, rate_limiter, channel, account)
+    total = len(batches)
+    for i, batch_content in enumerate(batches, 1):
+        if not post_batch(i, total, batch_content, report_type):
+            return False
+        # 批次间间隔（有限流器时由令牌桶控制）
+        if i < total and rate_limiter is None:
+            time.sleep(batch_interval)
+    return True
+
+
+def paced(
+    post_batch: PostBatchFunc,
+    rate_limiter: Optional[RateLimiter],
+    channel: str,
+    account: str,
+) -> PostBatchFunc:
+    """
+    为单批次发送函数加上限流（每次发送前获取令牌，包括重试）
+
+    Args:
+        post_batch: 单批次发送函数
+        rate_limiter: 推送限流器（为 None 时原样返回）
+        channel: 渠道名称
+        account: webhook 标识
+
+    Returns:
+        单批次发送函数
+    """
+    if rate_limiter is None:
+        return post_batch
+
+    def paced_post(sequence: int, total: int, content: str, report_type: str) -> bool:
+        rate_limiter.acquire(channel, account)
+        return post_batch(sequence, total, content, report_type)
+
+    return paced_post
+
+
+class NotificationOutbox:
+    """
+    推送发件箱
+
+    通过 storage_backend 持久化批次，仅本地存储后端支持（supports_outbox）；
+    远程存储后端每次状态变更都需要上传整个数据库，调度器在该情况下不启用发件箱。
+    """
+
+    # 单次重试退避的上限（秒）
+    MAX_RETRY_DELAY = 30.0
+
+    def __init__(
+        self,
+        storage_backend: Any,
+        max_pending_age: float = 60,
+        max_attempts: int = 5,
+        retries: int = 2,
+        retry_backoff: float = 2.0,
+        sleep_func: Callable[[float], None] = time.sleep,
+    ):
+        """
+        初始化推送发件箱
+
+        Args:
+            storage_backend: 存储后端实例（需支持 supports_outbox）
+            max_pending_age: 待投递批次的最长保留时间（分钟），超过后不再续发
+            max_attempts: 单个批次累计最大尝试次数（跨运行累计）
+            retries: 单次运行内失败重试次数
+            retry_backoff: 重试退避基数（秒），每次重试翻倍
+            sleep_func: 等待函数
+        """
+        self.storage_backend = storage_backend
+        self.max_pending_age = float(max_pending_age)
+        self.max_attempts = max(int(max_attempts), 1)
+        self.retries = max(int(retries), 0)
+        self.retry_backoff = float(retry_backoff)
+        self.sleep = sleep_func
+
+        # 本次运行中批次已成功入队的 (渠道, 账号摘要)，由 take_enqueued 取出
+        self._enqueued = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def account_key(*credentials: str) -> str:
+        """
+        根据账号凭据生成账号摘要（发件箱中不保存 webhook/token 原文）
+
+        Args:
+            credentials: 能唯一标识账号的凭据（如 webhook URL、bot token + chat id）
+
+        Returns:
+            16 位十六进制摘要
+        """
+        raw = "\x00".join(credentials)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+    def take_enqueued(self, channel: str, account: str) -> bool:
+        """
+        取出并清除渠道账号的入队标记
+
+        入队成功后批次已持久化，即使本次未能发出也会在下次推送时续发，
+        调用方（如增量推送）可以据此把这些内容视为已送达。
+
+        Args:
+            channel: 渠道名称
+            account: 账号摘要
+
+        Returns:
+            自上次取出以来该渠道账号是否有批次成功入队
+        """
+        with self._lock:
+            if (channel, account) in self._enqueued:
+                self._enqueued.discard((channel, account))
+                return True
+            return False
+
+    def _post_with_retry(
+        self,
+        post_batch: PostBatchFunc,
+        sequence: int,
+        total: int,
+        content: str,
+        report_type: str,
+        attempts: int,
+        log_prefix: str,
+    ) -> Tuple[bool, int]:
+        """
+        发送单个批次，失败时按指数退避重试
+
+        Returns:
+            (是否成功, 累计尝试次数)
+        """
+        for retry in range(self.retries + 1):
+            attempts += 1
+            if post_batch(sequence, total, content, report_type):
+                return True, attempts
+            if retry >= self.retries or attempts >= self.max_attempts:
+                break
+            delay = min(self.retry_backoff * (2 ** retry), self.MAX_RETRY_DELAY)
+            print(f"[发件箱] {log_prefix}第 {sequence}/{total} 批次 {delay:.0f} 秒后重试")
+            self.sleep(delay)
+        return False, attempts
+
+    def deliver(
+        self,
+        channel: str,
+        account: str,
+        batches: List[str],
+        post_batch: PostBatchFunc,
+        batch_interval: float,
+        report_type: str,
+        log_prefix: str = "",
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> bool:
+        """
+        批次入队后按入队顺序投递该渠道账号的全部待投递批次
+
+        先续发之前运行中断遗留且未过期的批次，再发送本次批次。某批次重试后仍失败时停止投递，
+        剩余批次保留在发件箱中；累计尝试次数达到上限的批次标记为 failed 并跳过。
+
+        Args:
+            channel: 渠道名称
+            account: 账号摘要
+            batches: 本次批次内容列表
+            post_batch: 单批次发送函数
+            batch_interval: 批次发送间隔（秒）
+            report_type: 报告类型
+            log_prefix: 日志前缀
+            rate_limiter: 推送限流器（可选，有限流器时不使用固定批次间隔）
+
+        Returns:
+            bool: 本次批次是否全部发送成功
+        """
+        dispatch_id = uuid.uuid4().hex
+        if not self.storage_backend.enqueue_outbox_batches(
+            dispatch_id, channel, account, batches, report_type, self.max_pending_age
+        ):
+            print(f"[发件箱] {log_prefix}批次入队失败，直接发送")
+            return deliver_batches(
+                batches, post_batch, batch_interval,
+                channel=channel, account=account, report_type=report_type, rate_limiter=rate_limiter,
+            )
+        with self._lock:
+            self._enqueued.add((channel, account))
+
+        post_batch = paced(post_batch, rate_limiter, channel, account)
+
+        pending = self.storage_backend.get_pending_outbox_batches(channel, account)
+        resumed = sum(1 for row in pending if row["dispatch_id"] != dispatch_id)
+        if resumed:
+            print(f"[发件箱] {log_prefix}续发上次未送达的 {resumed} 个批次")
+
+        current_ok = True
+        for index, row in enumerate(pending):
+            success, attempts = self._post_with_retry(
+                post_batch, row["sequence"], row["total"], row["content"],
+                row["report_type"] or report_type, row["attempts"], log_prefix,
+            )
+
+            if success:
+                self.storage_backend.update_outbox_batch(row["id"], "sent", attempts)
+                # 批次间间隔（有限流器时由令牌桶控制）
+                if index < len(pending) - 1 and rate_limiter is None:
+                    self.sleep(batch_interval)
+                continue
+
+            if attempts >= self.max_attempts:
+                # 达到上限后放弃该批次，避免阻塞后续批次
+                self.storage_backend.update_outbox_batch(row["id"], "failed", attempts)
+                print(
+                    f"[发件箱] {log_prefix}第 {row['sequence']}/{row['total']} 批次"
+                    f"已尝试 {attempts} 次，放弃投递"
+                )
+                if row["dispatch_id"] == dispatch_id:
+                    current_ok = False
+                continue
+
+            self.storage_backend.update_outbox_batch(row["id"], "pending", attempts)
+            remaining = len(pending) - index
+            print(f"[发件箱] {log_prefix}{remaining} 个批次未送达，将在下次推送时续发")
+            return False
+
+        return current_ok
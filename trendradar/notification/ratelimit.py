@@ -0,0 +1,203 @@
+# coding=utf-8
+"""
+推送限流模块
+
+按 webhook（渠道 + 账号）维护令牌桶，替代批次间的固定间隔等待：
+- 额度未用完时批次立即发送，超出额度时只等待到下一个令牌可用
+- 各渠道使用官方公布的频率限制作为默认额度，可通过配置覆盖
+- 收到限流响应（HTTP 429 或渠道限流错误码）时自动降低该 webhook 的额度，
+  并在服务端给出 Retry-After 时暂停到指定时间之后
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+
+# 各渠道默认额度：(突发容量, 每分钟消息数)
+# - 飞书自定义机器人：100 次/分钟，5 次/秒
+# - 钉钉自定义机器人：20 条/分钟
+# - 企业微信群机器人：20 条/分钟
+# - Telegram：同一群组 20 条/分钟
+# - Slack Incoming Webhook：1 条/秒
+# - ntfy.sh：突发 60 条，之后每 5 秒 1 条
+# - Bark / 通用 Webhook：无公开限制，使用保守默认值
+# ntfy、Bark 按反向顺序推送，发送函数在批次间另外保留最小间隔，保证客户端显示顺序
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[int, float]] = {
+    "feishu": (5, 100),
+    "dingtalk": (20, 20),
+    "wework": (20, 20),
+    "telegram": (20, 20),
+    "slack": (1, 60),
+    "ntfy": (60, 12),
+    "bark": (10, 60),
+    "generic_webhook": (10, 60),
+}
+
+# 未知渠道的默认额度
+_FALLBACK_RATE_LIMIT: Tuple[int, float] = (10, 60)
+
+# 降速下限：每分钟至少允许 1 条
+_MIN_PER_MINUTE = 1.0
+
+
+class TokenBucket:
+    """
+    令牌桶
+
+    容量为 capacity，每秒补充 rate 个令牌；每次发送消耗 1 个令牌。
+    """
+
+    def __init__(self, capacity: float, rate: float, clock: Callable[[], float] = time.monotonic):
+        """
+        初始化令牌桶
+
+        Args:
+            capacity: 突发容量（令牌数）
+            rate: 每秒补充的令牌数
+            clock: 单调时钟
+        """
+        self.capacity = max(float(capacity), 1.0)
+        self.rate = rate
+        self.clock = clock
+        self.tokens = self.capacity
+        self.updated_at = clock()
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        """按经过的时间补充令牌"""
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def reserve(self) -> float:
+        """
+        预订一个令牌
+
+        Returns:
+            需要等待的秒数（0 表示可立即发送）
+        """
+        now = self.clock()
+        self._refill(now)
+        self.tokens -= 1
+        wait = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+        return max(wait, self.blocked_until - now, 0.0)
+
+    def slow_down(self, factor: float, min_rate: float, retry_after: Optional[float] = None) -> None:
+        """
+        降低补充速率并清空剩余令牌
+
+        Args:
+            factor: 速率缩放系数（0-1）
+            min_rate: 速率下限（每秒）
+            retry_after: 服务端要求的等待秒数（可选）
+        """
+        now = self.clock()
+        self._refill(now)
+        self.rate = max(self.rate * factor, min_rate)
+        self.capacity = 1.0
+        self.tokens = min(self.tokens, 0.0)
+        if retry_after:
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+
+
+class RateLimiter:
+    """
+    按 webhook 限流的令牌桶集合（线程安全，可在并发发送的多个渠道/账号间共享）
+    """
+
+    def __init__(
+        self,
+        per_minute: Optional[Dict[str, float]] = None,
+        backoff_factor: float = 0.5,
+        sleep_func: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        初始化限流器
+
+        Args:
+            per_minute: 按渠道覆盖默认额度 {渠道: 每分钟消息数}
+            backoff_factor: 收到限流响应时的降速系数
+            sleep_func: 等待函数
+            clock: 单调时钟
+        """
+        self.limits = dict(DEFAULT_RATE_LIMITS)
+        for channel, value in (per_minute or {}).items():
+            burst, _ = self.limits.get(channel, _FALLBACK_RATE_LIMIT)
+            value = float(value)
+            if value > 0:
+                self.limits[channel] = (min(burst, max(int(value), 1)), value)
+
+        self.backoff_factor = backoff_factor
+        self.sleep = sleep_func
+        self.clock = clock
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _get_bucket(self, channel: str, key: str) -> TokenBucket:
+        """获取（或创建）webhook 对应的令牌桶，调用方需持有锁"""
+        bucket = self._buckets.get((channel, key))
+        if bucket is None:
+            burst, per_minute = self.limits.get(channel, _FALLBACK_RATE_LIMIT)
+            bucket = TokenBucket(burst, per_minute / 60.0, self.clock)
+            self._buckets[(channel, key)] = bucket
+        return bucket
+
+    def acquire(self, channel: str, key: str) -> float:
+        """
+        获取发送许可，超出额度时阻塞到令牌可用
+
+        Args:
+            channel: 渠道名称
+            key: webhook 标识（如 webhook URL 或其摘要）
+
+        Returns:
+            实际等待的秒数
+        """
+        with self._lock:
+            wait = self._get_bucket(channel, key).reserve()
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+    def throttled(self, channel: str, key: str, retry_after: Optional[float] = None) -> None:
+        """
+        报告限流响应，降低该 webhook 的额度
+
+        Args:
+            channel: 渠道名称
+            key: webhook 标识
+            retry_after: 服务端要求的等待秒数（可选）
+        """
+        with self._lock:
+            bucket = self._get_bucket(channel, key)
+            bucket.slow_down(self.backoff_factor, _MIN_PER_MINUTE / 60.0, retry_after)
+            per_minute = bucket.rate * 60
+        hint = f"，{retry_after:.0f} 秒后恢复" if retry_after else ""
+        print(f"[限流] {channel} 收到限流响应，额度降至 {per_minute:.1f} 条/分钟{hint}")
+
+
+def parse_retry_after(response) -> Optional[float]:
+    """
+    从响应中解析服务端要求的等待秒数
+
+    支持 Retry-After 响应头和 Telegram 的 parameters.retry_after 字段。
+
+    Args:
+        response: requests 响应对象
+
+    Returns:
+        等待秒数，无法解析时返回 None
+    """
+    value = response.headers.get("Retry-After") if response.headers else None
+    if value is None:
+        try:
+            value = (response.json().get("parameters") or {}).get("retry_after")
+        except Exception:
+            value = None
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
@@ -15,22 +15,41 @@
 每个发送函数都支持分批发送，并通过参数化配置实现与 CONFIG 的解耦。
 """
 
+import io
 import smtplib
 import time
 import json
 from datetime import datetime
+from email.generator import BytesGenerator
 from email.header import Header
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import formataddr, formatdate, make_msgid
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
 
-from .batch import add_batch_headers, get_max_batch_header_size
+from .batch import BatchCache, add_batch_headers, get_max_batch_header_size
 from .formatters import convert_markdown_to_mrkdwn, strip_markdown
+from .mailer import SMTPTransport
+from .outbox import NotificationOutbox, deliver_batches
+from .ratelimit import RateLimiter, parse_retry_after
+
+
+# 各渠道表示"发送过快"的业务错误码（HTTP 状态码仍为 200）
+_FEISHU_THROTTLE_CODES = {9499, 11232}
+_DINGTALK_THROTTLE_CODES = {130101, 660026}
+_WEWORK_THROTTLE_CODES = {45009, 45033}
+
+
+def _report_throttle(
+    rate_limiter: Optional[RateLimiter], channel: str, account: str, response: Any
+) -> None:
+    """收到限流响应时通知限流器降低该 webhook 的额度"""
+    if rate_limiter is not None:
+        rate_limiter.throttled(channel, account, parse_retry_after(response))
 
 
 def _render_ai_analysis(ai_analysis: Any, channel: str, ai_push_mode: str) -> str:
@@ -92,6 +111,10 @@ def send_to_feishu(
     ai_analysis: Any = None,
     ai_push_mode: str = "both",
     standalone_data: Optional[Dict] = None,
+    batch_cache: Optional[BatchCache] = None,
+    outbox: Optional[NotificationOutbox] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    session: Optional[requests.Session] = None,
 ) -> bool:
     """
     发送到飞书（支持分批发送，支持热榜+RSS合并+独立展示区）
@@ -110,6 +133,10 @@ def send_to_feishu(
         get_time_func: 获取当前时间的函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        batch_cache: 分批结果缓存（可选，由调度器在单次分发内共享）
+        outbox: 推送发件箱（可选，批次持久化并支持断点续发）
+        rate_limiter: 推送限流器（可选，替代固定批次间隔）
+        session: HTTP 会话（可选，由调度器按渠道复用连接）
 
     Returns:
         bool: 发送是否成功
@@ -119,50 +146,68 @@ def send_to_feishu(
     if proxy_url:
         proxies = {"http": proxy_url, "https": proxy_url}
 
+    # 复用调度器提供的会话（keep-alive），未提供时退回 requests 模块级接口
+    http = session if session is not None else requests
+
     # 日志前缀
     log_prefix = f"飞书{account_label}" if account_label else "飞书"
 
-    # 渲染 AI 分析内容（如果有）
-    ai_content = None
-    ai_stats = None
-    if ai_analysis:
-        ai_content = _render_ai_analysis(ai_analysis, "feishu", ai_push_mode)
-        # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
-        if getattr(ai_analysis, "success", False):
-            ai_stats = {
-                "total_news": getattr(ai_analysis, "total_news", 0),
-                "analyzed_news": getattr(ai_analysis, "analyzed_news", 0),
-                "max_news_limit": getattr(ai_analysis, "max_news_limit", 0),
-                "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
-                "rss_count": getattr(ai_analysis, "rss_count", 0),
-            }
-
-    # 预留批次头部空间，避免添加头部后超限
-    header_reserve = get_max_batch_header_size("feishu")
-    batches = split_content_func(
-        report_data,
-        "feishu",
-        update_info,
-        max_bytes=batch_size - header_reserve,
-        mode=mode,
-        rss_items=rss_items,
-        rss_new_items=rss_new_items,
-        ai_content=ai_content,
-        standalone_data=standalone_data,
-        ai_stats=ai_stats,
-        report_type=report_type,
-    )
+    def build_batches() -> List[str]:
+        # 渲染 AI 分析内容（如果有）
+        ai_content = None
+        ai_stats = None
+        if ai_analysis:
+            ai_content = _render_ai_analysis(ai_analysis, "feishu", ai_push_mode)
+            # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
+            if getattr(ai_analysis, "success", False):
+                ai_stats = {
+                    "total_news": getattr(ai_analysis, "total_news", 0),
+                    "analyzed_news": getattr(ai_analysis, "analyzed_news", 0),
+                    "max_news_limit": getattr(ai_analysis, "max_news_limit", 0),
+                    "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
+                    "rss_count": getattr(ai_analysis, "rss_count", 0),
+                }
+
+        # 预留批次头部空间，避免添加头部后超限
+        header_reserve = get_max_batch_header_size("feishu")
+        batches = split_content_func(
+            report_data,
+            "feishu",
+            update_info,
+            max_bytes=batch_size - header_reserve,
+            mode=mode,
+            rss_items=rss_items,
+            rss_new_items=rss_new_items,
+            ai_content=ai_content,
+            standalone_data=standalone_data,
+            ai_stats=ai_stats,
+            report_type=report_type,
+        )
 
-    # 统一添加批次头部（已预留空间，不会超限）
-    batches = add_batch_headers(batches, "feishu", batch_size)
+        # 统一添加批次头部（已预留空间，不会超限）
+        batches = add_batch_headers(batches, "feishu", batch_size)
+        return batches
+
+    # 同一次分发中输入相同的账号共用分批结果
+    if batch_cache is not None:
+        batches = batch_cache.get_or_build(
+            "feishu", batch_size,
+            (report_data, report_type, update_info, mode, rss_items, rss_new_items,
+             ai_analysis, ai_push_mode, standalone_data),
+            build_batches,
+        )
+    else:
+        batches = build_batches()
 
     print(f"{log_prefix}消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
-    for i, batch_content in enumerate(batches, 1):
+    account = NotificationOutbox.account_key(webhook_url)
+
+    # 单批次发送（由发件箱续发时也使用）
+    def post_batch(i: int, total: int, batch_content: str, report_type: str) -> bool:
         content_size = len(batch_content.encode("utf-8"))
         print(
-            f"发送{log_prefix}第 {i}/{len(batches)} 批次，大小：{content_size} 字节 [{report_type}]"
+            f"发送{log_prefix}第 {i}/{total} 批次，大小：{content_size} 字节 [{report_type}]"
         )
 
         # 飞书 webhook 只显示 content.text，所有信息都整合到 text 中
@@ -174,32 +219,40 @@ def send_to_feishu(
         }
 
         try:
-            response = requests.post(
+            response = http.post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
                 # 检查飞书的响应状态
                 if result.get("StatusCode") == 0 or result.get("code") == 0:
-                    print(f"{log_prefix}第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(batch_interval)
+                    print(f"{log_prefix}第 {i}/{total} 批次发送成功 [{report_type}]")
+                    return True
                 else:
+                    if result.get("code") in _FEISHU_THROTTLE_CODES:
+                        _report_throttle(rate_limiter, "feishu", account, response)
                     error_msg = result.get("msg") or result.get("StatusMessage", "未知错误")
                     print(
-                        f"{log_prefix}第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{error_msg}"
+                        f"{log_prefix}第 {i}/{total} 批次发送失败 [{report_type}]，错误：{error_msg}"
                     )
                     return False
             else:
+                if response.status_code == 429:
+                    _report_throttle(rate_limiter, "feishu", account, response)
                 print(
-                    f"{log_prefix}第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
+                    f"{log_prefix}第 {i}/{total} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
                 )
                 return False
         except Exception as e:
-            print(f"{log_prefix}第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
+            print(f"{log_prefix}第 {i}/{total} 批次发送出错 [{report_type}]：{e}")
             return False
 
+    if not deliver_batches(
+        batches, post_batch, batch_interval, outbox,
+        "feishu", account, report_type, log_prefix, rate_limiter,
+    ):
+        return False
+
     print(f"{log_prefix}所有 {len(batches)} 批次发送完成 [{report_type}]")
 
     return True
@@ -222,6 +275,10 @@ def send_to_dingtalk(
     ai_analysis: Any = None,
     ai_push_mode: str = "both",
     standalone_data: Optional[Dict] = None,
+    batch_cache: Optional[BatchCache] = None,
+    outbox: Optional[NotificationOutbox] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    session: Optional[requests.Session] = None,
 ) -> bool:
     """
     发送到钉钉（支持分批发送，支持热榜+RSS合并+独立展示区）
@@ -239,6 +296,10 @@ def send_to_dingtalk(
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        batch_cache: 分批结果缓存（可选，由调度器在单次分发内共享）
+        outbox: 推送发件箱（可选，批次持久化并支持断点续发）
+        rate_limiter: 推送限流器（可选，替代固定批次间隔）
+        session: HTTP 会话（可选，由调度器按渠道复用连接）
 
     Returns:
         bool: 发送是否成功
@@ -248,50 +309,68 @@ def send_to_dingtalk(
     if proxy_url:
         proxies = {"http": proxy_url, "https": proxy_url}
 
+    # 复用调度器提供的会话（keep-alive），未提供时退回 requests 模块级接口
+    http = session if session is not None else requests
+
     # 日志前缀
     log_prefix = f"钉钉{account_label}" if account_label else "钉钉"
 
-    # 渲染 AI 分析内容（如果有）
-    ai_content = None
-    ai_stats = None
-    if ai_analysis:
-        ai_content = _render_ai_analysis(ai_analysis, "dingtalk", ai_push_mode)
-        # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
-        if getattr(ai_analysis, "success", False):
-            ai_stats = {
-                "total_news": getattr(ai_analysis, "total_news", 0),
-                "analyzed_news": getattr(ai_analysis, "analyzed_news", 0),
-                "max_news_limit": getattr(ai_analysis, "max_news_limit", 0),
-                "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
-                "rss_count": getattr(ai_analysis, "rss_count", 0),
-            }
-
-    # 预留批次头部空间，避免添加头部后超限
-    header_reserve = get_max_batch_header_size("dingtalk")
-    batches = split_content_func(
-        report_data,
-        "dingtalk",
-        update_info,
-        max_bytes=batch_size - header_reserve,
-        mode=mode,
-        rss_items=rss_items,
-        rss_new_items=rss_new_items,
-        ai_content=ai_content,
-        standalone_data=standalone_data,
-        ai_stats=ai_stats,
-        report_type=report_type,
-    )
+    def build_batches() -> List[str]:
+        # 渲染 AI 分析内容（如果有）
+        ai_content = None
+        ai_stats = None
+        if ai_analysis:
+            ai_content = _render_ai_analysis(ai_analysis, "dingtalk", ai_push_mode)
+            # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
+            if getattr(ai_analysis, "success", False):
+                ai_stats = {
+                    "total_news": getattr(ai_analysis, "total_news", 0),
+                    "analyzed_news": getattr(ai_analysis, "analyzed_news", 0),
+                    "max_news_limit": getattr(ai_analysis, "max_news_limit", 0),
+                    "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
+                    "rss_count": getattr(ai_analysis, "rss_count", 0),
+                }
+
+        # 预留批次头部空间，避免添加头部后超限
+        header_reserve = get_max_batch_header_size("dingtalk")
+        batches = split_content_func(
+            report_data,
+            "dingtalk",
+            update_info,
+            max_bytes=batch_size - header_reserve,
+            mode=mode,
+            rss_items=rss_items,
+            rss_new_items=rss_new_items,
+            ai_content=ai_content,
+            standalone_data=standalone_data,
+            ai_stats=ai_stats,
+            report_type=report_type,
+        )
 
-    # 统一添加批次头部（已预留空间，不会超限）
-    batches = add_batch_headers(batches, "dingtalk", batch_size)
+        # 统一添加批次头部（已预留空间，不会超限）
+        batches = add_batch_headers(batches, "dingtalk", batch_size)
+        return batches
+
+    # 同一次分发中输入相同的账号共用分批结果
+    if batch_cache is not None:
+        batches = batch_cache.get_or_build(
+            "dingtalk", batch_size,
+            (report_data, report_type, update_info, mode, rss_items, rss_new_items,
+             ai_analysis, ai_push_mode, standalone_data),
+            build_batches,
+        )
+    else:
+        batches = build_batches()
 
     print(f"{log_prefix}消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
-    for i, batch_content in enumerate(batches, 1):
+    account = NotificationOutbox.account_key(webhook_url)
+
+    # 单批次发送（由发件箱续发时也使用）
+    def post_batch(i: int, total: int, batch_content: str, report_type: str) -> bool:
         content_size = len(batch_content.encode("utf-8"))
         print(
-            f"发送{log_prefix}第 {i}/{len(batches)} 批次，大小：{content_size} 字节 [{report_type}]"
+            f"发送{log_prefix}第 {i}/{total} 批次，大小：{content_size} 字节 [{report_type}]"
         )
 
         payload = {
@@ -303,30 +382,38 @@ def send_to_dingtalk(
         }
 
         try:
-            response = requests.post(
+            response = http.post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
                 if result.get("errcode") == 0:
-                    print(f"{log_prefix}第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(batch_interval)
+                    print(f"{log_prefix}第 {i}/{total} 批次发送成功 [{report_type}]")
+                    return True
                 else:
+                    if result.get("errcode") in _DINGTALK_THROTTLE_CODES:
+                        _report_throttle(rate_limiter, "dingtalk", account, response)
                     print(
-                        f"{log_prefix}第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('errmsg')}"
+                        f"{log_prefix}第 {i}/{total} 批次发送失败 [{report_type}]，错误：{result.get('errmsg')}"
                     )
                     return False
             else:
+                if response.status_code == 429:
+                    _report_throttle(rate_limiter, "dingtalk", account, response)
                 print(
-                    f"{log_prefix}第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
+                    f"{log_prefix}第 {i}/{total} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
                 )
                 return False
         except Exception as e:
-            print(f"{log_prefix}第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
+            print(f"{log_prefix}第 {i}/{total} 批次发送出错 [{report_type}]：{e}")
             return False
 
+    if not deliver_batches(
+        batches, post_batch, batch_interval, outbox,
+        "dingtalk", account, report_type, log_prefix, rate_limiter,
+    ):
+        return False
+
     print(f"{log_prefix}所有 {len(batches)} 批次发送完成 [{report_type}]")
 
     return True
@@ -350,6 +437,10 @@ def send_to_wework(
     ai_analysis: Any = None,
     ai_push_mode: str = "both",
     standalone_data: Optional[Dict] = None,
+    batch_cache: Optional[BatchCache] = None,
+    outbox: Optional[NotificationOutbox] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    session: Optional[requests.Session] = None,
 ) -> bool:
     """
     发送到企业微信（支持分批发送，支持 markdown 和 text 两种格式，支持热榜+RSS合并+独立展示区）
@@ -368,6 +459,10 @@ def send_to_wework(
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        batch_cache: 分批结果缓存（可选，由调度器在单次分发内共享）
+        outbox: 推送发件箱（可选，批次持久化并支持断点续发）
+        rate_limiter: 推送限流器（可选，替代固定批次间隔）
+        session: HTTP 会话（可选，由调度器按渠道复用连接）
 
     Returns:
         bool: 发送是否成功
@@ -377,6 +472,9 @@ def send_to_wework(
     if proxy_url:
         proxies = {"http": proxy_url, "https": proxy_url}
 
+    # 复用调度器提供的会话（keep-alive），未提供时退回 requests 模块级接口
+    http = session if session is not None else requests
+
     # 日志前缀
     log_prefix = f"企业微信{account_label}" if account_label else "企业微信"
 
@@ -391,40 +489,55 @@ def send_to_wework(
     # text 模式使用 wework_text，markdown 模式使用 wework
     header_format_type = "wework_text" if is_text_mode else "wework"
 
-    # 渲染 AI 分析内容（如果有）
-    ai_content = None
-    ai_stats = None
-    if ai_analysis:
-        ai_content = _render_ai_analysis(ai_analysis, "wework", ai_push_mode)
-        # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
-        if getattr(ai_analysis, "success", False):
-            ai_stats = {
-                "total_news": getattr(ai_analysis, "total_news", 0),
-                "analyzed_news": getattr(ai_analysis, "analyzed_news", 0),
-                "max_news_limit": getattr(ai_analysis, "max_news_limit", 0),
-                "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
-                "rss_count": getattr(ai_analysis, "rss_count", 0),
-            }
-
-    # 获取分批内容，预留批次头部空间
-    header_reserve = get_max_batch_header_size(header_format_type)
-    batches = split_content_func(
-        report_data, "wework", update_info, max_bytes=batch_size - header_reserve, mode=mode,
-        rss_items=rss_items,
-        rss_new_items=rss_new_items,
-        ai_content=ai_content,
-        standalone_data=standalone_data,
-        ai_stats=ai_stats,
-        report_type=report_type,
-    )
+    def build_batches() -> List[str]:
+        # 渲染 AI 分析内容（如果有）
+        ai_content = None
+        ai_stats = None
+        if ai_analysis:
+            ai_content = _render_ai_analysis(ai_analysis, "wework", ai_push_mode)
+            # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
+            if getattr(ai_analysis, "success", False):
+                ai_stats = {
+                    "total_news": getattr(ai_analysis, "total_news", 0),
+                    "analyzed_news": getattr(ai_analysis, "analyzed_news", 0),
+                    "max_news_limit": getattr(ai_analysis, "max_news_limit", 0),
+                    "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
+                    "rss_count": getattr(ai_analysis, "rss_count", 0),
+                }
+
+        # 获取分批内容，预留批次头部空间
+        header_reserve = get_max_batch_header_size(header_format_type)
+        batches = split_content_func(
+            report_data, "wework", update_info, max_bytes=batch_size - header_reserve, mode=mode,
+            rss_items=rss_items,
+            rss_new_items=rss_new_items,
+            ai_content=ai_content,
+            standalone_data=standalone_data,
+            ai_stats=ai_stats,
+            report_type=report_type,
+        )
 
-    # 统一添加批次头部（已预留空间，不会超限）
-    batches = add_batch_headers(batches, header_format_type, batch_size)
+        # 统一添加批次头部（已预留空间，不会超限）
+        batches = add_batch_headers(batches, header_format_type, batch_size)
+        return batches
+
+    # 同一次分发中输入相同的账号共用分批结果
+    if batch_cache is not None:
+        batches = batch_cache.get_or_build(
+            header_format_type, batch_size,
+            (report_data, report_type, update_info, mode, rss_items, rss_new_items,
+             ai_analysis, ai_push_mode, standalone_data),
+            build_batches,
+        )
+    else:
+        batches = build_batches()
 
     print(f"{log_prefix}消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
-    for i, batch_content in enumerate(batches, 1):
+    account = NotificationOutbox.account_key(webhook_url)
+
+    # 单批次发送（由发件箱续发时也使用）
+    def post_batch(i: int, total: int, batch_content: str, report_type: str) -> bool:
         # 根据消息类型构建 payload
         if is_text_mode:
             # text 格式：去除 markdown 语法
@@ -437,34 +550,42 @@ def send_to_wework(
             content_size = len(batch_content.encode("utf-8"))
 
         print(
-            f"发送{log_prefix}第 {i}/{len(batches)} 批次，大小：{content_size} 字节 [{report_type}]"
+            f"发送{log_prefix}第 {i}/{total} 批次，大小：{content_size} 字节 [{report_type}]"
         )
 
         try:
-            response = requests.post(
+            response = http.post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
                 if result.get("errcode") == 0:
-                    print(f"{log_prefix}第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(batch_interval)
+                    print(f"{log_prefix}第 {i}/{total} 批次发送成功 [{report_type}]")
+                    return True
                 else:
+                    if result.get("errcode") in _WEWORK_THROTTLE_CODES:
+                        _report_throttle(rate_limiter, "wework", account, response)
                     print(
-                        f"{log_prefix}第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('errmsg')}"
+                        f"{log_prefix}第 {i}/{total} 批次发送失败 [{report_type}]，错误：{result.get('errmsg')}"
                     )
                     return False
             else:
+                if response.status_code == 429:
+                    _report_throttle(rate_limiter, "wework", account, response)
                 print(
-                    f"{log_prefix}第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
+                    f"{log_prefix}第 {i}/{total} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
                 )
                 return False
         except Exception as e:
-            print(f"{log_prefix}第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
+            print(f"{log_prefix}第 {i}/{total} 批次发送出错 [{report_type}]：{e}")
             return False
 
+    if not deliver_batches(
+        batches, post_batch, batch_interval, outbox,
+        "wework", account, report_type, log_prefix, rate_limiter,
+    ):
+        return False
+
     print(f"{log_prefix}所有 {len(batches)} 批次发送完成 [{report_type}]")
 
     return True
@@ -488,6 +609,10 @@ def send_to_telegram(
     ai_analysis: Any = None,
     ai_push_mode: str = "both",
     standalone_data: Optional[Dict] = None,
+    batch_cache: Optional[BatchCache] = None,
+    outbox: Optional[NotificationOutbox] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    session: Optional[requests.Session] = None,
 ) -> bool:
     """
     发送到 Telegram（支持分批发送，支持热榜+RSS合并+独立展示区）
@@ -506,6 +631,10 @@ def send_to_telegram(
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        batch_cache: 分批结果缓存（可选，由调度器在单次分发内共享）
+        outbox: 推送发件箱（可选，批次持久化并支持断点续发）
+        rate_limiter: 推送限流器（可选，替代固定批次间隔）
+        session: HTTP 会话（可选，由调度器按渠道复用连接）
 
     Returns:
         bool: 发送是否成功
@@ -517,46 +646,64 @@ def send_to_telegram(
     if proxy_url:
         proxies = {"http": proxy_url, "https": proxy_url}
 
+    # 复用调度器提供的会话（keep-alive），未提供时退回 requests 模块级接口
+    http = session if session is not None else requests
+
     # 日志前缀
     log_prefix = f"Telegram{account_label}" if account_label else "Telegram"
 
-    # 渲染 AI 分析内容（如果有）
-    ai_content = None
-    ai_stats = None
-    if ai_analysis:
-        ai_content = _render_ai_analysis(ai_analysis, "telegram", ai_push_mode)
-        # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
-        if getattr(ai_analysis, "success", False):
-            ai_stats = {
-                "total_news": getattr(ai_analysis, "total_news", 0),
-                "analyzed_news": getattr(ai_analysis, "analyzed_news", 0),
-                "max_news_limit": getattr(ai_analysis, "max_news_limit", 0),
-                "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
-                "rss_count": getattr(ai_analysis, "rss_count", 0),
-            }
-
-    # 获取分批内容，预留批次头部空间
-    header_reserve = get_max_batch_header_size("telegram")
-    batches = split_content_func(
-        report_data, "telegram", update_info, max_bytes=batch_size - header_reserve, mode=mode,
-        rss_items=rss_items,
-        rss_new_items=rss_new_items,
-        ai_content=ai_content,
-        standalone_data=standalone_data,
-        ai_stats=ai_stats,
-        report_type=report_type,
-    )
+    def build_batches() -> List[str]:
+        # 渲染 AI 分析内容（如果有）
+        ai_content = None
+        ai_stats = None
+        if ai_analysis:
+            ai_content = _render_ai_analysis(ai_analysis, "telegram", ai_push_mode)
+            # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
+            if getattr(ai_analysis, "success", False):
+                ai_stats = {
+                    "total_news": getattr(ai_analysis, "total_news", 0),
+                    "analyzed_news": getattr(ai_analysis, "analyzed_news", 0),
+                    "max_news_limit": getattr(ai_analysis, "max_news_limit", 0),
+                    "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
+                    "rss_count": getattr(ai_analysis, "rss_count", 0),
+                }
+
+        # 获取分批内容，预留批次头部空间
+        header_reserve = get_max_batch_header_size("telegram")
+        batches = split_content_func(
+            report_data, "telegram", update_info, max_bytes=batch_size - header_reserve, mode=mode,
+            rss_items=rss_items,
+            rss_new_items=rss_new_items,
+            ai_content=ai_content,
+            standalone_data=standalone_data,
+            ai_stats=ai_stats,
+            report_type=report_type,
+        )
 
-    # 统一添加批次头部（已预留空间，不会超限）
-    batches = add_batch_headers(batches, "telegram", batch_size)
+        # 统一添加批次头部（已预留空间，不会超限）
+        batches = add_batch_headers(batches, "telegram", batch_size)
+        return batches
+
+    # 同一次分发中输入相同的账号共用分批结果
+    if batch_cache is not None:
+        batches = batch_cache.get_or_build(
+            "telegram", batch_size,
+            (report_data, report_type, update_info, mode, rss_items, rss_new_items,
+             ai_analysis, ai_push_mode, standalone_data),
+            build_batches,
+        )
+    else:
+        batches = build_batches()
 
     print(f"{log_prefix}消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
-    for i, batch_content in enumerate(batches, 1):
+    account = NotificationOutbox.account_key(bot_token, chat_id)
+
+    # 单批次发送（由发件箱续发时也使用）
+    def post_batch(i: int, total: int, batch_content: str, report_type: str) -> bool:
         content_size = len(batch_content.encode("utf-8"))
         print(
-            f"发送{log_prefix}第 {i}/{len(batches)} 批次，大小：{content_size} 字节 [{report_type}]"
+            f"发送{log_prefix}第 {i}/{total} 批次，大小：{content_size} 字节 [{report_type}]"
         )
 
         payload = {
@@ -567,35 +714,184 @@ def send_to_telegram(
         }
 
         try:
-            response = requests.post(
+            response = http.post(
                 url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
                 if result.get("ok"):
-                    print(f"{log_prefix}第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(batch_interval)
+                    print(f"{log_prefix}第 {i}/{total} 批次发送成功 [{report_type}]")
+                    return True
                 else:
                     print(
-                        f"{log_prefix}第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('description')}"
+                        f"{log_prefix}第 {i}/{total} 批次发送失败 [{report_type}]，错误：{result.get('description')}"
                     )
                     return False
             else:
+                if response.status_code == 429:
+                    _report_throttle(rate_limiter, "telegram", account, response)
                 print(
-                    f"{log_prefix}第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
+                    f"{log_prefix}第 {i}/{total} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
                 )
                 return False
         except Exception as e:
-            print(f"{log_prefix}第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
+            print(f"{log_prefix}第 {i}/{total} 批次发送出错 [{report_type}]：{e}")
             return False
 
+    if not deliver_batches(
+        batches, post_batch, batch_interval, outbox,
+        "telegram", account, report_type, log_prefix, rate_limiter,
+    ):
+        return False
+
     print(f"{log_prefix}所有 {len(batches)} 批次发送完成 [{report_type}]")
 
     return True
 
 
+def _resolve_smtp_settings(
+    from_email: str,
+    custom_smtp_server: Optional[str] = None,
+    custom_smtp_port: Optional[int] = None,
+) -> Tuple[str, int, bool]:
+    """
+    解析 SMTP 服务器配置
+
+    Args:
+        from_email: 发件人邮箱
+        custom_smtp_server: 自定义 SMTP 服务器（可选）
+        custom_smtp_port: 自定义 SMTP 端口（可选）
+
+    Returns:
+        (SMTP 服务器, 端口, 是否使用 STARTTLS)
+    """
+    domain = from_email.split("@")[-1].lower()
+
+    if custom_smtp_server and custom_smtp_port:
+        # 使用自定义 SMTP 配置
+        smtp_server = custom_smtp_server
+        smtp_port = int(custom_smtp_port)
+        # 根据端口判断加密方式：465=SSL, 587=TLS
+        if smtp_port == 465:
+            use_tls = False  # SSL 模式（SMTP_SSL）
+        elif smtp_port == 587:
+            use_tls = True  # TLS 模式（STARTTLS）
+        else:
+            # 其他端口优先尝试 TLS（更安全，更广泛支持）
+            use_tls = True
+    elif domain in SMTP_CONFIGS:
+        # 使用预设配置
+        config = SMTP_CONFIGS[domain]
+        smtp_server = config["server"]
+        smtp_port = config["port"]
+        use_tls = config["encryption"] == "TLS"
+    else:
+        print(f"未识别的邮箱服务商: {domain}，使用通用 SMTP 配置")
+        smtp_server = f"smtp.{domain}"
+        smtp_port = 587
+        use_tls = True
+
+    return smtp_server, smtp_port, use_tls
+
+
+def create_smtp_transport(
+    from_email: str,
+    password: str,
+    custom_smtp_server: Optional[str] = None,
+    custom_smtp_port: Optional[int] = None,
+) -> SMTPTransport:
+    """
+    根据邮箱配置创建可复用的 SMTP 传输
+
+    Args:
+        from_email: 发件人邮箱
+        password: 邮箱密码/授权码
+        custom_smtp_server: 自定义 SMTP 服务器（可选）
+        custom_smtp_port: 自定义 SMTP 端口（可选）
+
+    Returns:
+        SMTPTransport 实例（首次发送时才建立连接）
+    """
+    smtp_server, smtp_port, use_tls = _resolve_smtp_settings(
+        from_email, custom_smtp_server, custom_smtp_port
+    )
+    return SMTPTransport(from_email, password, smtp_server, smtp_port, use_tls)
+
+
+def _build_email_html_part(html_file_path: str, ai_content: str) -> MIMEText:
+    """
+    构建邮件的 HTML 正文部分（读取报告文件并完成编码，可在多次发送间复用）
+
+    Returns:
+        已编码的 HTML 正文
+    """
+    print(f"使用HTML文件: {html_file_path}")
+    with open(html_file_path, "r", encoding="utf-8") as f:
+        html_content = f.read()
+
+    # 追加 AI 分析内容到 HTML
+    if ai_content:
+        html_content = html_content.replace("</body>", f"{ai_content}</body>")
+
+    return MIMEText(html_content, "html", "utf-8")
+
+
+def _build_email_message(
+    from_email: str,
+    recipients: List[str],
+    report_type: str,
+    html_part: MIMEText,
+    now: datetime,
+) -> bytes:
+    """
+    构建并序列化邮件（HTML 报告 + 纯文本备选）
+
+    收件人、主题、Date 和 Message-ID 每次发送单独生成，HTML 正文使用已编码的部分。
+
+    Returns:
+        可直接交给 SMTP DATA 的邮件字节（CRLF 换行）
+    """
+    msg = MIMEMultipart("alternative")
+
+    # 严格按照 RFC 标准设置 From header
+    sender_name = "TrendRadar"
+    msg["From"] = formataddr((sender_name, from_email))
+
+    # 设置收件人
+    if len(recipients) == 1:
+        msg["To"] = recipients[0]
+    else:
+        msg["To"] = ", ".join(recipients)
+
+    # 设置邮件主题
+    subject = f"TrendRadar 热点分析报告 - {report_type} - {now.strftime('%m月%d日 %H:%M')}"
+    msg["Subject"] = Header(subject, "utf-8")
+
+    # 设置其他标准 header
+    msg["MIME-Version"] = "1.0"
+    msg["Date"] = formatdate(localtime=True)
+    msg["Message-ID"] = make_msgid()
+
+    # 添加纯文本部分（作为备选）
+    text_content = f"""
+TrendRadar 热点分析报告
+========================
+报告类型：{report_type}
+生成时间：{now.strftime('%Y-%m-%d %H:%M:%S')}
+
+请使用支持HTML的邮件客户端查看完整报告内容。
+        """
+    text_part = MIMEText(text_content, "plain", "utf-8")
+    msg.attach(text_part)
+
+    msg.attach(html_part)
+
+    # 与 SMTP.send_message 的序列化方式一致（CRLF 换行）
+    buffer = io.BytesIO()
+    BytesGenerator(buffer, policy=msg.policy.clone(linesep="\r\n")).flatten(msg)
+    return buffer.getvalue()
+
+
 def send_to_email(
     from_email: str,
     password: str,
@@ -608,6 +904,7 @@ def send_to_email(
     get_time_func: Callable = None,
     ai_analysis: Any = None,
     ai_push_mode: str = "both",
+    transport: Optional[SMTPTransport] = None,
 ) -> bool:
     """
     发送邮件通知
@@ -621,113 +918,44 @@ def send_to_email(
         custom_smtp_server: 自定义 SMTP 服务器（可选）
         custom_smtp_port: 自定义 SMTP 端口（可选）
         get_time_func: 获取当前时间的函数
+        transport: SMTP 传输（可选，由调度器在单次运行内复用同一会话；
+            未提供时本次发送单独建立连接，发送后关闭）
 
     Returns:
         bool: 发送是否成功
     """
+    own_transport = transport is None
+    smtp_server, smtp_port = custom_smtp_server, custom_smtp_port
     try:
         if not html_file_path or not Path(html_file_path).exists():
             print(f"错误：HTML文件不存在或未提供: {html_file_path}")
             return False
 
-        print(f"使用HTML文件: {html_file_path}")
-        with open(html_file_path, "r", encoding="utf-8") as f:
-            html_content = f.read()
-
-        # 追加 AI 分析内容到 HTML
-        if ai_analysis:
-            ai_content = _render_ai_analysis(ai_analysis, "email", ai_push_mode)
-            if ai_content:
-                html_content = html_content.replace("</body>", f"{ai_content}</body>")
-
-        domain = from_email.split("@")[-1].lower()
-
-        if custom_smtp_server and custom_smtp_port:
-            # 使用自定义 SMTP 配置
-            smtp_server = custom_smtp_server
-            smtp_port = int(custom_smtp_port)
-            # 根据端口判断加密方式：465=SSL, 587=TLS
-            if smtp_port == 465:
-                use_tls = False  # SSL 模式（SMTP_SSL）
-            elif smtp_port == 587:
-                use_tls = True  # TLS 模式（STARTTLS）
-            else:
-                # 其他端口优先尝试 TLS（更安全，更广泛支持）
-                use_tls = True
-        elif domain in SMTP_CONFIGS:
-            # 使用预设配置
-            config = SMTP_CONFIGS[domain]
-            smtp_server = config["server"]
-            smtp_port = config["port"]
-            use_tls = config["encryption"] == "TLS"
-        else:
-            print(f"未识别的邮箱服务商: {domain}，使用通用 SMTP 配置")
-            smtp_server = f"smtp.{domain}"
-            smtp_port = 587
-            use_tls = True
-
-        msg = MIMEMultipart("alternative")
-
-        # 严格按照 RFC 标准设置 From header
-        sender_name = "TrendRadar"
-        msg["From"] = formataddr((sender_name, from_email))
+        if own_transport:
+            transport = create_smtp_transport(
+                from_email, password, custom_smtp_server, custom_smtp_port
+            )
+        smtp_server, smtp_port = transport.server, transport.port
 
-        # 设置收件人
         recipients = [addr.strip() for addr in to_email.split(",")]
-        if len(recipients) == 1:
-            msg["To"] = recipients[0]
-        else:
-            msg["To"] = ", ".join(recipients)
-
-        # 设置邮件主题
         now = get_time_func() if get_time_func else datetime.now()
-        subject = f"TrendRadar 热点分析报告 - {report_type} - {now.strftime('%m月%d日 %H:%M')}"
-        msg["Subject"] = Header(subject, "utf-8")
-
-        # 设置其他标准 header
-        msg["MIME-Version"] = "1.0"
-        msg["Date"] = formatdate(localtime=True)
-        msg["Message-ID"] = make_msgid()
-
-        # 添加纯文本部分（作为备选）
-        text_content = f"""
-TrendRadar 热点分析报告
-========================
-报告类型：{report_type}
-生成时间：{now.strftime('%Y-%m-%d %H:%M:%S')}
-
-请使用支持HTML的邮件客户端查看完整报告内容。
-        """
-        text_part = MIMEText(text_content, "plain", "utf-8")
-        msg.attach(text_part)
-
-        html_part = MIMEText(html_content, "html", "utf-8")
-        msg.attach(html_part)
+        ai_content = _render_ai_analysis(ai_analysis, "email", ai_push_mode) if ai_analysis else ""
+
+        # 同一报告文件和 AI 内容只读取、编码一次 HTML 正文；
+        # 收件人、主题和 Message-ID 等邮件头每次发送单独生成
+        stat = Path(html_file_path).stat()
+        body_key = (str(html_file_path), stat.st_mtime_ns, stat.st_size, ai_content)
+        html_part = transport.get_body(
+            body_key, lambda: _build_email_html_part(html_file_path, ai_content)
+        )
+        message = _build_email_message(from_email, recipients, report_type, html_part, now)
 
         print(f"正在发送邮件到 {to_email}...")
         print(f"SMTP 服务器: {smtp_server}:{smtp_port}")
         print(f"发件人: {from_email}")
 
         try:
-            if use_tls:
-                # TLS 模式
-                server = smtplib.SMTP(smtp_server, smtp_port, timeout=30)
-                server.set_debuglevel(0)  # 设为1可以查看详细调试信息
-                server.ehlo()
-                server.starttls()
-                server.ehlo()
-            else:
-                # SSL 模式
-                server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=30)
-                server.set_debuglevel(0)
-                server.ehlo()
-
-            # 登录
-            server.login(from_email, password)
-
-            # 发送邮件
-            server.send_message(msg)
-            server.quit()
+            transport.send(recipients, message)
 
             print(f"邮件发送成功 [{report_type}] -> {to_email}")
             return True
@@ -758,6 +986,9 @@ TrendRadar 热点分析报告
         import traceback
         traceback.print_exc()
         return False
+    finally:
+        if own_transport and transport is not None:
+            transport.close()
 
 
 def send_to_ntfy(
@@ -778,6 +1009,9 @@ def send_to_ntfy(
     ai_analysis: Any = None,
     ai_push_mode: str = "both",
     standalone_data: Optional[Dict] = None,
+    batch_cache: Optional[BatchCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    session: Optional[requests.Session] = None,
 ) -> bool:
     """
     发送到 ntfy（支持分批发送，严格遵守4KB限制，支持热榜+RSS合并+独立展示区）
@@ -796,10 +1030,16 @@ def send_to_ntfy(
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        batch_cache: 分批结果缓存（可选，由调度器在单次分发内共享）
+        rate_limiter: 推送限流器（可选，替代固定批次间隔）
+        session: HTTP 会话（可选，由调度器按渠道复用连接）
 
     Returns:
         bool: 发送是否成功
     """
+    # 复用调度器提供的会话（keep-alive），未提供时退回 requests 模块级接口
+    http = session if session is not None else requests
+
     # 日志前缀
     log_prefix = f"ntfy{account_label}" if account_label else "ntfy"
 
@@ -834,35 +1074,48 @@ def send_to_ntfy(
     if proxy_url:
         proxies = {"http": proxy_url, "https": proxy_url}
 
-    # 渲染 AI 分析内容（如果有），合并到主内容中
-    ai_content = None
-    ai_stats = None
-    if ai_analysis:
-        ai_content = _render_ai_analysis(ai_analysis, "ntfy", ai_push_mode)
-        # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
-        if getattr(ai_analysis, "success", False):
-            ai_stats = {
-                "total_news": getattr(ai_analysis, "total_news", 0),
-                "analyzed_news": getattr(ai_analysis, "analyzed_news", 0),
-                "max_news_limit": getattr(ai_analysis, "max_news_limit", 0),
-                "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
-                "rss_count": getattr(ai_analysis, "rss_count", 0),
-            }
-
-    # 获取分批内容，预留批次头部空间
-    header_reserve = get_max_batch_header_size("ntfy")
-    batches = split_content_func(
-        report_data, "ntfy", update_info, max_bytes=batch_size - header_reserve, mode=mode,
-        rss_items=rss_items,
-        rss_new_items=rss_new_items,
-        ai_content=ai_content,
-        standalone_data=standalone_data,
-        ai_stats=ai_stats,
-        report_type=report_type,
-    )
+    def build_batches() -> List[str]:
+        # 渲染 AI 分析内容（如果有），合并到主内容中
+        ai_content = None
+        ai_stats = None
+        if ai_analysis:
+            ai_content = _render_ai_analysis(ai_analysis, "ntfy", ai_push_mode)
+            # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
+            if getattr(ai_analysis, "success", False):
+                ai_stats = {
+                    "total_news": getattr(ai_analysis, "total_news", 0),
+                    "analyzed_news": getattr(ai_analysis, "analyzed_news", 0),
+                    "max_news_limit": getattr(ai_analysis, "max_news_limit", 0),
+                    "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
+                    "rss_count": getattr(ai_analysis, "rss_count", 0),
+                }
+
+        # 获取分批内容，预留批次头部空间
+        header_reserve = get_max_batch_header_size("ntfy")
+        batches = split_content_func(
+            report_data, "ntfy", update_info, max_bytes=batch_size - header_reserve, mode=mode,
+            rss_items=rss_items,
+            rss_new_items=rss_new_items,
+            ai_content=ai_content,
+            standalone_data=standalone_data,
+            ai_stats=ai_stats,
+            report_type=report_type,
+        )
 
-    # 统一添加批次头部（已预留空间，不会超限）
-    batches = add_batch_headers(batches, "ntfy", batch_size)
+        # 统一添加批次头部（已预留空间，不会超限）
+        batches = add_batch_headers(batches, "ntfy", batch_size)
+        return batches
+
+    # 同一次分发中输入相同的账号共用分批结果
+    if batch_cache is not None:
+        batches = batch_cache.get_or_build(
+            "ntfy", batch_size,
+            (report_data, report_type, update_info, mode, rss_items, rss_new_items,
+             ai_analysis, ai_push_mode, standalone_data),
+            build_batches,
+        )
+    else:
+        batches = build_batches()
 
     total_batches = len(batches)
     print(f"{log_prefix}消息分为 {total_batches} 批次发送 [{report_type}]")
@@ -873,6 +1126,8 @@ def send_to_ntfy(
 
     print(f"{log_prefix}将按反向顺序推送（最后批次先推送），确保客户端显示顺序正确")
 
+    account = NotificationOutbox.account_key(url)
+
     # 逐批发送（反向顺序）
     success_count = 0
     for idx, batch_content in enumerate(reversed_batches, 1):
@@ -893,8 +1148,11 @@ def send_to_ntfy(
         if total_batches > 1:
             current_headers["Title"] = f"{report_type_en} ({actual_batch_num}/{total_batches})"
 
+        if rate_limiter is not None:
+            rate_limiter.acquire("ntfy", account)
+
         try:
-            response = requests.post(
+            response = http.post(
                 url,
                 headers=current_headers,
                 data=batch_content.encode("utf-8"),
@@ -906,6 +1164,7 @@ def send_to_ntfy(
                 print(f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次发送成功 [{report_type}]")
                 success_count += 1
                 if idx < total_batches:
+                    # 反向推送依赖到达时间排序，启用限流器时也保留最小间隔（令牌桶突发会让批次同时到达）
                     # 公共服务器建议 2-3 秒，自托管可以更短
                     interval = 2 if "ntfy.sh" in server_url else 1
                     time.sleep(interval)
@@ -913,9 +1172,14 @@ def send_to_ntfy(
                 print(
                     f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次速率限制 [{report_type}]，等待后重试"
                 )
-                time.sleep(10)  # 等待10秒后重试
+                if rate_limiter is not None:
+                    # 降低额度并按令牌桶等待
+                    _report_throttle(rate_limiter, "ntfy", account, response)
+                    rate_limiter.acquire("ntfy", account)
+                else:
+                    time.sleep(10)  # 等待10秒后重试
                 # 重试一次
-                retry_response = requests.post(
+                retry_response = http.post(
                     url,
                     headers=current_headers,
                     data=batch_content.encode("utf-8"),
@@ -980,6 +1244,9 @@ def send_to_bark(
     ai_analysis: Any = None,
     ai_push_mode: str = "both",
     standalone_data: Optional[Dict] = None,
+    batch_cache: Optional[BatchCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    session: Optional[requests.Session] = None,
 ) -> bool:
     """
     发送到 Bark（支持分批发送，使用 markdown 格式，支持热榜+RSS合并+独立展示区）
@@ -997,10 +1264,16 @@ def send_to_bark(
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        batch_cache: 分批结果缓存（可选，由调度器在单次分发内共享）
+        rate_limiter: 推送限流器（可选，替代固定批次间隔）
+        session: HTTP 会话（可选，由调度器按渠道复用连接）
 
     Returns:
         bool: 发送是否成功
     """
+    # 复用调度器提供的会话（keep-alive），未提供时退回 requests 模块级接口
+    http = session if session is not None else requests
+
     # 日志前缀
     log_prefix = f"Bark{account_label}" if account_label else "Bark"
 
@@ -1020,35 +1293,48 @@ def send_to_bark(
     # 构建正确的 API 端点
     api_endpoint = f"{parsed_url.scheme}://{parsed_url.netloc}/push"
 
-    # 渲染 AI 分析内容（如果有），合并到主内容中
-    ai_content = None
-    ai_stats = None
-    if ai_analysis:
-        ai_content = _render_ai_analysis(ai_analysis, "bark", ai_push_mode)
-        # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
-        if getattr(ai_analysis, "success", False):
-            ai_stats = {
-                "total_news": getattr(ai_analysis, "total_news", 0),
-                "analyzed_news": getattr(ai_analysis, "analyzed_news", 0),
-                "max_news_limit": getattr(ai_analysis, "max_news_limit", 0),
-                "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
-                "rss_count": getattr(ai_analysis, "rss_count", 0),
-            }
-
-    # 获取分批内容，预留批次头部空间
-    header_reserve = get_max_batch_header_size("bark")
-    batches = split_content_func(
-        report_data, "bark", update_info, max_bytes=batch_size - header_reserve, mode=mode,
-        rss_items=rss_items,
-        rss_new_items=rss_new_items,
-        ai_content=ai_content,
-        standalone_data=standalone_data,
-        ai_stats=ai_stats,
-        report_type=report_type,
-    )
+    def build_batches() -> List[str]:
+        # 渲染 AI 分析内容（如果有），合并到主内容中
+        ai_content = None
+        ai_stats = None
+        if ai_analysis:
+            ai_content = _render_ai_analysis(ai_analysis, "bark", ai_push_mode)
+            # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
+            if getattr(ai_analysis, "success", False):
+                ai_stats = {
+                    "total_news": getattr(ai_analysis, "total_news", 0),
+                    "analyzed_news": getattr(ai_analysis, "analyzed_news", 0),
+                    "max_news_limit": getattr(ai_analysis, "max_news_limit", 0),
+                    "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
+                    "rss_count": getattr(ai_analysis, "rss_count", 0),
+                }
+
+        # 获取分批内容，预留批次头部空间
+        header_reserve = get_max_batch_header_size("bark")
+        batches = split_content_func(
+            report_data, "bark", update_info, max_bytes=batch_size - header_reserve, mode=mode,
+            rss_items=rss_items,
+            rss_new_items=rss_new_items,
+            ai_content=ai_content,
+            standalone_data=standalone_data,
+            ai_stats=ai_stats,
+            report_type=report_type,
+        )
 
-    # 统一添加批次头部（已预留空间，不会超限）
-    batches = add_batch_headers(batches, "bark", batch_size)
+        # 统一添加批次头部（已预留空间，不会超限）
+        batches = add_batch_headers(batches, "bark", batch_size)
+        return batches
+
+    # 同一次分发中输入相同的账号共用分批结果
+    if batch_cache is not None:
+        batches = batch_cache.get_or_build(
+            "bark", batch_size,
+            (report_data, report_type, update_info, mode, rss_items, rss_new_items,
+             ai_analysis, ai_push_mode, standalone_data),
+            build_batches,
+        )
+    else:
+        batches = build_batches()
 
     total_batches = len(batches)
     print(f"{log_prefix}消息分为 {total_batches} 批次发送 [{report_type}]")
@@ -1059,6 +1345,8 @@ def send_to_bark(
 
     print(f"{log_prefix}将按反向顺序推送（最后批次先推送），确保客户端显示顺序正确")
 
+    account = NotificationOutbox.account_key(bark_url)
+
     # 逐批发送（反向顺序）
     success_count = 0
     for idx, batch_content in enumerate(reversed_batches, 1):
@@ -1086,8 +1374,11 @@ def send_to_bark(
             "action": "none",  # 点击推送跳到 APP 不弹出弹框,方便阅读
         }
 
+        if rate_limiter is not None:
+            rate_limiter.acquire("bark", account)
+
         try:
-            response = requests.post(
+            response = http.post(
                 api_endpoint,
                 json=payload,
                 proxies=proxies,
@@ -1099,7 +1390,7 @@ def send_to_bark(
                 if result.get("code") == 200:
                     print(f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次发送成功 [{report_type}]")
                     success_count += 1
-                    # 批次间间隔
+                    # 批次间最小间隔：反向推送依赖到达时间排序，启用限流器时也保留（限流器只在此基础上额外等待）
                     if idx < total_batches:
                         time.sleep(batch_interval)
                 else:
@@ -1107,6 +1398,8 @@ def send_to_bark(
                         f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次发送失败 [{report_type}]，错误：{result.get('message', '未知错误')}"
                     )
             else:
+                if response.status_code == 429:
+                    _report_throttle(rate_limiter, "bark", account, response)
                 print(
                     f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
                 )
@@ -1153,6 +1446,10 @@ def send_to_slack(
     ai_analysis: Any = None,
     ai_push_mode: str = "both",
     standalone_data: Optional[Dict] = None,
+    batch_cache: Optional[BatchCache] = None,
+    outbox: Optional[NotificationOutbox] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    session: Optional[requests.Session] = None,
 ) -> bool:
     """
     发送到 Slack（支持分批发送，使用 mrkdwn 格式，支持热榜+RSS合并+独立展示区）
@@ -1170,6 +1467,10 @@ def send_to_slack(
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        batch_cache: 分批结果缓存（可选，由调度器在单次分发内共享）
+        outbox: 推送发件箱（可选，批次持久化并支持断点续发）
+        rate_limiter: 推送限流器（可选，替代固定批次间隔）
+        session: HTTP 会话（可选，由调度器按渠道复用连接）
 
     Returns:
         bool: 发送是否成功
@@ -1179,75 +1480,99 @@ def send_to_slack(
     if proxy_url:
         proxies = {"http": proxy_url, "https": proxy_url}
 
+    # 复用调度器提供的会话（keep-alive），未提供时退回 requests 模块级接口
+    http = session if session is not None else requests
+
     # 日志前缀
     log_prefix = f"Slack{account_label}" if account_label else "Slack"
 
-    # 渲染 AI 分析内容（如果有），合并到主内容中
-    ai_content = None
-    ai_stats = None
-    if ai_analysis:
-        ai_content = _render_ai_analysis(ai_analysis, "slack", ai_push_mode)
-        # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
-        if getattr(ai_analysis, "success", False):
-            ai_stats = {
-                "total_news": getattr(ai_analysis, "total_news", 0),
-                "analyzed_news": getattr(ai_analysis, "analyzed_news", 0),
-                "max_news_limit": getattr(ai_analysis, "max_news_limit", 0),
-                "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
-                "rss_count": getattr(ai_analysis, "rss_count", 0),
-            }
-
-    # 获取分批内容，预留批次头部空间
-    header_reserve = get_max_batch_header_size("slack")
-    batches = split_content_func(
-        report_data, "slack", update_info, max_bytes=batch_size - header_reserve, mode=mode,
-        rss_items=rss_items,
-        rss_new_items=rss_new_items,
-        ai_content=ai_content,
-        standalone_data=standalone_data,
-        ai_stats=ai_stats,
-        report_type=report_type,
-    )
+    def build_batches() -> List[str]:
+        # 渲染 AI 分析内容（如果有），合并到主内容中
+        ai_content = None
+        ai_stats = None
+        if ai_analysis:
+            ai_content = _render_ai_analysis(ai_analysis, "slack", ai_push_mode)
+            # 提取 AI 分析统计数据（只要 AI 分析成功就显示）
+            if getattr(ai_analysis, "success", False):
+                ai_stats = {
+                    "total_news": getattr(ai_analysis, "total_news", 0),
+                    "analyzed_news": getattr(ai_analysis, "analyzed_news", 0),
+                    "max_news_limit": getattr(ai_analysis, "max_news_limit", 0),
+                    "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
+                    "rss_count": getattr(ai_analysis, "rss_count", 0),
+                }
+
+        # 获取分批内容，预留批次头部空间
+        header_reserve = get_max_batch_header_size("slack")
+        batches = split_content_func(
+            report_data, "slack", update_info, max_bytes=batch_size - header_reserve, mode=mode,
+            rss_items=rss_items,
+            rss_new_items=rss_new_items,
+            ai_content=ai_content,
+            standalone_data=standalone_data,
+            ai_stats=ai_stats,
+            report_type=report_type,
+        )
 
-    # 统一添加批次头部（已预留空间，不会超限）
-    batches = add_batch_headers(batches, "slack", batch_size)
+        # 统一添加批次头部（已预留空间，不会超限）
+        batches = add_batch_headers(batches, "slack", batch_size)
+        return batches
+
+    # 同一次分发中输入相同的账号共用分批结果
+    if batch_cache is not None:
+        batches = batch_cache.get_or_build(
+            "slack", batch_size,
+            (report_data, report_type, update_info, mode, rss_items, rss_new_items,
+             ai_analysis, ai_push_mode, standalone_data),
+            build_batches,
+        )
+    else:
+        batches = build_batches()
 
     print(f"{log_prefix}消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
-    for i, batch_content in enumerate(batches, 1):
+    account = NotificationOutbox.account_key(webhook_url)
+
+    # 单批次发送（由发件箱续发时也使用）
+    def post_batch(i: int, total: int, batch_content: str, report_type: str) -> bool:
         # 转换 Markdown 到 mrkdwn 格式
         mrkdwn_content = convert_markdown_to_mrkdwn(batch_content)
 
         content_size = len(mrkdwn_content.encode("utf-8"))
         print(
-            f"发送{log_prefix}第 {i}/{len(batches)} 批次，大小：{content_size} 字节 [{report_type}]"
+            f"发送{log_prefix}第 {i}/{total} 批次，大小：{content_size} 字节 [{report_type}]"
         )
 
         # 构建 Slack payload（使用简单的 text 字段，支持 mrkdwn）
         payload = {"text": mrkdwn_content}
 
         try:
-            response = requests.post(
+            response = http.post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
 
             # Slack Incoming Webhooks 成功时返回 "ok" 文本
             if response.status_code == 200 and response.text == "ok":
-                print(f"{log_prefix}第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                # 批次间间隔
-                if i < len(batches):
-                    time.sleep(batch_interval)
+                print(f"{log_prefix}第 {i}/{total} 批次发送成功 [{report_type}]")
+                return True
             else:
+                if response.status_code == 429:
+                    _report_throttle(rate_limiter, "slack", account, response)
                 error_msg = response.text if response.text else f"状态码：{response.status_code}"
                 print(
-                    f"{log_prefix}第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{error_msg}"
+                    f"{log_prefix}第 {i}/{total} 批次发送失败 [{report_type}]，错误：{error_msg}"
                 )
                 return False
         except Exception as e:
-            print(f"{log_prefix}第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
+            print(f"{log_prefix}第 {i}/{total} 批次发送出错 [{report_type}]：{e}")
             return False
 
+    if not deliver_batches(
+        batches, post_batch, batch_interval, outbox,
+        "slack", account, report_type, log_prefix, rate_limiter,
+    ):
+        return False
+
     print(f"{log_prefix}所有 {len(batches)} 批次发送完成 [{report_type}]")
 
     return True
@@ -1271,6 +1596,10 @@ def send_to_generic_webhook(
     ai_analysis: Any = None,
     ai_push_mode: str = "both",
     standalone_data: Optional[Dict] = None,
+    batch_cache: Optional[BatchCache] = None,
+    outbox: Optional[NotificationOutbox] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    session: Optional[requests.Session] = None,
 ) -> bool:
     """
     发送到通用 Webhook（支持分批发送，支持自定义 JSON 模板，支持热榜+RSS合并+独立展示区）
@@ -1289,6 +1618,10 @@ def send_to_generic_webhook(
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        batch_cache: 分批结果缓存（可选，由调度器在单次分发内共享）
+        outbox: 推送发件箱（可选，批次持久化并支持断点续发）
+        rate_limiter: 推送限流器（可选，替代固定批次间隔）
+        session: HTTP 会话（可选，由调度器按渠道复用连接）
 
     Returns:
         bool: 发送是否成功
@@ -1301,49 +1634,67 @@ def send_to_generic_webhook(
     if proxy_url:
         proxies = {"http": proxy_url, "https": proxy_url}
 
+    # 复用调度器提供的会话（keep-alive），未提供时退回 requests 模块级接口
+    http = session if session is not None else requests
+
     # 日志前缀
     log_prefix = f"通用Webhook{account_label}" if account_label else "通用Webhook"
 
-    # 渲染 AI 分析内容（如果有）
-    ai_content = None
-    ai_stats = None
-    if ai_analysis:
-        # 通用 Webhook 使用 markdown 格式渲染 AI 分析
-        ai_content = _render_ai_analysis(ai_analysis, "wework", ai_push_mode)
-        # 提取 AI 分析统计数据
-        if getattr(ai_analysis, "success", False):
-            ai_stats = {
-                "total_news": getattr(ai_analysis, "total_news", 0),
-                "analyzed_news": getattr(ai_analysis, "analyzed_news", 0),
-                "max_news_limit": getattr(ai_analysis, "max_news_limit", 0),
-                "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
-                "rss_count": getattr(ai_analysis, "rss_count", 0),
-            }
-
-    # 获取分批内容
-    # 使用 'wework' 作为 format_type 以获取 markdown 格式的通用输出
-    # 预留一定空间给模板外壳
-    template_overhead = 200 
-    batches = split_content_func(
-        report_data, "wework", update_info, max_bytes=batch_size - template_overhead, mode=mode,
-        rss_items=rss_items,
-        rss_new_items=rss_new_items,
-        ai_content=ai_content,
-        standalone_data=standalone_data,
-        ai_stats=ai_stats,
-        report_type=report_type,
-    )
+    def build_batches() -> List[str]:
+        # 渲染 AI 分析内容（如果有）
+        ai_content = None
+        ai_stats = None
+        if ai_analysis:
+            # 通用 Webhook 使用 markdown 格式渲染 AI 分析
+            ai_content = _render_ai_analysis(ai_analysis, "wework", ai_push_mode)
+            # 提取 AI 分析统计数据
+            if getattr(ai_analysis, "success", False):
+                ai_stats = {
+                    "total_news": getattr(ai_analysis, "total_news", 0),
+                    "analyzed_news": getattr(ai_analysis, "analyzed_news", 0),
+                    "max_news_limit": getattr(ai_analysis, "max_news_limit", 0),
+                    "hotlist_count": getattr(ai_analysis, "hotlist_count", 0),
+                    "rss_count": getattr(ai_analysis, "rss_count", 0),
+                }
+
+        # 获取分批内容
+        # 使用 'wework' 作为 format_type 以获取 markdown 格式的通用输出
+        # 预留一定空间给模板外壳
+        template_overhead = 200 
+        batches = split_content_func(
+            report_data, "wework", update_info, max_bytes=batch_size - template_overhead, mode=mode,
+            rss_items=rss_items,
+            rss_new_items=rss_new_items,
+            ai_content=ai_content,
+            standalone_data=standalone_data,
+            ai_stats=ai_stats,
+            report_type=report_type,
+        )
 
-    # 统一添加批次头部
-    batches = add_batch_headers(batches, "wework", batch_size)
+        # 统一添加批次头部
+        batches = add_batch_headers(batches, "wework", batch_size)
+        return batches
+
+    # 同一次分发中输入相同的账号共用分批结果
+    if batch_cache is not None:
+        batches = batch_cache.get_or_build(
+            "generic_webhook", batch_size,
+            (report_data, report_type, update_info, mode, rss_items, rss_new_items,
+             ai_analysis, ai_push_mode, standalone_data),
+            build_batches,
+        )
+    else:
+        batches = build_batches()
 
     print(f"{log_prefix}消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
-    for i, batch_content in enumerate(batches, 1):
+    account = NotificationOutbox.account_key(webhook_url)
+
+    # 单批次发送（由发件箱续发时也使用）
+    def post_batch(i: int, total: int, batch_content: str, report_type: str) -> bool:
         content_size = len(batch_content.encode("utf-8"))
         print(
-            f"发送{log_prefix}第 {i}/{len(batches)} 批次，大小：{content_size} 字节 [{report_type}]"
+            f"发送{log_prefix}第 {i}/{total} 批次，大小：{content_size} 字节 [{report_type}]"
         )
 
         try:
@@ -1367,23 +1718,30 @@ def send_to_generic_webhook(
                 # 默认格式
                 payload = {"title": report_type, "content": batch_content}
 
-            response = requests.post(
+            response = http.post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             
             if response.status_code >= 200 and response.status_code < 300:
-                print(f"{log_prefix}第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                if i < len(batches):
-                    time.sleep(batch_interval)
+                print(f"{log_prefix}第 {i}/{total} 批次发送成功 [{report_type}]")
+                return True
             else:
+                if response.status_code == 429:
+                    _report_throttle(rate_limiter, "generic_webhook", account, response)
                 print(
-                    f"{log_prefix}第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}, 响应: {response.text}"
+                    f"{log_prefix}第 {i}/{total} 批次发送失败 [{report_type}]，状态码：{response.status_code}, 响应: {response.text}"
                 )
                 return False
         except Exception as e:
-            print(f"{log_prefix}第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
+            print(f"{log_prefix}第 {i}/{total} 批次发送出错 [{report_type}]：{e}")
             return False
 
+    if not deliver_batches(
+        batches, post_batch, batch_interval, outbox,
+        "generic_webhook", account, report_type, log_prefix, rate_limiter,
+    ):
+        return False
+
     print(f"{log_prefix}所有 {len(batches)} 批次发送完成 [{report_type}]")
 
     return True
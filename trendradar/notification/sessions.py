@@ -0,0 +1,71 @@
+# coding=utf-8
+"""
+HTTP 会话池模块
+
+按推送渠道账号维护 requests.Session，使同一账号的多个批次以及热榜/RSS 推送
+复用已建立的 TLS 连接（keep-alive），避免每个批次重新握手。
+requests.Session 不保证线程安全，调度器并发发送的各账号使用各自的会话。
+"""
+
+import threading
+from typing import Dict, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class SessionPool:
+    """
+    按渠道账号划分的 HTTP 会话池（线程安全）
+
+    每个 (渠道, 账号) 一个 Session：同一账号的批次按顺序发送，会话不会被多个线程同时使用；
+    未指定账号时（如按顺序逐账号发送的 RSS 推送）同一渠道共用一个会话。
+    """
+
+    def __init__(self, pool_size: int = 4):
+        """
+        初始化会话池
+
+        Args:
+            pool_size: 每个主机保留的最大连接数
+        """
+        self.pool_size = max(int(pool_size), 1)
+        self._sessions: Dict[Tuple[str, str], requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def _create_session(self) -> requests.Session:
+        """创建请求会话"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def get(self, channel: str, account: str = "") -> requests.Session:
+        """
+        获取渠道账号对应的会话（不存在时创建）
+
+        Args:
+            channel: 渠道名称
+            account: 账号摘要（见 NotificationOutbox.account_key），为空时使用渠道共用的会话
+
+        Returns:
+            requests.Session
+        """
+        key = (channel, account)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._create_session()
+                self._sessions[key] = session
+            return session
+
+    def close(self) -> None:
+        """关闭所有会话及其连接"""
+        with self._lock:
+            for (channel, _), session in self._sessions.items():
+                try:
+                    session.close()
+                except Exception as e:
+                    print(f"[推送] 关闭 {channel} 会话失败: {e}")
+            self._sessions.clear()
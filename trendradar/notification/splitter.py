@@ -22,6 +22,41 @@ DEFAULT_BATCH_SIZES = {
 }
 
 
+def _utf8_len(text: str) -> int:
+    """计算字符串的 UTF-8 字节数（纯 ASCII 时无需编码）"""
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-8"))
+
+
+class _BatchBuffer:
+    """批次缓冲区
+
+    以片段列表累积批次内容，并维护累计 UTF-8 字节数。
+    追加片段只计算该片段自身的字节数，批次完成时才拼接一次，
+    避免每追加一行都重新拼接并编码整个批次。
+    """
+
+    __slots__ = ("_parts", "size")
+
+    def __init__(self, *fragments: str):
+        self._parts: List[str] = []
+        self.size = 0
+        for fragment in fragments:
+            self.append(fragment)
+
+    def append(self, fragment: str, size: Optional[int] = None) -> None:
+        """追加片段（size 为已计算的片段字节数，可选）"""
+        if not fragment:
+            return
+        self._parts.append(fragment)
+        self.size += _utf8_len(fragment) if size is None else size
+
+    def render(self, suffix: str = "") -> str:
+        """拼接为最终批次内容"""
+        return "".join(self._parts) + suffix
+
+
 def split_content_into_batches(
     report_data: Dict,
     format_type: str,
@@ -51,6 +86,7 @@ def split_content_into_batches(
 
     Args:
         report_data: 报告数据字典，包含 stats, new_titles, failed_ids, total_new_count
+            （增量推送时可包含 unchanged_summary: {"groups": 未变化词组数, "titles": 已推送条数}）
         format_type: 格式类型 (feishu, dingtalk, wework, telegram, ntfy, bark, slack)
         update_info: 版本更新信息（可选）
         max_bytes: 最大字节数（可选，如果不指定则使用默认配置）
@@ -170,6 +206,8 @@ def split_content_into_batches(
         if update_info:
             base_footer += f"\n_TrendRadar 发现新版本 *{update_info['remote_version']}*，当前 *{update_info['current_version']}_"
 
+    footer_size = _utf8_len(base_footer)
+
     # 根据 display_mode 选择统计标题
     stats_title = "热点词汇统计" if display_mode == "keyword" else "热点新闻统计"
     stats_header = ""
@@ -187,7 +225,7 @@ def split_content_into_batches(
         elif format_type == "slack":
             stats_header = f"📊 *{stats_title}* (共 {total_hotlist_count} 条)\n\n"
 
-    current_batch = base_header
+    current_batch = _BatchBuffer(base_header)
     current_batch_has_content = False
 
     # 当没有热榜数据时的处理
@@ -196,6 +234,7 @@ def split_content_into_batches(
         not report_data["stats"]
         and not report_data["new_titles"]
         and not report_data["failed_ids"]
+        and not report_data.get("unchanged_summary")  # 增量推送时仍需提示未变化的词组
         and not ai_content  # 有 AI 内容时不返回"暂无匹配"
         and not rss_items  # 有 RSS 内容时也不返回
         and not standalone_data  # 有独立展示区数据时也不返回
@@ -215,22 +254,19 @@ def split_content_into_batches(
     def process_stats_section(current_batch, current_batch_has_content, batches):
         """处理热点词汇统计"""
         if not report_data["stats"]:
-            return current_batch, current_batch_has_content, batches
+            return process_unchanged_summary(current_batch, current_batch_has_content, batches)
 
         total_count = len(report_data["stats"])
 
         # 添加统计标题
-        test_content = current_batch + stats_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            < max_bytes
-        ):
-            current_batch = test_content
+        fragment_size = _utf8_len(stats_header)
+        if current_batch.size + fragment_size + footer_size < max_bytes:
+            current_batch.append(stats_header, fragment_size)
             current_batch_has_content = True
         else:
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + stats_header
+                batches.append(current_batch.render(base_footer))
+            current_batch = _BatchBuffer(base_header, stats_header)
             current_batch_has_content = True
 
         # 逐个处理词组（确保词组标题+第一条新闻的原子性）
@@ -340,20 +376,17 @@ def split_content_into_batches(
 
             # 原子性检查：词组标题+第一条新闻必须一起处理
             word_with_first_news = word_header + first_news_line
-            test_content = current_batch + word_with_first_news
+            fragment_size = _utf8_len(word_with_first_news)
 
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
+            if current_batch.size + fragment_size + footer_size >= max_bytes:
                 # 当前批次容纳不下，开启新批次
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + stats_header + word_with_first_news
+                    batches.append(current_batch.render(base_footer))
+                current_batch = _BatchBuffer(base_header, stats_header, word_with_first_news)
                 current_batch_has_content = True
                 start_index = 1
             else:
-                current_batch = test_content
+                current_batch.append(word_with_first_news, fragment_size)
                 current_batch_has_content = True
                 start_index = 1
 
@@ -391,17 +424,14 @@ def split_content_into_batches(
                 if j < len(stat["titles"]) - 1:
                     news_line += "\n"
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
+                fragment_size = _utf8_len(news_line)
+                if current_batch.size + fragment_size + footer_size >= max_bytes:
                     if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + stats_header + word_header + news_line
+                        batches.append(current_batch.render(base_footer))
+                    current_batch = _BatchBuffer(base_header, stats_header, word_header, news_line)
                     current_batch_has_content = True
                 else:
-                    current_batch = test_content
+                    current_batch.append(news_line, fragment_size)
                     current_batch_has_content = True
 
             # 词组间分隔符
@@ -420,12 +450,38 @@ def split_content_into_batches(
                 elif format_type == "slack":
                     separator = f"\n\n"
 
-                test_content = current_batch + separator
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    < max_bytes
-                ):
-                    current_batch = test_content
+                fragment_size = _utf8_len(separator)
+                if current_batch.size + fragment_size + footer_size < max_bytes:
+                    current_batch.append(separator, fragment_size)
+
+        return process_unchanged_summary(current_batch, current_batch_has_content, batches)
+
+    # 定义处理未变化词组摘要的函数（增量推送模式）
+    def process_unchanged_summary(current_batch, current_batch_has_content, batches):
+        """处理未变化词组摘要行"""
+        unchanged = report_data.get("unchanged_summary")
+        if not unchanged:
+            return current_batch, current_batch_has_content, batches
+
+        label = "关键词" if display_mode == "keyword" else "平台"
+        summary = f"其余 {unchanged['groups']} 个{label}无新增（此前已推送 {unchanged['titles']} 条）"
+        if format_type == "feishu":
+            summary_line = f"📎 <font color='grey'>{summary}</font>\n"
+        elif format_type == "slack":
+            summary_line = f"📎 _{summary}_\n"
+        else:
+            summary_line = f"📎 {summary}\n"
+        if report_data["stats"]:
+            summary_line = "\n" + summary_line
+
+        fragment_size = _utf8_len(summary_line)
+        if current_batch.size + fragment_size + footer_size >= max_bytes:
+            if current_batch_has_content:
+                batches.append(current_batch.render(base_footer))
+            current_batch = _BatchBuffer(base_header, summary_line)
+        else:
+            current_batch.append(summary_line, fragment_size)
+        current_batch_has_content = True
 
         return current_batch, current_batch_has_content, batches
 
@@ -451,17 +507,14 @@ def split_content_into_batches(
         elif format_type == "slack":
             new_header = f"\n\n🆕 *本次新增热点新闻* (共 {report_data['total_new_count']} 条)\n\n"
 
-        test_content = current_batch + new_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
+        fragment_size = _utf8_len(new_header)
+        if current_batch.size + fragment_size + footer_size >= max_bytes:
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header
+                batches.append(current_batch.render(base_footer))
+            current_batch = _BatchBuffer(base_header, new_header)
             current_batch_has_content = True
         else:
-            current_batch = test_content
+            current_batch.append(new_header, fragment_size)
             current_batch_has_content = True
 
         # 逐个处理新增新闻来源
@@ -514,19 +567,16 @@ def split_content_into_batches(
 
             # 原子性检查：来源标题+第一条新闻
             source_with_first_news = source_header + first_news_line
-            test_content = current_batch + source_with_first_news
+            fragment_size = _utf8_len(source_with_first_news)
 
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
+            if current_batch.size + fragment_size + footer_size >= max_bytes:
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_with_first_news
+                    batches.append(current_batch.render(base_footer))
+                current_batch = _BatchBuffer(base_header, new_header, source_with_first_news)
                 current_batch_has_content = True
                 start_index = 1
             else:
-                current_batch = test_content
+                current_batch.append(source_with_first_news, fragment_size)
                 current_batch_has_content = True
                 start_index = 1
 
@@ -561,20 +611,17 @@ def split_content_into_batches(
 
                 news_line = f"  {j + 1}. {formatted_title}\n"
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
+                fragment_size = _utf8_len(news_line)
+                if current_batch.size + fragment_size + footer_size >= max_bytes:
                     if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + new_header + source_header + news_line
+                        batches.append(current_batch.render(base_footer))
+                    current_batch = _BatchBuffer(base_header, new_header, source_header, news_line)
                     current_batch_has_content = True
                 else:
-                    current_batch = test_content
+                    current_batch.append(news_line, fragment_size)
                     current_batch_has_content = True
 
-            current_batch += "\n"
+            current_batch.append("\n")
 
         return current_batch, current_batch_has_content, batches
 
@@ -645,17 +692,14 @@ def split_content_into_batches(
         elif format_type == "dingtalk":
             failed_header = f"\n---\n\n⚠️ **数据获取失败的平台：**\n\n"
 
-        test_content = current_batch + failed_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
+        fragment_size = _utf8_len(failed_header)
+        if current_batch.size + fragment_size + footer_size >= max_bytes:
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + failed_header
+                batches.append(current_batch.render(base_footer))
+            current_batch = _BatchBuffer(base_header, failed_header)
             current_batch_has_content = True
         else:
-            current_batch = test_content
+            current_batch.append(failed_header, fragment_size)
             current_batch_has_content = True
 
         for i, id_value in enumerate(report_data["failed_ids"], 1):
@@ -666,17 +710,14 @@ def split_content_into_batches(
             else:
                 failed_line = f"  • {id_value}\n"
 
-            test_content = current_batch + failed_line
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
+            fragment_size = _utf8_len(failed_line)
+            if current_batch.size + fragment_size + footer_size >= max_bytes:
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + failed_header + failed_line
+                    batches.append(current_batch.render(base_footer))
+                current_batch = _BatchBuffer(base_header, failed_header, failed_line)
                 current_batch_has_content = True
             else:
-                current_batch = test_content
+                current_batch.append(failed_line, fragment_size)
                 current_batch_has_content = True
 
     # 处理 AI 分析内容（放在最后，footer 之前）
@@ -693,30 +734,21 @@ def split_content_into_batches(
             ai_separator = "\n\n"
 
         # 尝试将 AI 内容添加到当前批次
-        test_content = current_batch + ai_separator + ai_content
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            < max_bytes
-        ):
-            current_batch = test_content
+        fragment_size = _utf8_len(ai_separator + ai_content)
+        if current_batch.size + fragment_size + footer_size < max_bytes:
+            current_batch.append(ai_separator + ai_content, fragment_size)
             current_batch_has_content = True
         else:
             # 当前批次容纳不下，开启新批次
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            # AI 内容可能很长，需要考虑是否需要进一步分割
-            ai_with_header = base_header + ai_content
-            if len(ai_with_header.encode("utf-8")) + len(base_footer.encode("utf-8")) < max_bytes:
-                current_batch = ai_with_header
-                current_batch_has_content = True
-            else:
-                # AI 内容过长，直接添加（可能会超限，但保持完整性）
-                current_batch = ai_with_header
-                current_batch_has_content = True
+                batches.append(current_batch.render(base_footer))
+            # AI 内容单独开启新批次（过长时也直接添加，可能会超限，但保持完整性）
+            current_batch = _BatchBuffer(base_header, ai_content)
+            current_batch_has_content = True
 
     # 完成最后批次
     if current_batch_has_content:
-        batches.append(current_batch + base_footer)
+        batches.append(current_batch.render(base_footer))
 
     return batches
 
@@ -728,7 +760,7 @@ def _process_rss_stats_section(
     base_header: str,
     base_footer: str,
     max_bytes: int,
-    current_batch: str,
+    current_batch: "_BatchBuffer",
     current_batch_has_content: bool,
     batches: List[str],
     timezone: str = "Asia/Shanghai",
@@ -743,7 +775,7 @@ def _process_rss_stats_section(
         base_header: 基础头部
         base_footer: 基础尾部
         max_bytes: 最大字节数
-        current_batch: 当前批次内容
+        current_batch: 当前批次缓冲区
         current_batch_has_content: 当前批次是否有内容
         batches: 已完成的批次列表
         timezone: 时区名称
@@ -771,15 +803,17 @@ def _process_rss_stats_section(
     else:
         rss_header = f"\n\n📰 **RSS 订阅统计** (共 {total_items} 条)\n\n"
 
+    footer_size = _utf8_len(base_footer)
+
     # 添加 RSS 标题
-    test_content = current_batch + rss_header
-    if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) < max_bytes:
-        current_batch = test_content
+    fragment_size = _utf8_len(rss_header)
+    if current_batch.size + fragment_size + footer_size < max_bytes:
+        current_batch.append(rss_header, fragment_size)
         current_batch_has_content = True
     else:
         if current_batch_has_content:
-            batches.append(current_batch + base_footer)
-        current_batch = base_header + rss_header
+            batches.append(current_batch.render(base_footer))
+        current_batch = _BatchBuffer(base_header, rss_header)
         current_batch_has_content = True
 
     # 逐个处理关键词组（与热榜一致）
@@ -858,16 +892,16 @@ def _process_rss_stats_section(
 
         # 原子性检查：关键词标题 + 第一条新闻必须一起处理
         word_with_first_news = word_header + first_news_line
-        test_content = current_batch + word_with_first_news
+        fragment_size = _utf8_len(word_with_first_news)
 
-        if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
+        if current_batch.size + fragment_size + footer_size >= max_bytes:
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + rss_header + word_with_first_news
+                batches.append(current_batch.render(base_footer))
+            current_batch = _BatchBuffer(base_header, rss_header, word_with_first_news)
             current_batch_has_content = True
             start_index = 1
         else:
-            current_batch = test_content
+            current_batch.append(word_with_first_news, fragment_size)
             current_batch_has_content = True
             start_index = 1
 
@@ -893,14 +927,14 @@ def _process_rss_stats_section(
             if j < len(stat["titles"]) - 1:
                 news_line += "\n"
 
-            test_content = current_batch + news_line
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
+            fragment_size = _utf8_len(news_line)
+            if current_batch.size + fragment_size + footer_size >= max_bytes:
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + rss_header + word_header + news_line
+                    batches.append(current_batch.render(base_footer))
+                current_batch = _BatchBuffer(base_header, rss_header, word_header, news_line)
                 current_batch_has_content = True
             else:
-                current_batch = test_content
+                current_batch.append(news_line, fragment_size)
                 current_batch_has_content = True
 
         # 关键词间分隔符
@@ -919,9 +953,9 @@ def _process_rss_stats_section(
             elif format_type == "slack":
                 separator = "\n\n"
 
-            test_content = current_batch + separator
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) < max_bytes:
-                current_batch = test_content
+            fragment_size = _utf8_len(separator)
+            if current_batch.size + fragment_size + footer_size < max_bytes:
+                current_batch.append(separator, fragment_size)
 
     return current_batch, current_batch_has_content, batches
 
@@ -933,7 +967,7 @@ def _process_rss_new_titles_section(
     base_header: str,
     base_footer: str,
     max_bytes: int,
-    current_batch: str,
+    current_batch: "_BatchBuffer",
     current_batch_has_content: bool,
     batches: List[str],
     timezone: str = "Asia/Shanghai",
@@ -948,7 +982,7 @@ def _process_rss_new_titles_section(
         base_header: 基础头部
         base_footer: 基础尾部
         max_bytes: 最大字节数
-        current_batch: 当前批次内容
+        current_batch: 当前批次缓冲区
         current_batch_has_content: 当前批次是否有内容
         batches: 已完成的批次列表
         timezone: 时区名称
@@ -989,15 +1023,17 @@ def _process_rss_new_titles_section(
     elif format_type == "slack":
         new_header = f"\n\n🆕 *RSS 本次新增* (共 {total_items} 条)\n\n"
 
+    footer_size = _utf8_len(base_footer)
+
     # 添加 RSS 新增标题
-    test_content = current_batch + new_header
-    if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
+    fragment_size = _utf8_len(new_header)
+    if current_batch.size + fragment_size + footer_size >= max_bytes:
         if current_batch_has_content:
-            batches.append(current_batch + base_footer)
-        current_batch = base_header + new_header
+            batches.append(current_batch.render(base_footer))
+        current_batch = _BatchBuffer(base_header, new_header)
         current_batch_has_content = True
     else:
-        current_batch = test_content
+        current_batch.append(new_header, fragment_size)
         current_batch_has_content = True
 
     # 按来源分组显示（与热榜新增格式一致）
@@ -1044,16 +1080,16 @@ def _process_rss_new_titles_section(
 
         # 原子性检查：来源标题 + 第一条新闻必须一起处理
         source_with_first_news = source_header + first_news_line
-        test_content = current_batch + source_with_first_news
+        fragment_size = _utf8_len(source_with_first_news)
 
-        if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
+        if current_batch.size + fragment_size + footer_size >= max_bytes:
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header + source_with_first_news
+                batches.append(current_batch.render(base_footer))
+            current_batch = _BatchBuffer(base_header, new_header, source_with_first_news)
             current_batch_has_content = True
             start_index = 1
         else:
-            current_batch = test_content
+            current_batch.append(source_with_first_news, fragment_size)
             current_batch_has_content = True
             start_index = 1
 
@@ -1078,18 +1114,18 @@ def _process_rss_new_titles_section(
 
             news_line = f"  {j + 1}. {formatted_title}\n"
 
-            test_content = current_batch + news_line
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
+            fragment_size = _utf8_len(news_line)
+            if current_batch.size + fragment_size + footer_size >= max_bytes:
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_header + news_line
+                    batches.append(current_batch.render(base_footer))
+                current_batch = _BatchBuffer(base_header, new_header, source_header, news_line)
                 current_batch_has_content = True
             else:
-                current_batch = test_content
+                current_batch.append(news_line, fragment_size)
                 current_batch_has_content = True
 
         # 来源间添加空行（与热榜新增格式一致）
-        current_batch += "\n"
+        current_batch.append("\n")
 
     return current_batch, current_batch_has_content, batches
 
@@ -1155,7 +1191,7 @@ def _process_standalone_section(
     base_header: str,
     base_footer: str,
     max_bytes: int,
-    current_batch: str,
+    current_batch: "_BatchBuffer",
     current_batch_has_content: bool,
     batches: List[str],
     timezone: str = "Asia/Shanghai",
@@ -1177,7 +1213,7 @@ def _process_standalone_section(
         base_header: 基础头部
         base_footer: 基础尾部
         max_bytes: 最大字节数
-        current_batch: 当前批次内容
+        current_batch: 当前批次缓冲区
         current_batch_has_content: 当前批次是否有内容
         batches: 已完成的批次列表
         timezone: 时区名称
@@ -1212,15 +1248,17 @@ def _process_standalone_section(
     else:
         section_header = f"\n\n📋 **独立展示区** (共 {total_items} 条)\n\n"
 
+    footer_size = _utf8_len(base_footer)
+
     # 添加区块标题
-    test_content = current_batch + section_header
-    if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) < max_bytes:
-        current_batch = test_content
+    fragment_size = _utf8_len(section_header)
+    if current_batch.size + fragment_size + footer_size < max_bytes:
+        current_batch.append(section_header, fragment_size)
         current_batch_has_content = True
     else:
         if current_batch_has_content:
-            batches.append(current_batch + base_footer)
-        current_batch = base_header + section_header
+            batches.append(current_batch.render(base_footer))
+        current_batch = _BatchBuffer(base_header, section_header)
         current_batch_has_content = True
 
     # 处理热榜平台
@@ -1252,16 +1290,16 @@ def _process_standalone_section(
 
         # 原子性检查
         platform_with_first = platform_header + first_item_line
-        test_content = current_batch + platform_with_first
+        fragment_size = _utf8_len(platform_with_first)
 
-        if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
+        if current_batch.size + fragment_size + footer_size >= max_bytes:
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + section_header + platform_with_first
+                batches.append(current_batch.render(base_footer))
+            current_batch = _BatchBuffer(base_header, section_header, platform_with_first)
             current_batch_has_content = True
             start_index = 1
         else:
-            current_batch = test_content
+            current_batch.append(platform_with_first, fragment_size)
             current_batch_has_content = True
             start_index = 1
 
@@ -1269,17 +1307,17 @@ def _process_standalone_section(
         for j in range(start_index, len(items)):
             item_line = _format_standalone_platform_item(items[j], j + 1, format_type, rank_threshold)
 
-            test_content = current_batch + item_line
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
+            fragment_size = _utf8_len(item_line)
+            if current_batch.size + fragment_size + footer_size >= max_bytes:
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + section_header + platform_header + item_line
+                    batches.append(current_batch.render(base_footer))
+                current_batch = _BatchBuffer(base_header, section_header, platform_header, item_line)
                 current_batch_has_content = True
             else:
-                current_batch = test_content
+                current_batch.append(item_line, fragment_size)
                 current_batch_has_content = True
 
-        current_batch += "\n"
+        current_batch.append("\n")
 
     # 处理 RSS 源
     for feed in rss_feeds:
@@ -1310,16 +1348,16 @@ def _process_standalone_section(
 
         # 原子性检查
         feed_with_first = feed_header + first_item_line
-        test_content = current_batch + feed_with_first
+        fragment_size = _utf8_len(feed_with_first)
 
-        if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
+        if current_batch.size + fragment_size + footer_size >= max_bytes:
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + section_header + feed_with_first
+                batches.append(current_batch.render(base_footer))
+            current_batch = _BatchBuffer(base_header, section_header, feed_with_first)
             current_batch_has_content = True
             start_index = 1
         else:
-            current_batch = test_content
+            current_batch.append(feed_with_first, fragment_size)
             current_batch_has_content = True
             start_index = 1
 
@@ -1327,17 +1365,17 @@ def _process_standalone_section(
         for j in range(start_index, len(items)):
             item_line = _format_standalone_rss_item(items[j], j + 1, format_type, timezone)
 
-            test_content = current_batch + item_line
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
+            fragment_size = _utf8_len(item_line)
+            if current_batch.size + fragment_size + footer_size >= max_bytes:
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + section_header + feed_header + item_line
+                    batches.append(current_batch.render(base_footer))
+                current_batch = _BatchBuffer(base_header, section_header, feed_header, item_line)
                 current_batch_has_content = True
             else:
-                current_batch = test_content
+                current_batch.append(item_line, fragment_size)
                 current_batch_has_content = True
 
-        current_batch += "\n"
+        current_batch.append("\n")
 
     return current_batch, current_batch_has_content, batches
 
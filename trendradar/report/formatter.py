@@ -2,18 +2,152 @@
 """
 平台标题格式化模块
 
-提供多平台标题格式化功能
+提供多平台标题格式化功能，以及单次运行内的标题行片段缓存：
+同一标题在同一格式下（来源/关键词、排名、时间、次数均相同）只渲染一次，
+推送分批、各渠道渲染与 HTML 报告共用。
 """
 
-from typing import Dict
+from typing import Callable, Dict, Optional, Tuple
 
 from trendradar.report.helpers import clean_title, html_escape, format_rank_display
 
 
+class TitleFragmentCache:
+    """
+    标题行片段缓存
+
+    缓存键由格式与影响渲染结果的全部标题字段组成（标题、来源、链接、排名元组、
+    高亮阈值、时间显示、次数、是否新增、关键词标签），相同的键必然得到相同的片段，
+    因此不同报告数据（如当前榜单与当日汇总、各渠道的增量报告）中的相同标题也能命中。
+    由 AppContext 在单次运行内安装，运行结束后清空。
+
+    多个推送线程可并发使用：dict 的单次读写在 GIL 下是原子的，
+    并发渲染同一键时结果相同，后写入者覆盖即可，因此不加锁；命中统计在并发下为近似值。
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        platform: str, title_data: Dict, show_source: bool, show_keyword: bool
+    ) -> Tuple:
+        """生成标题行的缓存键"""
+        return (
+            platform,
+            show_source,
+            show_keyword,
+            title_data.get("title", ""),
+            title_data.get("source_name", ""),
+            title_data.get("url", ""),
+            title_data.get("mobile_url", ""),
+            tuple(title_data.get("ranks") or ()),
+            title_data.get("rank_threshold"),
+            title_data.get("time_display", ""),
+            title_data.get("count", 1),
+            bool(title_data.get("is_new")),
+            title_data.get("matched_keyword", "") if show_keyword else "",
+        )
+
+    def get_or_render(
+        self,
+        platform: str,
+        title_data: Dict,
+        show_source: bool,
+        show_keyword: bool,
+        render: Callable[[], str],
+    ) -> str:
+        """
+        获取缓存的片段，未命中时调用 render 生成
+
+        Args:
+            platform: 格式标识
+            title_data: 标题数据字典
+            show_source: 是否显示来源名称
+            show_keyword: 是否显示关键词标签
+            render: 渲染函数
+
+        Returns:
+            渲染后的片段
+        """
+        key = self.make_key(platform, title_data, show_source, show_keyword)
+        fragment = self._entries.get(key)
+        if fragment is None:
+            fragment = render()
+            self._entries[key] = fragment
+            self.misses += 1
+        else:
+            self.hits += 1
+        return fragment
+
+    def stats(self) -> Dict[str, int]:
+        """缓存统计：片段数、命中次数、渲染次数"""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        """清空缓存与统计"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# 当前运行安装的片段缓存（None 表示不缓存，每次直接渲染）
+_fragment_cache: Optional[TitleFragmentCache] = None
+
+
+def set_fragment_cache(cache: Optional[TitleFragmentCache]) -> Optional[TitleFragmentCache]:
+    """
+    安装（或移除）运行级标题片段缓存
+
+    Args:
+        cache: 片段缓存，None 表示停用
+
+    Returns:
+        之前安装的缓存
+    """
+    global _fragment_cache
+    previous = _fragment_cache
+    _fragment_cache = cache
+    return previous
+
+
+def get_fragment_cache() -> Optional[TitleFragmentCache]:
+    """获取当前安装的片段缓存"""
+    return _fragment_cache
+
+
+def cached_fragment(
+    platform: str,
+    title_data: Dict,
+    show_source: bool,
+    show_keyword: bool,
+    render: Callable[[], str],
+) -> str:
+    """
+    经运行级缓存渲染标题片段（未安装缓存时直接渲染）
+
+    Args:
+        platform: 格式标识
+        title_data: 标题数据字典
+        show_source: 是否显示来源名称
+        show_keyword: 是否显示关键词标签
+        render: 渲染函数
+
+    Returns:
+        渲染后的片段
+    """
+    cache = _fragment_cache
+    if cache is None:
+        return render()
+    return cache.get_or_render(platform, title_data, show_source, show_keyword, render)
+
+
 def format_title_for_platform(
     platform: str, title_data: Dict, show_source: bool = True, show_keyword: bool = False
 ) -> str:
-    """统一的标题格式化方法
+    """统一的标题格式化方法（已安装运行级片段缓存时，相同标题行只渲染一次）
 
     为不同平台生成对应格式的标题字符串。
 
@@ -44,6 +178,16 @@ def format_title_for_platform(
     Returns:
         格式化后的标题字符串
     """
+    return cached_fragment(
+        platform, title_data, show_source, show_keyword,
+        lambda: _render_title_for_platform(platform, title_data, show_source, show_keyword),
+    )
+
+
+def _render_title_for_platform(
+    platform: str, title_data: Dict, show_source: bool, show_keyword: bool
+) -> str:
+    """渲染单个标题行（format_title_for_platform 的实现，不经缓存）"""
     rank_display = format_rank_display(
         title_data["ranks"], title_data["rank_threshold"], platform
     )
@@ -6,12 +6,100 @@ HTML 报告渲染模块
 """
 
 from datetime import datetime
+from functools import partial
 from typing import Dict, List, Optional, Callable
 
+from trendradar.report.formatter import cached_fragment
 from trendradar.report.helpers import html_escape
 from trendradar.utils.time import convert_time_for_display
 
 
+def _render_stat_title_html(title_data: Dict, display_mode: str) -> str:
+    """渲染 HTML 报告中单条统计新闻的内容区（不含序号）
+
+    Args:
+        title_data: 标题数据字典
+        display_mode: 显示模式 ("keyword"=显示来源, "platform"=显示关键词)
+
+    Returns:
+        新闻内容区 HTML 片段
+    """
+    fragment_html = """
+                        <div class="news-content">
+                            <div class="news-header">"""
+
+    # 根据 display_mode 决定显示来源还是关键词
+    if display_mode == "keyword":
+        # keyword 模式：显示来源
+        fragment_html += f'<span class="source-name">{html_escape(title_data["source_name"])}</span>'
+    else:
+        # platform 模式：显示关键词
+        matched_keyword = title_data.get("matched_keyword", "")
+        if matched_keyword:
+            fragment_html += f'<span class="keyword-tag">[{html_escape(matched_keyword)}]</span>'
+
+    # 处理排名显示
+    ranks = title_data.get("ranks", [])
+    if ranks:
+        min_rank = min(ranks)
+        max_rank = max(ranks)
+        rank_threshold = title_data.get("rank_threshold", 10)
+
+        # 确定排名等级
+        if min_rank <= 3:
+            rank_class = "top"
+        elif min_rank <= rank_threshold:
+            rank_class = "high"
+        else:
+            rank_class = ""
+
+        if min_rank == max_rank:
+            rank_text = str(min_rank)
+        else:
+            rank_text = f"{min_rank}-{max_rank}"
+
+        fragment_html += f'<span class="rank-num {rank_class}">{rank_text}</span>'
+
+    # 处理时间显示
+    time_display = title_data.get("time_display", "")
+    if time_display:
+        # 简化时间显示格式，将波浪线替换为~
+        simplified_time = (
+            time_display.replace(" ~ ", "~")
+            .replace("[", "")
+            .replace("]", "")
+        )
+        fragment_html += (
+            f'<span class="time-info">{html_escape(simplified_time)}</span>'
+        )
+
+    # 处理出现次数
+    count_info = title_data.get("count", 1)
+    if count_info > 1:
+        fragment_html += f'<span class="count-info">{count_info}次</span>'
+
+    fragment_html += """
+                            </div>
+                            <div class="news-title">"""
+
+    # 处理标题和链接
+    escaped_title = html_escape(title_data["title"])
+    link_url = title_data.get("mobile_url") or title_data.get("url", "")
+
+    if link_url:
+        escaped_url = html_escape(link_url)
+        fragment_html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+    else:
+        fragment_html += escaped_title
+
+    fragment_html += """
+                            </div>
+                        </div>
+                    </div>"""
+
+    return fragment_html
+
+
 def render_html_content(
     report_data: Dict,
     total_titles: int,
@@ -761,78 +849,14 @@ def render_html_content(
 
                 stats_html += f"""
                     <div class="news-item {new_class}">
-                        <div class="news-number">{j}</div>
-                        <div class="news-content">
-                            <div class="news-header">"""
-
-                # 根据 display_mode 决定显示来源还是关键词
-                if display_mode == "keyword":
-                    # keyword 模式：显示来源
-                    stats_html += f'<span class="source-name">{html_escape(title_data["source_name"])}</span>'
-                else:
-                    # platform 模式：显示关键词
-                    matched_keyword = title_data.get("matched_keyword", "")
-                    if matched_keyword:
-                        stats_html += f'<span class="keyword-tag">[{html_escape(matched_keyword)}]</span>'
-
-                # 处理排名显示
-                ranks = title_data.get("ranks", [])
-                if ranks:
-                    min_rank = min(ranks)
-                    max_rank = max(ranks)
-                    rank_threshold = title_data.get("rank_threshold", 10)
-
-                    # 确定排名等级
-                    if min_rank <= 3:
-                        rank_class = "top"
-                    elif min_rank <= rank_threshold:
-                        rank_class = "high"
-                    else:
-                        rank_class = ""
-
-                    if min_rank == max_rank:
-                        rank_text = str(min_rank)
-                    else:
-                        rank_text = f"{min_rank}-{max_rank}"
-
-                    stats_html += f'<span class="rank-num {rank_class}">{rank_text}</span>'
-
-                # 处理时间显示
-                time_display = title_data.get("time_display", "")
-                if time_display:
-                    # 简化时间显示格式，将波浪线替换为~
-                    simplified_time = (
-                        time_display.replace(" ~ ", "~")
-                        .replace("[", "")
-                        .replace("]", "")
-                    )
-                    stats_html += (
-                        f'<span class="time-info">{html_escape(simplified_time)}</span>'
-                    )
-
-                # 处理出现次数
-                count_info = title_data.get("count", 1)
-                if count_info > 1:
-                    stats_html += f'<span class="count-info">{count_info}次</span>'
-
-                stats_html += """
-                            </div>
-                            <div class="news-title">"""
-
-                # 处理标题和链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
-
-                if link_url:
-                    escaped_url = html_escape(link_url)
-                    stats_html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
-                else:
-                    stats_html += escaped_title
-
-                stats_html += """
-                            </div>
-                        </div>
-                    </div>"""
+                        <div class="news-number">{j}</div>"""
+
+                # 标题行内容与序号无关，经运行级片段缓存渲染
+                stats_html += cached_fragment(
+                    "html_report", title_data,
+                    display_mode == "keyword", display_mode != "keyword",
+                    partial(_render_stat_title_html, title_data, display_mode),
+                )
 
             stats_html += """
                 </div>"""
@@ -14,6 +14,9 @@ from trendradar.storage.base import (
     NewsData,
     convert_crawl_results_to_news_data,
     convert_news_data_to_results,
+    news_data_to_result_views,
+    NewsDataView,
+    CurrentTitleInfoView,
 )
 from trendradar.storage.local import LocalStorageBackend
 from trendradar.storage.manager import StorageManager, get_storage_manager
@@ -34,6 +37,9 @@ __all__ = [
     # 转换函数
     "convert_crawl_results_to_news_data",
     "convert_news_data_to_results",
+    "news_data_to_result_views",
+    "NewsDataView",
+    "CurrentTitleInfoView",
     # 后端实现
     "LocalStorageBackend",
     "RemoteStorageBackend",
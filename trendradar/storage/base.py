@@ -6,11 +6,12 @@
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Set, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsItem:
     """新闻条目数据模型（热榜数据）"""
 
@@ -62,7 +63,7 @@ class NewsItem:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RSSItem:
     """RSS 条目数据模型"""
 
@@ -249,8 +250,7 @@ class NewsData:
                     # 合并排名
                     existing_ranks = set(existing.ranks) if existing.ranks else set()
                     new_ranks = set(item.ranks) if item.ranks else set()
-                    merged_ranks = sorted(existing_ranks | new_ranks)
-                    existing.ranks = merged_ranks
+                    existing.ranks = sorted(existing_ranks | new_ranks)
 
                     # 更新时间
                     if item.first_time and (not existing.first_time or item.first_time < existing.first_time):
@@ -340,6 +340,23 @@ class StorageBackend(ABC):
         """
         pass
 
+    def get_latest_batch_titles(
+        self, date: Optional[str] = None, platform_ids: Optional[List[str]] = None
+    ) -> Optional[Tuple[str, Dict[str, Set[str]]]]:
+        """
+        获取最新一批抓取中出现的标题（current 模式使用）
+
+        默认实现返回 None，调用方会退回到遍历全天数据的方式。
+
+        Args:
+            date: 日期字符串，默认为今天
+            platform_ids: 只统计这些平台（None 表示全部）
+
+        Returns:
+            (最新批次时间, {source_id: {title, ...}})，不支持或没有数据返回 None
+        """
+        return None
+
     @abstractmethod
     def detect_new_titles(self, current_data: NewsData) -> Dict[str, Dict]:
         """
@@ -459,6 +476,124 @@ class StorageBackend(ABC):
         """
         pass
 
+    # === 推送投递状态相关方法 ===
+    # 非抽象方法：默认不支持，调用方退回到每次推送完整内容
+
+    @property
+    def supports_delivery_state(self) -> bool:
+        """
+        是否支持记录各渠道已推送的标题（增量推送）
+        """
+        return False
+
+    def get_delivered_titles(
+        self,
+        channel: str,
+        date: Optional[str] = None,
+    ) -> Dict[str, Set[str]]:
+        """
+        获取渠道当日已推送的标题
+
+        Args:
+            channel: 渠道名称
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            {词组: {标题摘要, ...}}
+        """
+        return {}
+
+    def record_delivered_titles(
+        self,
+        channel: str,
+        delivered: Dict[str, List[str]],
+        date: Optional[str] = None,
+    ) -> bool:
+        """
+        记录渠道本次推送的标题
+
+        Args:
+            channel: 渠道名称
+            delivered: {词组: [标题摘要, ...]}
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            是否记录成功
+        """
+        return False
+
+    # === 推送发件箱相关方法 ===
+    # 非抽象方法：默认不支持发件箱，调用方退回到直接逐批发送
+
+    @property
+    def supports_outbox(self) -> bool:
+        """
+        是否支持推送发件箱（批次持久化与断点续发）
+        """
+        return False
+
+    def enqueue_outbox_batches(
+        self,
+        dispatch_id: str,
+        channel: str,
+        account: str,
+        batches: List[str],
+        report_type: str,
+        max_pending_age: Optional[float] = None,
+    ) -> bool:
+        """
+        将已渲染的批次写入发件箱（状态 pending）
+
+        Args:
+            dispatch_id: 分发批次ID
+            channel: 渠道名称
+            account: 账号摘要
+            batches: 批次内容列表（按发送顺序）
+            report_type: 报告类型
+            max_pending_age: 该渠道账号积压的待投递批次最长保留时间（分钟），
+                超过的标记为 expired 不再续发；None 表示不过期
+
+        Returns:
+            是否写入成功
+        """
+        return False
+
+    def get_pending_outbox_batches(
+        self,
+        channel: str,
+        account: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        获取指定渠道账号的待投递批次（先入队的在前）
+
+        Args:
+            channel: 渠道名称
+            account: 账号摘要
+
+        Returns:
+            批次列表，每项包含 id/dispatch_id/sequence/total/content/report_type/attempts
+        """
+        return []
+
+    def update_outbox_batch(
+        self,
+        batch_id: int,
+        status: str,
+        attempts: int,
+    ) -> bool:
+        """
+        更新发件箱批次的投递状态
+
+        Args:
+            batch_id: 批次行ID
+            status: 新状态（pending / sent / failed）
+            attempts: 累计尝试次数
+
+        Returns:
+            是否更新成功
+        """
+        return False
+
 
 def convert_crawl_results_to_news_data(
     results: Dict[str, Dict],
@@ -559,3 +694,242 @@ def convert_news_data_to_results(data: NewsData) -> tuple:
             }
 
     return results, data.id_to_name, title_info
+
+
+# === 只读映射视图 ===
+#
+# 分析层和报告层使用嵌套字典格式：
+#   results:    {source_id: {title: {"ranks", "url", "mobileUrl"}}}
+#   title_info: {source_id: {title: {"first_time", "last_time", "count", "ranks", "url", "mobileUrl"}}}
+# 以下视图直接包装 NewsData / 抓取结果，按需读取字段，不再为每次运行复制一整棵字典树。
+
+_RESULT_FIELDS = {
+    "ranks": "ranks",
+    "url": "url",
+    "mobileUrl": "mobile_url",
+}
+
+_TITLE_INFO_FIELDS = {
+    "first_time": "first_time",
+    "last_time": "last_time",
+    "count": "count",
+    "ranks": "ranks",
+    "url": "url",
+    "mobileUrl": "mobile_url",
+}
+
+
+class _NewsItemView(Mapping):
+    """单条新闻的只读字典视图（字段名与旧版字典一致）"""
+
+    __slots__ = ("_item", "_fields")
+
+    def __init__(self, item: Any, fields: Dict[str, str]):
+        self._item = item
+        self._fields = fields
+
+    def __getitem__(self, key: str) -> Any:
+        attr = self._fields[key]
+        value = getattr(self._item, attr)
+        if value is None and attr in ("url", "mobile_url"):
+            return ""
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class _SourceTitlesView(Mapping):
+    """单个平台的 {title: 新闻视图} 只读映射"""
+
+    __slots__ = ("_index", "_fields")
+
+    def __init__(self, index: Dict[str, Any], fields: Dict[str, str]):
+        self._index = index
+        self._fields = fields
+
+    def __getitem__(self, title: str) -> _NewsItemView:
+        return _NewsItemView(self._index[title], self._fields)
+
+    def __contains__(self, title: object) -> bool:
+        return title in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class NewsDataView(Mapping):
+    """
+    NewsData 的只读嵌套映射视图
+
+    表现为 {source_id: {title: title_data}}，可直接传给 count_word_frequency、
+    报告生成等使用旧版字典格式的代码。同一平台下出现重复标题时，与旧版字典构建
+    方式一致：保留首次出现的位置，取最后一条的数据。
+
+    Args:
+        data: NewsData 对象
+        fields: 视图暴露的字段（映射键 -> NewsItem 属性名）
+        platform_ids: 只暴露这些平台（None 表示全部）
+        indexes: 共享的 {source_id: {title: item}} 索引缓存（同一 NewsData 的多个视图共用）
+    """
+
+    def __init__(
+        self,
+        data: NewsData,
+        fields: Dict[str, str],
+        platform_ids: Optional[Iterable[str]] = None,
+        indexes: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        self._data = data
+        self._fields = fields
+        self._indexes = indexes if indexes is not None else {}
+        if platform_ids is None:
+            self._source_ids = list(data.items.keys())
+        else:
+            allowed = set(platform_ids)
+            self._source_ids = [sid for sid in data.items.keys() if sid in allowed]
+        self._source_set = set(self._source_ids)
+
+    def _get_index(self, source_id: str) -> Dict[str, Any]:
+        index = self._indexes.get(source_id)
+        if index is None:
+            index = {item.title: item for item in self._data.items[source_id]}
+            self._indexes[source_id] = index
+        return index
+
+    def __getitem__(self, source_id: str) -> _SourceTitlesView:
+        if source_id not in self._source_set:
+            raise KeyError(source_id)
+        return _SourceTitlesView(self._get_index(source_id), self._fields)
+
+    def __contains__(self, source_id: object) -> bool:
+        return source_id in self._source_set
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._source_ids)
+
+    def __len__(self) -> int:
+        return len(self._source_ids)
+
+    def __repr__(self) -> str:
+        return f"NewsDataView(sources={self._source_ids!r})"
+
+
+def news_data_to_result_views(
+    data: NewsData,
+    platform_ids: Optional[Iterable[str]] = None,
+) -> Tuple[NewsDataView, Dict[str, str], NewsDataView]:
+    """
+    将 NewsData 包装为旧版 results / title_info 格式的只读视图（零拷贝）
+
+    与 convert_news_data_to_results 返回的数据内容一致，但不复制任何条目。
+
+    Args:
+        data: NewsData 对象
+        platform_ids: 只保留这些平台（None 表示全部）
+
+    Returns:
+        (results, id_to_name, title_info) 元组
+    """
+    indexes: Dict[str, Dict[str, Any]] = {}
+    results = NewsDataView(data, _RESULT_FIELDS, platform_ids, indexes)
+    title_info = NewsDataView(data, _TITLE_INFO_FIELDS, platform_ids, indexes)
+    id_to_name = {
+        source_id: data.id_to_name.get(source_id, source_id) for source_id in results
+    }
+    return results, id_to_name, title_info
+
+
+class _CurrentTitleDataView(Mapping):
+    """抓取结果条目的 title_info 视图（首次/最后时间为当前批次，次数为 1）"""
+
+    __slots__ = ("_title_data", "_time_info")
+
+    _KEYS = ("first_time", "last_time", "count", "ranks", "url", "mobileUrl")
+
+    def __init__(self, title_data: Dict, time_info: str):
+        self._title_data = title_data
+        self._time_info = time_info
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "first_time" or key == "last_time":
+            return self._time_info
+        if key == "count":
+            return 1
+        if key == "ranks":
+            return self._title_data.get("ranks", [])
+        if key in ("url", "mobileUrl"):
+            return self._title_data.get(key, "")
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class _CurrentSourceView(Mapping):
+    """单个平台抓取结果的 title_info 视图"""
+
+    __slots__ = ("_titles", "_time_info")
+
+    def __init__(self, titles: Dict, time_info: str):
+        self._titles = titles
+        self._time_info = time_info
+
+    def __getitem__(self, title: str) -> _CurrentTitleDataView:
+        return _CurrentTitleDataView(self._titles[title], self._time_info)
+
+    def __contains__(self, title: object) -> bool:
+        return title in self._titles
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._titles)
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+
+class CurrentTitleInfoView(Mapping):
+    """
+    从当前抓取结果派生的 title_info 只读视图
+
+    等价于为每个标题构建 {"first_time": time_info, "last_time": time_info, "count": 1,
+    "ranks", "url", "mobileUrl"}，但不复制数据。
+
+    Args:
+        results: 抓取结果 {source_id: {title: {ranks, url, mobileUrl}}}
+        time_info: 当前批次时间
+    """
+
+    def __init__(self, results: Dict[str, Dict], time_info: str):
+        self._results = results
+        self._time_info = time_info
+
+    def __getitem__(self, source_id: str) -> _CurrentSourceView:
+        return _CurrentSourceView(self._results[source_id], self._time_info)
+
+    def __contains__(self, source_id: object) -> bool:
+        return source_id in self._results
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._results)
+
+    def __len__(self) -> int:
+        return len(self._results)
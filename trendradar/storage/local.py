@@ -7,11 +7,12 @@
 
 import sqlite3
 import shutil
+import threading
 import pytz
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData
 from trendradar.utils.time import (
@@ -22,6 +23,9 @@ from trendradar.utils.time import (
 from trendradar.utils.url import normalize_url
 
 
+# 发件箱中已结束（sent / failed）批次的保留天数
+OUTBOX_RETENTION_DAYS = 7
+
 class LocalStorageBackend(StorageBackend):
     """
     本地存储后端
@@ -53,6 +57,9 @@ class LocalStorageBackend(StorageBackend):
         self.enable_html = enable_html
         self.timezone = timezone
         self._db_connections: Dict[str, sqlite3.Connection] = {}
+        # 发件箱由推送线程并发访问，使用独立连接并加锁串行化
+        self._outbox_connections: Dict[str, sqlite3.Connection] = {}
+        self._outbox_lock = threading.Lock()
 
     @property
     def backend_name(self) -> str:
@@ -120,13 +127,15 @@ class LocalStorageBackend(StorageBackend):
         获取 schema.sql 文件路径
 
         Args:
-            db_type: 数据库类型 ("news" 或 "rss")
+            db_type: 数据库类型 ("news"、"rss" 或 "outbox")
 
         Returns:
             schema 文件路径
         """
         if db_type == "rss":
             return Path(__file__).parent / "rss_schema.sql"
+        if db_type == "outbox":
+            return Path(__file__).parent / "outbox_schema.sql"
         return Path(__file__).parent / "schema.sql"
 
     def _init_tables(self, conn: sqlite3.Connection, db_type: str = "news") -> None:
@@ -561,6 +570,67 @@ class LocalStorageBackend(StorageBackend):
             print(f"[本地存储] 获取最新数据失败: {e}")
             return None
 
+    def get_latest_batch_titles(
+        self, date: Optional[str] = None, platform_ids: Optional[List[str]] = None
+    ) -> Optional[Tuple[str, Dict[str, Set[str]]]]:
+        """
+        获取最新一批抓取中出现的标题（基于 last_crawl_time 索引查询）
+
+        Args:
+            date: 日期字符串，默认为今天
+            platform_ids: 只统计这些平台（None 表示全部）
+
+        Returns:
+            (最新批次时间, {source_id: {title, ...}})，没有数据返回 None
+        """
+        try:
+            db_path = self._get_db_path(date)
+            if not db_path.exists():
+                return None
+
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+
+            # 最新批次时间：沿 idx_news_crawl_time 倒序取第一条
+            platform_filter = ""
+            params: List = []
+            if platform_ids is not None:
+                if not platform_ids:
+                    return None
+                platform_filter = f"WHERE platform_id IN ({','.join('?' * len(platform_ids))})"
+                params = list(platform_ids)
+
+            cursor.execute(f"""
+                SELECT last_crawl_time FROM news_items
+                {platform_filter}
+                ORDER BY last_crawl_time DESC
+                LIMIT 1
+            """, params)
+            time_row = cursor.fetchone()
+            if not time_row or not time_row[0]:
+                return None
+
+            latest_time = time_row[0]
+
+            # 该批次的标题（last_crawl_time 等值查询同样走索引）
+            cursor.execute("""
+                SELECT platform_id, title FROM news_items
+                WHERE last_crawl_time = ?
+            """, (latest_time,))
+
+            allowed = set(platform_ids) if platform_ids is not None else None
+            batch_titles: Dict[str, Set[str]] = {}
+            for platform_id, title in cursor.fetchall():
+                if allowed is not None and platform_id not in allowed:
+                    continue
+                batch_titles.setdefault(platform_id, set()).add(title)
+
+            return latest_time, batch_titles
+
+        except Exception as e:
+            print(f"[本地存储] 获取最新批次标题失败: {e}")
+            return None
+
     def detect_new_titles(self, current_data: NewsData) -> Dict[str, Dict]:
         """
         检测新增的标题
@@ -785,6 +855,14 @@ class LocalStorageBackend(StorageBackend):
 
         self._db_connections.clear()
 
+        with self._outbox_lock:
+            for conn in self._outbox_connections.values():
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._outbox_connections.clear()
+
     def cleanup_old_data(self, retention_days: int) -> int:
         """
         清理过期数据
@@ -957,6 +1035,249 @@ class LocalStorageBackend(StorageBackend):
             print(f"[本地存储] 记录推送失败: {e}")
             return False
 
+    # ========================================
+    # 推送投递状态方法
+    # ========================================
+
+    @property
+    def supports_delivery_state(self) -> bool:
+        return True
+
+    def get_delivered_titles(
+        self,
+        channel: str,
+        date: Optional[str] = None,
+    ) -> Dict[str, Set[str]]:
+        """
+        获取渠道当日已推送的标题
+
+        Args:
+            channel: 渠道名称
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            {词组: {标题摘要, ...}}
+        """
+        try:
+            # 各渠道在调度器线程中并发读写，复用允许跨线程的发件箱连接
+            with self._outbox_lock:
+                conn = self._get_outbox_connection(date)
+                cursor = conn.execute("""
+                    SELECT group_key, title_key FROM push_delivered_titles
+                    WHERE channel = ?
+                """, (channel,))
+                rows = cursor.fetchall()
+
+            delivered: Dict[str, Set[str]] = {}
+            for group_key, title_key in rows:
+                delivered.setdefault(group_key, set()).add(title_key)
+            return delivered
+
+        except Exception as e:
+            print(f"[本地存储] 读取推送投递状态失败: {e}")
+            return {}
+
+    def record_delivered_titles(
+        self,
+        channel: str,
+        delivered: Dict[str, List[str]],
+        date: Optional[str] = None,
+    ) -> bool:
+        """
+        记录渠道本次推送的标题
+
+        Args:
+            channel: 渠道名称
+            delivered: {词组: [标题摘要, ...]}
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            是否记录成功
+        """
+        try:
+            now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
+            with self._outbox_lock:
+                conn = self._get_outbox_connection(date)
+                conn.executemany("""
+                    INSERT OR IGNORE INTO push_delivered_titles
+                    (channel, group_key, title_key, delivered_at)
+                    VALUES (?, ?, ?, ?)
+                """, [
+                    (channel, group_key, title_key, now_str)
+                    for group_key, title_keys in delivered.items()
+                    for title_key in title_keys
+                ])
+                conn.commit()
+            return True
+
+        except Exception as e:
+            print(f"[本地存储] 记录推送投递状态失败: {e}")
+            return False
+
+    # ========================================
+    # 推送发件箱方法
+    # ========================================
+
+    @property
+    def supports_outbox(self) -> bool:
+        return True
+
+    def _get_outbox_db_path(self) -> Path:
+        """
+        获取发件箱数据库路径：output/push/outbox.db
+
+        发件箱与日期无关，跨午夜仍未送达的批次在次日继续续发。
+        """
+        db_dir = self.data_dir / "push"
+        db_dir.mkdir(parents=True, exist_ok=True)
+        return db_dir / "outbox.db"
+
+    def _get_outbox_connection(self, date: Optional[str] = None, db_type: str = "news") -> sqlite3.Connection:
+        """
+        获取推送线程共享的连接（允许跨线程使用，调用方需持有 _outbox_lock）
+
+        Args:
+            date: 日期字符串（db_type 为 "news" 时有效）
+            db_type: "news"（当日数据库，保存推送投递状态）或 "outbox"（发件箱数据库）
+
+        Returns:
+            数据库连接
+        """
+        if db_type == "outbox":
+            db_path = str(self._get_outbox_db_path())
+        else:
+            db_path = str(self._get_db_path(date, db_type))
+
+        if db_path not in self._outbox_connections:
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            self._init_tables(conn, db_type)
+            self._outbox_connections[db_path] = conn
+
+        return self._outbox_connections[db_path]
+
+    def enqueue_outbox_batches(
+        self,
+        dispatch_id: str,
+        channel: str,
+        account: str,
+        batches: List[str],
+        report_type: str,
+        max_pending_age: Optional[float] = None,
+    ) -> bool:
+        """
+        将已渲染的批次写入发件箱（状态 pending），同时清理过期的已结束批次
+
+        Args:
+            dispatch_id: 分发批次ID
+            channel: 渠道名称
+            account: 账号摘要
+            batches: 批次内容列表（按发送顺序）
+            report_type: 报告类型
+            max_pending_age: 该渠道账号积压的待投递批次最长保留时间（分钟），
+                超过的标记为 expired 不再续发；None 表示不过期
+
+        Returns:
+            是否写入成功
+        """
+        try:
+            now = self._get_configured_time()
+            now_str = now.strftime("%Y-%m-%d %H:%M:%S")
+            expire_str = (now - timedelta(days=OUTBOX_RETENTION_DAYS)).strftime("%Y-%m-%d %H:%M:%S")
+            total = len(batches)
+            with self._outbox_lock:
+                conn = self._get_outbox_connection(db_type="outbox")
+                conn.execute("""
+                    DELETE FROM push_outbox
+                    WHERE status != 'pending' AND updated_at < ?
+                """, (expire_str,))
+                if max_pending_age is not None:
+                    stale_str = (now - timedelta(minutes=max_pending_age)).strftime("%Y-%m-%d %H:%M:%S")
+                    cursor = conn.execute("""
+                        UPDATE push_outbox SET status = 'expired', updated_at = ?
+                        WHERE channel = ? AND account = ? AND status = 'pending' AND created_at < ?
+                    """, (now_str, channel, account, stale_str))
+                    if cursor.rowcount:
+                        print(f"[发件箱] {channel} 有 {cursor.rowcount} 个批次积压超过 {max_pending_age:g} 分钟，不再续发")
+                conn.executemany("""
+                    INSERT OR IGNORE INTO push_outbox
+                    (dispatch_id, channel, account, sequence, total, content,
+                     report_type, status, attempts, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, 'pending', 0, ?, ?)
+                """, [
+                    (dispatch_id, channel, account, i, total, content, report_type, now_str, now_str)
+                    for i, content in enumerate(batches, 1)
+                ])
+                conn.commit()
+            return True
+
+        except Exception as e:
+            print(f"[本地存储] 写入推送发件箱失败: {e}")
+            return False
+
+    def get_pending_outbox_batches(
+        self,
+        channel: str,
+        account: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        获取指定渠道账号的待投递批次（先入队的在前）
+
+        Args:
+            channel: 渠道名称
+            account: 账号摘要
+
+        Returns:
+            批次列表，每项包含 id/dispatch_id/sequence/total/content/report_type/attempts
+        """
+        try:
+            with self._outbox_lock:
+                conn = self._get_outbox_connection(db_type="outbox")
+                cursor = conn.execute("""
+                    SELECT id, dispatch_id, sequence, total, content, report_type, attempts
+                    FROM push_outbox
+                    WHERE channel = ? AND account = ? AND status = 'pending'
+                    ORDER BY id
+                """, (channel, account))
+                return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            print(f"[本地存储] 读取推送发件箱失败: {e}")
+            return []
+
+    def update_outbox_batch(
+        self,
+        batch_id: int,
+        status: str,
+        attempts: int,
+    ) -> bool:
+        """
+        更新发件箱批次的投递状态
+
+        Args:
+            batch_id: 批次行ID
+            status: 新状态（pending / sent / failed）
+            attempts: 累计尝试次数
+
+        Returns:
+            是否更新成功
+        """
+        try:
+            now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
+            with self._outbox_lock:
+                conn = self._get_outbox_connection(db_type="outbox")
+                conn.execute("""
+                    UPDATE push_outbox
+                    SET status = ?, attempts = ?, updated_at = ?
+                    WHERE id = ?
+                """, (status, attempts, now_str, batch_id))
+                conn.commit()
+            return True
+
+        except Exception as e:
+            print(f"[本地存储] 更新推送发件箱失败: {e}")
+            return False
+
     # ========================================
     # RSS 数据存储方法
     # ========================================
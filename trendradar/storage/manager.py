@@ -6,7 +6,7 @@
 """
 
 import os
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from trendradar.storage.base import StorageBackend, NewsData, RSSData
 
@@ -225,6 +225,12 @@ class StorageManager:
         """获取最新抓取数据"""
         return self.get_backend().get_latest_crawl_data(date)
 
+    def get_latest_batch_titles(
+        self, date: Optional[str] = None, platform_ids: Optional[List[str]] = None
+    ) -> Optional[Tuple[str, Dict[str, Set[str]]]]:
+        """获取最新一批抓取中出现的标题"""
+        return self.get_backend().get_latest_batch_titles(date, platform_ids)
+
     def detect_new_titles(self, current_data: NewsData) -> dict:
         """检测新增标题"""
         return self.get_backend().detect_new_titles(current_data)
@@ -307,6 +313,68 @@ class StorageManager:
         """
         return self.get_backend().record_push(report_type, date)
 
+    # === 推送投递状态相关方法 ===
+
+    @property
+    def supports_delivery_state(self) -> bool:
+        """是否支持记录各渠道已推送的标题"""
+        return self.get_backend().supports_delivery_state
+
+    def get_delivered_titles(
+        self,
+        channel: str,
+        date: Optional[str] = None,
+    ) -> Dict[str, Set[str]]:
+        """获取渠道当日已推送的标题"""
+        return self.get_backend().get_delivered_titles(channel, date)
+
+    def record_delivered_titles(
+        self,
+        channel: str,
+        delivered: Dict[str, List[str]],
+        date: Optional[str] = None,
+    ) -> bool:
+        """记录渠道本次推送的标题"""
+        return self.get_backend().record_delivered_titles(channel, delivered, date)
+
+    # === 推送发件箱相关方法 ===
+
+    @property
+    def supports_outbox(self) -> bool:
+        """是否支持推送发件箱"""
+        return self.get_backend().supports_outbox
+
+    def enqueue_outbox_batches(
+        self,
+        dispatch_id: str,
+        channel: str,
+        account: str,
+        batches: List[str],
+        report_type: str,
+        max_pending_age: Optional[float] = None,
+    ) -> bool:
+        """将已渲染的批次写入发件箱"""
+        return self.get_backend().enqueue_outbox_batches(
+            dispatch_id, channel, account, batches, report_type, max_pending_age
+        )
+
+    def get_pending_outbox_batches(
+        self,
+        channel: str,
+        account: str,
+    ) -> List[Dict[str, Any]]:
+        """获取指定渠道账号的待投递批次"""
+        return self.get_backend().get_pending_outbox_batches(channel, account)
+
+    def update_outbox_batch(
+        self,
+        batch_id: int,
+        status: str,
+        attempts: int,
+    ) -> bool:
+        """更新发件箱批次的投递状态"""
+        return self.get_backend().update_outbox_batch(batch_id, status, attempts)
+
 
 def get_storage_manager(
     backend_type: str = "auto",
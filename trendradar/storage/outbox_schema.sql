@@ -0,0 +1,34 @@
+-- TrendRadar 推送发件箱数据库表结构
+-- 与日期无关（output/push/outbox.db），跨午夜未送达的批次在次日继续续发
+
+-- ============================================
+-- 推送发件箱表
+-- 每个已渲染的批次入队一行，投递成功后标记为 sent，
+-- 中途失败的批次保持 pending，下次推送时从断点继续
+-- account 为账号凭据的摘要（不保存 webhook 原文）
+-- ============================================
+CREATE TABLE IF NOT EXISTS push_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    dispatch_id TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    account TEXT NOT NULL,
+    sequence INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    report_type TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',  -- pending / sent / failed / expired
+    attempts INTEGER DEFAULT 0,
+    created_at TEXT,
+    updated_at TEXT,
+    UNIQUE(dispatch_id, channel, account, sequence)
+);
+
+-- ============================================
+-- 索引定义
+-- ============================================
+
+-- 发件箱索引（按渠道+账号查询待投递批次）
+CREATE INDEX IF NOT EXISTS idx_push_outbox_pending ON push_outbox(channel, account, status);
+
+-- 清理索引（按状态+更新时间删除过期批次）
+CREATE INDEX IF NOT EXISTS idx_push_outbox_updated ON push_outbox(status, updated_at);
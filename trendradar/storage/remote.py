@@ -15,7 +15,7 @@ import tempfile
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 try:
     import boto3
@@ -743,6 +743,63 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 获取最新数据失败: {e}")
             return None
 
+    def get_latest_batch_titles(
+        self, date: Optional[str] = None, platform_ids: Optional[List[str]] = None
+    ) -> Optional[Tuple[str, Dict[str, Set[str]]]]:
+        """
+        获取最新一批抓取中出现的标题（基于 last_crawl_time 索引查询）
+
+        Args:
+            date: 日期字符串，默认为今天
+            platform_ids: 只统计这些平台（None 表示全部）
+
+        Returns:
+            (最新批次时间, {source_id: {title, ...}})，没有数据返回 None
+        """
+        try:
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+
+            # 最新批次时间：沿 idx_news_crawl_time 倒序取第一条
+            platform_filter = ""
+            params: List = []
+            if platform_ids is not None:
+                if not platform_ids:
+                    return None
+                platform_filter = f"WHERE platform_id IN ({','.join('?' * len(platform_ids))})"
+                params = list(platform_ids)
+
+            cursor.execute(f"""
+                SELECT last_crawl_time FROM news_items
+                {platform_filter}
+                ORDER BY last_crawl_time DESC
+                LIMIT 1
+            """, params)
+            time_row = cursor.fetchone()
+            if not time_row or not time_row[0]:
+                return None
+
+            latest_time = time_row[0]
+
+            # 该批次的标题（last_crawl_time 等值查询同样走索引）
+            cursor.execute("""
+                SELECT platform_id, title FROM news_items
+                WHERE last_crawl_time = ?
+            """, (latest_time,))
+
+            allowed = set(platform_ids) if platform_ids is not None else None
+            batch_titles: Dict[str, Set[str]] = {}
+            for platform_id, title in cursor.fetchall():
+                if allowed is not None and platform_id not in allowed:
+                    continue
+                batch_titles.setdefault(platform_id, set()).add(title)
+
+            return latest_time, batch_titles
+
+        except Exception as e:
+            print(f"[远程存储] 获取最新批次标题失败: {e}")
+            return None
+
     def detect_new_titles(self, current_data: NewsData) -> Dict[str, Dict]:
         """
         检测新增的标题
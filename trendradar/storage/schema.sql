@@ -93,6 +93,19 @@ CREATE TABLE IF NOT EXISTS push_records (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- ============================================
+-- 推送投递状态表
+-- 记录各渠道当日已推送过的词组与标题，用于增量推送（delta_push）
+-- group_key 为词组（或平台）名称，title_key 为来源+标题的摘要
+-- ============================================
+CREATE TABLE IF NOT EXISTS push_delivered_titles (
+    channel TEXT NOT NULL,
+    group_key TEXT NOT NULL,
+    title_key TEXT NOT NULL,
+    delivered_at TEXT,
+    PRIMARY KEY (channel, group_key, title_key)
+);
+
 -- ============================================
 -- 索引定义
 -- ============================================
@@ -0,0 +1,56 @@
+# coding=utf-8
+"""
+Top-K 选择工具模块
+
+提供有界 Top-K 选择功能，用于"排序后截断"的场景：
+- select_top_k: 选出排序后的前 K 个元素，结果与 sorted(...)[:k] 完全一致
+"""
+
+import heapq
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def select_top_k(
+    items: Iterable[T],
+    k: Optional[int],
+    key: Optional[Callable[[T], Any]] = None,
+    reverse: bool = False,
+) -> List[T]:
+    """
+    选出排序后的前 K 个元素
+
+    等价于 sorted(items, key=key, reverse=reverse)[:k]，但当 k 小于元素总数时
+    使用堆选择，复杂度从 O(n log n) 降为 O(n log k)。
+    heapq.nsmallest / nlargest 对相等元素保持原始顺序，与 sorted 的稳定排序一致，
+    因此并列元素的先后顺序不会因切换实现而改变。
+
+    Args:
+        items: 待选择的元素
+        k: 返回数量，None 表示不限制（返回全部排序结果），<= 0 返回空列表
+        key: 排序键函数（与 sorted 相同）
+        reverse: 是否降序（与 sorted 相同）
+
+    Returns:
+        排序后的前 K 个元素列表
+
+    Examples:
+        >>> select_top_k([3, 1, 2, 5, 4], 2)
+        [1, 2]
+        >>> select_top_k(["bb", "a", "ccc"], 2, key=len, reverse=True)
+        ['ccc', 'bb']
+    """
+    if k is not None and k <= 0:
+        return []
+
+    if not isinstance(items, list):
+        items = list(items)
+
+    # 不限制数量，或数量覆盖全部元素时，直接完整排序
+    if k is None or k >= len(items):
+        return sorted(items, key=key, reverse=reverse)
+
+    if reverse:
+        return heapq.nlargest(k, items, key=key)
+    return heapq.nsmallest(k, items, key=key)